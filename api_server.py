@@ -0,0 +1,351 @@
+"""
+Lokalne API JSON tylko do odczytu — kolekcja dla innych narzędzi (VTT, dashboard).
+
+Uruchomienie (bez okna aplikacji)::
+
+    python -m api_server [--host 127.0.0.1] [--port 8765]
+
+Zasoby (GET): ``/api/systems`` (hierarchia gra → podręcznik główny →
+suplementy), ``/api/items`` (płaska lista pozycji), ``/api/sessions``,
+``/api/players``, ``/api/publishers``, ``/api/stats`` oraz ``/api/version``.
+Listy są stronicowane: ``?limit=100&offset=0`` (limit najwyżej 1000).
+
+Dane czytane są wprost z tabel (połączenie tylko do odczytu, jak w
+``sesyjka``) — serwer nie importuje modułów zakładek ani Tk.
+Każda odpowiedź ma ``ETag`` wyliczony ze stanu baz: ``PRAGMA data_version``
+na stałych połączeniach (zmienia się po zapisie z innego połączenia) oraz
+``stat`` plików (podmiana pliku przy imporcie). Zapytanie z pasującym
+``If-None-Match`` dostaje ``304`` bez wczytywania danych, a zmienione zasoby
+trafiają do pamięci podręcznej — odpytywanie niezmienionej kolekcji kosztuje
+kilka wywołań PRAGMA.
+
+Serwer nasłuchuje domyślnie tylko na 127.0.0.1 i niczego nie zapisuje.
+"""
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+from collections import OrderedDict
+from contextlib import closing
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple, cast
+from urllib.parse import parse_qs, urlsplit
+
+from database_manager import get_own_db_path
+
+_log = logging.getLogger(__name__)
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+_CACHE_SIZE = 128
+
+_DB_FILES = ("systemy_rpg.db", "sesje_rpg.db", "gracze.db", "wydawcy.db")
+
+
+# ── Stan baz (ETag) ──
+
+class DataState:
+    """Token stanu wszystkich baz — zmienia się po każdym zapisie lub podmianie pliku."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._conns: Dict[str, Tuple[Optional[sqlite3.Connection], Any]] = {}
+
+    def _probe(self, db_file: str) -> Tuple[Any, ...]:
+        path = Path(get_own_db_path(db_file))
+        try:
+            st = path.stat()
+        except FileNotFoundError:
+            self._close(db_file)
+            return (db_file, None)
+        file_id = (st.st_ino, st.st_dev)
+        conn, known_id = self._conns.get(db_file, (None, None))
+        if conn is None or known_id != file_id:
+            # Nowy plik (np. po imporcie) — ``data_version`` liczy się od nowa
+            self._close(db_file)
+            conn = sqlite3.connect(
+                path.resolve().as_uri() + "?mode=ro", uri=True, check_same_thread=False
+            )
+            self._conns[db_file] = (conn, file_id)
+        version = conn.execute("PRAGMA data_version").fetchone()[0]
+        return (db_file, file_id, st.st_mtime_ns, st.st_size, version, id(conn))
+
+    def _close(self, db_file: str) -> None:
+        conn, _ = self._conns.pop(db_file, (None, None))
+        if conn is not None:
+            conn.close()
+
+    def token(self) -> str:
+        with self._lock:
+            probes = [self._probe(db_file) for db_file in _DB_FILES]
+        return hashlib.blake2b(repr(probes).encode(), digest_size=8).hexdigest()
+
+    def close(self) -> None:
+        with self._lock:
+            for db_file in list(self._conns):
+                self._close(db_file)
+
+
+# ── Zasoby ──
+#
+# Zapytania bezpośrednio do tabel (jak ``sesyjka``) — moduły zakładek importują
+# Tk, a serwer ma działać bez okna. Zasoby zwracają surowe kolumny (statusy,
+# ceny, identyfikatory) zamiast napisów przygotowanych do wyświetlenia w tabeli.
+
+_ITEMS_SQL = """
+    SELECT s.id, s.nazwa, s.typ, s.system_glowny_id, s.typ_suplementu,
+           s.system_glowny_nazwa_custom, s.system_gry_id, w.nazwa AS wydawca,
+           s.fizyczny, s.pdf, s.vtt, s.jezyk, s.status_gra, s.status_kolekcja,
+           s.cena_fiz, s.cena_pdf, s.cena_vtt, s.waluta_zakupu,
+           s.cena_sprzedazy, s.waluta_sprzedazy
+    FROM systemy_rpg s
+    LEFT JOIN wydawcy w ON w.id = s.wydawca_id
+    ORDER BY s.id
+"""
+
+
+def _query(sql: str, *schemas: str) -> List[Dict[str, Any]]:
+    """Wiersze zapytania jako słowniki; brak którejś z baz ``schemas`` — pusta lista."""
+    from sesyjka import open_readonly
+
+    with closing(open_readonly()) as conn:
+        attached = {row[1] for row in conn.execute("PRAGMA database_list")}
+        if not attached.issuperset(schemas):
+            return []
+        conn.row_factory = sqlite3.Row
+        return [dict(row) for row in conn.execute(sql)]
+
+
+def _systems_payload() -> List[Dict[str, Any]]:
+    items = _items_payload()
+    by_id = {item["id"]: item for item in items}
+    for item in items:
+        item["suplementy"] = []
+    # Suplement trafia pod swój podręcznik główny, pozostałe pozycje — pod grę
+    by_game: Dict[Any, List[Dict[str, Any]]] = {}
+    for item in items:
+        parent = by_id.get(item["system_glowny_id"])
+        if parent is not None and parent is not item:
+            parent["suplementy"].append(item)
+        else:
+            by_game.setdefault(item["system_gry_id"], []).append(item)
+
+    games = _query(
+        "SELECT g.id, g.nazwa, w.nazwa AS wydawca, g.jezyk, g.notatki FROM systemy_gry g"
+        " LEFT JOIN wydawcy w ON w.id = g.wydawca_id ORDER BY g.id",
+        "systemy_rpg", "wydawcy",
+    )
+    result = [dict(game, pozycje=by_game.pop(game["id"], [])) for game in games]
+    orphans = [item for group in by_game.values() for item in group]
+    if orphans:
+        result.append({"id": None, "nazwa": "(bez systemu)", "pozycje": orphans})
+    return result
+
+
+def _items_payload() -> List[Dict[str, Any]]:
+    return _query(_ITEMS_SQL, "systemy_rpg", "wydawcy")
+
+
+def _sessions_payload() -> List[Dict[str, Any]]:
+    sessions = _query(
+        "SELECT s.id, s.data_sesji, s.system_id, g.nazwa AS system, s.mg_id, m.nick AS mg,"
+        " s.kampania, s.jednostrzal, s.tytul_kampanii, s.tytul_przygody FROM sesje_rpg s"
+        " LEFT JOIN systemy_gry g ON g.id = s.system_id"
+        " LEFT JOIN gracze m ON m.id = s.mg_id"
+        " ORDER BY s.data_sesji, s.id",
+        "sesje_rpg", "systemy_rpg", "gracze",
+    )
+    players: Dict[Any, List[Dict[str, Any]]] = {}
+    for row in _query(
+        "SELECT sg.sesja_id, sg.gracz_id, p.nick FROM sesje_gracze sg"
+        " LEFT JOIN gracze p ON p.id = sg.gracz_id ORDER BY sg.sesja_id, sg.gracz_id",
+        "sesje_rpg", "gracze",
+    ):
+        players.setdefault(row["sesja_id"], []).append(
+            {"id": row["gracz_id"], "nick": row["nick"]}
+        )
+    for session in sessions:
+        session["gracze"] = players.get(session["id"], [])
+    return sessions
+
+
+def _players_payload() -> List[Dict[str, Any]]:
+    return _query(
+        "SELECT id, nick, imie_nazwisko, plec, social, glowny_uzytkownik, wazna, grupa"
+        " FROM gracze ORDER BY id",
+        "gracze",
+    )
+
+
+def _publishers_payload() -> List[Dict[str, Any]]:
+    return _query("SELECT id, nazwa, strona, kraj FROM wydawcy ORDER BY id", "wydawcy")
+
+
+def _stats_payload() -> Dict[str, Any]:
+    from sesyjka import collect_stats
+
+    return collect_stats()
+
+
+# Ścieżka → (funkcja danych, czy lista do stronicowania)
+RESOURCES: Dict[str, Tuple[Callable[[], Any], bool]] = {
+    "/api/systems": (_systems_payload, True),
+    "/api/items": (_items_payload, True),
+    "/api/sessions": (_sessions_payload, True),
+    "/api/players": (_players_payload, True),
+    "/api/publishers": (_publishers_payload, True),
+    "/api/stats": (_stats_payload, False),
+}
+
+
+# ── Serwer ──
+
+class ApiServer(ThreadingHTTPServer):
+    """Serwer HTTP z pamięcią podręczną odpowiedzi zależną od stanu baz."""
+
+    daemon_threads = True
+
+    def __init__(self, address: Tuple[str, int]) -> None:
+        super().__init__(address, ApiRequestHandler)
+        self.state = DataState()
+        self._cache: "OrderedDict[str, Tuple[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
+        # Jedno wczytanie naraz — równoległe odpytywania czekają na gotowy wynik
+        self._load_lock = threading.Lock()
+
+    def load(self, path: str, token: str) -> Any:
+        """Dane zasobu dla stanu ``token`` (z pamięci podręcznej, jeśli aktualne)."""
+        with self._cache_lock:
+            cached = self._cache.get(path)
+            if cached is not None and cached[0] == token:
+                self._cache.move_to_end(path)
+                return cached[1]
+        with self._load_lock:
+            with self._cache_lock:
+                cached = self._cache.get(path)
+                if cached is not None and cached[0] == token:
+                    return cached[1]
+            data = RESOURCES[path][0]()
+            with self._cache_lock:
+                self._cache[path] = (token, data)
+                self._cache.move_to_end(path)
+                while len(self._cache) > _CACHE_SIZE:
+                    self._cache.popitem(last=False)
+            return data
+
+    def server_close(self) -> None:
+        super().server_close()
+        self.state.close()
+
+
+class ApiRequestHandler(BaseHTTPRequestHandler):
+    server_version = "SesyjkaAPI/1"
+
+    def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+        _log.debug("%s - %s", self.address_string(), format % args)
+
+    def do_GET(self) -> None:  # noqa: N802
+        server = cast(ApiServer, self.server)
+        url = urlsplit(self.path)
+        path = url.path.rstrip("/") or "/"
+        if path == "/api/version":
+            self._send_json({"data_version": server.state.token()})
+            return
+        if path not in RESOURCES:
+            self._send_json(
+                {"error": "Nie znaleziono", "resources": sorted(RESOURCES)}, HTTPStatus.NOT_FOUND
+            )
+            return
+        query = parse_qs(url.query)
+        try:
+            limit = min(int(query.get("limit", [DEFAULT_LIMIT])[0]), MAX_LIMIT)
+            offset = int(query.get("offset", [0])[0])
+            if limit < 0 or offset < 0:
+                raise ValueError
+        except ValueError:
+            self._send_json({"error": "Niepoprawne limit/offset"}, HTTPStatus.BAD_REQUEST)
+            return
+
+        token = server.state.token()
+        paged = RESOURCES[path][1]
+        variant = f"{path}?{limit}:{offset}" if paged else path
+        etag = '"' + hashlib.blake2b(
+            f"{token}|{variant}".encode(), digest_size=8
+        ).hexdigest() + '"'
+        if etag in self.headers.get("If-None-Match", ""):
+            self._send_headers(HTTPStatus.NOT_MODIFIED, etag, None)
+            return
+
+        try:
+            data = server.load(path, token)
+        except sqlite3.Error as e:
+            _log.error("Błąd odczytu %s: %s", path, e)
+            self._send_json({"error": str(e)}, HTTPStatus.SERVICE_UNAVAILABLE)
+            return
+        if paged:
+            page = data[offset:offset + limit]
+            next_offset = offset + limit if offset + limit < len(data) else None
+            body: Any = {
+                "items": page, "total": len(data), "offset": offset, "limit": limit,
+                "next_offset": next_offset, "data_version": token,
+            }
+        else:
+            body = {"data": data, "data_version": token}
+        self._send_json(body, etag=etag)
+
+    def _send_headers(
+        self, status: HTTPStatus, etag: Optional[str], length: Optional[int]
+    ) -> None:
+        self.send_response(status)
+        if etag is not None:
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", "no-cache")
+        if length is not None:
+            self.send_header("Content-Type", "application/json; charset=utf-8")
+            self.send_header("Content-Length", str(length))
+        self.end_headers()
+
+    def _send_json(
+        self, body: Any, status: HTTPStatus = HTTPStatus.OK, etag: Optional[str] = None
+    ) -> None:
+        raw = json.dumps(body, ensure_ascii=False, default=str).encode("utf-8")
+        self._send_headers(status, etag, len(raw))
+        self.wfile.write(raw)
+
+
+def serve(host: str = DEFAULT_HOST, port: int = DEFAULT_PORT) -> None:
+    """Uruchamia serwer i obsługuje zapytania do przerwania (Ctrl+C)."""
+    with ApiServer((host, port)) as server:
+        _log.info("API Sesyjki: http://%s:%d/api/", host, server.server_address[1])
+        print(f"API Sesyjki: http://{host}:{server.server_address[1]}/api/  (Ctrl+C — koniec)")
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        prog="python -m api_server", description="Lokalne API JSON kolekcji Sesyjki."
+    )
+    parser.add_argument("--host", default=os.environ.get("SESYJKA_API_HOST", DEFAULT_HOST))
+    parser.add_argument(
+        "--port", type=int, default=int(os.environ.get("SESYJKA_API_PORT", DEFAULT_PORT))
+    )
+    parser.add_argument("-v", "--verbose", action="store_true")
+    args = parser.parse_args()
+    logging.basicConfig(level=logging.DEBUG if args.verbose else logging.INFO)
+    serve(args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
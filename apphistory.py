@@ -1,6 +1,16 @@
+"""
+Okno historii wersji aplikacji Sesyjka.
+
+Lista zmian przechowywana jest w pliku danych ``version_history.json``
+(wczytywanym leniwie przy pierwszym otwarciu okna) i wyświetlana w widżecie
+tekstowym z wyszukiwarką.
+"""
+import json
+import sys
 import tkinter as tk
+from pathlib import Path
 from tkinter import ttk
-from typing import Any
+from typing import Any, Dict, List, Optional
 import customtkinter as ctk  # type: ignore
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel, apply_dark_titlebar
@@ -8,6 +18,67 @@ import logging
 
 _log = logging.getLogger("apphistory")
 
+_HISTORY_FILE = "version_history.json"
+
+# Wczytana historia (None = jeszcze nie wczytano)
+_history_cache: Optional[List[Dict[str, Any]]] = None
+
+
+def _get_history_path() -> Path:
+    """Ścieżka do pliku historii: PyInstaller _MEIPASS > katalog modułu."""
+    if hasattr(sys, '_MEIPASS'):
+        return Path(getattr(sys, '_MEIPASS')) / _HISTORY_FILE
+    return Path(__file__).parent / _HISTORY_FILE
+
+
+def _merge_continuation_lines(changes: List[str]) -> str:
+    """Scala linie kontynuacji (wcięcie ≥4 spacji) z poprzednią linią."""
+    merged: List[str] = []
+    for line in changes:
+        line = str(line)
+        if line.startswith('    ') and merged and merged[-1].strip():
+            merged[-1] = merged[-1].rstrip() + ' ' + line.strip()
+        else:
+            merged.append(line)
+    return "\n".join(merged)
+
+
+def load_version_history() -> List[Dict[str, Any]]:
+    """
+    Wczytuje historię wersji z pliku danych (raz na sesję).
+
+    Każdy wpis zawiera klucze ``version``, ``date``, ``changes`` oraz
+    przygotowane pola ``text`` (scalona treść) i ``_search`` (małe litery).
+
+    Returns:
+        Lista wersji od najnowszej; pusta lista, gdy pliku nie udało się wczytać.
+    """
+    global _history_cache
+    if _history_cache is not None:
+        return _history_cache
+    try:
+        with open(_get_history_path(), "r", encoding="utf-8") as f:
+            raw: List[Dict[str, Any]] = json.load(f)
+    except (OSError, ValueError):
+        _log.error("Nie można wczytać historii wersji", exc_info=True)
+        raw = []
+    history: List[Dict[str, Any]] = []
+    for item in raw:
+        body = _merge_continuation_lines(list(item.get("changes", [])))
+        version = str(item.get("version", ""))
+        date = str(item.get("date", ""))
+        history.append(
+            {
+                "version": version,
+                "date": date,
+                "changes": item.get("changes", []),
+                "text": body,
+                "_search": f"{version}\n{date}\n{body}".lower(),
+            }
+        )
+    _history_cache = history
+    return history
+
 
 def show_version_history_dialog(parent: Any, app_name: str = "Sesyjka") -> None:
     """
@@ -55,1786 +126,97 @@ def show_version_history_dialog(parent: Any, app_name: str = "Sesyjka") -> None:
     separator = ttk.Separator(main_frame, orient='horizontal')
     separator.pack(fill=tk.X, pady=(0, 15))
 
-    # Scrollable Frame dla zawartości
-    scrollable_frame = ctk.CTkScrollableFrame(main_frame, width=550, height=600)
-    scrollable_frame.pack(fill=tk.BOTH, expand=True)
 
-    # Historia wersji
-    version_history = [  # type: ignore
-        {
-            "version": "0.4.41",
-            "date": "04.05.2026",
-            "changes": [
-                "\ud83d\udc1b NAPRAWA B\u0141\u0118D\u00d3W:\u00b0",
-                "",
-                "\u2705 DIALOG EDYCJI SESJI \u2014 BRAKUJ\u0104CE POLA:",
-                "  \u2022 pola Mistrz Gry, Typ sesji, Tytu\u0142 kampanii/przygody oraz przyciski by\u0142y niewidoczne",
-                "  \u2022 przyczyna: b\u0142\u0105d unpacking krotki (id, nick, grupa) do 2 zmiennych",
-                "  \u2022 naprawa: u\u017cycie indeks\u00f3w p[0], p[1] zamiast for p_id, p_nick in players",
-                "  \u2022 dialog zamieniony na CTkScrollableFrame (jak dialog dodawania)",
-                "",
-                "\u2705 NIEPRAWID\u0141OWA SZEROKO\u015a\u0106 OKNA EDYCJI SYSTEMU RPG:",
-                "  \u2022 przy zaznaczonym VTT okno rozszerza\u0142o si\u0119 do 1100px zamiast ~900px",
-                "  \u2022 naprawiono dla obu przypadk\u00f3w: inicjalnego i po prze\u0142\u0105czeniu checkboxa VTT",
-                "",
-                "\ud83d\udda5\ufe0f PRZEWIJANIE K\u00d3\u0141KIEM MYSZY W COMBOBOXACH:\u00b0",
-                "",
-                "\u2705 POLE SYSTEM RPG W SESJACH:",
-                "  \u2022 k\u00f3\u0142ko myszy przewija list\u0119 system\u00f3w w dialogach dodawania i edycji sesji",
-                "  \u2022 dzia\u0142a r\u00f3wnie\u017c po wpisaniu frazy filtruj\u0105cej \u2014 przewija tylko przefiltrowane pozycje",
-                "",
-                "\u2705 POLA PRZYPISZ DO SYSTEMU I WYDAWCA:",
-                "  \u2022 k\u00f3\u0142ko myszy w comboboxach w dialogach dodawania i edycji systemu RPG",
-                "  \u2022 binding na frame CTkComboBox oraz wewn\u0119trzny _entry (zdarzenia trafiaj\u0105 do _entry)",
-            ],
-        },
-        {
-            "version": "0.4.39",
-            "date": "04.05.2026",
-            "changes": [
-                "\u2728 GRUPY GRACZY (TAGI):\u00b0",
-                "",
-                "\u2705 NOWA KOLUMNA GRUPA W KATALOGU GRACZY:",
-                "  \u2022 pole \u201eGrupa\u201d w formularzach dodawania i edycji gracza",
-                "  \u2022 wiele grup/kampanii po przecinku, np.: Dru\u017cyna A, Kampania 2",
-                "  \u2022 kolumna \u201eGrupa\u201d w tabeli graczy z sortowaniem i wyszukiwaniem",
-                "  \u2022 automatyczna migracja bazy danych (ALTER TABLE gracze ADD COLUMN grupa TEXT)",
-                "",
-                "\u2705 SZYBKIE ZAZNACZANIE GRUPY W SESJACH:",
-                "  \u2022 panel \u201eZaznacz grup\u0119\u201d w dialogu wyboru graczy przy dodawaniu sesji",
-                "  \u2022 panel \u201eZaznacz grup\u0119\u201d w dialogu wyboru graczy przy edycji sesji",
-                "  \u2022 lista rozwijana z wszystkimi unikalnymi tagami graczy",
-                "  \u2022 przycisk \u201eZaznacz\u201d b\u0142yskawicznie zaznacza wszystkich graczy z wybranego tagu",
-                "  \u2022 zachowany limit maksymalnej liczby graczy w sesji",
-                "",
-                "\ud83d\udc1b NAPRAWA B\u0141\u0118D\u00d3W:\u00b0",
-                "",
-                "\u2705 PUSTE TABELE PO STARCIE APLIKACJI:",
-                "  \u2022 widgety CTk budowane przy withdraw() nie renderowa\u0142y si\u0119 po deiconify()",
-                "  \u2022 po zamkni\u0119ciu splash screenu wszystkie zak\u0142adki oznaczane jako _dirty",
-                "  \u2022 aktywna zak\u0142adka od\u015bwie\u017cana po 100 ms od zamkni\u0119cia splash screenu",
-                "",
-                "\u2705 DIALOG ZAPISU EXCEL (FILEDIALOG):",
-                "  \u2022 filedialog.asksaveasfilename(parent=CTkToplevel) powodowa\u0142 b\u0142\u0105d DPI",
-                "  \u2022 fix: parent=main_window + dlg.update() przed wywo\u0142aniem filedialog",
-                "  \u2022 przycisk Zapisz ponownie widoczny na ekranach wysokiego DPI",
-            ],
-        },
-        {
-            "version": "0.4.37",
-            "date": "29.04.2026",
-            "changes": [
-                "🔧 NAPRAWA SELEKCJI GRACZY W DIALOGACH WYBORU:°",
-                "",
-                "✅ TRWAŁY ZBIÓR ZAZNACZONYCH GRACZY (_persistent_sel):",
-                "  • zaznaczenie graczy zachowywane podczas wpisywania tekstu w polu wyszukiwania",
-                "  • flaga _rebuilding blokuje handler <<ListboxSelect>> podczas programatycznego select_set",
-                "  • naprawa błędu UnboundLocalError (‘-=’ w domknięciu) przez zastąpienie na .difference_update()",
-                "  • działa dla obu dialogów: dodawanie i edycja sesji",
-                "",
-                "✨ SESJE GM-LESS:°",
-                "",
-                "✅ NOWY CHECKBOX \u201eGRA GM-LESS\u201d W SEKCJI MISTRZA GRY:",
-                "  • zaznaczenie disabluje przycisk \u201eWybierz MG...\” i wyświetla N/A w polu MG",
-                "  • sesja zapisywana z mg_id = NULL w bazie danych",
-                "  • kolumna Mistrz Gry w tabeli sesji wyświetla N/A dla sesji GM-less",
-                "  • dialog edycji: automatyczne ustawienie checkboxa gdy mg_id IS NULL",
-                "",
-                "🔧 MIGRACJA BAZY DANYCH:",
-                "  • _migrate_mg_id_nullable() zmienia mg_id INTEGER NOT NULL \u2192 INTEGER (jednorazowo przy starcie)",
-                "  • nowe bazy tworzone od razu z nullable mg_id",
-            ],
-        },
-        {
-            "version": "0.4.35",
-            "date": "28.04.2026",
-            "changes": [
-                "⚡ OPTYMALIZACJA WYDAJNOŚCI — DIALOGI SESJI:°",
-                "",
-                "✅ OKNA WYBORU GRACZY I MISTRZA GRY (DODAWANIE I EDYCJA SESJI):",
-                "  • zastąpiono CTkCheckBox/CTkRadioButton na tk.Listbox — 1 widget zamiast ~87×5=435 operacji Tk",
-                "  • eliminacja zamrażania UI przy otwieraniu dialogów wyboru (87+ graczy)",
-                "  • naprawa znikającego przycisku Dodaj gracza w CTkScrollableFrame przy dużej liczbie graczy",
-                "  • zmiana obowiązuje w obu kontekstach: dialog dodawania i edycji sesji",
-                "",
-                "✅ TABELA SESJI — _build_rows (ctk_table.py):",
-                "  • zastąpiono dopasowanie pozycyjne ramek (frame[i] vs data[i]) dopasowaniem po ID wiersza",
-                "  • przy posortowaniu malejącym i dodaniu nowej sesji: ~484×pack() zamiast ~4356 destroy+recreate",
-                "  • eliminacja wielosekundowego zamrożenia głównego okna przy filtrowaniu i sortowaniu",
-            ],
-        },
-        {
-            "version": "0.4.34",
-            "date": "28.04.2026",
-            "changes": [
-                "\ud83d\udce4 ZARZ\u0104DZANIE BAZAMI DANYCH \u2014 TRANSFER:\u00b0",
-                "",
-                "\u2705 EKSPORT BAZ DANYCH (db_transfer_dialog):",
-                "  \u2022 zapis 4 baz SQLite do pliku ZIP (jeden plik archiwum)",
-                "  \u2022 zapis do folderu (osobne pliki .db)",
-                "  \u2022 nowy format: eksport do arkusza Excel (.xlsx) \u2014 ka\u017cda tabela SQLite jako osobny arkusz",
-                "  \u2022 przycisk \u201eEksportuj bazy danych\u201d w dialogu zarz\u0105dzania bazami",
-                "",
-                "\u2705 IMPORT W\u0141ASNYCH DANYCH:",
-                "  \u2022 wczytanie baz z pliku ZIP lub folderu \u2014 obs\u0142uga obu format\u00f3w",
-                "  \u2022 automatyczny backup bie\u017c\u0105cych baz przed zast\u0105pieniem",
-                "  \u2022 walidacja zawarto\u015bci \u2014 sprawdzenie obecno\u015bci plik\u00f3w .db przed importem",
-                "  \u2022 potwierdzenie z list\u0105 znalezionych plik\u00f3w przed nadpisaniem",
-                "",
-                "\u2705 TRYB GO\u015aCIA \u2014 PRZEGL\u0104DANIE OBCYCH BAZ:",
-                "  \u2022 otwarcie baz innego u\u017cytkownika z pliku ZIP lub folderu tylko do odczytu",
-                "  \u2022 ribbon wy\u015bwietla pomara\u0144czowy pasek informuj\u0105cy o aktywnym trybie go\u015bcia",
-                "  \u2022 przycisk \u201eWr\u00f3\u0107 do swoich danych\u201d przywraca w\u0142asn\u0105 baz\u0119 i wy\u0142\u0105cza tryb go\u015bcia",
-                "  \u2022 statystyki odwi\u0105zuj\u0105 si\u0119 od w\u0142asnej bazy na czas przegl\u0105dania",
-                "",
-                "\ud83d\udd12 TRYB GO\u015aCIA \u2014 OCHRONA PRZED ZAPISEM:\u00b0",
-                "",
-                "\u2705 PE\u0141NA BLOKADA EDYCJI W TRYBIE GO\u015aCIA:",
-                "  \u2022 ikona \u270f\ufe0f, podw\u00f3jne klikni\u0119cie i menu PPM zablokowane we wszystkich zak\u0142adkach",
-                "  \u2022 nowy _fire_edit_cb() w CTkDataTable \u2014 centralna brama blokuj\u0105ca przed wywo\u0142aniem _edit_cb",
-                "  \u2022 guard is_guest_mode() w _on_edit() i _del() we wszystkich modu\u0142ach (Systemy, Sesje, Gracze, Wydawcy)",
-                "  \u2022 guard w save_session() w dialogach dodawania i edycji sesji",
-                "",
-                "\u26a1 NAPRAWA ZAMRO\u017bENIA PO KLIKNIi\u0118CIU \u201eWR\u00d3\u0106 DO SWOICH DANYCH\u201d:",
-                "  \u2022 refresh_statistics() wywo\u0142ywane synchronicznie blokowa\u0142o w\u0105tek UI na kilka sekund",
-                "  \u2022 usuni\u0119to z enter_guest_mode() i exit_guest_mode() \u2014 statystyki odswiezaj\u0105 si\u0119 leniwie",
-                "",
-                "\ud83d\udcca EKSPORT BAZ DO EXCELA:",
-                "  \u2022 nowa opcja \u201eExcel (.xlsx)\u201d w oknie transferu danych obok eksportu ZIP",
-                "  \u2022 ka\u017cda tabela z ka\u017cdej bazy SQLite jako osobny arkusz (format: \u201eLabel \u2014 tabela\u201d)",
-                "  \u2022 wiersz nag\u0142\u00f3wkowy z niebieskim t\u0142em i bia\u0142\u0105 pogrubion\u0105 czcionk\u0105",
-                "  \u2022 auto-szeroko\u015b\u0107 kolumn (maks. 50 znak\u00f3w)",
-                "  \u2022 nowa funkcja export_databases_excel() w database_manager.py",
-                "  \u2022 wymagany pakiet: openpyxl\u22653.1.5",
-                "",
-                "\ud83d\udccb REQUIREMENTS.TXT:",
-                "  \u2022 dodano plik z zablokowanymi wersjami wszystkich zale\u017cno\u015bci",
-                "  \u2022 openpyxl==3.1.5, et_xmlfile==2.0.0 wpisane jawnie",
-            ],
-        },
-        {
-            "version": "0.4.30",
-            "date": "28.04.2026",
-            "changes": [
-                "\ud83d\udc1b NAPRAWA WYDAJNO\u015aCI I B\u0141\u0118D\u00d3W DIALOG\u00d3W:\u00b0",
-                "",
-                "\u2705 OKNO WYBORU GRACZY (DODAWANIE I EDYCJA SESJI):",
-                "  \u2022 usuni\u0119to rekurencyjn\u0105 kaskad\u0119 var.trace + v.set(False) w validate_players_selection",
-                "  \u2022 zamieniono trace(\u201ew\u201d) na command= w CTkCheckBox \u2014 callback tylko od klikni\u0119cia",
-                "  \u2022 checkboxy graczy \u0142adowane partiami po 12 przez after(0) \u2014 UI nie zamarza przy 87 graczach",
-                "",
-                "\u2705 DIALOG FILTROWANIA SESJI:",
-                "  \u2022 powi\u0119kszono okno do 820\u00d7580 z w\u0142\u0105czonym resizable=True",
-                "  \u2022 columnconfigure(1, weight=1) przeniesione przed budow\u0105 wierszy filtr\u00f3w",
-                "  \u2022 reflow scalony \u2014 jeden update_idletasks + _run_all_reflows zamiast 4 osobnych after(150)",
-                "  \u2022 brak samoplanowania after(50) \u2014 obs\u0142uga przez bind(<Configure>) przy ka\u017cdym resize",
-            ],
-        },
-        {
-            "version": "0.4.29",
-            "date": "28.04.2026",
-            "changes": [
-                "\ud83d\udc1b NAPRAWA OKNA WYBORU GRACZY I MG:\u00b0",
-                "",
-                "\u2705 DIALOG WYBORU GRACZY \u2014 DODAWANIE I EDYCJA SESJI:",
-                "  \u2022 CTkScrollableFrame nie mia\u0142 ustawionej jawnej wysoko\u015bci (brak parametru height=)",
-                "  \u2022 przy 60+ graczach okno rozci\u0105ga\u0142o si\u0119 na ~2000px zamiast scrollowa\u0107",
-                "  \u2022 naprawiono przez dodanie height=300 w 4 miejscach (gracze + MG, dodaj + edytuj)",
-            ],
-        },
-        {
-            "version": "0.4.28",
-            "date": "27.04.2026",
-            "changes": [
-                "\ud83d\udd27 ULEPSZENIA UX W TABELACH:\u00b0",
-                "",
-                "\u2705 PODW\u00d3JNE KLIKNI\u0118CIE \u2014 EDYCJA:",
-                "  \u2022 dwuklik na dowolnym wierszu tabeli otwiera dialog edycji (CTkDataTable)",
-                "  \u2022 obs\u0142uga we wszystkich zak\u0142adkach: Systemy RPG, Sesje RPG, Gracze, Wydawcy",
-                "",
-                "\u2705 PRZYCISK EDYCJI W KOLUMNACH:",
-                "  \u2022 nowa opcja \u201ePokaż przycisk edycji\u201d w dialogu Kolumny (sekcja Opcje tabeli)",
-                "  \u2022 ukrycie ikonki \u270f\ufe0f gdy edycja przez dwuklik jest wystarczaj\u0105ca",
-                "  \u2022 ustawienie zapisywane w settings.json osobno dla ka\u017cdej zak\u0142adki",
-                "",
-                "\ud83d\udd0d ZAK\u0141ADKA GRACZE \u2014 ZARZ\u0104DZANIE KOLUMNAMI:\u00b0",
-                "",
-                "  \u2022 nowy przycisk \u201eKolumny\u201d w g\u00f3rnym pasku zak\u0142adki Gracze",
-                "  \u2022 dialog z checkboxami widoczno\u015bci kolumn i przyciskami \u2191/\u2193 do zmiany kolejno\u015bci",
-                "  \u2022 ustawienia widoczno\u015bci i kolejno\u015bci kolumn zapisywane w settings.json",
-                "  \u2022 opcja \u201ePokaż przycisk edycji\u201d w sekcji Opcje tabeli",
-                "",
-                "\ud83c\udfb2 WYB\u00d3R SYSTEMU RPG W FORMULARZACH SESJI:\u00b0",
-                "",
-                "\u2705 WYSZUKIWANIE W POLU SYSTEMU:",
-                "  \u2022 pole System RPG w formularzach dodaj/edytuj sesj\u0119 jest teraz filtrowalne",
-                "  \u2022 wpisanie fragmentu nazwy w\u0105\u017ci list\u0119 propozycji w czasie rzeczywistym",
-                "  \u2022 walidacja sprawdza czy wybrana warto\u015b\u0107 pochodzi z listy",
-                "",
-                "\u2705 DODAJ SYSTEM Z POZIOMU FORMULARZA SESJI:",
-                "  \u2022 przycisk \u2795 obok pola systemu otwiera formularz dodawania nowego systemu RPG",
-                "  \u2022 po zapisaniu lista system\u00f3w w formularzu sesji od\u015bwie\u017ca si\u0119 automatycznie",
-                "  \u2022 zak\u0142adka Systemy RPG w g\u0142\u00f3wnym oknie r\u00f3wnie\u017c jest od\u015bwie\u017cana",
-                "",
-                "\u2705 POLSKA KOLEJNO\u015a\u0106 SORTOWANIA:",
-                "  \u2022 systemy RPG w formularzu sesji sortowane z uwzgl\u0119dnieniem polskich znak\u00f3w",
-                "  \u2022 wcze\u015bniej \u0105, \u0107, \u0119, \u0142, \u0144, \u00f3, \u015b, \u017a, \u017c trafia\u0142y na koniec listy (b\u0142\u0105d sortowania SQLite)",
-            ],
-        },
-        {
-            "version": "0.4.22",
-            "date": "22.04.2026",
-            "changes": [
-                "\ud83d\udd27 UPROSZCZENIE HIERARCHII SYSTEM\u00d3W RPG:\u00b0",
-                "",
-                "  \u2022 struktura 2-poziomowa: System \u2192 wszystkie pozycje (PG i suplementy)",
-                "  \u2022 kolumna \u201eSystem g\u0142\u00f3wny\u201d zawsze pokazuje nazw\u0119 systemu gry",
-                "  \u2022 PG wy\u015bwietlane przed suplementami (sortowanie po typie, potem alfabetycznie)",
-                "",
-                "\ud83d\udc1b NAPRAWIONE B\u0141\u0118DY ZAPIS\u00d3W:\u00b0",
-                "",
-                "  \u2022 edycja systemu/PG zachowuje system_glowny_id (poprzednio resetowane do None)",
-                "  \u2022 dodawanie suplementu poprawnie zapisuje system_gry_id",
-                "",
-                "\ud83d\udd04 OD\u015aWIE\u017bANIE ZAK\u0141ADKI WYDAWCY:\u00b0",
-                "",
-                "  \u2022 po dodaniu wydawcy z formularza PG/suplementu tabela Wydawcy od\u015bwie\u017ca si\u0119 natychmiast",
-                "  \u2022 wcze\u015bniej wymaga\u0142o re-renderu okna (np. zmiana trybu jasny/ciemny)",
-                "",
-                "\ud83d\udcd6 UZUPE\u0141NIONA INSTRUKCJA OBS\u0141UGI:\u00b0",
-                "",
-                "  \u2022 opis przycisku Kolumny: zmiana kolejno\u015bci \u2191/\u2193 i zapis w settings.json",
-                "  \u2022 opis checkbox \u201eUkryj systemy\u201d \u2014 ukrywa wiersze-systemy, pokazuje tylko PG i suplementy",
-                "  \u2022 opis r\u0119cznej zmiany szeroko\u015bci kolumn przez przeci\u0105ganie kraw\u0119dzi nag\u0142\u00f3wka",
-            ],
-        },
-        {
-            "version": "0.4.20",
-            "date": "21.04.2026",
-            "changes": [
-                "💰 CENY PER FORMA POSIADANIA:°",
-                "",
-                "✅ NOWE POLA CEN:",
-                "  \u2022 Cena Fizyczna, Cena PDF, Cena VTT — osobna cena dla ka\u017cdej formy",
-                "  \u2022 pola wy\u015bwietlane dynamicznie po zaznaczeniu Fizyczny/PDF/VTT",
-                "  \u2022 automatyczna migracja danych z \u201ecena_zakupu\u201d do nowych p\u00f3l",
-                "  \u2022 obs\u0142uga w dialogach dodawania i edycji systemu",
-                "",
-                "🎛️ MULTI-SELECT FILTRY WE WSZYSTKICH ZAKŁADKACH:°",
-                "",
-                "✅ TOGGLE-BUTTONY ZAMIAST COMBOBOX:",
-                "  \u2022 Systemy RPG: Typ, J\u0119zyk, Status, Wydawca, Posiadanie",
-                "  \u2022 Sesje RPG: Rok, System, Typ sesji, Mistrz Gry",
-                "  \u2022 Gracze: P\u0142e\u0107, Status",
-                "  \u2022 Wydawcy: Kraj, Strona WWW",
-                "  \u2022 brak zaznaczenia = poka\u017c wszystko",
-                "",
-                "📐 ZAWIJANIE PRZYCISKÓW FILTRÓW:°",
-                "",
-                "  \u2022 przy du\u017cej liczbie opcji przyciski zawijaj\u0105 si\u0119 do nowych wierszy",
-                "  \u2022 brak ucinania opcji przy w\u0105skim oknie",
-                "  \u2022 dynamiczne przeliczanie przy zmianie szeroko\u015bci okna",
-                "",
-                "⚡ OPTYMALIZACJA ROZWIJANIA/ZWIJANIA HIERARCHII:°",
-                "",
-                "  \u2022 _cached_lp na ramkach wierszy CTkDataTable",
-                "  \u2022 z\u0142o\u017cono\u015b\u0107 O(k) \u2014 tylko modyfikowane wiersze, nie ca\u0142a tabela",
-                "  \u2022 pierwsze rozwini\u0119cie ~5 ms, zwijanie/re-rozwini\u0119cie ~2 ms",
-                "",
-                "\ud83d\udcc4 ZMIANA KOLEJNO\u015aCI KOLUMN:\u00b0",
-                "",
-                "  \u2022 dialog \u201eWidoczno\u015b\u0107 i kolejno\u015b\u0107 kolumn\u201d: przyciski \u2191/\u2193 do przestawiania",
-                "  \u2022 kolejno\u015b\u0107 zapisywana w settings.json i odtwarzana przy starcie",
-                "  \u2022 parametr col_order w CTkDataTable \u2014 renderowanie w dowolnej permutacji",
-                "",
-                "\ud83d\udc41\ufe0f CHECKBOX \u201eUkryj systemy\u201d (SYSTEMY RPG):\u00b0",
-                "",
-                "  \u2022 prze\u0142\u0105cznik w pasku tabeli Systemy RPG",
-                "  \u2022 po w\u0142\u0105czeniu: wiersze-systemy ukryte, widoczne tylko PG i suplementy",
-                "  \u2022 przy prze\u0142\u0105czeniu: automatycznie zwija wszystkie i wy\u0142\u0105cza Rozwi\u0144 wszystkie",
-            ],
-        },
-        {
-            "version": "0.4.16",
-            "date": "21.04.2026",
-            "changes": [
-                "🔧 PRZEBUDOWA DIALOGÓW SYSTEMÓW RPG:°",
-                "",
-                "✅ DIALOG EDYCJI — PRZYPISZ DO SYSTEMU:",
-                "  • pole „Przypisz do systemu” (powiązanie z katalogiem gier)",
-                "    zamiast tekstowego pola nazwy systemu głównego",
-                "  • przycisk ➕ Dodaj system bez zamykania formularza edycji,",
-                "    nowy system od razu widoczny na liście wyboru",
-                "  • pre-wypełnienie z zapisanego system_gry_id przy otwarciu",
-                "",
-                "🗑️ USUNIĘCIE „SYSTEM GŁÓWNY (OPCJONALNIE)”:°",
-                "",
-                "  • suplementy i PG są równorzędne wobec systemu nadrzędnego",
-                "  • hierarchia wyłącznie przez „Przypisz do systemu” (systemy_gry)",
-                "  • usunięte z dialogu dodawania i edycji",
-                "",
-                "🐛 NAPRAWIONE BŁĘDY:°",
-                "",
-                "  • „tuple index out of range” przy otwieraniu dialogu edycji",
-                "    — brakująca kolumna system_gry_id w zapytaniu SELECT",
-            ],
-        },
-        {
-            "version": "0.4.13",
-            "date": "21.04.2026",
-            "changes": [
-                "�️ PRZEBUDOWA HIERARCHII SYSTEMÓW RPG:°",
-                "",
-                "✅ NOWA STRUKTURA TRÓJPOZIOMOWA:",
-                "  • System (systemy_gry) → Podręczniki Główne → Suplementy",
-                "  • tabela CTkDataTable z rozwijaniem [+]/[-]/[ ]",
-                "  • expand/collapse dla każdego systemu niezależnie",
-                "  \u2022 przycisk \u201eRozwiń wszystkie\u201d / \u201eZwiń wszystkie\u201d",
-                "  • PG wyświetlane przed suplementami, oba sortowane po nazwie",
-                "",
-                "✅ TRÓJKOLOROWE WIERSZE SYSTEMU:",
-                "  • szary — brak pozycji (pusty system)",
-                "  • niebieski — tylko suplementy bezpośrednie (bez PG)",
-                "  • złoty/amber — system ma Podręczniki Główne",
-                "",
-                "✅ RIBBON — NOWE PRZYCISKI SYSTEMÓW:",
-                "  • ✚ Dodaj System — nowy wpis w katalogu systemów",
-                "  • ✚ Dodaj PG/Suplement — podręcznik lub suplement do systemu",
-                "  • 🗑 Usuń — usuwa zaznaczony wiersz",
-                "  • ⚙ Migruj dane — kreator migracji starych danych",
-                "    (widoczny tylko gdy potrzebna migracja, znika po zakończeniu)",
-                "",
-                "✅ DIALOGI DODAWANIA I EDYCJI PG:",
-                "  • tytuł: „Dodaj podręcznik lub suplement”",
-                "  • pole „Nazwa/Tytuł *”",
-                "  • przycisk ➕ Dodaj wydawcę — bez zamykania formularza,",
-                "    nowy wydawca automatycznie zaznaczany",
-                "",
-                "🐛 NAPRAWIONE BŁĘDY HIERARCHII:°",
-                "",
-                "  • _on_toggle_expand_all — iteracja po games (poprawny zasięg)",
-                "  • sortowanie Wydawca/Język — agregacja z pg_by_game",
-                "    (g[2] na poziomie systemu_gry była zawsze pusta)",
-                "  • dodano sortowanie po Status, Posiadanie, Cena",
-                "  • supl_direct_by_game — suplementy z system_gry_id ale",
-                "    bez PG-rodzica teraz poprawnie trafiają pod swój System",
-                "    w drzewie zamiast pozostawać jako osierocone (!)",
-                "  • dialog \u201eDodaj do systemu: ...\u201d ukrywa pola",
-                "    \u201eSystem g\u0142\u00f3wny\u201d i \u201elub wpisz nazw\u0119:\u201d \u2014 zb\u0119dne gdy",
-                "    system jest ju\u017c znany z kontekstu (preset_game_id)",
-                "",
-                "⚡ NAPRAWA FLICKERA PRZY ZMIANIE TRYBU:°",
-                "",
-                "  • _rebuild_tab() przekazuje preloaded data z cache",
-                "    do fill_*_tab() — rebuild synchroniczny bez spawnu wątku",
-                "  • update_idletasks() w toggle_mode() renderuje nowe widgety",
-                "    przed przywróceniem alpha=1 — brak widocznego przebłysku",
-                "",
-                "🎬 SPLASH SCREEN I POMOC:°",
-                "",
-                "  • splash_screen.py — splash w klimacie TTRPG (Toplevel,",
-                "    nie tk.Tk), ciemne tło, złote runy, 2 s po starcie",
-                "  • help_dialog.py — instrukcja obsługi z przyciskiem ❓ Pomoc",
-                "    w ribbonie; opis wszystkich zakładek i funkcjonalności",
-                "",
-                "🔧 RĘCZNA ZMIANA SZEROKOŚCI KOLUMN:°",
-                "",
-                "  • przeciąganie krawędzi nagłówka kolumny w CTkDataTable",
-                "  • szerokości zapisywane w settings.json i odtwarzane",
-                "    przy kolejnym uruchomieniu aplikacji",
-            ],
-        },
-        {
-            "version": "0.3.34",
-            "date": "20.04.2026",
-            "changes": [
-                "📅 GRAFICZNY KALENDARZ DAT:°",
-                "",
-                "✅ DIALOG_UTILS.PY — open_calendar_picker():°",
-                "",
-                "  • nowa funkcja open_calendar_picker(parent, initial_date)",
-                "    w dialog_utils.py",
-                "  • otwiera modalne okno tk.Toplevel z widgetem",
-                "    tkcalendar.Calendar — pełny widok miesiąca",
-                "  • automatyczne dostosowanie kolorów do trybu",
-                "    ciemnego/jasnego (ctk.get_appearance_mode())",
-                "  • podwójne kliknięcie na dacie = szybkie zatwierdzenie",
-                "  • Anuluj — data w polu nie zmienia się",
-                "",
-                "✅ SESJE_RPG_DIALOGS.PY:",
-                "  • przycisk 📅 w dialogach Dodaj sesję i Edytuj sesję",
-                "    używa teraz open_calendar_picker zamiast askstring",
-                "  • usunięty zbędny import simpledialog",
-                "",
-                "🗂️ DODAJ SESJĘ DO ISTNIEJĄCEJ KAMPANII:°",
-                "",
-                "✅ SESJE_RPG.PY — menu PPM:",
-                "  • nowa opcja \u201eDodaj sesj\u0119 do istniej\u0105cej kampanii\u201c",
-                "    pojawia się wyłącznie na sesjach typu Kampania",
-                "  • pobiera z bazy: system, liczbę graczy, MG,",
-                "    listę graczy i tytuł kampanii",
-                "  • otwiera dialog dodawania sesji z prefillowanymi",
-                "    polami — wszystkie wartości można zmienić",
-                "",
-                "✅ SESJE_RPG_DIALOGS.PY — prefill:",
-                "  • dodaj_sesje_rpg() przyjmuje nowy parametr",
-                "    prefill: Optional[Dict[str, Any]]",
-                "  • obsługiwane klucze: system_id, liczba_graczy,",
-                "    player_ids, mg_id, tytul_kampanii",
-                "  • checkbox Kampania zaznaczany automatycznie",
-                "",
-                "🔧 INNE POPRAWKI:°",
-                "",
-                "  • .vscode/tasks.json: usunięte zadanie Test Configuration",
-                "    (nieistniejące config.py), zaktualizowane nazwy",
-                "  • .vscode/launch.json: usunięte przestarzałe debugOptions,",
-                "    brakujące .env, błędna wersja schematu 0.2.2",
-                "  • .github/copilot-instructions.md: zaktualizowany",
-                "    do aktualnego stacku i konwencji projektu",
-            ],
-        },
-        {
-            "version": "0.3.32",
-            "date": "10.04.2026",
-            "changes": [
-                "🎛️ WYBÓR WIDOCZNYCH KOLUMN:°",
-                "",
-                "✅ SYSTEMY RPG I SESJE RPG:",
-                '  • nowy przycisk „Kolumny" w górnym pasku obu zakładek',
-                "  • dialog z checkboxami — ukryj/pokaż dowolne kolumny tabeli",
-                "  • kolumny ID/symbol zawsze widoczne (nie można ukryć)",
-                "  • preferencje widoczności zapisywane w settings.json",
-                "  • odtwarzane przy starcie aplikacji",
-                "",
-                "🔧 CTK_TABLE.PY — hidden_cols:°",
-                "",
-                "  • nowy parametr hidden_cols: Optional[List[int]]",
-                "    w konstruktorze CTkDataTable",
-                "  • nagłówki i komórki ukrytych kolumn pomijane",
-                "    w renderowaniu (dane w callbackach pełne)",
-                "",
-                "🐛 NAPRAWIONE BŁĘDY:°",
-                "",
-                "  • Pyright: reportPossiblyUnbound dla _PILImage/_PILImageTk",
-                "    (inicjalizacja jako Any = None przed blokiem try)",
-                "  • Pyright: błędy call-arg dla configure(bg=...) na widgetach",
-                "    tkinter — cast do Any w systemy_rpg.py i sesje_rpg.py",
-                "  • Odświeżanie tabeli po zmianie kolumn: usunięcie cache",
-                "    przed przebudową wymusza pełny rebuild z nowym hidden_cols",
-            ],
-        },
-        {
-            "version": "0.3.31",
-            "date": "18.03.2026",
-            "changes": [
-                "📈 NAPRAWA STATYSTYKI — WYKRES SYSTEMÓW:°",
-                "",
-                "✅ STATYSTYKI.PY — ROSNąCE OKNO:",
-                "  • pack_propagate(False) na ramce wykresu",
-                "    — canvas matplotlib nie rozciąga już okna",
-                "  • figsize dynamiczne: winfo_width()/height()",
-                "    zamiast max(3, len * 0.4)",
-                "  • update_idletasks() po destroy — poprawny",
-                "    pomiar dostępnej przestrzeni",
-                "  • Etykieta podsumowania pakowana BOTTOM",
-                "    przed canvasem — nie wypycha wykresu",
-                "",
-                "🖼️ LAYOUT KOLUMN STATYSTYK:°",
-                "",
-                "  • Kolumny 0 i 1: równe (weight=1, min 280px)",
-                "  • Kolumna 2 (systemy): szersza",
-                "    (weight=3, min 520px)",
-                "  • Nagłówek pierwszej statystyki: wraplength=240",
-                "    — tekst zawija się zamiast rozszerzać kolumnę",
-            ],
-        },
-        {
-            "version": "0.3.30",
-            "date": "18.03.2026",
-            "changes": [
-                "⚙️ REFAKTORYZACJA KODU — RUNDY 1–4:°",
-                "",
-                "✅ BLACK FORMATTER + PYRIGHT:",
-                "  • Black zastosowany do wszystkich 14 plików",
-                "    źródłowych — linie do 99 znaków",
-                "  • pyrightconfig.json — konfiguracja type checkera",
-                "  • Adnotacje typów (PEP 484) we wszystkich",
-                "    nowych funkcjach i metodach",
-                "",
-                "✅ SQLITE — DOBRE PRAKTYKI:",
-                "  • conn.row_factory = sqlite3.Row w każdym",
-                "    połączeniu — dostęp do kolumn po nazwie",
-                "  • PRAGMA foreign_keys = ON — integralność",
-                "    referencyjna wymuszona w całej aplikacji",
-                "  • Context managery (with sqlite3.connect as conn:)",
-                "    — automatyczny commit/rollback",
-                "",
-                "✅ THREADING — GUI NIE BLOKUJE:",
-                "  • fill_systemy_rpg_tab(), fill_sesje_rpg_tab(),",
-                "    fill_gracze_tab(), fill_wydawcy_tab():",
-                "    SQL/IO przeniesione do wątku tła",
-                "    — widget.after() do aktualizacji UI",
-                "  • update_system_chart(): matplotlib + SQL",
-                "    w wątku tła, naprawa N+1 query",
-                "    (batch WHERE id IN (?) zamiast per-system)",
-                "",
-                "🐛 NAPRAWA UI:°",
-                "",
-                "  • wraplength zmniejszone do 510 px — tekst",
-                "    nie wychodzi poza krawędź dialogów",
-            ],
-        },
-        {
-            "version": "0.3.28",
-            "date": "10.03.2026",
-            "changes": [
-                "🔍 WYSZUKIWANIE NA ŻYWO:°",
-                "",
-                "✅ ZAKŁADKI GŁÓWNE:",
-                '  • Pole „Wyszukaj“ w górnym pasku',
-                "    zakładek Gracze, Sesje RPG, Wydawcy,",
-                "    Systemy RPG — filtrowanie w czasie rzeczywistym",
-                "  • Systemy RPG: wyszukiwanie uwzględnia",
-                "    suplementy — wyświetla całą grupę",
-                "    gdy nazwa głównego lub suplementu pasuje",
-                "  • Wyszukiwanie aktywuje automatyczne",
-                "    rozwinięcie drzewa systemów",
-                "",
-                "✅ DIALOGI WYBORU GRACZY I MG:",
-                '  • Pole „🔍 Szukaj gracza…“ w oknach',
-                "    wyboru graczy i MG (dodaj/edytuj sesję)",
-                "  • Natychmiastowe filtrowanie listy",
-                "    checkboxów i radiobutonów przy wpisywaniu",
-                "",
-                "🔧 NAPRAWA DARK MODE FLASH:°",
-                "",
-                "✅ DIALOG_UTILS.PY — NOWE FUNKCJE:",
-                "  • create_ctk_toplevel() — tworzy CTkToplevel",
-                "    bez problematycznego cyklu withdraw/update",
-                "    eliminuje flicker trybu ciemnego na Windows",
-                "  • apply_dark_titlebar() — DWM API bez withdraw",
-                "  • Debug logging do pliku debug_sesyjka.log",
-                "    (RotatingFileHandler 2 MB, monkey-patch tracker)",
-            ],
-        },
-        {
-            "version": "0.3.27",
-            "date": "08.03.2026",
-            "changes": [
-                "🖊️ DIALOGI WYBORU GRACZY I MG:°",
-                "",
-                "✅ SESJE_RPG_DIALOGS.PY — NOWE FUNKCJE:",
-                "  • Przycisk '➕ Dodaj gracza' w oknie",
-                "    wyboru graczy i MG bez zamykania dialogu",
-                "  • Lista graczy odświeżana natychmiast",
-                "    po dodaniu nowego gracza",
-                "  • Zakładka Gracze odświeżana automatycznie",
-                "    po dodaniu gracza z dialogu wyboru",
-                "",
-                "🔧 PRZEPISANIE DIALOGÓW NA CUSTOMTKINTER:°",
-                "",
-                "✅ SESJE_RPG_DIALOGS.PY — REFAKTOR:",
-                "  • CTkToplevel zamiast tk.Toplevel",
-                "  • CTkScrollableFrame zamiast Canvas",
-                "    + Scrollbar + Frame + mousewheel bind",
-                "  • CTkCheckBox zamiast ttk.Checkbutton",
-                "  • CTkRadioButton zamiast ttk.Radiobutton",
-                "  • Usunięto ręczne apply_dark_theme_to_dialog()",
-                "",
-                "✅ UJEDNOLICONO KOLORY TEKSTU:",
-                "  • text_color_disabled identyczny z text_color",
-                "    — zablokowane checkboxy wyglądają jak radiobutony",
-                "",
-                "🔧 SYSTEMY RPG — PRZEŁĄCZNIK ROZWIŃ/ZWIŃ:°",
-                "",
-                "✅ SYSTEMY_RPG.PY — NOWY SWITCH:",
-                "  • CTkSwitch 'Rozwiń wszystkie' w pasku górnym",
-                "  • Stan zapamiętywany w settings.json",
-                "  • Przywracany przy starcie aplikacji",
-                "",
-                "🐛 POPRAWKI:°",
-                "",
-                "  • Kolumna Lp. zawsze pokazuje numerację",
-                "    bezwzględną (niezależną od filtrowania)",
-            ],
-        },
-        {
-            "version": "0.3.26",
-            "date": "05.03.2026",
-            "changes": [
-                "🔧 MIGRACJA MODUŁU SYSTEMÓW RPG:°",
-                "",
-                "✅ SYSTEMY_RPG.PY — NOWY WIDOK TABELI:",
-                "  • Tabela przebudowana z tksheet.Sheet",
-                "    na CTkDataTable — spójny z graczami,",
-                "    sesjami i wydawcami",
-                "  • Hierarchia: podręczniki główne",
-                "    + suplementy ([+]/[-] expand/collapse)",
-                "  • Pełne 13 kolumn: Lp., ID, Nazwa, Typ,",
-                "    System gł., Rodzaj, Wydawca, Fizyczna,",
-                "    PDF, VTT, Język, Status, Cena",
-                "  • Zaawansowane filtry, sortowanie",
-                "    po wszystkich kolumnach, menu PPM",
-                "  • Przycisk ✎ Edytuj z ikoną PNG w wierszu",
-                "",
-                "⚡ OPTYMALIZACJA SESJI RPG — N+1 QUERIES:°",
-                "",
-                "✅ SESJE_RPG.PY — ZAPYTANIA ZBIORCZE:",
-                "  • Zastąpienie wzorca N+1 zapytaniami",
-                "    zbiorczymi (JOIN / GROUP BY)",
-                "  • 2800+ połączeń DB → 3 niezależnie",
-                "    od liczby rekordów sesji",
-                "  • get_all_sessions() oraz get_all_systems()",
-                "    przepisane na bulk queries",
-                "",
-                "⚡ OPTYMALIZACJA EXPAND/COLLAPSE SUPLEMENTÓW:°",
-                "",
-                "✅ CTKTABLE.PY — METODA toggle_expand():",
-                "  • Nowa metoda toggle_expand(parent_id,",
-                "    expand, child_rows) — omija _build_rows",
-                "  • pack(after=...) / pack_forget() zamiast",
-                "    przebudowy całej tabeli",
-                "  • Złożoność O(k) gdzie k = liczba suplementów,",
-                "    niezależna od rozmiaru tabeli",
-                "  • _cell_labels na każdej ramce wiersza —",
-                "    aktualizacja symbolu [+]/[-] jednym",
-                "    Label.configure() bez destroy/create",
-                "  • Pula ramek (_row_pool) reużywana przy",
-                "    ponownym rozwinięciu (zero widget create)",
-                "",
-                "⚡ WYNIKI POMIARÓW:",
-                "  • Pierwsze rozwinięcie: ~450 ms → ~5 ms",
-                "  • Zwinięcie / re-rozwinięcie: ~120 ms → ~2 ms",
-            ],
-        },
-        {
-            "version": "0.3.25",
-            "date": "04.03.2026",
-            "changes": [
-                "✅ KOLUMNA NUMERÓW WIERSZY (Lp.):°",
-                "",
-                "✅ CTKTABLE.PY — NOWY PARAMETR:",
-                "  • show_row_numbers=True — dodaje kolumnę",
-                "    'Lp.' przed danymi (36px, centrowana)",
-                "  • Obsługa hover/selekcji/PPM tak samo",
-                "    jak pozostałe komórki",
-                "  • Domyślnie False — wsteczna kompatybilność",
-                "",
-                "✅ WŁĄCZONO W MODUŁACH:",
-                "  • sesje_rpg.py, gracze.py, wydawcy.py:",
-                "    show_row_numbers=True",
-                "",
-                "⚡ OPTYMALIZACJA RE-RENDERU UI:°",
-                "",
-                "✅ DEBOUNCE SLIDERA CZCIONEK:",
-                "  • Slider aktualizuje tylko etykietę %",
-                "    podczas przeciągania",
-                "  • Pełny rebuild odpala się 250 ms po",
-                "    zatrzymaniu (after() z anulowaniem)",
-                "  • Ribbon rebuild w withdraw/deiconify —",
-                "    eliminuje flicker okna",
-                "",
-                "✅ LAZY REBUILD ZAKŁADEK:",
-                "  • toggle_mode i zmiana skali czcionek",
-                "    oznaczają zakładki jako 'dirty'",
-                "  • Przebudowuje tylko aktywną zakładkę",
-                "    natychmiast; pozostałe przy pierwszym",
-                "    przełączeniu na nie (<<NotebookTabChanged>>)",
-                "  • Efekt: 5 rebuildów → 1 przy przełączaniu",
-                "    trybu dark/light",
-            ],
-        },
-        {
-            "version": "0.3.24",
-            "date": "03.03.2026",
-            "changes": [
-                "🔧 MIGRACJA MODUŁU SESJI RPG:°",
-                "",
-                "✅ NOWY WIDOK TABELI SESJI RPG:",
-                "  • Tabela przebudowana z tksheet.Sheet",
-                "    na CTkDataTable — spójny z graczami",
-                "    i wydawcami",
-                "  • Auto-dopasowanie szerokości kolumn",
-                "    (_compute_widths() via tkfont)",
-                "  • Przycisk ✎ Edytuj z ikoną PNG i tooltipem",
-                "    w każdym wierszu",
-                "  • Kolorowanie wierszy według miesiąca",
-                "    sesji (12 kolorów, osobne palety dla",
-                "    trybu jasnego i ciemnego)",
-                "  • Dialog filtrowania: Rok, System,",
-                "    Typ sesji, Mistrz Gry (CTkToplevel)",
-                "  • Sortowanie po każdej kolumnie",
-                "  • Menu kontekstowe PPM: Edytuj / Usuń",
-                "  • usun_zaznaczona_sesja() zaktualizowane:",
-                "    CTkDataTable.get_selected() zamiast",
-                "    tksheet API",
-                "",
-                "⚡ OPTYMALIZACJA WYDAJNOŚCI:°",
-                "",
-                "✅ CTKTABLE.PY — INKREMENTALNY REBUILD:",
-                "  • _build_rows() nie niszczy już ramek",
-                "    przy każdym set_data() — reużywa",
-                "    istniejące tk.Frame, niszczy tylko",
-                "    Label/Button dzieci (_refresh_row())",
-                "  • Nowe metody: _refresh_row(i, row),",
-                "    _populate_row(rf, i, row)",
-                "  • 200 sesji: ~1600 → ~200 operacji Tcl",
-                "",
-                "✅ CACHE ZAKŁADEK (gracze/wydawcy/sesje):",
-                "  • fill_*_tab() zapisuje cache na obiekcie",
-                "    zakładki (tab._*_tab_cache)",
-                "  • Szybka ścieżka: aktualizuje tylko dane",
-                "    i rysuje tabelę — zero rebuild UI",
-                "  • Cache unieważniany przy zmianie",
-                "    dark_mode lub zniszczeniu widgetu",
-                "  • data_ref: List[...] — mutable container",
-                "    dla poprawnego sharing w zamknięciach",
-                "  • Efekt: brak flickera przy odświeżaniu",
-                "    po akcjach CRUD",
-            ],
-        },
-        {
-            "version": "0.3.23",
-            "date": "02.03.2026",
-            "changes": [
-                "🔧 MIGRACJA MODUŁU GRACZY:°",
-                "",
-                "✅ NOWY WIDOK TABELI GRACZY:",
-                "  • Tabela przebudowana z tksheet.Sheet",
-                "    na CTkDataTable — spójny z wydawcami",
-                "  • Auto-dopasowanie szerokości kolumn",
-                "    (_compute_widths() via tkfont)",
-                "  • Przycisk ✎ Edytuj z ikoną PNG i tooltipem",
-                "    w każdym wierszu (jak u wydawców)",
-                "  • Kolorowanie wierszy: Status (w pierwszej",
-                "    kolejności) + Płeć jako tło",
-                "    (⭐ Główny: zółty, 👑 Ważna: fioletowy,",
-                "    Kobieta: różowy, Mężczyzna: błękitny, etc.)",
-                "  • Kolumna Social media: klikalny link",
-                "  • Menu kontekstowe PPM: Edytuj / Usuń",
-                "  • Sortowanie po każdej kolumnie",
-                "  • Dialog filtrowania: Płeć, Imię i nazwisko,",
-                "    Social media, Status (ttk.Combobox)",
-                "",
-                "✅ NAPRAWA FILTRA ŚWSEROKOŚCI (ctk_table.py):",
-                "  • Ostatnia kolumna nie rozciągała się do",
-                "    pełnej szerokości okna — za nagamiądfkami",
-                "    i wierszami dodano filler Label z",
-                "    relwidth=1, width=-x",
-                "",
-                "🔧 NAPRAWA IKONY W PLIKU EXE:°",
-                "",
-                "❌ PROBLEM - IKONA EDYCJI NIE DZIAŁAŁA W EXE:",
-                "  • ctk_table.py używał Path(__file__).parent",
-                "    do znalezienia Icons/edit.png, co nie",
-                "    działa w PyInstaller one-file (brak __file__",
-                "    w katalogu roboczym)",
-                "",
-                "✅ ROZWIĄZANIE (database_manager.py +",
-                "  ctk_table.py + main.py):",
-                "  • Dodano ensure_app_icons() w",
-                "    database_manager — kopiuje *.png z",
-                "    sys._MEIPASS/Icons (EXE) lub lokalnego",
-                "    folderu Icons do AppData/Local/Sesyjka/",
-                "    Icons/ przy każdym uruchomieniu",
-                "  • Wywoływane w main.py zaraz po init baz",
-                "  • ctk_table._get_icon_path() szuka w:",
-                "    AppData/Icons > _MEIPASS/Icons > lokalne",
-                "  • Ikona edycji działa tak samo na każdym",
-                "    komputerze (również z EXE)",
-                "",
-                "✅ ZAKTUALIZOWANO README I O PROGRAMIE:",
-                "  • Dodano ctk_table.py do struktury projektu",
-                "  • Dodano Pillow do sekcji Technologie",
-                "  • ctk_table.py opisany jako własny widget",
-            ],
-        },
-        {
-            "version": "0.3.22",
-            "date": "02.03.2026",
-            "changes": [
-                "🔧 PRZEBUDOWA MODUŁU WYDAWCÓW:\n",
-                "",
-                "✅ NOWY WIDOK TABELI WYDAWCÓW:",
-                "  • Tabela przebudowana z CTkScrollableFrame",
-                "    (ręczny grid) na CTkDataTable — spójny",
-                "    z resztą aplikacji",
-                "  • Auto-dopasowanie szerokości kolumn do",
-                "    zawartości (_compute_widths() via tkfont)",
-                "    z limitami: Nazwa ≤ 280px, Strona ≤ 500px,",
-                "    Kraj ≤ 120px",
-                "  • Kolumna Strona działa jako klikalny link",
-                "    (otwiera przeglądarkę, niebieski tekst)",
-                "  • Menu kontekstowe PPM: Edytuj / Usuń",
-                "  • Sortowanie po każdej kolumnie zachowane",
-                "  • Dialog filtrowania: Kraj i Filtr Strony",
-                "",
-                "✅ IKONA PRZYCISKU EDYCJI (ctk_table.py):",
-                "  • Ikona ołówka z Icons/edit.png zamiast ✎",
-                "  • Dwa warianty koloru przez PIL tint:",
-                "    jasny tryb → #1558d6 (ciemnoniebieski),",
-                "    ciemny tryb → #7baaff (jasnoniebieski)",
-                "  • Tooltip 'Edytuj' nad przyciskiem",
-                "",
-                "🐛 NAPRAWA BŁĘDÓW:\n",
-                "",
-                "❌ PROBLEM 1 - TOOLTIP EDYCJI NIE DZIAŁAŁ:",
-                "  • btn.bind('<Enter>'/'<Leave>') bez add='+'",
-                "    nadpisywał bindingi tooltipa",
-                "",
-                "✅ ROZWIĄZANIE 1 (ctk_table.py):",
-                "  • Dodano add='+' do bind <Enter>/<Leave>",
-                "    przycisku edycji",
-                "",
-                "❌ PROBLEM 2 - TclError PO REBUILD TABELI:",
-                "  • Przełączenie dark/light mode lub refresh",
-                "    tabeli wywoływał TclError: bad window path",
-                "  • CTkComboBox rejestruje after() na focus",
-                "    który odpala po zniszczeniu widgetów",
-                "",
-                "✅ ROZWIĄZANIE 2 (wydawcy.py + main.py):",
-                "  • Dialog filtrowania: CTkComboBox → ttk.",
-                "    Combobox (nie rejestruje after() callbacków)",
-                "  • Dodano report_callback_exception() w",
-                "    SesyjkaApp — cicho ignoruje TclError",
-                "    'bad window path' (benign race condition",
-                "    przy destroyu widgetów)",
-                "",
-                "❌ PROBLEM 3 - BRAKUJĄCE FUNKCJE w wydawcy.py:",
-                "  • usun_wydawce_dialog i",
-                "    usun_zaznaczonego_wydawce zaginęły",
-                "    podczas refaktoryzacji",
-                "",
-                "✅ ROZWIĄZANIE 3 (wydawcy.py):",
-                "  • Przywrócono obie funkcje z gita",
-                "  • usun_zaznaczonego_wydawce używa",
-                "    CTkDataTable.get_selected() zamiast",
-                "    tksheet.get_currently_selected()",
-            ],
-        },
-        {
-            "version": "0.3.21",
-            "date": "02.03.2026",
-            "changes": [
-                "🐛 NAPRAWA BŁĘDÓW - EDYCJA SUPLEMENTÓW:\n",
-                "",
-                "❌ PROBLEM 1 - SUPLEMENTY BEZ SYSTEMU GŁÓWNEGO:",
-                "  • Edycja osieroconych suplementów (bez",
-                "    przypisanego podręcznika głównego) nie",
-                "    otwierała okna edycji u części użytkowników",
-                "  • Powtarzalne przy suplementach na końcu",
-                "    długiej listy",
-                "",
-                "✅ ROZWIĄZANIE 1 (systemy_rpg.py):",
-                "  • context_edit/context_delete/context_add",
-                "    _supplement czytały selekcję przez",
-                "    get_currently_selected() po otwarciu menu",
-                "  • Indeks wiersza przechwytywany w captured_r",
-                "    w momencie prawego kliknięcia",
-                "  • Przekazywany przez domyślne argumenty lambda",
-                "    - nie może ulec zmianie między kliknięciem",
-                "    a wybraniem opcji menu",
-                "  • Refaktoryzacja: context_edit(row_idx),",
-                "    context_delete(row_idx),",
-                "    context_add_supplement(row_idx)",
-                "",
-                "❌ PROBLEM 2 - OKNO EDYCJI NADAL ZNIKA:",
-                "  • Okno edycji otwierało się, ale natychmiast",
-                "    znikało dla osieroconych suplementów",
-                "    (system_glowny_id=None)",
-                "  • CTkToplevel withdrawn/deiconify race",
-                "    condition: configure() na CTkComboBox",
-                "    podczas init wyzwala przetwarzanie kolejki",
-                "    Tk, co koliduje z wewnętrznym",
-                "    withdraw/deiconify CTkToplevel (~200ms)",
-                "",
-                "✅ ROZWIĄZANIE 2 (systemy_rpg.py):",
-                "  • _ensure_visible() uruchamiana after(300ms):",
-                "    deiconify() + lift() + focus_force()",
-                "  • 300ms > 200ms CTkToplevel cycle = bezpieczna",
-                "    wartość bez race condition",
-                "  • Okno zawsze pojawi się na wierzchu niezale-",
-                "    żnie od stanu inicjalizacji",
-                "",
-                "❌ PROBLEM 3 - WERSJA WYŚWIETLANA JAKO 0.3.20:",
-                "  • APP_VERSION w main.py nie został zaktuali-",
-                "    zowany przy wydaniu 0.3.21",
-                "",
-                "✅ ROZWIĄZANIE 3 (main.py):",
-                "  • APP_VERSION zmienione na '0.3.21'",
-                "",
-                "📋 NOWE - DIAGNOSTYKA:",
-                "  • System logowania sesyjka_debug.log",
-                "    w katalogu AppData\\Local\\Sesyjka\\",
-                "  • Logi w open_edit_system_dialog,",
-                "    on_typ_change, context_edit,",
-                "    show_context_menu",
-                "  • Format: data [poziom] moduł: komunikat",
-            ],
-        },
-        {
-            "version": "0.3.20",
-            "date": "23.02.2026",
-            "changes": [
-                "🐛 NAPRAWA BŁĘDÓW - EDYCJA I FILTROWANIE:\n",
-                "",
-                "❌ PROBLEM 1 - MRUGNIĘCIE OKNA EDYCJI:",
-                "  • Osierocone suplementy (bez podręcznika",
-                "    głównego) powodowały natychmiastowe",
-                "    zamknięcie okna edycji po otwarciu",
-                "  • Powtarzalne przy 100+ rekordach i 5+",
-                "    osieroconych suplementach",
-                "",
-                "✅ ROZWIĄZANIE 1 (systemy_rpg.py):",
-                "  • Usunięto dialog.update_idletasks() podczas",
-                "    inicjalizacji - wyzwalał cykl CTkToplevel",
-                "    withdraw/deiconify zbyt wcześnie",
-                "  • Flaga _initializing blokuje update_dialog_size()",
-                "    podczas budowy formularza",
-                "  • dialog.after(50, ...) - resize po pełnej init",
-                "  • Jawne system_glowny_var.set('') dla",
-                "    osieroconych suplementów, aby CTkComboBox",
-                "    miał zawsze zdefiniowany stan",
-                "  • Usunięto dialog.update_idletasks() z obu",
-                "    update_dialog_size() - parent.update_idletasks()",
-                "    wystarczy do obliczeń geometrii",
-                "  • Guard winfo_exists() w update_dialog_size()",
-                "",
-                "❌ PROBLEM 2 - BŁĘDNE FILTRY I SORTOWANIE:",
-                "  • Kolumna vtt dodana na pozycji [8] przesunęła",
-                "    jezyk/status/cena o +1, ale nie wszystkie",
-                "    użycia były zaktualizowane",
-                "",
-                "✅ ROZWIĄZANIE 2 (systemy_rpg.py):",
-                "  • apply_filters(): rec[8]→[9] (jezyk),",
-                "    rec[9]→[10] (status), rec[10]→[11] (cena)",
-                "  • do_hierarchical_sort(): [8]→[9] (Język),",
-                "    [9]→[10] (Status), [10]→[11] (Cena)",
-                "  • reset_filters(): dodano nonlocal records",
-                "    (brak powodował brak aktualizacji domknięcia)",
-                "  • context_edit(): uproszczono do przekazania",
-                "    samego ID - usunięto 15 linii martwego kodu",
-                "    z błędnymi indeksami",
-                "",
-                "❌ PROBLEM 3 - BŁĘDNE DANE W EDYCJI GRACZA:",
-                "  • context_edit() przekazywał displayed_data[r]",
-                "    (emojis ⭐/👑/'') zamiast surowych danych",
-                "  • Edycja gracza z 👑 zapisywała go jako ⭐",
-                "  • Pole 'Ważna osoba' nigdy nie było zaznaczone",
-                "  • do_sort() sortował tylko displayed_data,",
-                "    desynchronizując z displayed_records",
-                "",
-                "✅ ROZWIĄZANIE 3 (gracze.py):",
-                "  • context_edit(): przekazuje displayed_records[r]",
-                "    (surowe dane z bazy z int 0/1)",
-                "  • do_sort(): obie listy sortowane razem przez",
-                "    sorted(zip(...)) z rozpakowaniem powrotnym",
-                "  • Poprawne kolorowanie statusów po sortowaniu",
-            ],
-        },
-        {
-            "version": "0.3.19",
-            "date": "18.02.2026",
-            "changes": [
-                "🛡️ BEZPIECZNA GEOMETRIA DIALOGÓW (dialog_utils.py):\n",
-                "",
-                "❌ PROBLEM - DIALOGI POZA EKRANEM:",
-                "  • Przy skalowaniu Windows 300% dialogi",
-                "    traciły elementy poza granicami ekranu",
-                "  • Formularze systemu RPG ucinały pola VTT",
-                "    i suplementów przy wysokim DPI",
-                "",
-                "✅ ROZWIĄZANIE - CENTRALNY MODUŁ dialog_utils.py:",
-                "  • clamp_geometry() - dopasowuje rozmiar do ekranu",
-                "  • apply_safe_geometry() - stosuje geometrię i centralnie",
-                "  • make_scrollable_dialog_frame() - CTkScrollableFrame",
-                "  • Obsługa CTk i tk.Toplevel (fallback scale=1.0)",
-                "",
-                "📐 SCROLLOWALNE FORMULARZE SYSTEMÓW RPG:",
-                "  • dodaj_system_rpg: CTkScrollableFrame + resizable",
-                "  • open_edit_system_dialog: CTkScrollableFrame",
-                "  • dodaj_suplement_do_systemu: CTkScrollableFrame",
-                "  • update_dialog_size() używa clamp_geometry()",
-                "",
-                "🖥️ NAPRAWA OKNA GŁÓWNEGO:",
-                "  • Okno clampowane do rozmiaru ekranu przy starcie",
-                "  • Margines: 20px (boki) + 48px (dół, taskbar)",
-                "  • Centrowanie w obszarze roboczym ekranu",
-                "",
-                "💾 NAPRAWA ZAPISU USTAWIEŃ:",
-                "  • Błąd: on_close() zapisywał piksele fizyczne",
-                "    (winfo_width/height = wartości fizyczne)",
-                "  • Fix: dzielenie przez _total_window_scale",
-                "  • Teraz settings.json przechowuje wartości logiczne",
-                "  • Brak podwójnego skalowania przy kolejnym starcie",
-                "",
-                "🔧 REFAKTORYZACJA WSZYSTKICH DIALOGÓW:",
-                "  • systemy_rpg.py, sesje_rpg_dialogs.py",
-                "  • sesje_rpg.py, gracze.py, wydawcy.py",
-                "  • about_dialog.py, apphistory.py",
-                "  • Każdy dialog używa apply_safe_geometry()",
-            ],
-        },
-        {
-            "version": "0.3.16",
-            "date": "16.02.2026",
-            "changes": [
-                "🐛 FIX: NAPRAWIONO SKALOWANIE FONTÓW:\n",
-                "",
-                "❌ PROBLEM 1 - RIBBON NA DOLE:",
-                "  • Po użyciu suwaka skalowania fontów ribbon",
-                "    renderował się na dole okna zamiast na górze",
-                "  • Przyczyna: ribbon był zmienną lokalną, niszczoną",
-                "    przez ogólną pętlę po wszystkich widgetach",
-                "  • Notebook był już zapakowany z expand=True",
-                "    i zajmował całą przestrzeń",
-                "",
-                "✅ ROZWIĄZANIE 1:",
-                "  • Zmiana ribbon na self.ribbon (zmienna instancji)",
-                "  • Poprawiono niszczenie: self.ribbon.destroy()",
-                "  • Dodano notebook.pack_forget() przed odbudową",
-                "  • Przepakowanie notebook po odbudowie ribbona",
-                "  • Ribbon zawsze pozostaje na górze",
-                "",
-                "❌ PROBLEM 2 - BRAK SKALOWANIA W TABELACH:",
-                "  • Skalowanie działało tylko w ribbonie",
-                "  • Tabele tksheet (systemy/sesje/gracze/wydawcy)",
-                "    nie skalowały fontów",
-                "  • Brakowało konfiguracji font w Sheet.set_options()",
-                "",
-                "✅ ROZWIĄZANIE 2:",
-                "  • Dodano brakujący import w sesje_rpg.py",
-                "  • Zaktualizowano 4 moduły z tabelami:",
-                "    - systemy_rpg.py (line 776-780)",
-                "    - sesje_rpg.py (line 251-255)",
-                "    - gracze.py (line 314-318)",
-                "    - wydawcy.py (line 200-204)",
-                "  • Dodano sheet.set_options() z fontami:",
-                "    font=(\"Segoe UI\", scale_font_size(10), \"normal\")",
-                "    header_font=(\"Segoe UI\", scale_font_size(10), \"bold\")",
-                "",
-                "✨ NOWA FUNKCJA - ELASTYCZNE SYSTEMY GŁÓWNE:\n",
-                "",
-                "🎯 SUGESTIA UŻYTKOWNIKA:",
-                "  • Czasem dodajesz suplement do gry, której",
-                "    nie masz w kolekcji jako system główny",
-                "  • Brak możliwości wpisania niestandardowej nazwy",
-                "",
-                "✅ ROZWIĄZANIE - DWIE METODY:",
-                "  1️⃣ WYBÓR Z KOLEKCJI:",
-                "     • Dropdown \"System główny (opcjonalnie)\"",
-                "     • Wybierz system z listy jeśli go posiadasz",
-                "     • Wyświetli nazwę z bazy danych",
-                "",
-                "  2️⃣ WPISANA NAZWA:",
-                "     • Pole \"lub wpisz nazwę:\" obok dropdowna",
-                "     • Wpisz nazwę gry spoza kolekcji",
-                "     • Nazwa wyświetli się w kolumnie \"System główny\"",
-                "",
-                "💾 IMPLEMENTACJA:",
-                "  • Nowa kolumna: system_glowny_nazwa_custom",
-                "  • Zaktualizowano get_all_systems()",
-                "  • Formularz dodawania: szerokość 700→950px",
-                "  • Formularz edycji: szerokość 700→950px",
-                "  • Layout: dropdown i pole tekstowe obok siebie",
-                "  • Lepsze dla panoramicznych monitorów",
-                "",
-                "🎨 LOGIKA WYŚWIETLANIA:",
-                "  • Priorytet 1: Jeśli wybrano z listy → nazwa z bazy",
-                "  • Priorytet 2: Jeśli wpisano custom → custom nazwa",
-                "  • Edycja: wybór z listy zastępuje custom nazwę",
-                "",
-                "📐 LAYOUT FORMULARZY:",
-                "  • Pole custom w tym samym row co dropdown",
-                "  • Okna szersze zamiast wyższe",
-                "  • Rozmiary: 950px/1100px (zamiast 700px/850px)",
-                "  • Responsive: columnconfigure(3, weight=1)",
-                "  • Wszystkie pola przesunięte o 1 row w dół",
-            ],
-        },
-        {
-            "version": "0.3.15",
-            "date": "16.02.2026",
-            "changes": [
-                "✨ GLOBALNE SKALOWANIE FONTÓW (80%-120%):\n",
-                "",
-                "🎯 PROBLEM: PREFERENCJE UŻYTKOWNIKÓW:",
-                "  • Testerzy zgłaszali różne potrzeby:",
-                "    - Niektórzy: domyślne fonty za małe",
-                "    - Inni: domyślne fonty za duże",
-                "  • Rozdzielczości ekranów 1080p, 2K, 4K różnią się",
-                "  • Brak uniwersalnej wielkości dla wszystkich",
-                "",
-                "✅ ROZWIĄZANIE - SUWAK W RIBBON:",
-                "  • Nowy moduł: font_scaling.py z funkcją scale_font_size()",
-                "  • Suwak w sekcji ribbon (80%-120%, 8 kroków)",
-                "  • Zaktualizowano 96 specyfikacji fontów w 9 plikach:",
-                "    - main.py (10), about_dialog.py (6)",
-                "    - gracze.py (18), wydawcy.py (4)",
-                "    - systemy_rpg.py (6), sesje_rpg_dialogs.py (2)",
-                "    - sesje_rpg.py (0), statystyki.py (33)",
-                "    - apphistory.py (5), font_scaling.py (12)",
-                "",
-                "🔧 DZIAŁANIE:",
-                "  • Font 12 → scale_font_size(12):",
-                "    - 80%  = 10 (min 8)",
-                "    - 100% = 12 (domyślnie)",
-                "    - 120% = 14",
-                "  • Matplotlib również skaluje (wykresy statystyk)",
-                "  • Zmiana natychmiastowa - ribbon się odbudowuje",
-                "  • Wszystkie elementy UI: dialogi, przyciski,",
-                "    labele, tabele zachowują proporcje",
-                "",
-                "💾 SZCZEGÓŁY TECHNICZNE:",
-                "  • Slider: 0.8-1.2 z krokiem 0.05",
-                "  • Zmienna globalna font_scale_factor",
-                "  • Funkcje: set/get_font_scale_factor()",
-                "  • Minimum: 8px (ochrona czytelności)",
-                "  • Ribbon rebuild po każdej zmianie",
-            ],
-        },
-        {
-            "version": "0.3.14",
-            "date": "16.02.2026",
-            "changes": [
-                "🐛 NAPRAWIONO WSZYSTKIE POZOSTAŁE HARDCODED ŚCIEŻKI:\n",
-                "",
-                "✅ PROBLEM: HARDCODED ŚCIEŻKI W STATYSTYKACH I SESJACH:",
-                "  • 11 miejsc w kodzie używało hardcoded ścieżek do baz",
-                "  • statystyki.py (6 odwołań):",
-                "    - sesje_rpg.db, gracze.db, systemy_rpg.db",
-                "  • sesje_rpg.py (5 odwołań):",
-                "    - systemy_rpg.db (3x), gracze.db (2x)",
-                "  • Aplikacja szukała baz w katalogu aplikacji",
-                "    zamiast w AppData/Local/Sesyjka/",
-                "",
-                "✅ ROZWIĄZANIE:",
-                "  • Dodano import get_db_path do statystyki.py",
-                "  • Zamieniono wszystkie 11 hardcoded ścieżek na get_db_path()",
-                "  • Wszystkie 56 wywołań sqlite3.connect() w projekcie",
-                "    używają teraz poprawnych ścieżek",
-                "",
-                "🆕 NOWY TYP SUPLEMENTU:",
-                "  • Dodano 'Starter/Zestaw Startowy' do typów suplementów",
-                "  • Dostępny w formularzach dodawania i edycji systemów RPG",
-                "  • 6 typów suplementów zamiast 5",
-                "",
-                "📐 DOSTOSOWANIE OKIEN DIALOGOWYCH:",
-                "  • Zwiększono wysokość okien o +30px (6 checkboxów)",
-                "  • Dodawanie systemu: 520→550px, 720→750px, 850→880px",
-                "  • Edycja systemu: 560→590px, 720→750px, 850→880px",
-                "  • Dodawanie suplementu: 650→680px",
-            ],
-        },
-        {
-            "version": "0.3.13",
-            "date": "14.02.2026",
-            "changes": [
-                "🐛 NAPRAWIONO KRYTYCZNY BUG DIALOGU SESJI RPG:\n",
-                "",
-                "✅ PROBLEM: PUSTE OKNO DODAWANIA SESJI RPG:",
-                "  • Dialog 'Dodaj sesję RPG do bazy' otwierał się pusty",
-                "  • Brak list systemów RPG i graczy w formularzu",
-                "  • Przyczyna: hardcoded ścieżki 'systemy_rpg.db' i 'gracze.db'",
-                "    w module sesje_rpg_dialogs.py",
-                "  • Moduł dialogów szukał baz w katalogu aplikacji",
-                "    zamiast w AppData/Local/Sesyjka/",
-                "",
-                "✅ ROZWIĄZANIE:",
-                "  • Naprawiono 2 funkcje w sesje_rpg_dialogs.py:",
-                "    - get_all_systems() - lista systemów RPG w formularzu",
-                "    - get_all_players() - lista graczy w formularzu",
-                "  • Zastąpiono hardcoded ścieżki wywołaniami get_db_path()",
-                "  • Analogiczny bug do naprawionego w v0.3.12 (wydawcy.db)",
-            ],
-        },
-        {
-            "version": "0.3.12",
-            "date": "13.02.2026",
-            "changes": [
-                "🐛 NAPRAWIONO KRYTYCZNY BUG LISTY WYDAWCÓW:\n",
-                "",
-                "✅ PROBLEM: NOWI WYDAWCY NIE WIDOCZNI W SYSTEMACH RPG:",
-                "  • Wydawcy dodani po wersji 0.3.7 nie pojawiali się",
-                "    na liście wydawców w formularzach systemów RPG",
-                "  • Przyczyna: hardcoded ścieżka 'wydawcy.db' zamiast",
-                "    get_db_path('wydawcy.db') w module systemy_rpg.py",
-                "  • Moduł systemów RPG czytał starą bazę z katalogu",
-                "    aplikacji zamiast aktualnej z AppData",
-                "",
-                "✅ ROZWIĄZANIE:",
-                "  • Naprawiono 3 miejsca w systemy_rpg.py z błędną ścieżką:",
-                "    - get_all_publishers() - lista wydawców w comboboxach",
-                "    - fill_systemy_rpg_tab() - nazwy wydawców w tabeli głównej",
-                "    - Sekcja suplementów - nazwy wydawców w tabeli suplementów",
-                "  • Wszystkie odwołania do wydawcy.db używają teraz get_db_path()",
-                "",
-                "✅ ULEPSZENIE ODŚWIEŻANIA LISTY WYDAWCÓW:",
-                "  • Kliknięcie w combobox wydawcy automatycznie odświeża listę",
-                "  • Pobieranie aktualnych danych bezpośrednio z bazy przy kliknięciu",
-                "  • Działa we wszystkich 3 formularzach:",
-                "    - Dodawanie systemu RPG",
-                "    - Edycja systemu RPG",
-                "    - Dodawanie suplementu",
-                "",
-                "🔧 CZYSZCZENIE KODU:",
-                "  • Usunięto niedziałający system callbacków odświeżania",
-                "  • Usunięto zbędne przyciski odświeżania (🔄)",
-                "  • Uproszczony, niezawodny mechanizm refresh-on-click",
-            ],
-        },
-        {
-            "version": "0.3.11",
-            "date": "13.02.2026",
-            "changes": [
-                "🎮 WSPARCIE DLA PLATFORM VTT (VIRTUAL TABLETOP):\n",
-                "",
-                "✅ NOWA FUNKCJA - VTT DLA SYSTEMÓW RPG:",
-                "  • Dodano kolumnę VTT w bazie systemów RPG",
-                "  • Opcja zaznaczenia, czy system wspiera VTT",
-                "  • Po zaznaczeniu pojawia się lista 9 platform VTT",
-                "  • Multi-select: możliwość wyboru wielu platform jednocześnie",
-                "",
-                "✅ DOSTĘPNE PLATFORMY VTT:",
-                "  • AboveVTT (D&D Beyond companion)",
-                "  • Alchemy VTT",
-                "  • D&D Beyond",
-                "  • Demiplane",
-                "  • Fantasy Grounds (Unity)",
-                "  • Foundry VTT",
-                "  • Roll20",
-                "  • Tabletop Simulator",
-                "  • Telespire",
-                "",
-                "✅ INTERFEJS:",
-                "  • Checkbox 'VTT' w formularzach dodawania/edycji",
-                "  • Dynamiczne rozwijanie listy platform po zaznaczeniu",
-                "  • Scrollowalny panel z platformami VTT",
-                "  • Checkboxy dla każdej platformy",
-                "  • Wyświetlanie wybranych platform w tabeli",
-                "  • Inteligentne dopasowanie rozmiaru okna dialogu",
-                "",
-                "🔧 NAPRAWIONO KRYTYCZNE BŁĘDY FILTROWANIA:\n",
-                "",
-                "✅ PROBLEM: RESETOWANIE FILTRÓW PO EDYCJI:",
-                "  • Filtry znikały po dodaniu/edycji/usunięciu rekordów",
-                "  • Naprawiono we wszystkich 4 tabelach:",
-                "    - Sesje RPG (sesje_rpg.py)",
-                "    - Systemy RPG (systemy_rpg.py)",
-                "    - Gracze (gracze.py)",
-                "    - Wydawcy (wydawcy.py)",
-                "",
-                "✅ PROBLEM: BŁĘDNE INDEKSOWANIE W FILTRACH:",
-                "  • Edycja/usuwanie rekordów operowało na złych wierszach",
-                "  • Menu kontekstowe używało indeksów pełnej listy zamiast filtrowanej",
-                "  • Mogło to prowadzić do edycji/usunięcia niewłaściwych rekordów",
-                "",
-                "✅ ROZWIĄZANIE - DISPLAYED_DATA:",
-                "  • Wprowadzono zmienną displayed_data w każdej tabeli",
-                "  • Przechowuje tylko aktualnie widoczne rekordy",
-                "  • Wszystkie operacje (edycja, usuwanie) używają displayed_data",
-                "  • Sortowanie i kolorowanie działa na displayed_data",
-                "  • Auto-przywracanie aktywnych filtrów po odświeżeniu",
-                "",
-                "✅ BEZPIECZEŃSTWO DANYCH:",
-                "  • Poprawne indeksowanie eliminuje ryzyko modyfikacji złych rekordów",
-                "  • Filtry pozostają aktywne po wszystkich operacjach CRUD",
-                "  • Spójność między wyświetlanym widokiem a bazą danych",
-                "",
-                "📊 ZAKRES NAPRAWY:",
-                "  • 4 moduły tabel zaktualizowane",
-                "  • Wszystkie funkcje kontekstowe (edycja, usuwanie)",
-                "  • Wszystkie funkcje sortowania",
-                "  • Wszystkie funkcje filtrowania",
-                "  • Wykrywanie linków (w tabelach gracze i wydawcy)",
-            ],
-        },
-        {
-            "version": "0.3.10",
-            "date": "13.02.2026",
-            "changes": [
-                "🔧 POPRAWKA WYKRYWANIA ROZDZIELCZOŚCI (KRYTYCZNA):\n",
-                "",
-                "✅ FIZYCZNA ROZDZIELCZOŚĆ EKRANU:",
-                "  • Naprawiono wykrywanie rozdzielczości na Windows",
-                "  • Aplikacja ignoruje teraz skalowanie DPI Windows",
-                "  • Użycie EnumDisplaySettings dla fizycznej rozdzielczości",
-                "  • SetProcessDpiAwareness przed wykrywaniem",
-                "",
-                "🐛 ROZWIĄZANY PROBLEM:",
-                "  • Windows z 2880x1800 i skalowaniem 300%",
-                "  • Aplikacja wykrywała 1920x1200 (logiczną) zamiast 2880x1800 (fizyczną)",
-                "  • Teraz poprawnie wykrywa 2880x1800 i stosuje 167% skalowania",
-                "",
-                "🔧 SZCZEGÓŁY TECHNICZNE:",
-                "  • Użycie ctypes.windll.shcore.SetProcessDpiAwareness(2)",
-                "  • Użycie ctypes.windll.user32.EnumDisplaySettingsW",
-                "  • Struktura DEVMODE do odczytu dmPelsWidth/Height",
-                "  • Fallback do GetSystemMetrics jeśli EnumDisplaySettings zawiedzie",
-                "  • Fallback do tkinter dla Linux/Mac",
-                "",
-                "📊 WYNIK:",
-                "  • Poprawne wykrywanie rozdzielczości niezależnie od skalowania Windows",
-                "  • Okno 'O programie' pokazuje teraz fizyczną rozdzielczość",
-                "  • Odpowiednie skalowanie interfejsu dla monitorów 2K/4K",
-            ],
-        },
-        {
-            "version": "0.3.9",
-            "date": "13.02.2026",
-            "changes": [
-                "🖥️ AUTOMATYCZNE SKALOWANIE DPI DLA WYSOKICH ROZDZIELCZOŚCI:\n",
-                "",
-                "✅ INTELIGENTNE WYKRYWANIE ROZDZIELCZOŚCI:",
-                "  • Automatyczne wykrywanie rozdzielczości ekranu przy starcie",
-                "  • Dynamiczne obliczanie współczynnika skalowania",
-                "  • Bazowa rozdzielczość: 1920x1080 (Full HD)",
-                "  • Maksymalne skalowanie: 250% dla ekranów 5K+",
-                "",
-                "✅ SKALOWANIE PROPORCJONALNE:",
-                "  • 1920x1080 (Full HD) → 100% (bez skalowania)",
-                "  • 2560x1440 (QHD) → 133% skalowania",
-                "  • 2800x1800 → 167% skalowania",
-                "  • 3840x2160 (4K) → 200% skalowania",
-                "",
-                "✅ INFORMACJE W APLIKACJI:",
-                "  • Okno 'O programie' pokazuje wykrytą rozdzielczość",
-                "  • Wyświetlany współczynnik skalowania w procentach",
-                "  • Komunikaty w konsoli przy starcie (debug)",
-                "",
-                "📊 ZALETY SKALOWANIA:",
-                "  • Elementy interfejsu pozostają czytelne na dużych ekranach",
-                "  • Czcionki skalują się proporcjonalnie",
-                "  • Przyciski i kontrolki zachowują odpowiedni rozmiar",
-                "  • Brak mikroskopijnych elementów na ekranach 4K",
-                "",
-                "🔧 TECHNICZNE:",
-                "  • Wykorzystanie CustomTkinter set_widget_scaling()",
-                "  • Wykorzystanie CustomTkinter set_window_scaling()",
-                "  • Zaokrąglanie do 0.1 dla lepszej wydajności",
-                "  • Zabezpieczenia przed błędami wykrywania",
-            ],
-        },
-        {
-            "version": "0.3.8",
-            "date": "13.02.2026",
-            "changes": [
-                "🗄️ SYSTEM ZARZĄDZANIA BAZAMI DANYCH - BEZPIECZNE AKTUALIZACJE:\n",
-                "",
-                "✅ NOWA LOKALIZACJA BAZ DANYCH:",
-                "  • Windows: C:\\Users\\{username}\\AppData\\Local\\Sesyjka\\",
-                "  • Linux/Mac: ~/.sesyjka/",
-                "  • Bazy są teraz przechowywane w folderze użytkownika",
-                "  • Bezpieczne miejsce, niezależne od lokalizacji aplikacji",
-                "",
-                "✅ AUTOMATYCZNA MIGRACJA:",
-                "  • System automatycznie przenosi stare bazy do nowej lokalizacji",
-                "  • Podczas migracji tworzone są automatyczne backupy",
-                "  • Oryginalne bazy pozostają nietknięte",
-                "  • Proces migracji jest transparentny dla użytkownika",
-                "",
-                "✅ SYSTEM WERSJONOWANIA SCHEMATU:",
-                "  • Każda baza ma przypisaną wersję schematu",
-                "  • Automatyczne wykrywanie czy baza wymaga aktualizacji",
-                "  • Bezpieczne migracje schematu z automatycznymi backupami",
-                "  • Brak możliwości konfliktu przy aktualizacji aplikacji",
-                "",
-                "✅ BACKUPY I BEZPIECZEŃSTWO:",
-                "  • Automatyczne backupy przed każdą migracją",
-                "  • Backupy przechowywane w folderze 'backups'",
-                "  • Format: nazwa_bazy.backup_YYYYMMDD_HHMMSS",
-                "  • Możliwość łatwego przywrócenia poprzedniej wersji",
-                "",
-                "✅ KOMPATYBILNOŚĆ WSTECZNA:",
-                "  • Stare bazy działają z nową wersją aplikacji",
-                "  • System automatycznie aktualizuje schemat gdy potrzebny",
-                "  • Twoje dane są bezpieczne przy każdej aktualizacji",
-                "  • Nie ma ryzyka utraty danych podczas update'u",
-                "",
-                "✅ NOWY MODUŁ:",
-                "  • database_manager.py - zarządzanie bazami i migracjami",
-                "  • API do tworzenia backupów i sprawdzania wersji",
-                "  • Dokumentacja w MIGRATION_GUIDE.md",
-                "",
-                "✅ AKTUALIZACJA WSZYSTKICH MODUŁÓW:",
-                "  • systemy_rpg.py - używa nowego systemu ścieżek",
-                "  • sesje_rpg.py - używa nowego systemu ścieżek",
-                "  • gracze.py - używa nowego systemu ścieżek",
-                "  • wydawcy.py - używa nowego systemu ścieżek",
-                "  • main.py - inicjalizacja przez database_manager",
-            ],
-        },
-        {
-            "version": "0.3.7",
-            "date": "13.02.2026",
-            "changes": [
-                "🔄 SYSTEM STATUSÓW - ULEPSZENIE LOGIKI:\n",
-                "",
-                "✅ STATUS 'NA SPRZEDAŻ':",
-                "  • Status 'Na sprzedaż' wyświetla się jako 'W kolekcji, Na sprzedaż'",
-                "  • Logiczne podejście: przedmiot na sprzedaż musi być w posiadaniu",
-                "  • Wyświetlanie: '{status_gry}, W kolekcji, Na sprzedaż'",
-                "  • Przykład: 'Grane, W kolekcji, Na sprzedaż'",
-                "",
-                "✅ OBSŁUGA CENY ZAKUPU:",
-                "  • Dla statusu 'Na sprzedaż' wyświetla się cena zakupu",
-                "  • W formularzach dodawania/edycji pole ceny zakupu jest dostępne",
-                "  • Logika: przedmiot na sprzedaż ma cenę zakupu (jak 'W kolekcji')",
-                "  • Format: cena + waluta (np. '150.00 PLN')",
-                "",
-                "✅ FILTRY I KOLOROWANIE:",
-                "  • Filtry działają poprawnie dla nowego formatu statusu",
-                "  • Czerwone podświetlenie wierszy 'Na sprzedaż' nadal aktywne",
-                "  • Sprawdzanie statusu używa operatora 'in' dla elastyczności",
-                "",
-                "✅ ZAKRES ZMIAN:",
-                "  • Moduł: systemy_rpg.py",
-                "  • Funkcja wyświetlania: get_all_systems()",
-                "  • Funkcje dodawania: dodaj_system_rpg(), dodaj_suplement_do_systemu()",
-                "  • Funkcja edycji: edit_system_rpg_dialog()",
-                "  • Funkcje obsługi formularzy: on_status_kolekcja_change() (3 wystąpienia)",
-            ],
-        },
-        {
-            "version": "0.3.6",
-            "date": "13.02.2026",
-            "changes": [
-                "🔄 ODŚWIEŻANIE I FILTRY - ULEPSZENIA UX:",
-                "",
-                "✅ ZACHOWANIE FILTRÓW:",
-                "  • Filtry są teraz przechowywane na poziomie modułu",
-                "  • Po dodaniu nowego rekordu filtry pozostają aktywne",
-                "  • Dotyczy wszystkich zakładek:",
-                "    - 🎲 Systemy RPG",
-                "    - ⚔️ Sesje RPG",
-                "    - 👥 Gracze",
-                "    - 🏢 Wydawcy",
-                "  • Filtry resetują się tylko po wybraniu 'Resetuj' lub zamknięciu aplikacji",
-                "",
-                "✅ AUTOMATYCZNE ODŚWIEŻANIE STATYSTYK:",
-                "  • Statystyki automatycznie aktualizują się po:",
-                "    - Dodaniu nowego systemu RPG",
-                "    - Usunięciu systemu RPG",
-                "    - Dodaniu nowej sesji RPG",
-                "    - Usunięciu sesji RPG",
-                "    - Dodaniu gracza",
-                "    - Usunięciu gracza",
-                "    - Dodaniu wydawcy",
-                "    - Usunięciu wydawcy",
-                "  • Wykresy w zakładce Statystyki są zawsze aktualne",
-                "  • Brak potrzeby ręcznego odświeżania po zmianach",
-                "",
-                "✅ PRZYCISK ODŚWIEŻANIA STATYSTYK:",
-                "  • Nowy przycisk '🔄 Odśwież statystyki' w zakładce Statystyki",
-                "  • Umożliwia ręczne wymuszenie odświeżenia wykresów",
-                "  • Zielony design zgodny z motywem aplikacji",
-                "  • Umieszczony obok tytułu dla łatwego dostępu",
-                "",
-                "✅ POPRAWKI TECHNICZNE:",
-                "  • Naprawa błędów typowania w plikach:",
-                "    - about_dialog.py",
-                "    - apphistory.py",
-                "    - statystyki.py",
-                "    - systemy_rpg.py",
-                "    - wydawcy.py",
-                "    - gracze.py",
-                "  • Dodano dyrektywy pyright dla lepszego type checking",
-                "  • Kod zgodny ze standardami Python 3.9+",
-            ],
-        },
-        {
-            "version": "0.3.5",
-            "date": "16.01.2026",
-            "changes": [
-                "📊 STATYSTYKI - ROZBUDOWA I OPTYMALIZACJA:",
-                "",
-                "✅ UKŁAD STATYSTYK:",
-                "  • Zmiana z 2 na 3 kolumny statystyk",
-                "  • Optymalizacja szerokości kolumn dla ekranów 1080p:",
-                "    - Kolumna 1: 220px (wykres kołowy - kompaktowy)",
-                "    - Kolumna 2: 320px (MG vs Gracz)",
-                "    - Kolumna 3: 450px (Systemy - długie nazwy)",
-                "  • Jednolita wysokość wszystkich ramek statystyk (500px)",
-                "  • Wszystkie statystyki widoczne bez przewijania",
-                "",
-                "✅ STATYSTYKA 1 - SESJE RPG WEDŁUG ROKU:",
-                "  • Przeniesienie legendy nad wykres (wycentrowana)",
-                "  • Powiększenie wykresu kołowego: 3.2x2.8 → 4.2x3.5",
-                "  • Powiększenie elementów legendy:",
-                "    - Kwadraty kolorów: 16x16 → 20x20",
-                "    - Font legendy: 9 → 10",
-                "    - Font na wykresie: 9 → 11",
-                "  • Zwiększone odstępy dla lepszej czytelności",
-                "  • Optymalne wykorzystanie dostępnej przestrzeni",
-                "",
-                "✅ STATYSTYKA 2 - MG VS GRACZ:",
-                "  • Dodano wybór roku (Combobox z listą lat)",
-                "  • Dynamiczna aktualizacja wykresu po zmianie roku",
-                "  • Usunięto legendę z prawej strony wykresu",
-                "  • Dodano procenty w nawiasach w rozpisie na lata:",
-                "    - Format: '🎲 MG: 34 (79.1%)'",
-                "    - Format: '👥 Gracz: 9 (20.9%)'",
-                "  • Kompaktowy układ rozpisu na lata:",
-                "    - Zmniejszone odstępy między wierszami (5px → 2px)",
-                "    - Zmniejszone odstępy między kolumnami (10px → 5px)",
-                "    - Zmniejszone fonty dla lepszego dopasowania (12/11 → 11/10)",
-                "  • Lista wszystkich lat z pełną statystyką na dole",
-                "  • Podsumowanie dla wszystkich lat razem",
-                "",
-                "✅ STATYSTYKA 3 - SYSTEMY RPG: ILOŚĆ SESJI:",
-                "  • Zwiększenie szerokości kolumny (420px → 450px)",
-                "  • Naprawa ucinania ostatniej cyfry roku",
-                "  • Wybór roku z rozwijanej listy",
-                "  • Poziomy wykres słupkowy z sortowaniem:",
-                "    - Systemy z największą liczbą sesji na górze",
-                "    - Pełne nazwy systemów widoczne",
-                "  • Zapytania SQL między wieloma bazami danych",
-                "  • Podsumowanie: Ilość systemów i sesji w wybranym roku",
-                "",
-                "✅ POPRAWKI TECHNICZNE:",
-                "  • Naprawa błędu 'bad window path name' w matplotlib canvas",
-                "  • Poprawna hierarchia widgetów w ramkach",
-                "  • Optymalizacja renderowania wykresów",
-                "  • Responsywny layout z weight dla kolumn",
-                "  • Lepsza adaptacja do trybu ciemnego",
-            ],
-        },
-        {
-            "version": "0.3.0",
-            "date": "10.01.2026",
-            "changes": [
-                "🎉 DUŻA AKTUALIZACJA - CUSTOMTKINTER:",
-                "",
-                "✅ MODERNIZACJA INTERFEJSU:",
-                "  • Pełna migracja do CustomTkinter - nowoczesny, płaski design",
-                "  • Zaokrąglone przyciski z animacjami hover",
-                "  • Natywny przełącznik (switch) dla trybu ciemnego",
-                "  • Kolorowe przyciski: Dodaj (zielone), Usuń (czerwone), Zapisz (zielone)",
-                "  • Wszystkie dialogi zmigrowane do CTkToplevel",
-                "  • CTkEntry z placeholder_text dla lepszego UX",
-                "  • CTkComboBox zamiast ttk.Combobox",
-                "  • CTkCheckBox z emoji (⭐, 👑)",
-                "",
-                "✅ STATYSTYKI I WYKRESY:",
-                "  • Nowa zakładka 📊 Statystyki",
-                "  • Wykres kołowy - sesje RPG według roku",
-                "  • Wykres kołowy - główny użytkownik jako MG vs Gracz",
-                "  • Integracja z matplotlib dla profesjonalnych wykresów",
-                "  • Siatka 2-kolumnowa dla statystyk",
-                "",
-                "✅ GRACZE - STATUS OSOBY:",
-                "  • Kolumna Status (Główny użytkownik ⭐ / Ważna osoba 👑)",
-                "  • Wizualna identyfikacja: złoty kolor dla głównego, fioletowy dla ważnych",
-                "  • Wzajemne wykluczanie statusów",
-                "  • Filtrowanie i sortowanie według statusu",
-                "",
-                "✅ ZMIGROWANE MODUŁY:",
-                "  • main.py - główne okno i ribbon",
-                "  • gracze.py - dialogi dodawania i edycji",
-                "  • wydawcy.py - dialogi dodawania, edycji i usuwania",
-                "  • about_dialog.py - okno O programie",
-                "  • apphistory.py - historia wersji",
-            ],
-        },
-        {
-            "version": "0.2.8",
-            "date": "09.01.2026",
-            "changes": [
-                "✅ PRZYGOTOWANIE DO CUSTOMTKINTER:",
-                "  • Instalacja biblioteki CustomTkinter",
-                "  • Instalacja matplotlib dla wykresów",
-                "  • Utworzenie backupu projektu",
-                "  • Testy kompatybilności",
-            ],
-        },
-        {
-            "version": "0.2.7",
-            "date": "09.01.2026",
-            "changes": [
-                "✅ INTERFEJS UŻYTKOWNIKA:",
-                "  • Dodano przełącznik trybu jasny/ciemny w ribbonie",
-                "  • Przełącznik zachowuje stan po zmianie trybu",
-                "  • Uproszczona obsługa przełączania motywów",
-                "",
-                "✅ SYSTEMY RPG - ŚLEDZENIE CEN:",
-                "  • Dodano pole Cena zakupu dla pozycji 'W kolekcji'",
-                "  • Dodano pole Cena sprzedaży dla pozycji 'Sprzedane'",
-                "  • Obsługa 4 walut: PLN, USD, EUR, GBP",
-                "  • Automatyczna konwersja separatora dziesiętnego (przecinek → kropka)",
-                "  • Kolumna 'Cena' w widoku głównym",
-                "  • Sortowanie po cenie",
-                "  • Filtrowanie po walucie",
-                "",
-                "✅ POPRAWKI:",
-                "  • Naprawiono stabilność przełącznika trybu",
-                "  • Usunięto nieużywane importy",
-                "  • Zoptymalizowano kod przełączania motywów",
-            ],
-        },
-        {
-            "version": "0.2.6",
-            "date": "03.01.2026",
-            "changes": [
-                "✅ FILTROWANIE DANYCH:",
-                "  • Dodano kompleksowe filtrowanie w zakładce Sesje RPG:",
-                "    - Filtr po Roku",
-                "    - Filtr po Systemie",
-                "    - Filtr po Typie sesji (Kampania/Jednostrzał)",
-                "    - Filtr po Mistrzu Gry",
-                "  • Dodano filtrowanie w zakładce Gracze:",
-                "    - Filtr po Płci",
-                "    - Filtr po Imieniu i nazwisku (Wpisane/Puste)",
-                "    - Filtr po Social media (Wpisane/Puste)",
-                "  • Dodano filtrowanie w zakładce Wydawcy:",
-                "    - Filtr po Kraju",
-                "    - Filtr po Stronie (Wpisane/Puste)",
-                "  • Dodano zaawansowane filtrowanie w zakładce Systemy RPG:",
-                "    - Filtr po Typie (Podręcznik Główny/Suplement)",
-                "    - Filtr po Wydawcy",
-                "    - Filtr po Posiadaniu (Fizyczny/PDF/Oba/Żadne)",
-                "    - Filtr po Języku",
-                "    - Filtr po Statusie",
-                "  • Wszystkie okna filtrowania wycentrowane na środku ekranu",
-                "  • Licznik aktywnych filtrów na przycisku",
-                "  • Możliwość resetowania wszystkich filtrów",
-                "",
-                "✅ SYSTEMY RPG - NOWE STATUSY:",
-                "  • Dodano nowe statusy kolekcji:",
-                "    - Nieposiadane (szare wyróżnienie)",
-                "    - Do kupienia (fioletowe wyróżnienie)",
-                "  • Kolory statusu działają w trybie jasnym i ciemnym",
-                "  • Zaktualizowane filtrowanie po statusie",
-                "",
-                "✅ POPRAWKI:",
-                "  • Naprawione błędy typów we wszystkich modułach",
-                "  • Poprawione obsługa trybu ciemnego w dialogach",
-                "  • Ulepszona kompatybilność z Python 3.9+",
-            ],
-        },
-        {
-            "version": "0.2.2",
-            "date": "19.09.2025",
-            "changes": [
-                "✅ SYSTEMY RPG:",
-                "  • Dodano system statusów gry: Grane/Nie grane",
-                "  • Dodano system statusów kolekcji: W kolekcji/Na sprzedaż/Sprzedane",
-                "  • Czerwone wyróżnienie pozycji na sprzedaż",
-                "  • Pola statusu w oknach dodawania i edycji systemów",
-                "  • Poprawione pozycjonowanie przycisków w dialogach",
-                "",
-                "✅ INTERFEJS:",
-                "  • Zwiększone wysokości okien dialogowych",
-                "  • Dodano historię wersji aplikacji",
-                "  • Zaktualizowane informacje o programie",
-            ],
-        },
-        {
-            "version": "0.2.1",
-            "date": "18.09.2025",
-            "changes": [
-                "✅ SESJE RPG:",
-                "  • Poprawione filtrowanie dropdown - tylko podręczniki główne",
-                "  • Usunięto suplementy z listy wyboru systemów w sesjach",
-                "",
-                "🐛 POPRAWKI:",
-                "  • Naprawione błędy indeksowania w wyświetlaniu danych",
-                "  • Poprawiona struktura bazy danych",
-            ],
-        },
-        {
-            "version": "0.2.0",
-            "date": "15.09.2025",
-            "changes": [
-                "🎉 PIERWSZA PEŁNA WERSJA:",
-                "",
-                "✅ SYSTEMY RPG:",
-                "  • Hierarchiczny widok podręczników i suplementów",
-                "  • Dodawanie, edycja i usuwanie systemów",
-                "  • Multi-wybór typów suplementów",
-                "  • Kolorowe wyróżnienia typów publikacji",
-                "  • Menu kontekstowe z opcjami edycji",
-                "",
-                "✅ SESJE RPG:",
-                "  • Zarządzanie sesjami z datami i uczestnikami",
-                "  • Wybór graczy i Mistrza Gry",
-                "  • Kolorowanie wierszy według miesięcy",
-                "  • Walidacja konfliktów",
-                "",
-                "✅ GRACZE I WYDAWCY:",
-                "  • Pełne zarządzanie bazami danych",
-                "  • Kolorowanie wierszy według płci (gracze)",
-                "",
-                "✅ INTERFEJS:",
-                "  • Nowoczesna wstążka z kolorowymi przyciskami",
-                "  • Zakładki z ikonami emoji",
-                "  • Tryb jasny i ciemny",
-                "  • Spójny design we wszystkich oknach",
-            ],
-        },
-        {
-            "version": "0.1.0",
-            "date": "10.09.2025",
-            "changes": [
-                "🚀 WERSJA ROZWOJOWA:",
-                "  • Podstawowa struktura aplikacji",
-                "  • Implementacja baz danych SQLite",
-                "  • Podstawowe operacje CRUD",
-                "  • Prototyp interfejsu użytkownika",
-            ],
-        },
-    ]
+    # ── Wyszukiwarka ─────────────────────────────────────────────────────────
+    search_row = ctk.CTkFrame(main_frame, fg_color="transparent")
+    search_row.pack(fill=tk.X, pady=(0, 8))
+    ctk.CTkLabel(
+        search_row, text="🔍 Szukaj:", font=('Segoe UI', scale_font_size(11))
+    ).pack(side=tk.LEFT, padx=(0, 6))
+    search_var = tk.StringVar()
+    search_entry = ctk.CTkEntry(
+        search_row,
+        textvariable=search_var,
+        placeholder_text="np. wersja, moduł, funkcja...",
+        font=('Segoe UI', scale_font_size(11)),
+    )
+    search_entry.pack(side=tk.LEFT, fill=tk.X, expand=True)
+    count_label = ctk.CTkLabel(search_row, text="", font=('Segoe UI', scale_font_size(10)))
+    count_label.pack(side=tk.LEFT, padx=(8, 0))
+
+    # ── Widok tekstowy (tk.Text renderuje tylko widoczne linie) ──────────────
+    text_frame = ctk.CTkFrame(main_frame)
+    text_frame.pack(fill=tk.BOTH, expand=True)
+    fg = "#dce4ee" if _dark else "#1a1a1a"
+    bg = "#2b2b2b" if _dark else "#ffffff"
+    text = tk.Text(
+        text_frame,
+        wrap=tk.WORD,
+        font=('Segoe UI', scale_font_size(11)),
+        background=bg,
+        foreground=fg,
+        relief=tk.FLAT,
+        borderwidth=0,
+        padx=12,
+        pady=8,
+        cursor="arrow",
+    )
+    scrollbar = ctk.CTkScrollbar(text_frame, command=text.yview)
+    text.configure(yscrollcommand=scrollbar.set)
+    scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+    text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-    # Dodaj każdą wersję jako osobną sekcję
-    for version_info in version_history:  # type: ignore
-        # Frame dla wersji
-        version_frame = ctk.CTkFrame(scrollable_frame)
-        version_frame.pack(fill=tk.X, pady=(0, 15), padx=5)
+    text.tag_configure(
+        "version", font=('Segoe UI', scale_font_size(14), 'bold'), foreground="#1976D2",
+        spacing1=12,
+    )
+    text.tag_configure("date", font=('Segoe UI', scale_font_size(11)), foreground="#888888")
+    text.tag_configure("body", lmargin1=4, lmargin2=24, spacing3=1)
+    text.tag_configure("match", background="#FFE082", foreground="#1a1a1a")
 
-        # Nagłówek wersji
-        header_frame = ctk.CTkFrame(version_frame, fg_color="transparent")
-        header_frame.pack(fill=tk.X, padx=15, pady=(10, 5))
+    history = load_version_history()
 
-        version_label = ctk.CTkLabel(
-            header_frame,
-            text=f"Wersja {version_info['version']}",
-            font=('Segoe UI', scale_font_size(14), 'bold'),
-            text_color="#1976D2",
+    def _render(*_: Any) -> None:
+        phrase = search_var.get().strip().lower()
+        text.configure(state=tk.NORMAL)
+        text.delete("1.0", tk.END)
+        shown = 0
+        for entry in history:
+            if phrase and phrase not in entry["_search"]:
+                continue
+            shown += 1
+            text.insert(tk.END, f"Wersja {entry['version']}", "version")
+            text.insert(tk.END, f"   {entry['date']}\n", ("version", "date"))
+            text.insert(tk.END, entry["text"] + "\n", "body")
+        if shown == 0:
+            text.insert(tk.END, "Brak wersji pasujących do wyszukiwania.", "body")
+        if phrase:
+            start = "1.0"
+            while True:
+                pos = text.search(phrase, start, stopindex=tk.END, nocase=True)
+                if not pos:
+                    break
+                end = f"{pos}+{len(phrase)}c"
+                text.tag_add("match", pos, end)
+                start = end
+        text.configure(state=tk.DISABLED)
+        text.yview_moveto(0.0)
+        count_label.configure(
+            text=f"{shown}/{len(history)}" if phrase else f"{len(history)} wersji"
         )
-        version_label.pack(side=tk.LEFT)
 
-        date_label = ctk.CTkLabel(
-            header_frame,
-            text=version_info['date'],  # type: ignore
-            font=('Segoe UI', scale_font_size(12)),
-        )
-        date_label.pack(side=tk.RIGHT)
+    _search_after_id: list[Any] = [None]
 
-        # Lista zmian — scal linie kontynuacji (wcięcie ≥4 spacji) z poprzednią linią
-        merged: list[str] = []
-        for line in version_info['changes']:  # type: ignore
-            line = str(line)  # type: ignore[arg-type]
-            if line.startswith('    ') and merged and merged[-1].strip():
-                merged[-1] = merged[-1].rstrip() + ' ' + line.strip()
-            else:
-                merged.append(line)
-        changes_text = "\n".join(merged)
-        # tk.Label (nie CTkLabel) — poprawnie dopasowuje wysokość przy wraplength
-        raw_bg = version_frame.cget("fg_color")  # type: ignore[misc]
-        if isinstance(raw_bg, (list, tuple)):
-            frame_bg: str = str(raw_bg[1] if _dark else raw_bg[0])  # type: ignore[index]
-        else:
-            frame_bg = str(raw_bg)  # type: ignore[arg-type]
-        changes_label = tk.Label(
-            version_frame,
-            text=changes_text,
-            font=('Segoe UI', scale_font_size(11)),
-            justify=tk.LEFT,
-            anchor='nw',
-            wraplength=510,
-            background=frame_bg,
-            foreground="#dce4ee" if _dark else "#1a1a1a",
-        )
-        changes_label.pack(fill=tk.X, padx=15, pady=(0, 10))
+    def _on_search_changed(*_: Any) -> None:
+        if _search_after_id[0] is not None:
+            try:
+                dialog.after_cancel(_search_after_id[0])
+            except Exception:
+                pass
+        _search_after_id[0] = dialog.after(200, _render)
+
+    search_var.trace_add('write', _on_search_changed)  # type: ignore[misc]
+    _render()
 
     # Frame dla przycisku zamknij
     button_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
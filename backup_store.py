@@ -0,0 +1,390 @@
+"""
+Magazyn kopii zapasowych baz danych adresowany treścią (deduplikacja).
+
+Zamiast pełnej kopii z datą w nazwie przy każdej migracji i imporcie:
+
+- kopia bazy powstaje przez API backupu SQLite (``snapshot_database``),
+- treść jest haszowana (SHA-256, z pominięciem liczników zmian w nagłówku
+  pliku) i zapisywana raz jako obiekt ``objects/<xx>/<sha256>[.zst|.xz]``,
+- kopia identyczna z ostatnią kopią tej samej bazy jest pomijana, a kopia
+  identyczna ze starszą dopisuje tylko wpis w manifeście,
+- manifest (``manifest.json``) przechowuje listę kopii — listowanie nie czyta
+  obiektów,
+- polityka przechowywania (ustawienia ``backups``): ostatnie N kopii każdej
+  bazy oraz najnowsza kopia z każdego z ostatnich dni i tygodni; obiekty bez
+  wpisów w manifeście są usuwane,
+- kompresja zstd (``compression.zstd``, Python 3.14+) z rezerwowym LZMA.
+
+Moduł nie importuje Tk — korzysta z niego ``database_manager`` i dialog
+zarządzania bazami.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import lzma
+import os
+import shutil
+import sqlite3
+import tempfile
+import threading
+from contextlib import closing
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, List, Optional
+
+import database_manager as dm
+
+_log = logging.getLogger(__name__)
+
+_OWN_DATABASES = ("systemy_rpg.db", "sesje_rpg.db", "gracze.db", "wydawcy.db")
+_STORE_DIR = "store"
+_MANIFEST = "manifest.json"
+_MANIFEST_VERSION = 1
+
+# Bajty nagłówka SQLite zmieniane przy każdym zapisie bez zmiany treści:
+# licznik zmian pliku (24–27) i „version-valid-for” (92–95)
+_VOLATILE_HEADER = ((24, 28), (92, 96))
+
+# ── Powody kopii ──────────────────────────────────────────────────────────────
+REASON_MIGRATION = "migracja"
+REASON_IMPORT = "import"
+REASON_RESTORE = "przed przywróceniem"
+REASON_MANUAL = "ręczna"
+
+_lock = threading.RLock()
+
+
+@dataclass(frozen=True)
+class BackupEntry:
+    """Wpis manifestu — jedna kopia jednej bazy."""
+
+    id: str
+    db: str
+    sha256: str
+    size: int
+    stored_size: int
+    codec: str
+    created: str  # ISO 8601, czas lokalny
+    reason: str
+
+    @property
+    def created_at(self) -> datetime:
+        return datetime.fromisoformat(self.created)
+
+
+# ── Kodeki ────────────────────────────────────────────────────────────────────
+
+def _zstd() -> Any:
+    try:
+        from compression import zstd  # type: ignore[import-not-found]
+    except ImportError:
+        return None
+    return zstd
+
+
+_EXTENSIONS = {"zstd": ".zst", "lzma": ".xz", "none": ""}
+
+
+def _resolve_codec(name: str) -> str:
+    if name == "auto":
+        return "zstd" if _zstd() is not None else "lzma"
+    if name == "zstd" and _zstd() is None:
+        _log.info("Kompresja zstd niedostępna w tej wersji Pythona — używam LZMA")
+        return "lzma"
+    return name if name in _EXTENSIONS else "lzma"
+
+
+def _open_write(path: Path, codec: str) -> IO[bytes]:
+    if codec == "zstd":
+        return _zstd().open(path, "wb")
+    if codec == "lzma":
+        return lzma.open(path, "wb", preset=6)
+    return open(path, "wb")
+
+
+def _open_read(path: Path, codec: str) -> IO[bytes]:
+    if codec == "zstd":
+        zstd = _zstd()
+        if zstd is None:
+            raise RuntimeError("Ta kopia jest skompresowana zstd — wymagany Python 3.14+.")
+        return zstd.open(path, "rb")
+    if codec == "lzma":
+        return lzma.open(path, "rb")
+    return open(path, "rb")
+
+
+# ── Ścieżki i manifest ────────────────────────────────────────────────────────
+
+def _store_dir() -> Path:
+    # Kopie dotyczą zawsze własnych baz, także w trybie gościa
+    path = dm.get_app_data_dir() / "backups" / _STORE_DIR
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _object_path(entry: BackupEntry) -> Path:
+    return (
+        _store_dir() / "objects" / entry.sha256[:2]
+        / f"{entry.sha256}{_EXTENSIONS.get(entry.codec, '')}"
+    )
+
+
+def _load_manifest() -> List[BackupEntry]:
+    try:
+        with open(_store_dir() / _MANIFEST, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        return [BackupEntry(**item) for item in data.get("entries", [])]
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError, TypeError):
+        _log.warning("Uszkodzony manifest kopii zapasowych — zaczynam od pustego", exc_info=True)
+        return []
+
+
+def _save_manifest(entries: List[BackupEntry]) -> None:
+    path = _store_dir() / _MANIFEST
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(
+            {"version": _MANIFEST_VERSION, "entries": [asdict(e) for e in entries]},
+            f,
+            ensure_ascii=False,
+            indent=2,
+        )
+    os.replace(tmp, path)
+
+
+def _policy() -> Dict[str, Any]:
+    """Polityka przechowywania z ustawień (``settings["backups"]``)."""
+    from settings import load_settings
+
+    policy = load_settings().get("backups")
+    return policy if isinstance(policy, dict) else {}
+
+
+def _content_hash(path: Path) -> str:
+    """SHA-256 treści bazy z wyzerowanymi licznikami zmian w nagłówku."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        header = bytearray(f.read(100))
+        for start, end in _VOLATILE_HEADER:
+            header[start:end] = bytes(end - start)
+        h.update(header)
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+# ── API ───────────────────────────────────────────────────────────────────────
+
+def store_backup(db_path: str, reason: str = REASON_MANUAL) -> Optional[BackupEntry]:
+    """
+    Zapisuje kopię bazy w magazynie.
+
+    Returns:
+        Wpis manifestu nowej kopii; gdy treść jest identyczna z ostatnią kopią
+        tej bazy — istniejący wpis (nic nie jest zapisywane); None, gdy plik
+        bazy nie istnieje.
+    """
+    src = Path(db_path)
+    if not src.exists():
+        return None
+    db_name = src.name
+    policy = _policy()
+    codec = _resolve_codec(str(policy.get("compression", "auto")))
+
+    staging = Path(tempfile.mkdtemp(prefix="sesyjka_backup_"))
+    try:
+        snap = staging / db_name
+        dm.snapshot_database(src, snap)
+        digest = _content_hash(snap)
+        size = snap.stat().st_size
+
+        with _lock:
+            entries = _load_manifest()
+            same_db = [e for e in entries if e.db == db_name]
+            if same_db and same_db[-1].sha256 == digest:
+                return same_db[-1]
+
+            existing = next((e for e in entries if e.sha256 == digest), None)
+            if existing is not None and _object_path(existing).exists():
+                codec, stored_size = existing.codec, existing.stored_size
+            else:
+                candidate = BackupEntry("", db_name, digest, size, 0, codec, "", reason)
+                obj = _object_path(candidate)
+                obj.parent.mkdir(parents=True, exist_ok=True)
+                part = obj.with_name(obj.name + ".partial")
+                with open(snap, "rb") as fsrc, _open_write(part, codec) as fdst:
+                    for chunk in iter(lambda: fsrc.read(1024 * 1024), b""):
+                        fdst.write(chunk)
+                os.replace(part, obj)
+                stored_size = obj.stat().st_size
+
+            now = datetime.now()
+            entry = BackupEntry(
+                id=f"{db_name}@{now.strftime('%Y%m%d_%H%M%S_%f')}",
+                db=db_name,
+                sha256=digest,
+                size=size,
+                stored_size=stored_size,
+                codec=codec,
+                created=now.isoformat(timespec="seconds"),
+                reason=reason,
+            )
+            entries.append(entry)
+            entries = _apply_retention(entries, policy)
+            _save_manifest(entries)
+            _collect_garbage(entries)
+            return entry
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def store_own_databases(reason: str = REASON_MANUAL) -> List[BackupEntry]:
+    """Zapisuje kopie wszystkich własnych baz (pomija bazy bez zmian od ostatniej kopii)."""
+    entries = []
+    for db_file in _OWN_DATABASES:
+        entry = store_backup(dm.get_own_db_path(db_file), reason)
+        if entry is not None:
+            entries.append(entry)
+    return entries
+
+
+def list_backups(db_name: Optional[str] = None) -> List[BackupEntry]:
+    """Zwraca kopie z manifestu (najnowsze pierwsze), opcjonalnie dla jednej bazy."""
+    with _lock:
+        entries = _load_manifest()
+    if db_name is not None:
+        entries = [e for e in entries if e.db == db_name]
+    # Manifest jest dopisywany chronologicznie
+    return entries[::-1]
+
+
+def restore_backup(
+    entry_id: str,
+    progress: Optional[dm.ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> BackupEntry:
+    """
+    Przywraca własną bazę z kopii w magazynie.
+
+    Obiekt jest rozpakowywany obok bazy (``*.restoring``) i sprawdzany
+    (``PRAGMA quick_check``) — ten etap można anulować. Bieżąca baza trafia
+    do magazynu (powód „przed przywróceniem”), po czym plik jest podmieniany,
+    a schemat przywróconej bazy sprawdzany ponownie (``refresh_databases``).
+    Zaległe zapisy (``db_writer.flush``) musi opróżnić wywołujący.
+
+    Raises:
+        KeyError: Gdy w manifeście nie ma kopii o podanym identyfikatorze.
+        ValueError: Gdy rozpakowana kopia nie przechodzi kontroli spójności.
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    with _lock:
+        entry = next((e for e in _load_manifest() if e.id == entry_id), None)
+    if entry is None:
+        raise KeyError(entry_id)
+
+    dst = Path(dm.get_own_db_path(entry.db))
+    part = dst.with_name(dst.name + ".restoring")
+    try:
+        done = 0
+        with _open_read(_object_path(entry), entry.codec) as fsrc, open(part, "wb") as fdst:
+            for chunk in iter(lambda: fsrc.read(1024 * 1024), b""):
+                if cancel is not None and cancel.is_set():
+                    raise dm.OperationCancelled()
+                fdst.write(chunk)
+                done += len(chunk)
+                if progress is not None:
+                    progress(min(done, entry.size), entry.size, entry.db)
+        with closing(sqlite3.connect(str(part))) as conn:
+            result = conn.execute("PRAGMA quick_check").fetchone()[0]
+        if result != "ok":
+            raise ValueError(f"Kopia {entry.id} jest uszkodzona: {result}")
+        if cancel is not None and cancel.is_set():
+            raise dm.OperationCancelled()
+    except BaseException:
+        if part.exists():
+            part.unlink()
+        raise
+
+    if dst.exists():
+        store_backup(str(dst), REASON_RESTORE)
+    os.replace(part, dst)
+    dm.refresh_databases([entry.db])
+    return entry
+
+
+def prune() -> None:
+    """Stosuje politykę przechowywania i usuwa nieużywane obiekty."""
+    with _lock:
+        entries = _apply_retention(_load_manifest(), _policy())
+        _save_manifest(entries)
+        _collect_garbage(entries)
+
+
+# ── Przechowywanie ────────────────────────────────────────────────────────────
+
+def _apply_retention(entries: List[BackupEntry], policy: Dict[str, Any]) -> List[BackupEntry]:
+    """Zwraca wpisy zachowane przez politykę (osobno dla każdej bazy)."""
+    keep_last = int(policy.get("keep_last", 0))
+    keep_daily = int(policy.get("keep_daily", 0))
+    keep_weekly = int(policy.get("keep_weekly", 0))
+
+    kept: set[str] = set()
+    for db_name in {e.db for e in entries}:
+        newest_first = [e for e in reversed(entries) if e.db == db_name]
+        kept.update(e.id for e in newest_first[:max(keep_last, 1)])
+        for count, bucket in (
+            (keep_daily, lambda e: e.created_at.date()),
+            (keep_weekly, lambda e: e.created_at.isocalendar()[:2]),
+        ):
+            _keep_newest_per_bucket(newest_first, count, bucket, kept)
+    return [e for e in entries if e.id in kept]
+
+
+def _keep_newest_per_bucket(
+    newest_first: List[BackupEntry],
+    count: int,
+    bucket: Callable[[BackupEntry], Any],
+    kept: set[str],
+) -> None:
+    seen: List[Any] = []
+    for entry in newest_first:
+        key = bucket(entry)
+        if key in seen:
+            continue
+        if len(seen) >= count:
+            break
+        seen.append(key)
+        kept.add(entry.id)
+
+
+def _collect_garbage(entries: List[BackupEntry]) -> None:
+    """Usuwa obiekty, do których nie odwołuje się żaden wpis manifestu."""
+    referenced = {_object_path(e).name for e in entries}
+    objects = _store_dir() / "objects"
+    if not objects.exists():
+        return
+    for path in objects.glob("*/*"):
+        if path.name not in referenced:
+            try:
+                path.unlink()
+            except OSError:
+                _log.debug("Nie udało się usunąć obiektu kopii %s", path, exc_info=True)
+
+
+__all__ = [
+    "BackupEntry",
+    "REASON_IMPORT",
+    "REASON_MANUAL",
+    "REASON_MIGRATION",
+    "REASON_RESTORE",
+    "list_backups",
+    "prune",
+    "restore_backup",
+    "store_backup",
+    "store_own_databases",
+]
@@ -0,0 +1,299 @@
+"""
+Usuwanie wielu zaznaczonych rekordów z podglądem skutków (systemy, sesje, gracze, wydawcy).
+
+Przed potwierdzeniem jedno zapytanie (w tle, ``task_executor``) liczy rekordy
+zależne: pozycje pod usuwanymi systemami, suplementy usuwanych podręczników,
+powiązania ``sesje_gracze``, sesje prowadzone przez usuwanych graczy itd.
+Po potwierdzeniu całość — odłączenie zależnych rekordów i usunięcie wybranych —
+idzie przez ``db_writer`` w jednej transakcji (bazy zależne są dołączane do
+połączenia), a zdarzenia ``change_events`` publikowane po zatwierdzeniu dają
+jedno odświeżenie widoków.
+
+Identyfikatory trafiają do zapytań jako jedna lista JSON (``json_each``), więc
+treść SQL nie zależy od liczby zaznaczonych wierszy; warunki ``IN`` korzystają
+z indeksów zakładanych w ``ensure_schema`` modułów zakładek.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import tkinter as tk
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+from tkinter import messagebox
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import change_events
+import db_writer
+import task_executor
+from change_events import ChangeEvent
+from database_manager import get_own_db_path, is_guest_mode
+
+_log = logging.getLogger(__name__)
+
+
+def _in(param: str) -> str:
+    return f"IN (SELECT value FROM json_each(:{param}))"
+
+
+@dataclass(frozen=True)
+class DeletePlan:
+    """
+    Opis usunięcia: zapytanie podglądu, instrukcje zapisu i zdarzenia zmian.
+
+    ``impact_sql`` zwraca jeden wiersz liczników, opisanych kolejno przez
+    ``impact_labels`` (``{n}`` — liczba). Instrukcje ``statements`` wykonywane są
+    po kolei w jednej transakcji z parametrami ``params``.
+    """
+
+    title: str
+    question: str
+    db_file: str
+    attach: Tuple[Tuple[str, str], ...]
+    params: Dict[str, str]
+    impact_sql: str
+    impact_labels: Tuple[str, ...]
+    statements: Tuple[str, ...]
+    changes: Tuple[ChangeEvent, ...]
+
+
+def _ids_param(ids: Sequence[int]) -> str:
+    return json.dumps([int(i) for i in ids])
+
+
+# ── Plany ──
+
+def plan_systems(item_ids: Sequence[int], game_ids: Sequence[int]) -> DeletePlan:
+    """Pozycje (PG/suplementy) i systemy gier; pozycje pod systemem i suplementy PG zostają."""
+    return DeletePlan(
+        title="Usuń zaznaczone systemy",
+        question=(
+            f"Zaznaczone systemy: {len(game_ids)}, pozycje: {len(item_ids)}.\n"
+            "Czy na pewno chcesz je usunąć?"
+        ),
+        db_file="systemy_rpg.db",
+        attach=(("ses", "sesje_rpg.db"),),
+        params={"items": _ids_param(item_ids), "games": _ids_param(game_ids)},
+        impact_sql=f"""
+            SELECT
+                (SELECT COUNT(*) FROM systemy_rpg
+                 WHERE system_gry_id {_in('games')} AND id NOT {_in('items')}),
+                (SELECT COUNT(*) FROM systemy_rpg
+                 WHERE system_glowny_id {_in('items')} AND id NOT {_in('items')}),
+                (SELECT COUNT(*) FROM ses.sesje_rpg WHERE system_id {_in('games')})
+        """,
+        impact_labels=(
+            "Pozycje pod usuwanymi systemami, które zostaną bez systemu: {n}",
+            "Suplementy odłączane od usuwanych podręczników: {n}",
+            "Sesje wskazujące usuwane systemy (zostaną bez nazwy systemu): {n}",
+        ),
+        statements=(
+            f"UPDATE systemy_rpg SET system_gry_id = NULL WHERE system_gry_id {_in('games')}",
+            f"UPDATE systemy_rpg SET system_glowny_id = NULL "
+            f"WHERE system_glowny_id {_in('items')}",
+            f"DELETE FROM systemy_rpg WHERE id {_in('items')}",
+            f"DELETE FROM systemy_gry WHERE id {_in('games')}",
+        ),
+        changes=(
+            ChangeEvent(change_events.SYSTEMY_RPG, tuple(item_ids), change_events.DELETE),
+            ChangeEvent(change_events.SYSTEMY_GRY, tuple(game_ids), change_events.DELETE),
+        ),
+    )
+
+
+def plan_sessions(ids: Sequence[int]) -> DeletePlan:
+    """Sesje wraz z ich powiązaniami ``sesje_gracze``."""
+    return DeletePlan(
+        title="Usuń zaznaczone sesje",
+        question=f"Zaznaczone sesje: {len(ids)}.\nCzy na pewno chcesz je usunąć?",
+        db_file="sesje_rpg.db",
+        attach=(),
+        params={"ids": _ids_param(ids)},
+        impact_sql=f"SELECT COUNT(*) FROM sesje_gracze WHERE sesja_id {_in('ids')}",
+        impact_labels=("Usuwane powiązania sesja–gracz: {n}",),
+        statements=(
+            f"DELETE FROM sesje_gracze WHERE sesja_id {_in('ids')}",
+            f"DELETE FROM sesje_rpg WHERE id {_in('ids')}",
+        ),
+        changes=(
+            ChangeEvent(change_events.SESJE_RPG, tuple(ids), change_events.DELETE),
+            ChangeEvent(change_events.SESJE_GRACZE, tuple(ids), change_events.DELETE),
+        ),
+    )
+
+
+def plan_players(ids: Sequence[int], name: Optional[str] = None) -> DeletePlan:
+    """
+    Gracze; znikają ich udziały w sesjach, a sesje, które prowadzili, zostają bez MG.
+
+    Zapisana w sesji ``liczba_graczy`` zostaje bez zmian — to dane historyczne.
+
+    ``name`` — nick przy usuwaniu jednego gracza (treść pytania).
+    """
+    return DeletePlan(
+        title="Usuń gracza" if name is not None else "Usuń zaznaczonych graczy",
+        question=(
+            f"Czy na pewno chcesz usunąć gracza: {name}?" if name is not None
+            else f"Zaznaczeni gracze: {len(ids)}.\nCzy na pewno chcesz ich usunąć?"
+        ),
+        db_file="gracze.db",
+        attach=(("ses", "sesje_rpg.db"),),
+        params={"ids": _ids_param(ids)},
+        impact_sql=f"""
+            SELECT
+                (SELECT COUNT(*) FROM ses.sesje_gracze WHERE gracz_id {_in('ids')}),
+                (SELECT COUNT(*) FROM ses.sesje_rpg WHERE mg_id {_in('ids')})
+        """,
+        impact_labels=(
+            "Usuwane udziały w sesjach: {n}",
+            "Sesje prowadzone przez usuwanych graczy (zostaną bez MG): {n}",
+        ),
+        statements=(
+            f"DELETE FROM ses.sesje_gracze WHERE gracz_id {_in('ids')}",
+            f"UPDATE ses.sesje_rpg SET mg_id = NULL WHERE mg_id {_in('ids')}",
+            f"DELETE FROM gracze WHERE id {_in('ids')}",
+        ),
+        changes=(
+            ChangeEvent(change_events.GRACZE, tuple(ids), change_events.DELETE),
+            ChangeEvent(change_events.SESJE_GRACZE),
+            ChangeEvent(change_events.SESJE_RPG),
+        ),
+    )
+
+
+def plan_publishers(ids: Sequence[int], name: Optional[str] = None) -> DeletePlan:
+    """
+    Wydawcy; pozycje i systemy gier tych wydawców zostają bez wydawcy.
+
+    ``name`` — nazwa przy usuwaniu jednego wydawcy (treść pytania).
+    """
+    return DeletePlan(
+        title="Usuń wydawcę" if name is not None else "Usuń zaznaczonych wydawców",
+        question=(
+            f"Czy na pewno chcesz usunąć wydawcę: {name}?" if name is not None
+            else f"Zaznaczeni wydawcy: {len(ids)}.\nCzy na pewno chcesz ich usunąć?"
+        ),
+        db_file="wydawcy.db",
+        attach=(("sys", "systemy_rpg.db"),),
+        params={"ids": _ids_param(ids)},
+        impact_sql=f"""
+            SELECT
+                (SELECT COUNT(*) FROM sys.systemy_rpg WHERE wydawca_id {_in('ids')}),
+                (SELECT COUNT(*) FROM sys.systemy_gry WHERE wydawca_id {_in('ids')})
+        """,
+        impact_labels=(
+            "Pozycje, które zostaną bez wydawcy: {n}",
+            "Systemy, które zostaną bez wydawcy: {n}",
+        ),
+        statements=(
+            f"UPDATE sys.systemy_rpg SET wydawca_id = NULL WHERE wydawca_id {_in('ids')}",
+            f"UPDATE sys.systemy_gry SET wydawca_id = NULL WHERE wydawca_id {_in('ids')}",
+            f"DELETE FROM wydawcy WHERE id {_in('ids')}",
+        ),
+        changes=(
+            ChangeEvent(change_events.WYDAWCY, tuple(ids), change_events.DELETE),
+            ChangeEvent(change_events.SYSTEMY_RPG),
+            ChangeEvent(change_events.SYSTEMY_GRY),
+        ),
+    )
+
+
+# ── Podgląd i wykonanie ──
+
+def _attach_paths(plan: DeletePlan) -> Tuple[Tuple[str, str], ...]:
+    return tuple((alias, get_own_db_path(db_file)) for alias, db_file in plan.attach)
+
+
+def preview_impact(plan: DeletePlan) -> List[str]:
+    """Opisy niezerowych skutków usunięcia (jedno zapytanie, połączenie tylko do odczytu)."""
+    main = Path(get_own_db_path(plan.db_file)).resolve()
+    with closing(sqlite3.connect(main.as_uri() + "?mode=ro", uri=True)) as conn:
+        for alias, path in _attach_paths(plan):
+            conn.execute(
+                f"ATTACH DATABASE ? AS {alias}", (Path(path).resolve().as_uri() + "?mode=ro",)
+            )
+        counts = conn.execute(plan.impact_sql, plan.params).fetchone()
+    return [label.format(n=n) for label, n in zip(plan.impact_labels, counts) if n]
+
+
+def execute_plan(conn: sqlite3.Connection, plan: DeletePlan) -> None:
+    """Wykonuje instrukcje planu na połączeniu z dołączonymi bazami (bez ``commit``)."""
+    for sql in plan.statements:
+        conn.execute(sql, plan.params)
+
+
+def confirm_and_delete(
+    parent: tk.Misc, plan: DeletePlan, on_deleted: Optional[Callable[[], None]] = None
+) -> None:
+    """
+    Liczy skutki w tle, pyta o potwierdzenie i zleca usunięcie jednym zapisem.
+
+    Args:
+        parent: Zakładka (rodzic okien, przez nią wracają wyniki).
+        on_deleted: Wywoływane po zatwierdzeniu transakcji (wątek Tk).
+    """
+    if is_guest_mode():
+        messagebox.showwarning(
+            "Tryb gościa", "W trybie gościa usuwanie danych jest wyłączone.", parent=parent
+        )
+        return
+
+    def _confirm(impact: List[str]) -> None:
+        text = plan.question
+        if impact:
+            text += "\n\nSkutki:\n" + "\n".join(f"• {line}" for line in impact)
+        text += "\n\nOperacja jest nieodwracalna."
+        if not messagebox.askyesno(plan.title, text, parent=parent):
+            return
+
+        def _done(_result: Any) -> None:
+            _log.info("%s: zatwierdzono", plan.title)
+            if on_deleted is not None:
+                on_deleted()
+
+        def _write_error(exc: BaseException) -> None:
+            messagebox.showerror(
+                "Błąd bazy danych", f"Nie udało się usunąć:\n{exc}", parent=parent
+            )
+
+        db_writer.submit(
+            get_own_db_path(plan.db_file),
+            lambda conn: execute_plan(conn, plan),
+            parent,
+            _done,
+            _write_error,
+            label=plan.title,
+            changes=plan.changes,
+            attach=_attach_paths(plan),
+        )
+
+    def _error(exc: BaseException) -> None:
+        _log.error("Błąd podglądu usuwania", exc_info=(type(exc), exc, exc.__traceback__))
+        messagebox.showerror(
+            "Błąd bazy danych",
+            f"Nie udało się sprawdzić skutków usunięcia:\n{exc}",
+            parent=parent,
+        )
+
+    task_executor.submit(
+        f"bulk_delete:{plan.db_file}",
+        parent,
+        lambda: preview_impact(plan),
+        _confirm,
+        priority=task_executor.PRIORITY_VISIBLE,
+        on_error=_error,
+    )
+
+
+__all__ = [
+    "DeletePlan",
+    "confirm_and_delete",
+    "execute_plan",
+    "plan_players",
+    "plan_publishers",
+    "plan_sessions",
+    "plan_systems",
+    "preview_impact",
+]
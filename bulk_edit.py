@@ -0,0 +1,196 @@
+"""
+Edycja zbiorcza — zmiana wybranych pól wielu zaznaczonych rekordów naraz.
+
+Okno pokazuje listę pól; zapisywane są tylko pola z zaznaczonym polem wyboru.
+Zapis idzie przez ``db_writer`` jednym ``executemany`` w jednej transakcji,
+a rekordy, które już mają docelowe wartości, są pomijane warunkiem ``IS NOT``
+(bez pustych zapisów i wpisów w dzienniku synchronizacji). Po zatwierdzeniu
+publikowane jest jedno zdarzenie ``change_events`` z identyfikatorami rekordów —
+zakładka odświeża się raz, a ``CTkDataTable`` przerysowuje tylko wiersze,
+których dane faktycznie się zmieniły.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import tkinter as tk
+from dataclasses import dataclass
+from tkinter import messagebox
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import customtkinter as ctk  # type: ignore
+
+import db_writer
+from change_events import ChangeEvent
+from database_manager import is_guest_mode
+from dialog_utils import apply_safe_geometry, create_ctk_toplevel
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class BulkField:
+    """
+    Pole okna edycji zbiorczej.
+
+    ``choices`` to pary (etykieta, wartości kolumn) — jedna pozycja listy może
+    ustawiać kilka kolumn (np. typ sesji). Bez ``choices`` pole jest tekstowe
+    i zapisuje do ``column`` (puste pole → NULL).
+    """
+
+    label: str
+    choices: Optional[Sequence[Tuple[str, Dict[str, Any]]]] = None
+    column: Optional[str] = None
+
+
+def build_bulk_update(
+    table: str, ids: Sequence[int], values: Dict[str, Any]
+) -> Tuple[str, List[Tuple[Any, ...]]]:
+    """
+    Zapytanie ``UPDATE`` dla ``executemany`` i jego parametry (jeden zestaw na rekord).
+
+    Rekordy, w których wszystkie kolumny mają już docelowe wartości, nie są
+    zapisywane (``(kolumny) IS NOT (wartości)``).
+    """
+    if not values:
+        raise ValueError("Brak pól do zmiany")
+    cols = list(values)
+    assignments = ", ".join(f"{col} = ?" for col in cols)
+    targets = ", ".join(cols)
+    placeholders = ", ".join("?" for _ in cols)
+    sql = (
+        f"UPDATE {table} SET {assignments} "
+        f"WHERE id = ? AND ({targets}) IS NOT ({placeholders})"
+    )
+    vals = tuple(values[col] for col in cols)
+    return sql, [vals + (rid,) + vals for rid in ids]
+
+
+def apply_bulk_update(
+    conn: sqlite3.Connection, table: str, ids: Sequence[int], values: Dict[str, Any]
+) -> int:
+    """Wykonuje edycję zbiorczą (bez ``commit``); zwraca liczbę zmienionych rekordów."""
+    sql, params = build_bulk_update(table, ids, values)
+    return conn.executemany(sql, params).rowcount
+
+
+def open_bulk_edit_dialog(
+    parent: tk.Misc,
+    *,
+    title: str,
+    db_path: str,
+    table: str,
+    ids: Sequence[int],
+    fields: Sequence[BulkField],
+    change_tables: Sequence[str],
+) -> None:
+    """
+    Otwiera okno edycji zbiorczej rekordów ``ids`` tabeli ``table``.
+
+    Args:
+        parent: Zakładka (przez nią wraca wynik zapisu).
+        change_tables: Tabele, dla których po zapisie publikowane są zdarzenia zmian.
+    """
+    if is_guest_mode():
+        messagebox.showwarning(
+            "Tryb gościa",
+            "W trybie gościa edycja danych jest wyłączona.\n"
+            "Wróć do własnych danych, aby dokonać zmian.",
+            parent=parent,
+        )
+        return
+    ids = list(ids)
+    if not ids:
+        return
+
+    dlg = create_ctk_toplevel(parent)
+    dlg.withdraw()
+    dlg.title(title)
+    dlg.transient(parent.winfo_toplevel())
+    dlg.resizable(True, True)
+    apply_safe_geometry(dlg, parent, 520, 160 + 48 * len(fields))
+
+    mf = ctk.CTkFrame(dlg)
+    mf.pack(fill=tk.BOTH, expand=True, padx=20, pady=20)
+    mf.columnconfigure(1, weight=1)
+
+    ctk.CTkLabel(
+        mf, text=f"Zaznaczone rekordy: {len(ids)}", font=ctk.CTkFont(weight="bold"),
+    ).grid(row=0, column=0, columnspan=2, pady=(0, 4), sticky="w")
+    ctk.CTkLabel(
+        mf, text="Zmienione zostaną tylko pola z zaznaczonym polem wyboru.",
+    ).grid(row=1, column=0, columnspan=2, pady=(0, 10), sticky="w")
+
+    # (pole, czy zmieniać, wartość)
+    rows: List[Tuple[BulkField, tk.BooleanVar, tk.StringVar]] = []
+    for n, field in enumerate(fields, start=2):
+        enabled = tk.BooleanVar(value=False)
+        value = tk.StringVar(value=field.choices[0][0] if field.choices else "")
+        if field.choices:
+            widget: Any = ctk.CTkComboBox(
+                mf, variable=value, values=[label for label, _ in field.choices],
+                state="disabled", width=260,
+            )
+        else:
+            widget = ctk.CTkEntry(mf, textvariable=value, state="disabled", width=260)
+
+        def _toggle(w: Any = widget, v: tk.BooleanVar = enabled, f: BulkField = field) -> None:
+            if not v.get():
+                w.configure(state="disabled")
+            else:
+                w.configure(state="readonly" if f.choices else "normal")
+
+        ctk.CTkCheckBox(mf, text=field.label, variable=enabled, command=_toggle).grid(
+            row=n, column=0, pady=6, padx=(0, 10), sticky="w"
+        )
+        widget.grid(row=n, column=1, pady=6, sticky="ew")
+        rows.append((field, enabled, value))
+
+    bf = ctk.CTkFrame(mf, fg_color="transparent")
+    bf.grid(row=len(fields) + 2, column=0, columnspan=2, pady=(16, 0))
+
+    def _save() -> None:
+        values: Dict[str, Any] = {}
+        for field, enabled, value in rows:
+            if not enabled.get():
+                continue
+            if field.choices:
+                values.update(dict(field.choices)[value.get()])
+            elif field.column:
+                values[field.column] = value.get().strip() or None
+        if not values:
+            messagebox.showerror("Błąd", "Zaznacz co najmniej jedno pole do zmiany.", parent=dlg)
+            return
+
+        def _saved(changed: int) -> None:
+            _log.info("Edycja zbiorcza %s: %d z %d rekordów", table, changed, len(ids))
+            messagebox.showinfo(
+                "Edycja zbiorcza",
+                f"Zmieniono {changed} z {len(ids)} zaznaczonych rekordów.",
+                parent=parent.winfo_toplevel(),
+            )
+
+        db_writer.submit_dialog_save(
+            db_path,
+            lambda conn: apply_bulk_update(conn, table, ids, values),
+            dlg,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            error_message="Nie udało się zapisać zmian zbiorczych.",
+            changes=tuple(ChangeEvent(t, tuple(ids)) for t in change_tables),
+        )
+
+    save_btn = ctk.CTkButton(
+        bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    cancel_btn = ctk.CTkButton(
+        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555",
+        width=90,
+    )
+    cancel_btn.pack(side=tk.LEFT, padx=5)
+    dlg.after(0, dlg.deiconify)
+
+
+__all__ = ["BulkField", "apply_bulk_update", "build_bulk_update", "open_bulk_edit_dialog"]
@@ -0,0 +1,628 @@
+"""
+Import masowy — systemy, suplementy, sesje i gracze z plików CSV/JSONL.
+
+Plik jest czytany strumieniowo, wiersz po wierszu; każdy wiersz to jeden
+rekord (nagłówki CSV / klucze JSON to nazwy pól, np. ``nazwa``, ``wydawca``,
+``gra``). Wydawcy, gry (``systemy_gry``) i gracze są wskazywani nazwą —
+indeksy nazwa → id są budowane raz w pamięci, a brakujące wpisy zakładane
+z identyfikatorami przydzielanymi bez zapytań do bazy. Wiersze trafiają do
+baz przez ``executemany`` porcjami po ``_CHUNK_ROWS``, każda porcja w jednej
+transakcji obejmującej wszystkie pliki baz (jedno połączenie z ``ATTACH``).
+
+Błędny wiersz nie przerywa importu — trafia do raportu z numerem linii
+i przyczyną. Zaległe zapisy aplikacji (``db_writer.flush``) musi opróżnić
+wywołujący. Moduł nie importuje Tk.
+"""
+from __future__ import annotations
+
+import csv
+import io
+import json
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from database_manager import (
+    TEXT_EXPORT_FORMATS,
+    OperationCancelled,
+    ProgressCallback,
+    get_own_db_path,
+)
+from db_compare import normalize_name
+
+_log = logging.getLogger(__name__)
+
+KIND_SYSTEMS = "systemy"
+KIND_SUPPLEMENTS = "suplementy"
+KIND_SESSIONS = "sesje"
+KIND_PLAYERS = "gracze"
+KINDS = (KIND_SYSTEMS, KIND_SUPPLEMENTS, KIND_SESSIONS, KIND_PLAYERS)
+
+IMPORT_FORMATS = TEXT_EXPORT_FORMATS
+
+_CHUNK_ROWS = 500
+
+_CORE_BOOK = "Podręcznik Główny"
+_SUPPLEMENT = "Suplement"
+_ITEM_TYPES = (_CORE_BOOK, _SUPPLEMENT)
+_COLLECTION_STATUSES = ("W kolekcji", "Na sprzedaż", "Sprzedane", "Nieposiadane", "Do kupienia")
+_TRUE = {"1", "tak", "t", "true", "yes", "y", "x", "✓"}
+_FALSE = {"0", "nie", "n", "false", "no", "-"}
+
+# Alternatywne nazwy pól (np. z eksportu zakładki albo arkusza) → nazwa kanoniczna
+_FIELD_ALIASES = {
+    "system_gry": "gra",
+    "wydawca_nazwa": "wydawca",
+    "system_glowny_nazwa": "system_glowny",
+    "podrecznik_glowny": "system_glowny",
+    "data": "data_sesji",
+    "system": "gra",
+    "mistrz_gry": "mg",
+    "gm": "mg",
+    "imie": "imie_nazwisko",
+}
+
+# Kolumny zapisywane w kolejności (pomijane, gdy brak ich w schemacie bazy)
+_SYSTEM_COLUMNS = (
+    "id", "nazwa", "typ", "system_glowny_id", "typ_suplementu", "wydawca_id", "fizyczny",
+    "pdf", "vtt", "jezyk", "status_gra", "status_kolekcja", "cena_zakupu", "waluta_zakupu",
+    "cena_sprzedazy", "waluta_sprzedazy", "system_glowny_nazwa_custom", "system_gry_id",
+    "cena_fiz", "cena_pdf", "cena_vtt",
+)
+_SESSION_COLUMNS = (
+    "id", "data_sesji", "system_id", "liczba_graczy", "mg_id", "kampania", "jednostrzal",
+    "tytul_kampanii", "tytul_przygody",
+)
+_PLAYER_COLUMNS = (
+    "id", "nick", "imie_nazwisko", "plec", "social", "glowny_uzytkownik", "wazna", "grupa",
+)
+
+# Bazy potrzebne dla rodzaju importu (pierwsza — główna baza rodzaju)
+_KIND_DB_FILES: Dict[str, Tuple[str, ...]] = {
+    KIND_SYSTEMS: ("systemy_rpg.db", "wydawcy.db"),
+    KIND_SUPPLEMENTS: ("systemy_rpg.db", "wydawcy.db"),
+    KIND_SESSIONS: ("sesje_rpg.db", "systemy_rpg.db", "gracze.db"),
+    KIND_PLAYERS: ("gracze.db",),
+}
+
+
+class _RowRejected(ValueError):
+    """Wiersz pominięty z podanej przyczyny."""
+
+
+@dataclass
+class RowError:
+    """Wiersz, którego nie zaimportowano."""
+
+    line: int
+    message: str
+
+
+@dataclass
+class BulkImportReport:
+    """Wynik importu masowego."""
+
+    kind: str
+    inserted: int = 0
+    # Tabela → liczba wpisów założonych z nazw (wydawcy, systemy_gry, gracze)
+    created: Dict[str, int] = field(default_factory=dict)
+    errors: List[RowError] = field(default_factory=list)
+    # Tabela → identyfikatory nowych wierszy (dla ``change_events``)
+    inserted_ids: Dict[str, List[int]] = field(default_factory=dict)
+
+    def _add_ids(self, table: str, ids: Sequence[int]) -> None:
+        if ids:
+            self.inserted_ids.setdefault(table, []).extend(ids)
+
+
+# ── Odczyt pliku ──
+
+def detect_format(path: Path) -> str:
+    """Format pliku po rozszerzeniu (``csv`` albo ``jsonl``)."""
+    fmt = path.suffix.lower().lstrip(".")
+    if fmt == "ndjson":
+        fmt = "jsonl"
+    if fmt not in IMPORT_FORMATS:
+        raise ValueError(f"Nieobsługiwany format pliku: {path.name} (oczekiwano CSV lub JSONL).")
+    return fmt
+
+
+def _canonical_key(key: Any) -> str:
+    name = "_".join(normalize_name(str(key)).split())
+    return _FIELD_ALIASES.get(name, name)
+
+
+def _iter_records(
+    raw: io.BufferedReader, fmt: str
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Kolejne rekordy pliku: (numer linii, rekord, błąd odczytu)."""
+    text = io.TextIOWrapper(raw, encoding="utf-8-sig", newline="")
+    try:
+        yield from _iter_text_records(text, fmt)
+    finally:
+        text.detach()  # plik zamyka wywołujący (potrzebuje ``tell`` do postępu)
+
+
+def _iter_text_records(
+    text: io.TextIOWrapper, fmt: str
+) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    if fmt == "jsonl":
+        for line_no, line in enumerate(text, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, None, f"niepoprawny JSON: {e.msg}"
+                continue
+            if not isinstance(record, dict):
+                yield line_no, None, "wiersz JSONL musi być obiektem"
+                continue
+            yield line_no, {_canonical_key(k): v for k, v in record.items()}, None
+        return
+
+    header = text.readline()
+    # Arkusze w polskich ustawieniach zapisują CSV ze średnikiem
+    delimiter = ";" if header.count(";") > header.count(",") else ","
+    fields = [_canonical_key(name) for name in next(csv.reader([header], delimiter=delimiter))]
+    reader = csv.reader(text, delimiter=delimiter)
+    for row in reader:
+        if not any(cell.strip() for cell in row):
+            continue
+        line_no = reader.line_num + 1
+        if len(row) > len(fields):
+            yield line_no, None, f"więcej kolumn ({len(row)}) niż w nagłówku ({len(fields)})"
+            continue
+        yield line_no, dict(zip(fields, row)), None
+
+
+# ── Wartości pól ──
+
+def _text(record: Dict[str, Any], key: str) -> Optional[str]:
+    value = record.get(key)
+    if value is None:
+        return None
+    text = str(value).strip()
+    return text or None
+
+
+def _flag(record: Dict[str, Any], key: str, default: int = 0) -> int:
+    value = record.get(key)
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, (int, float)):
+        return int(bool(value))
+    text = (_text(record, key) or "").casefold()
+    if not text:
+        return default
+    if text in _TRUE:
+        return 1
+    if text in _FALSE:
+        return 0
+    raise _RowRejected(f"pole {key}: oczekiwano tak/nie, jest „{value}”")
+
+
+def _number(record: Dict[str, Any], key: str) -> Optional[float]:
+    value = record.get(key)
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    text = _text(record, key)
+    if text is None:
+        return None
+    try:
+        return float(text.replace(" ", "").replace(",", "."))
+    except ValueError:
+        raise _RowRejected(f"pole {key}: „{text}” nie jest liczbą") from None
+
+
+def _names(record: Dict[str, Any], key: str) -> List[str]:
+    value = record.get(key)
+    if isinstance(value, list):
+        items = [str(v).strip() for v in value]
+    else:
+        text = _text(record, key) or ""
+        items = [part.strip() for part in text.replace(";", ",").split(",")]
+    return [item for item in items if item]
+
+
+def _date(record: Dict[str, Any], key: str) -> str:
+    text = _text(record, key)
+    if text is None:
+        raise _RowRejected(f"brak pola {key}")
+    for fmt in ("%Y-%m-%d", "%d.%m.%Y"):
+        try:
+            return datetime.strptime(text, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    raise _RowRejected(f"pole {key}: „{text}” nie jest datą (RRRR-MM-DD lub DD.MM.RRRR)")
+
+
+# ── Indeksy nazw ──
+
+class _NameIndex:
+    """Znormalizowana nazwa → id; brakujące wpisy dostają kolejne id w pamięci."""
+
+    def __init__(
+        self, conn: sqlite3.Connection, schema: str, table: str, column: str
+    ) -> None:
+        self.schema = schema
+        self.table = table
+        self.column = column
+        self.ids: Dict[str, int] = {}
+        next_id = 1
+        for row_id, name in conn.execute(f"SELECT id, [{column}] FROM {schema}.[{table}]"):
+            self.ids.setdefault(normalize_name(name), row_id)
+            next_id = max(next_id, row_id + 1)
+        self.next_id = next_id
+        self.pending: List[Tuple[int, str]] = []
+        self.created = 0
+
+    def get(self, name: str) -> Optional[int]:
+        return self.ids.get(normalize_name(name))
+
+    def get_or_create(self, name: str) -> int:
+        key = normalize_name(name)
+        row_id = self.ids.get(key)
+        if row_id is None:
+            row_id = self.ids[key] = self.next_id
+            self.next_id += 1
+            self.pending.append((row_id, name))
+            self.created += 1
+        return row_id
+
+    def flush(self, conn: sqlite3.Connection) -> List[int]:
+        """Zapisuje nowe wpisy (wewnątrz transakcji wywołującego)."""
+        conn.executemany(
+            f"INSERT INTO {self.schema}.[{self.table}] (id, [{self.column}]) VALUES (?, ?)",
+            self.pending,
+        )
+        ids = [row_id for row_id, _ in self.pending]
+        self.pending = []
+        return ids
+
+
+def _max_id(conn: sqlite3.Connection, schema: str, table: str) -> int:
+    return conn.execute(f"SELECT COALESCE(MAX(id), 0) FROM {schema}.[{table}]").fetchone()[0]
+
+
+def _columns(conn: sqlite3.Connection, schema: str, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{table}])")}
+
+
+class _Table:
+    """Wiersze jednej tabeli czekające na zapis porcji."""
+
+    def __init__(
+        self, conn: sqlite3.Connection, schema: str, table: str, columns: Sequence[str]
+    ) -> None:
+        own = _columns(conn, schema, table)
+        self.table = table
+        self.columns = [c for c in columns if c in own]
+        cols = ", ".join(f"[{c}]" for c in self.columns)
+        marks = ", ".join("?" for _ in self.columns)
+        self.sql = f"INSERT INTO {schema}.[{table}] ({cols}) VALUES ({marks})"
+        self.rows: List[Tuple[Any, ...]] = []
+
+    def add(self, record: Dict[str, Any]) -> None:
+        self.rows.append(tuple(record.get(c) for c in self.columns))
+
+    def flush(self, conn: sqlite3.Connection) -> List[int]:
+        conn.executemany(self.sql, self.rows)
+        ids = [row[0] for row in self.rows] if self.columns[:1] == ["id"] else []
+        self.rows = []
+        return ids
+
+
+# ── Import ──
+
+class _Importer:
+    """Zamiana rekordów danego rodzaju na wiersze tabel."""
+
+    def __init__(self, conn: sqlite3.Connection, aliases: Dict[str, str], kind: str) -> None:
+        self.kind = kind
+        self.indexes: List[_NameIndex] = []
+        self.tables: List[_Table] = []
+        self.player_index: Optional[_NameIndex] = None
+        self.has_main_player = False
+        if kind in (KIND_SYSTEMS, KIND_SUPPLEMENTS):
+            sys_schema = aliases["systemy_rpg.db"]
+            self.publishers = _NameIndex(conn, aliases["wydawcy.db"], "wydawcy", "nazwa")
+            self.games = _NameIndex(conn, sys_schema, "systemy_gry", "nazwa")
+            self.indexes = [self.publishers, self.games]
+            # Podręczniki główne: nazwa → (id, id gry) — suplementy wskazują je nazwą
+            self.core_books: Dict[str, Tuple[int, Optional[int]]] = {}
+            for row_id, name, game_id in conn.execute(
+                f"SELECT id, nazwa, system_gry_id FROM {sys_schema}.systemy_rpg"
+                " WHERE typ = ? ORDER BY id", (_CORE_BOOK,)
+            ):
+                self.core_books.setdefault(normalize_name(name), (row_id, game_id))
+            self.next_id = _max_id(conn, sys_schema, "systemy_rpg") + 1
+            self.items = _Table(conn, sys_schema, "systemy_rpg", _SYSTEM_COLUMNS)
+            self.tables = [self.items]
+            self.convert: Callable[[Dict[str, Any]], None] = self._system
+        elif kind == KIND_SESSIONS:
+            ses_schema = aliases["sesje_rpg.db"]
+            self.games = _NameIndex(conn, aliases["systemy_rpg.db"], "systemy_gry", "nazwa")
+            self.player_index = _NameIndex(conn, aliases["gracze.db"], "gracze", "nick")
+            self.indexes = [self.games, self.player_index]
+            self.next_id = _max_id(conn, ses_schema, "sesje_rpg") + 1
+            self.sessions = _Table(conn, ses_schema, "sesje_rpg", _SESSION_COLUMNS)
+            self.links = _Table(conn, ses_schema, "sesje_gracze", ("sesja_id", "gracz_id"))
+            self.tables = [self.sessions, self.links]
+            self.convert = self._session
+        elif kind == KIND_PLAYERS:
+            self.player_schema = aliases["gracze.db"]
+            self.player_index = _NameIndex(conn, self.player_schema, "gracze", "nick")
+            self.next_id = self.player_index.next_id
+            self.players = _Table(conn, self.player_schema, "gracze", _PLAYER_COLUMNS)
+            self.tables = [self.players]
+            self.convert = self._player
+        else:
+            raise ValueError(f"Nieznany rodzaj importu: {kind}")
+
+    def _take_id(self) -> int:
+        row_id = self.next_id
+        self.next_id += 1
+        return row_id
+
+    def _system(self, record: Dict[str, Any]) -> None:
+        nazwa = _text(record, "nazwa")
+        if nazwa is None:
+            raise _RowRejected("brak pola nazwa")
+        default_type = _SUPPLEMENT if self.kind == KIND_SUPPLEMENTS else _CORE_BOOK
+        typ = _text(record, "typ") or default_type
+        if typ not in _ITEM_TYPES:
+            raise _RowRejected(f"pole typ: „{typ}” (dozwolone: {', '.join(_ITEM_TYPES)})")
+        status = _text(record, "status_kolekcja") or _COLLECTION_STATUSES[0]
+        if status not in _COLLECTION_STATUSES:
+            raise _RowRejected(f"pole status_kolekcja: nieznany status „{status}”")
+        main_name = _text(record, "system_glowny")
+        game_name = _text(record, "gra")
+        if typ == _SUPPLEMENT and main_name is None and game_name is None:
+            raise _RowRejected("suplement wymaga pola system_glowny lub gra")
+        row: Dict[str, Any] = {
+            "nazwa": nazwa,
+            "typ": typ,
+            "typ_suplementu": _text(record, "typ_suplementu") if typ == _SUPPLEMENT else None,
+            "fizyczny": _flag(record, "fizyczny"),
+            "pdf": _flag(record, "pdf"),
+            "vtt": _text(record, "vtt"),
+            "jezyk": _text(record, "jezyk"),
+            "status_gra": _text(record, "status_gra") or "Nie grane",
+            "status_kolekcja": status,
+            "waluta_zakupu": _text(record, "waluta_zakupu"),
+            "cena_sprzedazy": _number(record, "cena_sprzedazy"),
+            "waluta_sprzedazy": _text(record, "waluta_sprzedazy"),
+            "cena_fiz": _number(record, "cena_fiz"),
+            "cena_pdf": _number(record, "cena_pdf"),
+            "cena_vtt": _number(record, "cena_vtt"),
+        }
+        row["cena_zakupu"] = row["cena_fiz"]  # kopia zapasowa jak w oknie dodawania
+        if any(row[c] is not None for c in ("cena_fiz", "cena_pdf", "cena_vtt")):
+            row["waluta_zakupu"] = row["waluta_zakupu"] or "PLN"
+
+        # Nazwy rozwiązywane dopiero po walidacji — odrzucony wiersz niczego nie zakłada
+        publisher = _text(record, "wydawca")
+        row["wydawca_id"] = self.publishers.get_or_create(publisher) if publisher else None
+        game_id: Optional[int] = None
+        if typ == _SUPPLEMENT and main_name is not None:
+            main = self.core_books.get(normalize_name(main_name))
+            if main is not None:
+                row["system_glowny_id"], game_id = main
+            else:
+                # Podręcznika nie ma w bazie — nazwa zostaje jako własna, jak w oknie edycji
+                row["system_glowny_nazwa_custom"] = main_name
+        if game_name is not None:
+            game_id = self.games.get_or_create(game_name)
+        elif typ == _CORE_BOOK:
+            # Podręcznik główny musi należeć do gry — domyślnie gra o tej samej nazwie
+            game_id = self.games.get_or_create(nazwa)
+        row["system_gry_id"] = game_id
+        row["id"] = self._take_id()
+        if typ == _CORE_BOOK:
+            self.core_books.setdefault(normalize_name(nazwa), (row["id"], game_id))
+        self.items.add(row)
+
+    def _session(self, record: Dict[str, Any]) -> None:
+        assert self.player_index is not None
+        data_sesji = _date(record, "data_sesji")
+        game_name = _text(record, "gra")
+        if game_name is None:
+            raise _RowRejected("brak pola gra (system sesji)")
+        kampania = _flag(record, "kampania")
+        jednostrzal = _flag(record, "jednostrzal")
+        session_type = normalize_name(_text(record, "typ_sesji") or "")
+        if "kampan" in session_type:
+            kampania = 1
+        if "jednostrza" in session_type:
+            jednostrzal = 1
+        players = _names(record, "gracze")
+        count = _number(record, "liczba_graczy")
+        mg = _text(record, "mg")
+
+        player_ids = list(dict.fromkeys(self.player_index.get_or_create(n) for n in players))
+        row = {
+            "id": self._take_id(),
+            "data_sesji": data_sesji,
+            "system_id": self.games.get_or_create(game_name),
+            "liczba_graczy": int(count) if count is not None else len(player_ids),
+            "mg_id": self.player_index.get_or_create(mg) if mg else None,
+            "kampania": kampania,
+            "jednostrzal": jednostrzal,
+            "tytul_kampanii": _text(record, "tytul_kampanii"),
+            "tytul_przygody": _text(record, "tytul_przygody"),
+        }
+        self.sessions.add(row)
+        for player_id in player_ids:
+            self.links.add({"sesja_id": row["id"], "gracz_id": player_id})
+
+    def _player(self, record: Dict[str, Any]) -> None:
+        assert self.player_index is not None
+        nick = _text(record, "nick")
+        if nick is None:
+            raise _RowRejected("brak pola nick")
+        if self.player_index.get(nick) is not None:
+            raise _RowRejected(f"gracz „{nick}” już istnieje")
+        row = {
+            "nick": nick,
+            "imie_nazwisko": _text(record, "imie_nazwisko"),
+            "plec": _text(record, "plec"),
+            "social": _text(record, "social"),
+            "glowny_uzytkownik": _flag(record, "glowny_uzytkownik"),
+            "wazna": _flag(record, "wazna"),
+            "grupa": _text(record, "grupa"),
+        }
+        row["id"] = self.player_index.ids[normalize_name(nick)] = self._take_id()
+        self.has_main_player = self.has_main_player or bool(row["glowny_uzytkownik"])
+        self.players.add(row)
+
+    def pending_rows(self) -> int:
+        return len(self.tables[0].rows)
+
+    def flush(self, conn: sqlite3.Connection, report: BulkImportReport) -> None:
+        """Zapisuje porcję w jednej transakcji (nowe nazwy, potem wiersze)."""
+        if not self.pending_rows() and not any(index.pending for index in self.indexes):
+            return
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            if self.has_main_player:
+                self._keep_single_main_player(conn)
+            new_ids = [(index, index.flush(conn)) for index in self.indexes]
+            table_ids = [(table, table.flush(conn)) for table in self.tables]
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+        for index, ids in new_ids:
+            report._add_ids(index.table, ids)
+        for table, ids in table_ids:
+            report._add_ids(table.table, ids)
+            if table is self.tables[0]:
+                report.inserted += len(ids)
+
+    def _keep_single_main_player(self, conn: sqlite3.Connection) -> None:
+        # Główny użytkownik może być jeden — zostaje ostatni z importu
+        flag = self.players.columns.index("glowny_uzytkownik")
+        last = max(i for i, row in enumerate(self.players.rows) if row[flag])
+        self.players.rows = [
+            row[:flag] + (int(i == last),) + row[flag + 1:]
+            for i, row in enumerate(self.players.rows)
+        ]
+        conn.execute(f"UPDATE {self.player_schema}.gracze SET glowny_uzytkownik = 0")
+        self.has_main_player = False
+
+
+def _open_own(db_files: Sequence[str]) -> Tuple[sqlite3.Connection, Dict[str, str]]:
+    """Jedno połączenie z bazami rodzaju (pierwsza jako ``main``, reszta dołączona)."""
+    missing = [f for f in db_files if not Path(get_own_db_path(f)).exists()]
+    if missing:
+        raise ValueError(
+            f"Brak baz: {', '.join(missing)} — uruchom najpierw aplikację, aby je utworzyć."
+        )
+    conn = sqlite3.connect(
+        Path(get_own_db_path(db_files[0])).resolve().as_uri(),
+        uri=True, timeout=30.0, isolation_level=None,
+    )
+    aliases = {db_files[0]: "main"}
+    for i, db_file in enumerate(db_files[1:], start=1):
+        alias = f"own{i}"
+        conn.execute(
+            "ATTACH DATABASE ? AS " + alias, (Path(get_own_db_path(db_file)).resolve().as_uri(),)
+        )
+        aliases[db_file] = alias
+    return conn, aliases
+
+
+def import_file(
+    path: Path,
+    kind: str,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> BulkImportReport:
+    """
+    Importuje rekordy danego rodzaju z pliku CSV/JSONL do własnych baz.
+
+    Args:
+        path: Plik ``.csv`` (przecinek albo średnik, UTF-8) lub ``.jsonl``.
+        kind: Jeden z ``KINDS``.
+        progress: Wywoływane po każdej porcji z (bajty przeczytane, rozmiar, opis).
+        cancel: Zdarzenie anulowania, sprawdzane między porcjami.
+
+    Raises:
+        OperationCancelled: Gdy ustawiono ``cancel`` — porcje zapisane
+            wcześniej zostają w bazie.
+        ValueError: Nieznany rodzaj lub format albo brak baz.
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Nieznany rodzaj importu: {kind} (dozwolone: {', '.join(KINDS)}).")
+    fmt = detect_format(path)
+    report = BulkImportReport(kind)
+    total = path.stat().st_size
+
+    conn, aliases = _open_own(_KIND_DB_FILES[kind])
+    with closing(conn), open(path, "rb") as raw:
+        importer = _Importer(conn, aliases, kind)
+
+        def _flush() -> None:
+            importer.flush(conn, report)
+            if progress is not None:
+                progress(raw.tell(), total, f"{report.inserted} wierszy")
+
+        for line_no, record, error in _iter_records(raw, fmt):
+            if record is not None:
+                try:
+                    importer.convert(record)
+                except _RowRejected as e:
+                    error = str(e)
+            if error is not None:
+                report.errors.append(RowError(line_no, error))
+            if importer.pending_rows() >= _CHUNK_ROWS:
+                _flush()
+                if cancel is not None and cancel.is_set():
+                    raise OperationCancelled()
+        _flush()
+
+    for index in importer.indexes:
+        if index.created:
+            report.created[index.table] = index.created
+    _log.info(
+        "Import masowy %s (%s): %d wierszy, założono %s, błędów %d",
+        path.name, kind, report.inserted, report.created, len(report.errors),
+    )
+    return report
+
+
+def format_report(report: BulkImportReport, max_errors: int = 10) -> str:
+    """Podsumowanie raportu do okna komunikatu lub konsoli."""
+    lines = [f"Zaimportowano: {report.inserted}"]
+    if report.created:
+        lines.append(
+            "Założono z nazw: " + ", ".join(f"{t} {n}" for t, n in report.created.items())
+        )
+    if report.errors:
+        lines.append(f"Pominięte wiersze: {len(report.errors)}")
+        lines.extend(f"  linia {e.line}: {e.message}" for e in report.errors[:max_errors])
+        if len(report.errors) > max_errors:
+            lines.append(f"  … i {len(report.errors) - max_errors} więcej")
+    return "\n".join(lines)
+
+
+__all__ = [
+    "IMPORT_FORMATS",
+    "KINDS",
+    "KIND_PLAYERS",
+    "KIND_SESSIONS",
+    "KIND_SUPPLEMENTS",
+    "KIND_SYSTEMS",
+    "BulkImportReport",
+    "RowError",
+    "detect_format",
+    "format_report",
+    "import_file",
+]
@@ -0,0 +1,73 @@
+"""
+Magistrala zdarzeń zmian danych aplikacji Sesyjka.
+
+Kod zapisujący do baz (dialogi, usuwanie, ``db_writer``) publikuje typowane
+zdarzenia ``ChangeEvent`` (tabela + identyfikatory rekordów), zamiast samodzielnie
+przebudowywać zakładki. Subskrybentem jest okno główne, które zbiera zdarzenia
+z jednego obiegu pętli Tk i odświeża tylko widoki zależne od zmienionych tabel.
+
+Publikować należy z wątku Tk (``db_writer`` robi to w callbacku po zapisie).
+"""
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from typing import Callable, Iterable, List, Tuple
+
+_log = logging.getLogger(__name__)
+
+# ── Tabele ────────────────────────────────────────────────────────────────────
+SYSTEMY_GRY = "systemy_gry"
+SYSTEMY_RPG = "systemy_rpg"
+SESJE_RPG = "sesje_rpg"
+SESJE_GRACZE = "sesje_gracze"
+GRACZE = "gracze"
+WYDAWCY = "wydawcy"
+
+ALL_TABLES = frozenset({SYSTEMY_GRY, SYSTEMY_RPG, SESJE_RPG, SESJE_GRACZE, GRACZE, WYDAWCY})
+
+# ── Rodzaje zmian ─────────────────────────────────────────────────────────────
+INSERT = "insert"
+UPDATE = "update"
+DELETE = "delete"
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """Zmiana w jednej tabeli; puste ``ids`` oznacza „nieznane / dowolne rekordy”."""
+
+    table: str
+    ids: Tuple[int, ...] = ()
+    kind: str = UPDATE
+
+
+Subscriber = Callable[[ChangeEvent], None]
+
+_subscribers: List[Subscriber] = []
+
+
+def subscribe(callback: Subscriber) -> Callable[[], None]:
+    """Rejestruje odbiorcę zdarzeń; zwraca funkcję wyrejestrowującą."""
+    _subscribers.append(callback)
+
+    def _unsubscribe() -> None:
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+    return _unsubscribe
+
+
+def publish(table: str, ids: Iterable[int] = (), kind: str = UPDATE) -> None:
+    """Publikuje zmianę w tabeli (wątek Tk)."""
+    publish_event(ChangeEvent(table, tuple(ids), kind))
+
+
+def publish_event(event: ChangeEvent) -> None:
+    """Przekazuje gotowe zdarzenie wszystkim subskrybentom."""
+    if event.table not in ALL_TABLES:
+        _log.warning("Zdarzenie zmiany dla nieznanej tabeli: %s", event.table)
+    for callback in list(_subscribers):
+        try:
+            callback(event)
+        except Exception:
+            _log.error("Błąd obsługi zdarzenia zmiany (%s)", event.table, exc_info=True)
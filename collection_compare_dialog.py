@@ -0,0 +1,170 @@
+"""
+Okno porównania kolekcji — własne bazy kontra bazy gościa.
+
+Zestawienie liczy ``db_compare.compare_collections`` w tle (``task_executor``);
+wyniki trafiają do ``ttk.Treeview``, który rysuje tylko widoczne wiersze,
+więc tysiące pozycji nie tworzą tysięcy widgetów. Górna tabela pokazuje
+liczby na system, dolna — pozycje wybranej kategorii (i systemu).
+"""
+from __future__ import annotations
+
+import threading
+import tkinter as tk
+from tkinter import ttk
+from typing import Any, Optional
+
+import customtkinter as ctk  # type: ignore
+import logging
+
+import task_executor
+from database_manager import GuestSource, OperationCancelled
+from db_compare import CATEGORIES, ONLY_GUEST, CollectionDiff, compare_collections
+from dialog_utils import apply_safe_geometry, create_ctk_toplevel
+from font_scaling import scale_font_size
+
+_log = logging.getLogger(__name__)
+
+_ALL_SYSTEMS = "Wszystkie systemy"
+
+
+def show_collection_compare_dialog(parent: Any, guest: GuestSource, label: str) -> None:
+    """
+    Otwiera okno porównania własnej kolekcji z kolekcją gościa.
+
+    Args:
+        parent: Okno główne.
+        guest: Bazy gościa (np. bieżące źródło trybu gościa).
+        label: Nazwa gościa wyświetlana w nagłówku.
+    """
+    dlg = create_ctk_toplevel(parent)
+    dlg.title(f"Porównanie kolekcji — {label}")
+    dlg.transient(parent)
+    dlg.resizable(True, True)
+    apply_safe_geometry(dlg, parent, 860, 680)
+
+    font_h = ctk.CTkFont(family='Segoe UI', size=scale_font_size(13), weight='bold')
+    font_n = ctk.CTkFont(family='Segoe UI', size=scale_font_size(11))
+
+    outer = ctk.CTkFrame(dlg, fg_color="transparent")
+    outer.pack(fill=tk.BOTH, expand=True, padx=12, pady=12)
+
+    summary = ctk.CTkLabel(
+        outer, text="⏳  Porównywanie kolekcji...", font=font_h, anchor="w", justify="left"
+    )
+    summary.pack(fill=tk.X, pady=(0, 8))
+
+    # ── Liczby na system ──────────────────────────────────────────────────────
+
+    sys_frame = tk.Frame(outer)
+    sys_frame.pack(fill=tk.BOTH, expand=False, pady=(0, 8))
+    sys_cols = ("system",) + tuple(f"k{i}" for i in range(len(CATEGORIES)))
+    sys_tree = ttk.Treeview(sys_frame, columns=sys_cols, show="headings", height=8)
+    sys_tree.heading("system", text="System")
+    sys_tree.column("system", width=300, anchor="w")
+    for i, category in enumerate(CATEGORIES):
+        sys_tree.heading(f"k{i}", text=category)
+        sys_tree.column(f"k{i}", width=150, anchor="center")
+    sys_scroll = ttk.Scrollbar(sys_frame, orient=tk.VERTICAL, command=sys_tree.yview)
+    sys_tree.configure(yscrollcommand=sys_scroll.set)
+    sys_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    sys_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    # ── Pozycje wybranej kategorii ────────────────────────────────────────────
+
+    filter_row = ctk.CTkFrame(outer, fg_color="transparent")
+    filter_row.pack(fill=tk.X, pady=(0, 6))
+    category_var = tk.StringVar(value=ONLY_GUEST)
+    system_label = ctk.CTkLabel(filter_row, text=_ALL_SYSTEMS, font=font_n, anchor="e")
+
+    items_frame = tk.Frame(outer)
+    items_frame.pack(fill=tk.BOTH, expand=True)
+    item_cols = ("system", "nazwa", "typ", "wydawca")
+    items_tree = ttk.Treeview(items_frame, columns=item_cols, show="headings")
+    for col, text, width in (
+        ("system", "System", 200), ("nazwa", "Nazwa", 320),
+        ("typ", "Typ", 140), ("wydawca", "Wydawca", 160),
+    ):
+        items_tree.heading(col, text=text)
+        items_tree.column(col, width=width, anchor="w")
+    items_scroll = ttk.Scrollbar(items_frame, orient=tk.VERTICAL, command=items_tree.yview)
+    items_tree.configure(yscrollcommand=items_scroll.set)
+    items_scroll.pack(side=tk.RIGHT, fill=tk.Y)
+    items_tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+    result: Optional[CollectionDiff] = None
+    selected_system: Optional[str] = None
+    cancel_event = threading.Event()
+
+    def _fill_items() -> None:
+        items_tree.delete(*items_tree.get_children())
+        if result is None:
+            return
+        category = category_var.get()
+        for row in result.rows:
+            if row.category != category:
+                continue
+            if selected_system is not None and row.system != selected_system:
+                continue
+            items_tree.insert("", tk.END, values=(row.system, row.nazwa, row.typ, row.wydawca))
+        system_label.configure(text=selected_system or _ALL_SYSTEMS)
+
+    def _on_system_select(_event: Any = None) -> None:
+        nonlocal selected_system
+        selection = sys_tree.selection()
+        selected_system = sys_tree.item(selection[0], "values")[0] if selection else None
+        _fill_items()
+
+    def _show_all_systems() -> None:
+        sys_tree.selection_remove(*sys_tree.selection())
+
+    ctk.CTkSegmentedButton(
+        filter_row,
+        values=list(CATEGORIES),
+        variable=category_var,
+        command=lambda _value: _fill_items(),
+        font=font_n,
+    ).pack(side=tk.LEFT)
+    ctk.CTkButton(
+        filter_row, text=_ALL_SYSTEMS, command=_show_all_systems,
+        font=font_n, width=140, height=28,
+    ).pack(side=tk.RIGHT)
+    system_label.pack(side=tk.RIGHT, padx=8)
+    sys_tree.bind("<<TreeviewSelect>>", _on_system_select)
+
+    def _done(diff: CollectionDiff) -> None:
+        nonlocal result
+        result = diff
+        only_guest, only_own, both = diff.totals()
+        summary.configure(
+            text=(
+                f"{label}: {CATEGORIES[0]} — {only_guest}   |   "
+                f"{CATEGORIES[1]} — {only_own}   |   {CATEGORIES[2]} — {both}"
+            )
+        )
+        for system, counts in diff.per_system.items():
+            sys_tree.insert("", tk.END, values=(system, *counts))
+        _fill_items()
+
+    def _error(exc: BaseException) -> None:
+        if isinstance(exc, OperationCancelled):
+            return
+        _log.error("Błąd porównania kolekcji", exc_info=(type(exc), exc, exc.__traceback__))
+        summary.configure(text=f"⚠  Nie udało się porównać kolekcji: {exc}")
+
+    def _close() -> None:
+        cancel_event.set()
+        dlg.destroy()
+
+    ctk.CTkButton(outer, text="Zamknij", command=_close, font=font_n, width=120).pack(
+        pady=(8, 0)
+    )
+    dlg.protocol("WM_DELETE_WINDOW", _close)
+
+    task_executor.submit(
+        "collection_compare",
+        dlg,
+        lambda: compare_collections(guest, cancel_event),
+        _done,
+        priority=task_executor.PRIORITY_VISIBLE,
+        on_error=_error,
+    )
@@ -9,7 +9,8 @@ Wspiera:
   • Callback sortowania po kliknięciu nagłówka
   • Callback kliknięcia w komórkę
   • Callback prawego przycisku myszy
-  • Zaznaczanie wierszy lewym kliknięciem (get_selected())
+  • Zaznaczanie wierszy lewym kliknięciem (get_selected()), wielu wierszy
+    przez Ctrl+klik / Shift+klik (get_selected_rows())
   • Tryb ciemny
 """
 
@@ -164,6 +165,8 @@ _EDIT_W = 36  # szerokość kolumny przycisku edycji (px)
 _ROW_NUM_W = 36  # szerokość kolumny numeru wiersza Lp. (px)
 _ROW_H = 28  # wysokość wiersza danych (px)
 _HDR_H = 30  # wysokość nagłówka (px)
+_MOD_SHIFT = 0x0001  # maski modyfikatorów w event.state
+_MOD_CONTROL = 0x0004
 
 
 # ─── tooltip ───────────────────────────────────────────────────────────────
@@ -295,6 +298,9 @@ class CTkDataTable(tk.Frame):
         self._row_pool: Dict[Any, tk.Frame] = {}  # ID → ukryta ramka do ponownego użycia
         self._selected_idx: Optional[int] = None
         self._selected_data: Optional[List[Any]] = None
+        # Zaznaczenie wielu wierszy: klucze id_col (dict = zbiór z kolejnością)
+        self._sel_keys: Dict[Any, None] = {}
+        self._anchor_key: Optional[Any] = None
 
         # ── Stan przeciągania zmiany szerokości kolumn ──────────────────
         self._resize_cb = resize_callback
@@ -575,6 +581,7 @@ class CTkDataTable(tk.Frame):
                             if lbl is not None:
                                 lbl.configure(text=new_lp)
                             rf._cached_lp = new_lp  # type: ignore[attr-defined]
+                    self._sync_selection_paint(rf, i, row)
                     skipped += 1
                 else:
                     # Reuse ramki, ale odśwież zawartość (zniszcz stare dzieci)
@@ -610,6 +617,12 @@ class CTkDataTable(tk.Frame):
         if self._selected_idx is not None and self._selected_idx >= new_count:
             self._selected_idx = None
             self._selected_data = None
+        # Zaznaczenie wielu wierszy obejmuje tylko wiersze nadal widoczne
+        if self._sel_keys:
+            present = {self._pool_key(r) for r in self._data}
+            self._sel_keys = {k: None for k in self._sel_keys if k in present}
+            for i, rf in enumerate(self._row_frames):
+                self._sync_selection_paint(rf, i, self._data[i])
 
         _t1 = _time.perf_counter()
         _log.debug(
@@ -643,6 +656,7 @@ class CTkDataTable(tk.Frame):
                     if lbl is not None:
                         lbl.configure(text=new_lp)
                     rf._cached_lp = new_lp  # type: ignore[attr-defined]
+            self._sync_selection_paint(rf, i, row)
             return
         rf._cached_row = list(row)  # type: ignore[attr-defined]
         # Zniszcz tylko dzieci (Label/Button) – Frame zostaje
@@ -684,6 +698,7 @@ class CTkDataTable(tk.Frame):
                     lbl = getattr(rf, '_row_num_lbl', None)
                     if lbl is not None:
                         lbl.configure(text=str(i + 1))
+                self._sync_selection_paint(rf, i, row)
                 return
             # Reuse ramki, ale odśwież zawartość (zniszcz stare dzieci)
             for ch in rf.winfo_children():
@@ -706,19 +721,15 @@ class CTkDataTable(tk.Frame):
         def_bg, fg_ov = self._resolve_colors(i, row)
 
         # ── hover / selekcja ───────────────────────────────────────────
-        def _repaint(f: tk.Frame, color: str) -> None:
-            f.configure(bg=color)
-            for ch in f.winfo_children():
-                if isinstance(ch, tk.Label):
-                    ch.configure(bg=color)
+        rf._sel_painted = False  # type: ignore[attr-defined]
 
-        def _on_enter(_e: Any, f: tk.Frame = rf, idx: int = i) -> None:
-            if self._selected_idx != idx:
-                _repaint(f, t["hover"])
+        def _on_enter(_e: Any, f: tk.Frame = rf) -> None:
+            if not getattr(f, '_sel_painted', False):
+                self._repaint(f, t["hover"])
 
-        def _on_leave(_e: Any, f: tk.Frame = rf, orig: str = def_bg, idx: int = i) -> None:
-            if self._selected_idx != idx:
-                _repaint(f, orig)
+        def _on_leave(_e: Any, f: tk.Frame = rf, orig: str = def_bg) -> None:
+            if not getattr(f, '_sel_painted', False):
+                self._repaint(f, orig)
 
         def _on_click(
             _e: Any,
@@ -727,20 +738,7 @@ class CTkDataTable(tk.Frame):
             f: tk.Frame = rf,
             orig: str = def_bg,
         ) -> None:
-            # Odznacz poprzedni wiersz
-            if (
-                self._selected_idx is not None
-                and self._selected_idx != row_i
-                and self._selected_idx < len(self._row_frames)
-            ):
-                old_f = self._row_frames[self._selected_idx]
-                old_bg, _ = self._resolve_colors(
-                    self._selected_idx, self._data[self._selected_idx]
-                )
-                _repaint(old_f, old_bg)
-            self._selected_idx = row_i
-            self._selected_data = row_d
-            _repaint(f, t["sel"])
+            self._select_click(_e, row_i, row_d, f)
 
         rf.bind("<Enter>", _on_enter)
         rf.bind("<Leave>", _on_leave)
@@ -935,6 +933,71 @@ class CTkDataTable(tk.Frame):
                 "<Button-3>",
                 lambda _e, ri=ri_, rd=rd_: self._rc_cb(ri, rd, _e),  # type: ignore
             )
+        self._sync_selection_paint(rf, i, row)
+
+    # ── zaznaczenie ────────────────────────────────────────────────────────
+    @staticmethod
+    def _repaint(f: tk.Frame, color: str) -> None:
+        f.configure(bg=color)
+        for ch in f.winfo_children():
+            if isinstance(ch, tk.Label):
+                ch.configure(bg=color)
+
+    def _sync_selection_paint(self, rf: tk.Frame, i: int, row: List[Any]) -> None:
+        """Maluje ramkę kolorem zaznaczenia lub domyślnym — tylko gdy stan się zmienił."""
+        key = self._pool_key(row)
+        selected = key is not None and key in self._sel_keys
+        if getattr(rf, '_sel_painted', False) == selected:
+            return
+        rf._sel_painted = selected  # type: ignore[attr-defined]
+        self._repaint(rf, self._theme["sel"] if selected else self._resolve_colors(i, row)[0])
+
+    def _select_click(self, event: Any, row_i: int, row_d: List[Any], f: tk.Frame) -> None:
+        """Klik: zaznacza wiersz; Ctrl+klik przełącza, Shift+klik zaznacza zakres."""
+        state = int(getattr(event, "state", 0) or 0)
+        try:
+            idx = self._row_frames.index(f)  # ramki z puli mogą mieć nieaktualne row_i
+        except ValueError:
+            idx = row_i
+        row = self._data[idx] if idx < len(self._data) else row_d
+        key = self._pool_key(row)
+
+        anchor_idx: Optional[int] = None
+        if state & _MOD_SHIFT and self._anchor_key is not None:
+            anchor_idx = next(
+                (j for j, r in enumerate(self._data) if self._pool_key(r) == self._anchor_key),
+                None,
+            )
+        if key is not None and anchor_idx is not None:
+            lo, hi = sorted((anchor_idx, idx))
+            picked = dict(self._sel_keys) if state & _MOD_CONTROL else {}
+            for r in self._data[lo:hi + 1]:
+                k = self._pool_key(r)
+                if k is not None:
+                    picked[k] = None
+            self._sel_keys = picked
+        elif key is not None and state & _MOD_CONTROL:
+            if key in self._sel_keys:
+                del self._sel_keys[key]
+            else:
+                self._sel_keys[key] = None
+            self._anchor_key = key
+        else:
+            self._sel_keys = {key: None} if key is not None else {}
+            self._anchor_key = key
+
+        if key is None or key in self._sel_keys:
+            self._selected_idx = idx
+            self._selected_data = list(row)
+        else:
+            self._selected_idx = None
+            self._selected_data = None
+        for j, rf in enumerate(self._row_frames):
+            self._sync_selection_paint(rf, j, self._data[j])
+        if key is None:
+            # Wiersz bez ID nie trafia do zaznaczenia wielu wierszy — tylko podświetlenie
+            self._repaint(f, self._theme["sel"])
+            f._sel_painted = True  # type: ignore[attr-defined]
 
     # ── publiczne API ──────────────────────────────────────────────────────
     def set_data(self, data: List[List[Any]]) -> None:
@@ -1006,6 +1069,8 @@ class CTkDataTable(tk.Frame):
                         rf.configure(bg=def_bg)
                         self._populate_row(rf, child_idx, child_row)
                         rf._cached_row = list(child_row)  # type: ignore[attr-defined]
+                    else:
+                        self._sync_selection_paint(rf, child_idx, child_row)
                 else:
                     def_bg, _ = self._resolve_colors(child_idx, child_row)
                     rf = tk.Frame(self._scroll, bg=def_bg, height=_ROW_H)
@@ -1095,8 +1160,39 @@ class CTkDataTable(tk.Frame):
         self._data = new_data
         self._build_rows()
 
+    def displayed_rows(self) -> List[List[Any]]:
+        """Wiersze w kolejności wyświetlania (po filtrach, sortowaniu i rozwinięciu).
+
+        Płytka kopia listy — same wiersze nie są kopiowane, a tabela podmienia
+        wiersze zamiast je modyfikować, więc kopię można czytać w innym wątku.
+        """
+        return list(self._data)
+
+    def visible_columns(self) -> List[int]:
+        """Indeksy kolumn danych w kolejności wyświetlania, bez ukrytych."""
+        return [j for j in self._col_order if j not in self._hidden_cols]
+
     def get_selected(self) -> Optional[Tuple[int, List[Any]]]:
         """Zwraca (row_idx, row_data) ostatnio klikniętego wiersza lub None."""
         if self._selected_idx is None or self._selected_data is None:
             return None
         return (self._selected_idx, list(self._selected_data))
+
+    def get_selected_rows(self) -> List[List[Any]]:
+        """Zaznaczone wiersze (klik, Ctrl+klik, Shift+klik) w kolejności wyświetlania.
+
+        Zwinięte wiersze potomne nie są zwracane, nawet jeśli były zaznaczone.
+        """
+        if not self._sel_keys:
+            single = self.get_selected()
+            return [single[1]] if single is not None else []
+        return [list(r) for r in self._data if self._pool_key(r) in self._sel_keys]
+
+    def clear_selection(self) -> None:
+        """Usuwa zaznaczenie wszystkich wierszy."""
+        self._sel_keys = {}
+        self._anchor_key = None
+        self._selected_idx = None
+        self._selected_data = None
+        for i, rf in enumerate(self._row_frames):
+            self._sync_selection_paint(rf, i, self._data[i])
@@ -7,31 +7,90 @@ Zapewnia kompatybilność wsteczną przy aktualizacjach aplikacji
 import os
 import sqlite3
 import shutil
+import hashlib
+import json
+import logging
 import zipfile
 import tempfile
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional, Tuple, List
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import IO, Any, Callable, Dict, Optional, Tuple, List
 from datetime import datetime
 
+_log = logging.getLogger(__name__)
+
 # Wersja schematu bazy danych
 CURRENT_DB_VERSION = 1
 
 # ── Nazwy plików baz danych ───────────────────────────────────────────────────
 _DB_FILES: List[str] = ["systemy_rpg.db", "sesje_rpg.db", "gracze.db", "wydawcy.db"]
 
-# ── Tryb gościa — globalny katalog override ───────────────────────────────────
+# ── Tryb gościa — bazy innego użytkownika tylko do odczytu ──────────────────
+# Folder: pliki otwierane przez URI ``mode=ro&immutable=1``. ZIP: obrazy baz
+# wczytane do pamięci i ładowane przez ``Connection.deserialize`` — bez
+# rozpakowywania na dysk. W obu przypadkach zapis blokuje samo SQLite.
 _guest_db_dir: Optional[Path] = None
+_guest_images: Dict[str, bytes] = {}
 
 
 def set_guest_db_dir(path: Optional[Path]) -> None:
     """Ustawia katalog baz danych gościa (None = powrót do własnych danych)."""
     global _guest_db_dir
     _guest_db_dir = path
+    _guest_images.clear()
+
+
+@dataclass
+class GuestSource:
+    """Bazy gościa gotowe do przełączenia (wynik ``read_guest_source``)."""
+
+    db_files: List[str]
+    directory: Optional[Path] = None
+    images: Dict[str, bytes] = field(default_factory=dict)
+
+
+def set_guest_source(source: Optional[GuestSource]) -> None:
+    """Przełącza odczyty na bazy gościa (None = powrót do własnych danych; wątek Tk)."""
+    global _guest_db_dir
+    _guest_db_dir = source.directory if source is not None else None
+    _guest_images.clear()
+    if source is not None:
+        _guest_images.update(source.images)
 
 
 def is_guest_mode() -> bool:
     """Zwraca True jeśli aplikacja działa na bazach gościa (tylko odczyt)."""
-    return _guest_db_dir is not None
+    return _guest_db_dir is not None or bool(_guest_images)
+
+
+def connect_db(db_name: str, **kwargs: Any) -> sqlite3.Connection:
+    """
+    Otwiera połączenie do bazy w bieżącym trybie (własne dane lub gość).
+
+    W trybie gościa połączenie jest tylko do odczytu na poziomie SQLite:
+    plik z folderu otwierany jest przez URI ``mode=ro&immutable=1``, a baza
+    z ZIP jest kopią obrazu w pamięci z ``PRAGMA query_only``. Zapisy (dialogi,
+    ``db_writer``) powinny używać ``get_own_db_path``.
+
+    Args:
+        db_name: Nazwa pliku bazy danych (np. 'gracze.db').
+        **kwargs: Dodatkowe argumenty ``sqlite3.connect`` (np. ``timeout``).
+    """
+    if not is_guest_mode():
+        return sqlite3.connect(get_own_db_path(db_name), **kwargs)
+    if _guest_db_dir is not None and (_guest_db_dir / db_name).exists():
+        uri = (_guest_db_dir / db_name).resolve().as_uri() + "?mode=ro&immutable=1"
+        return sqlite3.connect(uri, uri=True, **kwargs)
+    # Obraz z ZIP albo brak tej bazy u gościa (pusta baza w pamięci)
+    conn = sqlite3.connect(":memory:", **kwargs)
+    image = _guest_images.get(db_name)
+    if image is not None:
+        conn.deserialize(image)
+    conn.execute("PRAGMA query_only = ON")
+    return conn
 
 
 def get_app_data_dir() -> Path:
@@ -63,6 +122,7 @@ def get_db_path(db_name: str) -> str:
 
     Returns:
         str: Pełna ścieżka do pliku bazy danych
+        (bazy gościa z ZIP nie mają pliku — do odczytu służy ``connect``)
     """
     if _guest_db_dir is not None:
         return str(_guest_db_dir / db_name)
@@ -100,7 +160,7 @@ def migrate_old_databases() -> None:
         new_path = app_dir / db_file
 
         # Jeśli stara baza istnieje w katalogu aplikacji i nie istnieje w nowej lokalizacji
-        if old_path.exists() and not new_path.exists():
+        if not new_path.exists() and old_path.exists():
             try:
                 # Skopiuj bazę danych do nowej lokalizacji
                 shutil.copy2(old_path, new_path)
@@ -133,23 +193,28 @@ def get_db_version(db_path: str) -> int:
         with sqlite3.connect(db_path) as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute(
-                """
-                SELECT name FROM sqlite_master 
-                WHERE type='table' AND name='db_version'
-            """
-            )
-
-            if c.fetchone():
-                c.execute("SELECT version FROM db_version LIMIT 1")
-                result = c.fetchone()
-                return result[0] if result else 0
-            return 0
+            return _read_db_version(conn)
     except Exception:
         return 0
 
 
+def _read_db_version(conn: sqlite3.Connection) -> int:
+    """Odczytuje wersję schematu na otwartym połączeniu (0 gdy brak tabeli db_version)."""
+    c = conn.cursor()
+    c.execute(
+        """
+        SELECT name FROM sqlite_master 
+        WHERE type='table' AND name='db_version'
+    """
+    )
+
+    if c.fetchone():
+        c.execute("SELECT version FROM db_version LIMIT 1")
+        result = c.fetchone()
+        return result[0] if result else 0
+    return 0
+
+
 def set_db_version(db_path: str, version: int) -> None:
     """
     Ustawia wersję schematu bazy danych.
@@ -161,53 +226,76 @@ def set_db_version(db_path: str, version: int) -> None:
     with sqlite3.connect(db_path) as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-
-        # Utwórz tabelę wersji jeśli nie istnieje
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS db_version (
-                version INTEGER NOT NULL,
-                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-            )
+        _write_db_version(conn, version)
+        conn.commit()
+
+
+def _write_db_version(conn: sqlite3.Connection, version: int) -> None:
+    """Zapisuje wersję schematu na otwartym połączeniu (bez commit)."""
+    c = conn.cursor()
+
+    # Utwórz tabelę wersji jeśli nie istnieje
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS db_version (
+            version INTEGER NOT NULL,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
         )
+    """
+    )
 
-        # Usuń starą wersję i wstaw nową
-        c.execute("DELETE FROM db_version")
-        c.execute("INSERT INTO db_version (version) VALUES (?)", (version,))
-        conn.commit()
+    # Usuń starą wersję i wstaw nową
+    c.execute("DELETE FROM db_version")
+    c.execute("INSERT INTO db_version (version) VALUES (?)", (version,))
+
+
+def open_schema_connection(db_path: str) -> sqlite3.Connection:
+    """
+    Otwiera połączenie do sprawdzania/migracji schematu.
+
+    Połączenie działa w trybie autocommit (``isolation_level=None``), bo migracje
+    same zarządzają transakcjami (BEGIN/COMMIT), a CREATE/ALTER nie wymagają
+    osobnego commit. Wywołujący odpowiada za zamknięcie połączenia.
+    """
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
 
 
-def backup_database(db_path: str) -> Optional[str]:
+def backup_database(
+    db_path: str, verbose: bool = True, reason: str = "migracja"
+) -> Optional[str]:
     """
-    Tworzy kopię zapasową bazy danych przed migracją.
+    Tworzy kopię zapasową bazy danych w magazynie kopii (``backup_store``).
+
+    Kopia identyczna z poprzednią kopią tej bazy nie jest zapisywana ponownie,
+    a stare kopie są usuwane zgodnie z polityką przechowywania z ustawień.
 
     Args:
         db_path: Ścieżka do pliku bazy danych
+        verbose: Czy wypisać komunikat o wyniku na stdout
+        reason: Powód kopii zapisywany w manifeście (np. 'migracja', 'import')
 
     Returns:
-        Optional[str]: Ścieżka do pliku backup lub None w przypadku błędu
+        Optional[str]: Identyfikator kopii w magazynie lub None w przypadku błędu
     """
     if not os.path.exists(db_path):
         return None
 
-    try:
-        app_dir = get_app_data_dir()
-        backups_dir = app_dir / 'backups'
-        backups_dir.mkdir(exist_ok=True)
-
-        db_name = Path(db_path).name
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-        backup_name = f"{db_name}.backup_{timestamp}"
-        backup_path = backups_dir / backup_name
+    import backup_store  # import lokalny — backup_store korzysta z tego modułu
 
-        shutil.copy2(db_path, backup_path)
-        print(f"✓ Utworzono backup: {backup_path}")
-        return str(backup_path)
+    try:
+        entry = backup_store.store_backup(db_path, reason)
+        if entry is None:
+            return None
+        if verbose:
+            print(f"✓ Utworzono backup: {entry.id}")
+        return entry.id
 
     except Exception as e:
-        print(f"⚠ Błąd podczas tworzenia backupu: {e}")
+        if verbose:
+            print(f"⚠ Błąd podczas tworzenia backupu: {e}")
         return None
 
 
@@ -240,10 +328,89 @@ def migrate_database_schema(db_path: str, db_name: str) -> None:
     print(f"✓ Migracja {db_name} zakończona")
 
 
-def initialize_app_databases() -> None:
+def _startup_db_pass(
+    db_file: str,
+    db_label: str,
+    prepare_hook: Optional[Callable[[sqlite3.Connection], None]],
+    db_path: Optional[str] = None,
+) -> List[str]:
+    """
+    Jednorazowy przebieg startowy dla jednego pliku bazy (jedno połączenie).
+
+    Kolejno: wersja schematu (+ backup i migracja wersji), schemat modułu
+    (``prepare_hook``) oraz sondy modułu wykonywane przez ten sam hook,
+    a na końcu wyzwalacze dziennika zmian (``db_sync``).
+
+    Args:
+        db_path: Plik bazy (domyślnie ``get_db_path(db_file)``).
+
+    Returns:
+        Komunikaty do wypisania w kolejności plików (wątki nie piszą naraz na stdout).
+    """
+    if db_path is None:
+        db_path = get_db_path(db_file)
+    existed = os.path.exists(db_path)
+    messages: List[str] = []
+
+    if existed:
+        messages.append(f"✓ {db_label}: Znaleziono istniejącą bazę")
+    else:
+        messages.append(f"→ {db_label}: Utworzenie nowej bazy")
+
+    conn = open_schema_connection(db_path)
+    try:
+        if existed:
+            current_version = _read_db_version(conn)
+            if current_version < CURRENT_DB_VERSION:
+                # Utwórz backup przed migracją
+                backup_path = backup_database(db_path, verbose=False)
+                if backup_path:
+                    messages.append(f"✓ Utworzono backup: {backup_path}")
+                else:
+                    messages.append(f"⚠ Błąd podczas tworzenia backupu: {db_file}")
+                messages.append(
+                    f"Migracja {db_file} z wersji {current_version} do {CURRENT_DB_VERSION}"
+                )
+                conn.execute("BEGIN")
+                _write_db_version(conn, CURRENT_DB_VERSION)
+                conn.execute("COMMIT")
+                messages.append(f"✓ Migracja {db_file} zakończona")
+        if prepare_hook is not None:
+            try:
+                prepare_hook(conn)
+            except Exception as e:
+                # Moduł ponowi inicjalizację przy pierwszym użyciu (init_db)
+                messages.append(f"⚠ {db_label}: Błąd inicjalizacji schematu: {e}")
+        # Dziennik zmian do synchronizacji przyrostowej — po schemacie modułu,
+        # bo przebudowa tabeli w migracji usuwa wyzwalacze
+        try:
+            import db_sync  # lokalnie — db_sync importuje ten moduł
+            db_sync.ensure_change_log(conn, db_file)
+        except Exception as e:
+            messages.append(f"⚠ {db_label}: Błąd dziennika zmian: {e}")
+    finally:
+        conn.close()
+    return messages
+
+
+# Hooki modułów z ``initialize_app_databases`` — ponawiane po podmianie plików baz
+_prepare_hooks: Dict[str, Callable[[sqlite3.Connection], None]] = {}
+
+
+def initialize_app_databases(
+    prepare_hooks: Optional[Dict[str, Callable[[sqlite3.Connection], None]]] = None,
+) -> None:
     """
     Inicjalizuje wszystkie bazy danych aplikacji.
     Wykonuje migrację starych baz i sprawdza zgodność wersji.
+
+    Każdy plik bazy otwierany jest dokładnie raz, a pliki przetwarzane są
+    równolegle. Na tym samym połączeniu wykonywany jest hook modułu
+    (``prepare_hooks[nazwa_pliku]``) — schemat, migracje i sondy — po którym
+    moduł nie musi już otwierać bazy, żeby sprawdzić schemat.
+
+    Args:
+        prepare_hooks: Mapowanie nazwa pliku .db → funkcja(conn) modułu.
     """
     print("=" * 60)
     print("Inicjalizacja baz danych Sesyjka")
@@ -259,20 +426,24 @@ def initialize_app_databases() -> None:
         'gracze.db': 'Gracze',
         'wydawcy.db': 'Wydawcy',
     }
+    hooks = prepare_hooks or {}
+    _prepare_hooks.update(hooks)
 
     app_dir = get_app_data_dir()
     print(f"\nLokalizacja baz danych: {app_dir}")
     print("-" * 60)
 
-    for db_file, db_label in db_configs.items():
-        db_path = get_db_path(db_file)
-
-        if os.path.exists(db_path):
-            print(f"✓ {db_label}: Znaleziono istniejącą bazę")
-            # Sprawdź wersję i ewentualnie zmigruj
-            migrate_database_schema(db_path, db_file)
-        else:
-            print(f"→ {db_label}: Utworzenie nowej bazy")
+    with ThreadPoolExecutor(max_workers=len(db_configs)) as pool:
+        futures = [
+            pool.submit(_startup_db_pass, db_file, db_label, hooks.get(db_file))
+            for db_file, db_label in db_configs.items()
+        ]
+        for (db_file, db_label), future in zip(db_configs.items(), futures):
+            try:
+                for message in future.result():
+                    print(message)
+            except Exception as e:
+                print(f"⚠ {db_label}: Błąd inicjalizacji bazy {db_file}: {e}")
 
     print("=" * 60)
     print("Inicjalizacja zakończona")
@@ -280,11 +451,80 @@ def initialize_app_databases() -> None:
     print()
 
 
+def refresh_databases(db_files: Optional[List[str]] = None) -> None:
+    """
+    Ponawia przebieg startowy dla własnych baz po podmianie ich plików.
+
+    Import i przywrócenie kopii mogą wstawić bazę w starszym schemacie
+    albo bez wyzwalaczy dziennika zmian (``db_sync``). Hooki modułów
+    (``prepare_db``) ponownie wykonują migracje i ustawiają flagi „schemat
+    sprawdzony” — bez tego zmiany do czasu restartu nie trafiałyby do changesetu.
+
+    Komunikaty przebiegu trafiają do logu, nie na stdout — polecenia CLI
+    (``sesyjka``) wypisują tam wyłącznie wynik w JSON.
+
+    Args:
+        db_files: Nazwy plików .db (domyślnie wszystkie istniejące własne bazy).
+    """
+    own_dir = get_app_data_dir()
+    for db_file in db_files if db_files is not None else _DB_FILES:
+        if not (own_dir / db_file).exists():
+            continue
+        try:
+            messages = _startup_db_pass(
+                db_file, db_file, _prepare_hooks.get(db_file), str(own_dir / db_file)
+            )
+        except Exception as e:
+            messages = [f"⚠ {db_file}: Błąd ponownej inicjalizacji bazy: {e}"]
+        for message in messages:
+            if message.startswith("⚠"):
+                _log.warning("%s", message)
+            else:
+                _log.info("%s", message)
+
+
+_ICONS_MANIFEST = '.manifest.json'
+
+
+def _file_sha256(path: Path) -> str:
+    """Zwraca skrót SHA-256 zawartości pliku."""
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(65536), b''):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def _icons_source_key(src: Path, icons: List[Path]) -> str:
+    """
+    Klucz identyfikujący zestaw ikon źródłowych bez czytania ich zawartości.
+
+    W pliku EXE (one-file) katalog _MEIPASS jest rozpakowywany na nowo przy każdym
+    starcie, więc mtime ikon się zmienia — kluczem jest wtedy sam plik EXE.
+    Przy uruchomieniu ze źródeł kluczem są rozmiary i mtime ikon.
+    """
+    import sys
+
+    if getattr(sys, 'frozen', False):
+        st = os.stat(sys.executable)
+        return f"exe:{sys.executable}:{st.st_size}:{st.st_mtime_ns}"
+    parts = [str(src)]
+    for icon_file in icons:
+        st = icon_file.stat()
+        parts.append(f"{icon_file.name}:{st.st_size}:{st.st_mtime_ns}")
+    return "|".join(parts)
+
+
 def ensure_app_icons() -> None:
     """
-    Kopiuje ikony aplikacji do katalogu AppData przy każdym uruchomieniu.
+    Synchronizuje ikony aplikacji z katalogiem AppData.
     Dziła zarówno z kodu źródłowego jak i z pliku EXE (PyInstaller one-file).
     Dzięki temu ikona przycisku edycji jest dostępna na każdym komputerze.
+
+    Stan synchronizacji zapisywany jest w manifeście (``Icons/.manifest.json``):
+    klucz źródła oraz rozmiar i SHA-256 każdej ikony. Gdy źródło się nie zmieniło,
+    a ikony docelowe istnieją z właściwym rozmiarem, nic nie jest kopiowane.
+    Brakujące lub nieaktualne ikony są kopiowane ponownie.
     """
     import sys
 
@@ -300,25 +540,279 @@ def ensure_app_icons() -> None:
     if not src.exists():
         return
 
-    for icon_file in src.glob('*.png'):
+    icons = sorted(src.glob('*.png'))
+    manifest_path = icons_dst / _ICONS_MANIFEST
+    try:
+        source_key = _icons_source_key(src, icons)
+    except OSError:
+        source_key = ""
+
+    manifest: dict = {}
+    try:
+        with open(manifest_path, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        manifest = {}
+    files: dict = manifest.get('files', {}) if isinstance(manifest.get('files'), dict) else {}
+
+    # Szybka ścieżka: źródło bez zmian, a wszystkie ikony docelowe są na miejscu
+    if source_key and manifest.get('source_key') == source_key and len(files) == len(icons):
+        try:
+            if all(
+                (icons_dst / icon_file.name).stat().st_size
+                == files.get(icon_file.name, {}).get('size')
+                for icon_file in icons
+            ):
+                return
+        except OSError:
+            pass  # brakująca ikona — pełna synchronizacja
+
+    new_files: dict = {}
+    for icon_file in icons:
         dst = icons_dst / icon_file.name
         try:
-            shutil.copy2(str(icon_file), str(dst))
+            digest = _file_sha256(icon_file)
+            size = icon_file.stat().st_size
+            up_to_date = (
+                dst.exists()
+                and dst.stat().st_size == size
+                and _file_sha256(dst) == digest
+            )
+            if not up_to_date:
+                shutil.copy2(str(icon_file), str(dst))
+            new_files[icon_file.name] = {'size': size, 'sha256': digest}
         except Exception:
             pass
 
+    try:
+        with open(manifest_path, 'w', encoding='utf-8') as f:
+            json.dump({'source_key': source_key, 'files': new_files}, f, indent=2)
+    except OSError:
+        pass
+
 
 # ── Eksport baz danych ────────────────────────────────────────────────────────
 
-def export_databases_excel(dest: Path) -> Path:
+# Postęp operacji na plikach: callback(wykonano, razem, etykieta) — wywoływany
+# z wątku roboczego; jednostką są bajty lub wiersze (zależnie od operacji)
+ProgressCallback = Callable[[int, int, str], None]
+
+# Rozmiar porcji kopiowania plików (bajty) — między porcjami sprawdzane jest anulowanie
+_COPY_CHUNK = 1024 * 1024
+
+
+class OperationCancelled(Exception):
+    """Operacja eksportu/importu została anulowana przez użytkownika."""
+
+
+class _Progress:
+    """Licznik postępu z obsługą anulowania (wątek roboczy)."""
+
+    def __init__(
+        self,
+        total: int,
+        callback: Optional[ProgressCallback],
+        cancel: Optional[threading.Event],
+    ) -> None:
+        self.total = max(total, 1)
+        self.done = 0
+        self._callback = callback
+        self._cancel = cancel
+
+    def check(self) -> None:
+        if self._cancel is not None and self._cancel.is_set():
+            raise OperationCancelled()
+
+    def advance(self, amount: int, label: str) -> None:
+        self.check()
+        self.done += amount
+        if self._callback is not None:
+            self._callback(min(self.done, self.total), self.total, label)
+
+
+def _copy_stream(fsrc: IO[bytes], fdst: IO[bytes], progress: _Progress, label: str) -> None:
+    """Kopiuje strumień porcjami, raportując postęp i sprawdzając anulowanie."""
+    while True:
+        progress.check()
+        chunk = fsrc.read(_COPY_CHUNK)
+        if not chunk:
+            break
+        fdst.write(chunk)
+        progress.advance(len(chunk), label)
+
+
+def _remove_quietly(path: Path) -> None:
+    try:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        elif path.exists():
+            path.unlink()
+    except OSError:
+        pass
+
+
+# ── Spójne kopie baz (API backupu SQLite) ─────────────────────────────────────
+
+# Liczba stron kopiowanych w jednym kroku backupu — między krokami blokada
+# bazy źródłowej jest zwalniana, więc zapisy aplikacji nie czekają na całą kopię
+_BACKUP_PAGES = 256
+# Ile sekund czekać na blokadę bazy źródłowej (zapis w toku w wątku pisarza)
+_BACKUP_TIMEOUT = 30.0
+
+
+def snapshot_database(
+    src: Path,
+    dst: Path,
+    compact: bool = False,
+    tracker: Optional[_Progress] = None,
+    label: str = "",
+) -> None:
+    """
+    Tworzy spójną kopię bazy SQLite przez ``sqlite3.Connection.backup``.
+
+    Kopia powstaje krokami po ``_BACKUP_PAGES`` stron; jeśli baza zostanie
+    zmieniona przez inne połączenie w trakcie, SQLite zaczyna kopiowanie od nowa,
+    więc wynik zawsze odpowiada jednemu zatwierdzonemu stanowi bazy.
+
+    Args:
+        src: Plik bazy źródłowej (może być w użyciu przez aplikację).
+        dst: Plik docelowy (nadpisywany).
+        compact: Czy dodatkowo skompaktować kopię przez ``VACUUM INTO``
+            (wykonywane na kopii pośredniej, nie na bazie źródłowej).
+        tracker: Licznik postępu (jednostka: bajty stron) z obsługą anulowania.
+        label: Etykieta postępu.
+
+    Raises:
+        OperationCancelled: Gdy anulowano przez ``tracker``.
+        sqlite3.Error: Gdy plik źródłowy nie jest poprawną bazą.
+    """
+    if not src.exists():
+        raise FileNotFoundError(src)
+    target = dst.with_name(dst.name + ".snapshot") if compact else dst
+    _remove_quietly(target)
+    copied = [0]
+
+    def _step(_status: int, remaining: int, total: int) -> None:
+        done = total - remaining
+        # Po restarcie kopii (zmiana źródła w trakcie) licznik nie cofa paska
+        if tracker is not None and done > copied[0]:
+            tracker.advance((done - copied[0]) * page_size, label)
+        copied[0] = max(copied[0], done)
+
+    try:
+        with closing(sqlite3.connect(str(src), timeout=_BACKUP_TIMEOUT)) as source:
+            page_size = source.execute("PRAGMA page_size").fetchone()[0]
+            with closing(sqlite3.connect(str(target))) as dest_conn:
+                source.backup(dest_conn, pages=_BACKUP_PAGES, progress=_step)
+        if compact:
+            _remove_quietly(dst)  # VACUUM INTO wymaga nieistniejącego pliku docelowego
+            with closing(sqlite3.connect(str(target))) as conn:
+                conn.execute("VACUUM INTO ?", (str(dst),))
+    except BaseException:
+        _remove_quietly(target)
+        _remove_quietly(dst)
+        raise
+    finally:
+        if compact:
+            _remove_quietly(target)
+
+
+def _snapshot_size(path: Path) -> int:
+    """Szacowany rozmiar kopii (do postępu) — rozmiar pliku bez dziennika."""
+    try:
+        return path.stat().st_size
+    except OSError:
+        return 0
+
+
+# Liczba wierszy pobieranych z kursora naraz przy eksporcie strumieniowym
+_EXCEL_BATCH = 500
+# Etykiety baz w nazwach arkuszy: "<etykieta> - <tabela>"
+_EXCEL_DB_LABELS: Dict[str, str] = {
+    "systemy_rpg.db": "Systemy RPG",
+    "sesje_rpg.db": "Sesje RPG",
+    "gracze.db": "Gracze",
+    "wydawcy.db": "Wydawcy",
+}
+# Maksymalna szerokość kolumny arkusza (w znakach)
+_EXCEL_MAX_COL_WIDTH = 50
+
+
+def _excel_column_widths(cursor: sqlite3.Cursor, table: str, headers: List[str]) -> List[int]:
+    """
+    Oblicza szerokości kolumn arkusza jednym zapytaniem agregującym.
+
+    Arkusz w trybie write-only zapisuje definicje kolumn przed wierszami,
+    więc szerokości muszą być znane z góry — liczy je SQLite, bez wczytywania
+    danych do pamięci.
+    """
+    if not headers:
+        return []
+    exprs = ", ".join(f"MAX(LENGTH(CAST([{h}] AS TEXT)))" for h in headers)
+    cursor.execute(f"SELECT {exprs} FROM [{table}]")
+    maxima = cursor.fetchone() or [None] * len(headers)
+    widths = []
+    for header, data_len in zip(headers, maxima):
+        widest = max(len(header), data_len or 0)
+        widths.append(min(widest + 2, _EXCEL_MAX_COL_WIDTH))
+    return widths
+
+
+def _excel_db_label(db_file: str) -> str:
+    return _EXCEL_DB_LABELS.get(db_file, db_file.replace(".db", ""))
+
+
+def _excel_sheet_name(db_file: str, table: str) -> str:
+    # Excel ogranicza nazwy arkuszy do 31 znaków
+    return f"{_excel_db_label(db_file)} - {table}"[:31]
+
+
+def _user_tables(conn: sqlite3.Connection) -> List[str]:
+    """Tabele z danymi — bez tabel SQLite i wewnętrznych (``_merge_base``, ``_sync_*``)."""
+    return _user_tables_in(conn, "main")
+
+
+def _user_tables_in(conn: sqlite3.Connection, schema: str) -> List[str]:
+    return [
+        row[0]
+        for row in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type='table' ORDER BY name"
+        )
+        if not row[0].startswith(("sqlite_", "_"))
+    ]
+
+
+def _discard_write_only(wb: Any) -> None:
+    """Zamyka arkusze przerwanego eksportu i usuwa ich pliki tymczasowe."""
+    for ws in wb.worksheets:
+        try:
+            if not ws.closed:
+                ws.close()
+            if ws._writer is not None:
+                ws._writer.cleanup()
+        except Exception:
+            pass
+
+
+def export_databases_excel(
+    dest: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Path:
     """
     Eksportuje własne bazy danych do jednego pliku Excel (.xlsx).
 
     Każda tabela z każdej bazy danych staje się osobnym arkuszem.
     Arkusze są nazwane wg schematu: "NazwaBazy - nazwa_tabeli".
+    Zapis jest strumieniowy (``Workbook(write_only=True)``, wiersze pobierane
+    z kursora partiami) — zużycie pamięci nie rośnie z rozmiarem danych.
+    Plik powstaje pod nazwą tymczasową i jest podmieniany dopiero na końcu,
+    więc anulowanie lub błąd nie zostawia częściowego arkusza.
 
     Args:
         dest: Ścieżka docelowa — plik .xlsx.
+        progress: Callback postępu (jednostka: wiersze, etykieta: arkusz).
+        cancel: Zdarzenie anulowania sprawdzane między partiami wierszy.
 
     Returns:
         Path: Ścieżka do zapisanego pliku.
@@ -326,95 +820,498 @@ def export_databases_excel(dest: Path) -> Path:
     Raises:
         ImportError: Gdy biblioteka openpyxl nie jest zainstalowana.
         ValueError: Gdy żadna baza danych nie istnieje.
+        OperationCancelled: Gdy ustawiono ``cancel``.
     """
     try:
         import openpyxl
+        from openpyxl.cell import WriteOnlyCell
         from openpyxl.styles import Font, PatternFill, Alignment
+        from openpyxl.utils import get_column_letter
     except ImportError:
         raise ImportError(
             "Eksport do Excela wymaga biblioteki openpyxl.\n"
             "Zainstaluj ją poleceniem: pip install openpyxl"
         )
 
-    _DB_LABELS: dict[str, str] = {
-        "systemy_rpg.db": "Systemy RPG",
-        "sesje_rpg.db": "Sesje RPG",
-        "gracze.db": "Gracze",
-        "wydawcy.db": "Wydawcy",
-    }
-
     header_fill = PatternFill(start_color="1565C0", end_color="1565C0", fill_type="solid")
     header_font = Font(color="FFFFFF", bold=True)
     center_align = Alignment(horizontal="center")
 
-    wb = openpyxl.Workbook()
-    wb.remove(wb.active)  # usuń domyślny pusty arkusz
+    wb = openpyxl.Workbook(write_only=True)
 
     own_dir = get_app_data_dir()
+    sources = [(db_file, own_dir / db_file) for db_file in _DB_FILES]
+    sources = [(db_file, src) for db_file, src in sources if src.exists()]
+
+    # Liczba wierszy do postępu (COUNT(*) jest tani w porównaniu z eksportem)
+    table_lists: Dict[str, List[str]] = {}
+    total_rows = 0
+    for db_file, src in sources:
+        with closing(sqlite3.connect(src)) as conn:
+            names = _user_tables(conn)
+            table_lists[db_file] = names
+            for table in names:
+                # +1 na nagłówek, żeby puste tabele też przesuwały pasek postępu
+                total_rows += conn.execute(f"SELECT COUNT(*) FROM [{table}]").fetchone()[0] + 1
+    tracker = _Progress(total_rows, progress, cancel)
 
-    for db_file in _DB_FILES:
-        src = own_dir / db_file
-        if not src.exists():
-            continue
-        label = _DB_LABELS.get(db_file, db_file.replace(".db", ""))
+    try:
+        for db_file, src in sources:
+            conn = sqlite3.connect(src)
+            try:
+                cursor = conn.cursor()
+                tables = table_lists[db_file]
+
+                for table in tables:
+                    sheet_name = _excel_sheet_name(db_file, table)
+                    ws = wb.create_sheet(title=sheet_name)
+
+                    cursor.execute(f"SELECT * FROM [{table}] LIMIT 0")  # tylko nagłówki
+                    if cursor.description is None:
+                        continue
+                    headers = [desc[0] for desc in cursor.description]
+
+                    # Szerokości kolumn muszą być ustawione przed pierwszym wierszem
+                    widths = _excel_column_widths(cursor, table, headers)
+                    for col_idx, width in enumerate(widths, 1):
+                        ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+                    # Nagłówki ze stylem
+                    header_row = []
+                    for header in headers:
+                        cell = WriteOnlyCell(ws, value=header)
+                        cell.fill = header_fill
+                        cell.font = header_font
+                        cell.alignment = center_align
+                        header_row.append(cell)
+                    ws.append(header_row)
+                    tracker.advance(1, sheet_name)
+
+                    # Dane — partiami, bez wczytywania całej tabeli
+                    cursor.execute(f"SELECT * FROM [{table}]")
+                    while True:
+                        batch = cursor.fetchmany(_EXCEL_BATCH)
+                        if not batch:
+                            break
+                        for row in batch:
+                            ws.append(row)
+                        tracker.advance(len(batch), sheet_name)
+            finally:
+                conn.close()
+    except BaseException:
+        _discard_write_only(wb)
+        raise
 
-        conn = sqlite3.connect(src)
-        conn.row_factory = sqlite3.Row
-        try:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' ORDER BY name"
+    if not wb.sheetnames:
+        raise ValueError("Brak baz danych do wyeksportowania.")
+
+    tmp = dest.with_name(dest.name + ".partial")
+    try:
+        wb.save(tmp)
+        os.replace(tmp, dest)
+    except BaseException:
+        _remove_quietly(tmp)
+        raise
+    return dest
+
+
+@dataclass
+class ExcelImportReport:
+    """Wynik wczytania arkusza Excel (``import_databases_excel``)."""
+
+    # Tabela → liczba wierszy wstawionych lub zmienionych
+    changed: Dict[str, int] = field(default_factory=dict)
+    # Tabela → liczba wierszy zgodnych z bazą (oraz nieznalezionych przy arkuszu
+    # bez wszystkich wymaganych kolumn — wtedy wiersze są tylko aktualizowane)
+    unchanged: Dict[str, int] = field(default_factory=dict)
+    # (arkusz, numer wiersza, przyczyna)
+    skipped_rows: List[Tuple[str, int, str]] = field(default_factory=list)
+    # Arkusze, które nie odpowiadają żadnej tabeli
+    skipped_sheets: List[str] = field(default_factory=list)
+
+    @property
+    def change_count(self) -> int:
+        return sum(self.changed.values())
+
+
+@dataclass
+class _SheetPlan:
+    """Arkusz dopasowany do tabeli — kolumny i zapytanie zapisu."""
+
+    sheet: Any
+    schema: str
+    table: str
+    positions: List[int]
+    names: List[str]
+    key_cols: List[str]
+    required: List[str]
+    sql: str
+    # UPDATE bez wstawiania (arkusz nie ma wszystkich wymaganych kolumn)
+    update_only: bool
+    # Kolumny z DEFAULT — pusta komórka zapisuje wartość domyślną zamiast NULL
+    defaults: List[str] = field(default_factory=list)
+    # Zapytania z pominiętymi pustymi kolumnami ``defaults`` (wg zestawu pominiętych)
+    variants: Dict[Tuple[str, ...], str] = field(default_factory=dict)
+
+    def sql_without(self, omitted: Tuple[str, ...]) -> str:
+        """Zapytanie zapisu bez kolumn ``omitted`` (dostają wartość domyślną)."""
+        if not omitted:
+            return self.sql
+        if omitted not in self.variants:
+            self.variants[omitted] = _upsert_sql(
+                self.schema, self.table, self.names, self.key_cols, omitted
             )
-            tables = [row[0] for row in cursor.fetchall() if not row[0].startswith("sqlite_")]
+        return self.variants[omitted]
+
+
+def _excel_value(value: Any) -> Any:
+    """Wartość komórki w postaci zapisywanej przez aplikację."""
+    if isinstance(value, datetime):
+        if value.hour == value.minute == value.second == 0:
+            return value.strftime("%Y-%m-%d")
+        return value.isoformat(sep=" ")
+    if hasattr(value, "isoformat"):  # date / time
+        return value.isoformat()
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, str):
+        return value if value.strip() else None
+    return value
+
+
+def _plan_sheet(
+    conn: sqlite3.Connection, sheet: Any, schema: str, table: str, problems: List[str]
+) -> Optional[_SheetPlan]:
+    """Sprawdza nagłówki arkusza ze schematem tabeli i buduje zapytanie zapisu."""
+    info = conn.execute(f"PRAGMA {schema}.table_info([{table}])").fetchall()
+    columns = {row[1]: row for row in info}
+    key_cols = [row[1] for row in sorted(info, key=lambda r: r[5]) if row[5]]
+    header = next(sheet.iter_rows(max_row=1, values_only=True), ())
+    positions = [i for i, v in enumerate(header) if v is not None and str(v).strip()]
+    names = [str(header[i]).strip() for i in positions]
+
+    errors = []
+    unknown = [n for n in names if n not in columns]
+    if unknown:
+        errors.append(f"nieznane kolumny: {', '.join(unknown)}")
+    duplicated = sorted({n for n in names if names.count(n) > 1})
+    if duplicated:
+        errors.append(f"powtórzone kolumny: {', '.join(duplicated)}")
+    if not key_cols:
+        errors.append(f"tabela {table} nie ma klucza głównego")
+    elif any(k not in names for k in key_cols):
+        errors.append(f"brak kolumn klucza: {', '.join(k for k in key_cols if k not in names)}")
+    if errors:
+        problems.append(f"{sheet.title}: " + "; ".join(errors))
+        return None
+
+    # NOT NULL bez wartości domyślnej (poza INTEGER PRIMARY KEY)
+    required = [
+        name for name, row in columns.items()
+        if row[3] and row[4] is None and name not in key_cols
+    ]
+    values = [n for n in names if n not in key_cols]
+    update_only = any(name not in names for name in required)
+    if update_only and not values:
+        problems.append(f"{sheet.title}: brak kolumn do zaktualizowania")
+        return None
+    quoted = ", ".join(f"[{n}]" for n in values)
+    # Warunek ``IS NOT`` pomija wiersze zgodne z bazą — bez zbędnych zapisów
+    if update_only:
+        where = " AND ".join(f"[{k}] = ?" for k in key_cols)
+        sql = (
+            f"UPDATE {schema}.[{table}] SET ({quoted}) = ({', '.join('?' for _ in values)})"
+            f" WHERE {where} AND ({quoted}) IS NOT ({', '.join('?' for _ in values)})"
+        )
+        # Kolejność parametrów: wartości, klucz, wartości
+        order = [names.index(n) for n in values + key_cols + values]
+        positions = [positions[i] for i in order]
+        names = [names[i] for i in order]
+    else:
+        sql = _upsert_sql(schema, table, names, key_cols, ())
+    return _SheetPlan(
+        sheet, schema, table, positions, names, key_cols,
+        [n for n in required if n in names], sql, update_only,
+        [n for n in values if columns[n][4] is not None] if not update_only else [],
+    )
 
-            for table in tables:
-                # Excel ogranicza nazwy arkuszy do 31 znaków
-                sheet_name = f"{label} - {table}"[:31]
-                ws = wb.create_sheet(title=sheet_name)
 
-                cursor.execute(f"SELECT * FROM [{table}] LIMIT 0")  # tylko nagłówki
-                if cursor.description is None:
+def _upsert_sql(
+    schema: str, table: str, names: List[str], key_cols: List[str], omitted: Tuple[str, ...]
+) -> str:
+    """
+    INSERT … ON CONFLICT dla kolumn ``names`` bez kolumn ``omitted``.
+
+    Pominięte kolumny dostają wartość z DEFAULT — ``excluded`` ma ją także
+    przy aktualizacji istniejącego wiersza, więc ponowny import jest neutralny.
+    """
+    values = [n for n in names if n not in key_cols]
+    inserted = [n for n in names if n not in omitted]
+    action = "DO NOTHING"
+    if values:
+        quoted = ", ".join(f"[{n}]" for n in values)
+        excluded = ", ".join(f"excluded.[{n}]" for n in values)
+        current = ", ".join(f"[{table}].[{n}]" for n in values)
+        action = (
+            f"DO UPDATE SET ({quoted}) = ({excluded})"
+            f" WHERE ({current}) IS NOT ({excluded})"
+        )
+    return (
+        f"INSERT INTO {schema}.[{table}] ({', '.join(f'[{n}]' for n in inserted)})"
+        f" VALUES ({', '.join('?' for _ in inserted)})"
+        f" ON CONFLICT ({', '.join(f'[{k}]' for k in key_cols)}) {action}"
+    )
+
+
+def _import_sheet(
+    conn: sqlite3.Connection,
+    plan: _SheetPlan,
+    tracker: _Progress,
+    report: ExcelImportReport,
+) -> None:
+    """Zapisuje wiersze arkusza partiami ``_EXCEL_BATCH`` (``executemany``)."""
+    title = plan.sheet.title
+    checked = {plan.names.index(n) for n in (*plan.key_cols, *plan.required)}
+    defaults = [(n, plan.names.index(n)) for n in plan.defaults]
+    # Wiersze partii pogrupowane wg pustych kolumn z DEFAULT (pomijanych w INSERT)
+    batch: Dict[Tuple[str, ...], List[List[Any]]] = {}
+    pending = changed = total = 0
+
+    def _flush() -> None:
+        nonlocal changed, pending
+        for omitted, rows in batch.items():
+            changed += conn.executemany(plan.sql_without(omitted), rows).rowcount
+        if pending:
+            tracker.advance(pending, title)
+        batch.clear()
+        pending = 0
+
+    rows = plan.sheet.iter_rows(min_row=2, values_only=True)
+    for row_no, row in enumerate(rows, start=2):
+        values = [_excel_value(row[i]) if i < len(row) else None for i in plan.positions]
+        if all(v is None for v in values):
+            continue  # pusty wiersz (np. formatowanie poniżej danych)
+        empty = [plan.names[i] for i in sorted(checked) if values[i] is None]
+        if empty:
+            report.skipped_rows.append((title, row_no, f"puste pola: {', '.join(empty)}"))
+            continue
+        omitted = tuple(n for n, i in defaults if values[i] is None)
+        if omitted:
+            skip = {plan.names.index(n) for n in omitted}
+            values = [v for i, v in enumerate(values) if i not in skip]
+        batch.setdefault(omitted, []).append(values)
+        pending += 1
+        total += 1
+        if pending >= _EXCEL_BATCH:
+            _flush()
+    _flush()
+    report.changed[plan.table] = changed
+    report.unchanged[plan.table] = total - changed
+
+
+def import_databases_excel(
+    source: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ExcelImportReport:
+    """
+    Wczytuje zmiany z arkusza Excel w formacie ``export_databases_excel``.
+
+    Arkusze są dopasowywane do tabel po nazwie ("Etykieta - tabela"),
+    a nagłówki sprawdzane z aktualnym schematem przed jakimkolwiek zapisem.
+    Wiersze są dodawane lub aktualizowane po kluczu głównym (wiersze zgodne
+    z bazą nie są zapisywane); wierszy usuniętych z arkusza nie usuwa się.
+    Arkusz może zawierać tylko część kolumn (np. ``id`` i ceny) — wtedy
+    istniejące wiersze są wyłącznie aktualizowane. Pusta komórka kolumny
+    z wartością domyślną (np. ``status_kolekcja``) zapisuje DEFAULT, a nie NULL.
+
+    Odczyt jest strumieniowy (``read_only=True``), zapis partiami przez
+    ``executemany`` w jednej transakcji obejmującej wszystkie bazy —
+    błąd lub anulowanie nie zostawia częściowo wczytanego arkusza.
+
+    Args:
+        source: Plik .xlsx.
+        progress: Callback postępu (jednostka: wiersze, etykieta: arkusz).
+        cancel: Zdarzenie anulowania sprawdzane między partiami wierszy.
+
+    Raises:
+        ImportError: Gdy biblioteka openpyxl nie jest zainstalowana.
+        ValueError: Gdy nagłówki nie pasują do schematu lub brak własnych baz.
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    try:
+        import openpyxl
+    except ImportError:
+        raise ImportError(
+            "Import z Excela wymaga biblioteki openpyxl.\n"
+            "Zainstaluj ją poleceniem: pip install openpyxl"
+        )
+
+    own_dir = get_app_data_dir()
+    db_files = [db_file for db_file in _DB_FILES if (own_dir / db_file).exists()]
+    if not db_files:
+        raise ValueError("Brak własnych baz danych do zaktualizowania.")
+    # Nagłówki sprawdzane są z aktualnym schematem — baza po imporcie starszej
+    # wersji musi być najpierw zmigrowana
+    refresh_databases(db_files)
+
+    report = ExcelImportReport()
+    wb = openpyxl.load_workbook(source, read_only=True, data_only=True)
+    try:
+        conn = sqlite3.connect(own_dir / db_files[0], timeout=30.0, isolation_level=None)
+        with closing(conn):
+            schemas = {db_files[0]: "main"}
+            for i, db_file in enumerate(db_files[1:], start=1):
+                conn.execute(f"ATTACH DATABASE ? AS own{i}", (str(own_dir / db_file),))
+                schemas[db_file] = f"own{i}"
+            targets = {
+                _excel_sheet_name(db_file, table): (schema, table)
+                for db_file, schema in schemas.items()
+                for table in _user_tables_in(conn, schema)
+            }
+
+            plans: List[_SheetPlan] = []
+            problems: List[str] = []
+            total_rows = 0
+            for sheet in wb.worksheets:
+                target = targets.get(sheet.title)
+                if target is None:
+                    report.skipped_sheets.append(sheet.title)
                     continue
-                headers = [desc[0] for desc in cursor.description]
-
-                # Nagłówki ze stylem
-                for col_idx, header in enumerate(headers, 1):
-                    cell = ws.cell(row=1, column=col_idx, value=header)
-                    cell.fill = header_fill
-                    cell.font = header_font
-                    cell.alignment = center_align
-
-                # Dane
-                cursor.execute(f"SELECT * FROM [{table}]")
-                for row_idx, row in enumerate(cursor.fetchall(), 2):
-                    for col_idx, value in enumerate(row, 1):
-                        ws.cell(row=row_idx, column=col_idx, value=value)
-
-                # Auto-szerokość kolumn (maks. 50 znaków)
-                for col in ws.columns:
-                    max_len = max(
-                        (len(str(cell.value)) for cell in col if cell.value is not None),
-                        default=8,
-                    )
-                    col_letter = col[0].column_letter
-                    ws.column_dimensions[col_letter].width = min(max_len + 2, 50)
-        finally:
-            conn.close()
+                plan = _plan_sheet(conn, sheet, target[0], target[1], problems)
+                if plan is not None:
+                    plans.append(plan)
+                    total_rows += max((sheet.max_row or 1) - 1, 0)
+            if problems:
+                raise ValueError(
+                    "Arkusz nie pasuje do schematu baz — nic nie zostało zmienione:\n"
+                    + "\n".join(problems)
+                )
+
+            tracker = _Progress(total_rows, progress, cancel)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for plan in plans:
+                    _import_sheet(conn, plan, tracker, report)
+                tracker.check()
+                conn.execute("COMMIT")
+            except BaseException:
+                if conn.in_transaction:
+                    conn.execute("ROLLBACK")
+                raise
+    finally:
+        wb.close()
+    return report
+
+
+TEXT_EXPORT_FORMATS = ('csv', 'jsonl')
+
+
+def export_databases_text(
+    dest: Path,
+    fmt: str,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Path:
+    """
+    Eksportuje tabele własnych baz do folderu — jeden plik CSV lub JSONL na tabelę.
 
-    if not wb.sheetnames:
+    Nazwy tabel są unikalne między bazami, więc pliki nazywane są wprost
+    ``<tabela>.csv``/``<tabela>.jsonl``. CSV ma wiersz nagłówków i kodowanie
+    UTF-8 z BOM (poprawnie otwiera się w Excelu), JSONL — jeden obiekt JSON
+    na wiersz. Zapis strumieniowy, pliki ``*.partial`` podmieniane na końcu.
+
+    Args:
+        dest: Katalog docelowy.
+        fmt: 'csv' lub 'jsonl'.
+        progress: Callback postępu (jednostka: wiersze, etykieta: tabela).
+        cancel: Zdarzenie anulowania sprawdzane między partiami wierszy.
+
+    Returns:
+        Path: Katalog z plikami.
+
+    Raises:
+        ValueError: Gdy fmt jest nieznany lub żadna baza nie istnieje.
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    import csv
+
+    if fmt not in TEXT_EXPORT_FORMATS:
+        raise ValueError(f"Nieznany format eksportu: {fmt!r}")
+    own_dir = get_app_data_dir()
+    sources = [own_dir / db_file for db_file in _DB_FILES if (own_dir / db_file).exists()]
+    if not sources:
         raise ValueError("Brak baz danych do wyeksportowania.")
 
-    wb.save(dest)
+    total_rows = 0
+    for src in sources:
+        with closing(sqlite3.connect(src)) as conn:
+            for table in _user_tables(conn):
+                total_rows += conn.execute(f"SELECT COUNT(*) FROM [{table}]").fetchone()[0] + 1
+    tracker = _Progress(total_rows, progress, cancel)
+
+    dest.mkdir(parents=True, exist_ok=True)
+    partials: List[Tuple[Path, Path]] = []
+    try:
+        for src in sources:
+            with closing(sqlite3.connect(src)) as conn:
+                for table in _user_tables(conn):
+                    final = dest / f"{table}.{fmt}"
+                    part = final.with_name(final.name + ".partial")
+                    partials.append((part, final))
+                    cursor = conn.execute(f"SELECT * FROM [{table}]")
+                    headers = [desc[0] for desc in cursor.description]
+                    encoding = 'utf-8-sig' if fmt == 'csv' else 'utf-8'
+                    with open(part, 'w', encoding=encoding, newline='') as fh:
+                        writer = csv.writer(fh) if fmt == 'csv' else None
+                        if writer is not None:
+                            writer.writerow(headers)
+                        tracker.advance(1, table)
+                        while True:
+                            batch = cursor.fetchmany(_EXCEL_BATCH)
+                            if not batch:
+                                break
+                            if writer is not None:
+                                writer.writerows(batch)
+                            else:
+                                fh.writelines(
+                                    json.dumps(dict(zip(headers, row)), ensure_ascii=False)
+                                    + "\n"
+                                    for row in batch
+                                )
+                            tracker.advance(len(batch), table)
+        tracker.check()
+    except BaseException:
+        for part, _ in partials:
+            _remove_quietly(part)
+        raise
+    for part, final in partials:
+        os.replace(part, final)
     return dest
 
 
-def export_databases(dest: Path, fmt: str) -> Path:
+def export_databases(
+    dest: Path,
+    fmt: str,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+    compact: bool = False,
+) -> Path:
     """
     Eksportuje własne bazy danych do pliku ZIP lub folderu.
 
+    Każda baza kopiowana jest przez API backupu SQLite (``snapshot_database``),
+    więc eksport jest spójny także wtedy, gdy aplikacja ma otwarte połączenia.
+    Pliki zapisywane są pod nazwami tymczasowymi (``*.partial``) i podmieniane
+    dopiero po skopiowaniu wszystkiego — anulowanie nie zostawia częściowego
+    eksportu ani nie rusza plików, które już były w folderze docelowym.
+
     Args:
         dest: Ścieżka docelowa — plik .zip (fmt='zip') lub katalog (fmt='folder').
         fmt: 'zip' lub 'folder'.
+        progress: Callback postępu (jednostka: bajty, etykieta: plik bazy).
+        cancel: Zdarzenie anulowania sprawdzane między porcjami danych.
+        compact: Czy kompaktować kopie (``VACUUM INTO``).
 
     Returns:
         Path: Ścieżka do utworzonego pliku/folderu.
@@ -422,41 +1319,79 @@ def export_databases(dest: Path, fmt: str) -> Path:
     Raises:
         ValueError: Gdy fmt jest nieznany.
         OSError: Gdy nie można zapisać pliku.
+        OperationCancelled: Gdy ustawiono ``cancel``.
     """
+    if fmt not in ('zip', 'folder'):
+        raise ValueError(f"Nieznany format eksportu: {fmt!r}")
     own_dir = get_app_data_dir()
+    sources = [(db_file, own_dir / db_file) for db_file in _DB_FILES]
+    sources = [(db_file, src) for db_file, src in sources if src.exists()]
+    total = sum(_snapshot_size(src) for _, src in sources)
+
     if fmt == 'zip':
-        with zipfile.ZipFile(dest, 'w', zipfile.ZIP_DEFLATED) as zf:
-            for db_file in _DB_FILES:
-                src = own_dir / db_file
-                if src.exists():
-                    zf.write(src, db_file)
-        return dest
-    elif fmt == 'folder':
-        dest.mkdir(parents=True, exist_ok=True)
-        for db_file in _DB_FILES:
-            src = own_dir / db_file
-            if src.exists():
-                shutil.copy2(src, dest / db_file)
+        # Kopia (backup) + kompresja — każdy etap liczony osobno
+        tracker = _Progress(total * 2, progress, cancel)
+        tmp = dest.with_name(dest.name + ".partial")
+        staging = Path(tempfile.mkdtemp(prefix="sesyjka_export_"))
+        try:
+            with zipfile.ZipFile(tmp, 'w', zipfile.ZIP_DEFLATED) as zf:
+                for db_file, src in sources:
+                    snap = staging / db_file
+                    snapshot_database(src, snap, compact, tracker, db_file)
+                    info = zipfile.ZipInfo.from_file(snap, db_file)
+                    info.compress_type = zipfile.ZIP_DEFLATED
+                    with open(snap, 'rb') as fsrc, zf.open(info, 'w') as fdst:
+                        _copy_stream(fsrc, fdst, tracker, db_file)
+                    snap.unlink()
+            os.replace(tmp, dest)
+        except BaseException:
+            _remove_quietly(tmp)
+            raise
+        finally:
+            _remove_quietly(staging)
         return dest
-    else:
-        raise ValueError(f"Nieznany format eksportu: {fmt!r}")
+
+    tracker = _Progress(total, progress, cancel)
+    dest.mkdir(parents=True, exist_ok=True)
+    partials: List[Tuple[Path, Path]] = []
+    try:
+        for db_file, src in sources:
+            part = dest / (db_file + ".partial")
+            partials.append((part, dest / db_file))
+            snapshot_database(src, part, compact, tracker, db_file)
+        tracker.check()
+    except BaseException:
+        for part, _ in partials:
+            _remove_quietly(part)
+        raise
+    for part, final in partials:
+        os.replace(part, final)
+    return dest
 
 
-def prepare_import_source(source: Path) -> Tuple[Path, List[str]]:
+def prepare_import_source(
+    source: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> Tuple[Path, List[str]]:
     """
     Przygotowuje źródło importu — rozpakowuje ZIP lub waliduje folder.
 
-    ZIP jest rozpakowywany do katalogu tymczasowego (%TEMP%\\sesyjka_import_*),
-    który pozostaje do końca sesji (lub do jawnego usunięcia przez exit_guest_mode).
+    ZIP jest rozpakowywany do katalogu tymczasowego (%TEMP%\\sesyjka_import_*)
+    — na potrzeby importu własnych danych (tryb gościa: ``read_guest_source``).
+    Przy anulowaniu lub błędzie rozpakowywania katalog jest usuwany.
 
     Args:
         source: Ścieżka do pliku .zip lub folderu z bazami.
+        progress: Callback postępu rozpakowywania (jednostka: bajty).
+        cancel: Zdarzenie anulowania.
 
     Returns:
         Tuple[Path, List[str]]: (katalog_z_plikami_db, lista_znalezionych_plików_db)
 
     Raises:
         ValueError: Gdy źródło nie zawiera żadnych baz danych Sesyjki.
+        OperationCancelled: Gdy ustawiono ``cancel``.
     """
     db_set = set(_DB_FILES)
     if source.suffix.lower() == '.zip':
@@ -466,9 +1401,15 @@ def prepare_import_source(source: Path) -> Tuple[Path, List[str]]:
             found = sorted(names & db_set)
             if not found:
                 raise ValueError("Plik ZIP nie zawiera żadnych baz danych Sesyjki (.db).")
+            tracker = _Progress(sum(zf.getinfo(f).file_size for f in found), progress, cancel)
             tmp = Path(tempfile.mkdtemp(prefix="sesyjka_import_"))
-            for f in found:
-                zf.extract(f, tmp)
+            try:
+                for f in found:
+                    with zf.open(f) as fsrc, open(tmp / f, 'wb') as fdst:
+                        _copy_stream(fsrc, fdst, tracker, f)
+            except BaseException:
+                _remove_quietly(tmp)
+                raise
         return tmp, found
     elif source.is_dir():
         found = sorted(f for f in _DB_FILES if (source / f).exists())
@@ -479,24 +1420,295 @@ def prepare_import_source(source: Path) -> Tuple[Path, List[str]]:
         raise ValueError("Nieznany format — wybierz plik .zip lub folder z bazami Sesyjki.")
 
 
-def replace_own_databases(source_dir: Path, db_files: List[str]) -> None:
+_SQLITE_MAGIC = b"SQLite format 3\x00"
+
+
+def read_guest_source(
+    source: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> GuestSource:
+    """
+    Przygotowuje bazy gościa bez rozpakowywania na dysk.
+
+    ZIP: każda baza jest wczytywana do pamięci (później ``Connection.deserialize``).
+    Folder: pliki zostają na miejscu i są otwierane tylko do odczytu.
+
+    Raises:
+        ValueError: Gdy źródło nie zawiera baz Sesyjki lub plik nie jest bazą SQLite.
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    db_set = set(_DB_FILES)
+    if source.suffix.lower() == '.zip':
+        with zipfile.ZipFile(source) as zf:
+            names = {n for n in zf.namelist() if '/' not in n and '\\' not in n}
+            found = sorted(names & db_set)
+            if not found:
+                raise ValueError("Plik ZIP nie zawiera żadnych baz danych Sesyjki (.db).")
+            tracker = _Progress(sum(zf.getinfo(f).file_size for f in found), progress, cancel)
+            images: Dict[str, bytes] = {}
+            for f in found:
+                chunks: List[bytes] = []
+                with zf.open(f) as member:
+                    while True:
+                        tracker.check()
+                        chunk = member.read(_COPY_CHUNK)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                        tracker.advance(len(chunk), f)
+                image = b"".join(chunks)
+                if not image.startswith(_SQLITE_MAGIC):
+                    raise ValueError(f"{f} w pliku ZIP nie jest bazą danych SQLite.")
+                images[f] = image
+        return GuestSource(found, images=images)
+    if source.is_dir():
+        found = sorted(f for f in _DB_FILES if (source / f).exists())
+        if not found:
+            raise ValueError("Folder nie zawiera żadnych baz danych Sesyjki (.db).")
+        for f in found:
+            with open(source / f, 'rb') as fh:
+                if fh.read(len(_SQLITE_MAGIC)) != _SQLITE_MAGIC:
+                    raise ValueError(f"{f} nie jest bazą danych SQLite.")
+        return GuestSource(found, directory=source)
+    raise ValueError("Nieznany format — wybierz plik .zip lub folder z bazami Sesyjki.")
+
+
+# ── Walidacja źródła importu ─────────────────────────────────────────────────
+
+# Tabele i kolumny, bez których aplikacja nie działa (kolumny dodawane później
+# przez ALTER TABLE w ``ensure_schema`` modułów nie są wymagane — dopisze je migracja)
+_REQUIRED_SCHEMA: Dict[str, Dict[str, frozenset]] = {
+    "systemy_rpg.db": {"systemy_rpg": frozenset({"id", "nazwa", "typ"})},
+    "sesje_rpg.db": {
+        "sesje_rpg": frozenset({"id", "data_sesji", "system_id", "liczba_graczy"}),
+    },
+    "gracze.db": {"gracze": frozenset({"id", "nick"})},
+    "wydawcy.db": {"wydawcy": frozenset({"id", "nazwa"})},
+}
+
+# Co ile instrukcji maszyny wirtualnej SQLite sprawdzać anulowanie (quick_check)
+_CHECK_INTERRUPT_STEPS = 20000
+
+
+@dataclass
+class ValidationResult:
+    """Wynik walidacji jednego pliku bazy ze źródła importu."""
+
+    db_file: str
+    errors: List[str] = field(default_factory=list)
+    fingerprint: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+
+def _check_header(header: bytes, file_size: int) -> List[str]:
+    """Sprawdza nagłówek SQLite: sygnaturę, rozmiar strony i zgodność rozmiaru pliku."""
+    if len(header) < 100 or not header.startswith(_SQLITE_MAGIC):
+        return ["plik nie jest bazą danych SQLite"]
+    page_size = int.from_bytes(header[16:18], "big")
+    if page_size == 1:
+        page_size = 65536
+    if page_size < 512 or page_size > 65536 or page_size & (page_size - 1):
+        return [f"nieprawidłowy rozmiar strony w nagłówku ({page_size})"]
+    errors = []
+    if file_size % page_size:
+        errors.append("rozmiar pliku nie jest wielokrotnością rozmiaru strony (plik ucięty?)")
+    page_count = int.from_bytes(header[28:32], "big")
+    valid_for = int.from_bytes(header[92:96], "big")
+    change_counter = int.from_bytes(header[24:28], "big")
+    # Liczba stron w nagłówku jest wiarygodna tylko, gdy valid-for == licznik zmian
+    if page_count and valid_for == change_counter and page_count * page_size > file_size:
+        errors.append(
+            f"plik jest ucięty ({file_size} B, nagłówek deklaruje {page_count * page_size} B)"
+        )
+    return errors
+
+
+def _schema_fingerprint(conn: sqlite3.Connection) -> Tuple[str, Dict[str, set]]:
+    """Zwraca odcisk schematu (SHA-256 z tabel i kolumn) oraz mapę tabela → kolumny."""
+    tables: Dict[str, set] = {}
+    for (name,) in conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name NOT LIKE 'sqlite_%' "
+        "ORDER BY name"
+    ):
+        tables[name] = {row[1] for row in conn.execute(f"PRAGMA table_info([{name}])")}
+    canonical = ";".join(f"{t}({','.join(sorted(cols))})" for t, cols in sorted(tables.items()))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:16], tables
+
+
+def _validate_database(
+    db_file: str,
+    header: bytes,
+    file_size: int,
+    open_conn: Callable[[], sqlite3.Connection],
+    stopped: Callable[[], bool],
+) -> ValidationResult:
+    result = ValidationResult(db_file, _check_header(header, file_size))
+    if result.errors:
+        return result
+    try:
+        with closing(open_conn()) as conn:
+            conn.set_progress_handler(lambda: int(stopped()), _CHECK_INTERRUPT_STEPS)
+            problems = [row[0] for row in conn.execute("PRAGMA quick_check(5)")]
+            if problems != ["ok"]:
+                result.errors.extend(f"uszkodzenie: {p}" for p in problems)
+                return result
+            result.fingerprint, tables = _schema_fingerprint(conn)
+    except sqlite3.Error as exc:
+        if stopped():
+            raise OperationCancelled() from exc
+        result.errors.append(f"nie można odczytać bazy: {exc}")
+        return result
+    for table, columns in _REQUIRED_SCHEMA.get(db_file, {}).items():
+        if table not in tables:
+            result.errors.append(f"brak tabeli {table}")
+        elif not columns <= tables[table]:
+            missing = ", ".join(sorted(columns - tables[table]))
+            result.errors.append(f"tabela {table} nie ma kolumn: {missing}")
+    return result
+
+
+def validate_import_source(
+    source: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> List[ValidationResult]:
+    """
+    Sprawdza bazy w źródle importu, zanim cokolwiek zostanie nadpisane.
+
+    Dla każdego pliku: sygnatura i rozmiar strony z nagłówka (także wykrycie
+    uciętego pliku), ``PRAGMA quick_check`` oraz odcisk schematu porównany
+    z tabelami/kolumnami wymaganymi przez aplikację. Pliki sprawdzane są
+    równolegle; bazy z ZIP są czytane prosto z archiwum do pamięci
+    (``Connection.deserialize``), bez zapisu na dysk.
+
+    Returns:
+        Wyniki w kolejności nazw plików (``ValidationResult.ok`` / ``errors``).
+
+    Raises:
+        ValueError: Gdy źródło nie zawiera żadnych baz Sesyjki.
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    # Przerywa trwające quick_check: anulowanie przez użytkownika lub błąd innego pliku
+    stop = threading.Event()
+
+    def _stopped() -> bool:
+        return stop.is_set() or (cancel is not None and cancel.is_set())
+
+    jobs: List[Tuple[str, int, Callable[[], ValidationResult]]] = []
+    if source.suffix.lower() == '.zip':
+        with zipfile.ZipFile(source) as zf:
+            names = {n for n in zf.namelist() if '/' not in n and '\\' not in n}
+            sizes = {f: zf.getinfo(f).file_size for f in sorted(names & set(_DB_FILES))}
+        for f, size in sizes.items():
+            def _job_zip(f: str = f) -> ValidationResult:
+                # ZipFile nie jest bezpieczny wątkowo — każdy wątek otwiera własny
+                with zipfile.ZipFile(source) as own_zf:
+                    image = own_zf.read(f)
+
+                def _open() -> sqlite3.Connection:
+                    conn = sqlite3.connect(":memory:")
+                    conn.deserialize(image)
+                    return conn
+
+                return _validate_database(f, image[:100], len(image), _open, _stopped)
+
+            jobs.append((f, size, _job_zip))
+    elif source.is_dir():
+        found = sorted(f for f in _DB_FILES if (source / f).exists())
+        for f in found:
+            path = source / f
+
+            def _job_dir(f: str = f, path: Path = path) -> ValidationResult:
+                with open(path, 'rb') as fh:
+                    header = fh.read(100)
+                uri = path.resolve().as_uri() + "?mode=ro"
+                return _validate_database(
+                    f, header, path.stat().st_size,
+                    lambda: sqlite3.connect(uri, uri=True), _stopped,
+                )
+
+            jobs.append((f, path.stat().st_size, _job_dir))
+    else:
+        raise ValueError("Nieznany format — wybierz plik .zip lub folder z bazami Sesyjki.")
+    if not jobs:
+        raise ValueError("Źródło nie zawiera żadnych baz danych Sesyjki (.db).")
+
+    tracker = _Progress(sum(size for _, size, _ in jobs), progress, cancel)
+    tracker.check()
+    results: Dict[str, ValidationResult] = {}
+    with ThreadPoolExecutor(max_workers=len(jobs)) as pool:
+        futures = {pool.submit(job): (f, size) for f, size, job in jobs}
+        try:
+            for future in as_completed(futures):
+                f, size = futures[future]
+                results[f] = future.result()
+                tracker.advance(size, f)
+        except BaseException:
+            stop.set()
+            raise
+    return [results[f] for f, _, _ in jobs]
+
+
+def format_validation_errors(results: List[ValidationResult]) -> str:
+    """Składa komunikat z błędów walidacji (pusty, gdy wszystko w porządku)."""
+    return "\n".join(
+        f"• {r.db_file}: {error}" for r in results for error in r.errors
+    )
+
+
+def replace_own_databases(
+    source_dir: Path,
+    db_files: List[str],
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> None:
     """
     Nadpisuje własne bazy danych plikami z source_dir.
-    Przed każdym nadpisaniem tworzy backup w %LOCALAPPDATA%\\Sesyjka\\backups\\.
+    Przed każdym nadpisaniem tworzy kopię w magazynie kopii zapasowych.
+
+    Pliki są najpierw kopiowane obok docelowych (``*.importing``) przez API
+    backupu SQLite — ten etap można anulować bez zmiany własnych danych, a plik,
+    który nie jest bazą SQLite, zostaje odrzucony. Backup i podmiana następują
+    dopiero po skopiowaniu wszystkich plików; podmienione bazy przechodzą
+    ponownie przebieg startowy (``refresh_databases``).
 
     Args:
         source_dir: Katalog źródłowy z plikami .db.
         db_files: Lista nazw plików .db do nadpisania.
+        progress: Callback postępu kopiowania (jednostka: bajty).
+        cancel: Zdarzenie anulowania.
+
+    Raises:
+        OperationCancelled: Gdy ustawiono ``cancel`` przed podmianą plików.
     """
     own_dir = get_app_data_dir()
-    for db_file in db_files:
-        src = source_dir / db_file
-        if not src.exists():
-            continue
-        dst = own_dir / db_file
+    sources = [(db_file, source_dir / db_file) for db_file in db_files]
+    sources = [(db_file, src) for db_file, src in sources if src.exists()]
+    tracker = _Progress(sum(_snapshot_size(src) for _, src in sources), progress, cancel)
+
+    staged: List[Tuple[Path, Path]] = []
+    try:
+        for db_file, src in sources:
+            part = own_dir / (db_file + ".importing")
+            staged.append((part, own_dir / db_file))
+            snapshot_database(src, part, tracker=tracker, label=db_file)
+        tracker.check()
+    except BaseException:
+        for part, _ in staged:
+            _remove_quietly(part)
+        raise
+
+    for part, dst in staged:
         if dst.exists():
-            backup_database(str(dst))
-        shutil.copy2(src, dst)
+            # Bez wypisywania na stdout — wynik poleceń CLI to sam JSON
+            backup_id = backup_database(str(dst), verbose=False, reason="import")
+            _log.info("Kopia przed importem %s: %s", dst.name, backup_id)
+        os.replace(part, dst)
+    refresh_databases([dst.name for _, dst in staged])
 
 
 # Eksportuj funkcje dla kompatybilności
@@ -505,14 +1717,30 @@ __all__ = [
     'get_db_path',
     'get_own_db_path',
     'set_guest_db_dir',
+    'set_guest_source',
+    'read_guest_source',
+    'GuestSource',
     'is_guest_mode',
+    'connect_db',
     'export_databases',
     'export_databases_excel',
+    'export_databases_text',
+    'import_databases_excel',
+    'ExcelImportReport',
+    'TEXT_EXPORT_FORMATS',
+    'OperationCancelled',
+    'ProgressCallback',
     'prepare_import_source',
+    'validate_import_source',
+    'format_validation_errors',
+    'ValidationResult',
     'replace_own_databases',
     'migrate_old_databases',
     'initialize_app_databases',
+    'refresh_databases',
+    'open_schema_connection',
     'ensure_app_icons',
     'backup_database',
+    'snapshot_database',
     'CURRENT_DB_VERSION',
 ]
@@ -0,0 +1,246 @@
+"""
+Porównanie kolekcji — własne bazy kontra bazy gościa, liczone w SQL.
+
+Własne i gościnne ``systemy_rpg.db``/``wydawcy.db`` są dołączane (``ATTACH``)
+do jednego połączenia tylko do odczytu. Pozycje posiadane po obu stronach
+trafiają do tymczasowych tabel z kluczem (znormalizowana nazwa,
+znormalizowany wydawca), a zestawienie „ma gość, nie mam ja”, „mam ja,
+nie ma gość” i „obaj mamy” to złączenia po tym kluczu (indeks klucza
+głównego tabeli tymczasowej). Identyfikatory wydawców po obu stronach są
+niezależne, dlatego porównywane są nazwy, nie ``wydawca_id``.
+
+Moduł nie importuje Tk.
+"""
+from __future__ import annotations
+
+import logging
+import sqlite3
+import threading
+import unicodedata
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from database_manager import GuestSource, OperationCancelled, get_own_db_path
+
+_log = logging.getLogger(__name__)
+
+ONLY_GUEST = "Ma gość, nie mam ja"
+ONLY_OWN = "Mam ja, nie ma gość"
+BOTH = "Obaj mamy"
+CATEGORIES = (ONLY_GUEST, ONLY_OWN, BOTH)
+
+# Statusy kolekcji oznaczające posiadanie pozycji
+_OWNED_STATUSES = ("W kolekcji", "Na sprzedaż")
+_NO_SYSTEM = "(bez systemu)"
+_CHECK_INTERRUPT_STEPS = 20000
+
+
+@dataclass
+class DiffRow:
+    """Pozycja zestawienia (jedna na klucz nazwa + wydawca)."""
+
+    category: str
+    system: str
+    nazwa: str
+    typ: str
+    wydawca: str
+
+
+@dataclass
+class CollectionDiff:
+    """Wynik porównania kolekcji."""
+
+    rows: List[DiffRow] = field(default_factory=list)
+    # system → (ma gość, mam ja, obaj) — w kolejności ``CATEGORIES``
+    per_system: Dict[str, Tuple[int, int, int]] = field(default_factory=dict)
+
+    def totals(self) -> Tuple[int, int, int]:
+        """Łączne liczby pozycji w kolejności ``CATEGORIES``."""
+        sums = [0, 0, 0]
+        for counts in self.per_system.values():
+            for i, n in enumerate(counts):
+                sums[i] += n
+        return sums[0], sums[1], sums[2]
+
+
+def normalize_name(value: Optional[str]) -> str:
+    """Klucz porównania: bez wielkości liter, akcentów i nadmiarowych spacji."""
+    if not value:
+        return ""
+    text = unicodedata.normalize("NFKD", value.casefold())
+    text = "".join(ch for ch in text if not unicodedata.combining(ch))
+    return " ".join(text.replace("ł", "l").split())
+
+
+def _attach_guest(
+    conn: sqlite3.Connection, guest: GuestSource, db_file: str, alias: str
+) -> bool:
+    """Dołącza bazę gościa (plik tylko do odczytu albo obraz z ZIP)."""
+    if guest.directory is not None and (guest.directory / db_file).exists():
+        uri = (guest.directory / db_file).resolve().as_uri() + "?mode=ro&immutable=1"
+        conn.execute("ATTACH DATABASE ? AS " + alias, (uri,))
+        return True
+    image = guest.images.get(db_file)
+    if image is None:
+        return False
+    conn.execute("ATTACH DATABASE ':memory:' AS " + alias)
+    conn.deserialize(image, name=alias)
+    return True
+
+
+def _columns(conn: sqlite3.Connection, schema: str, table: str) -> set:
+    return {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{table}])")}
+
+
+def _fill_items(
+    conn: sqlite3.Connection, side: str, sys_alias: str, wyd_alias: Optional[str]
+) -> None:
+    """Wypełnia tabelę tymczasową ``{side}_items`` posiadanymi pozycjami jednej strony."""
+    cols = _columns(conn, sys_alias, "systemy_rpg")
+    has_gry = "system_gry_id" in cols and "systemy_gry" in {
+        row[0] for row in conn.execute(
+            f"SELECT name FROM {sys_alias}.sqlite_master WHERE type = 'table'"
+        )
+    }
+    wydawca = "w.nazwa" if wyd_alias is not None and "wydawca_id" in cols else "NULL"
+    joins = (
+        f" LEFT JOIN {wyd_alias}.wydawcy w ON w.id = s.wydawca_id"
+        if wydawca != "NULL" else ""
+    )
+    gry = "g.nazwa" if has_gry else "NULL"
+    if has_gry:
+        joins += f" LEFT JOIN {sys_alias}.systemy_gry g ON g.id = s.system_gry_id"
+    glowny = "NULL"
+    if "system_glowny_id" in cols:
+        glowny = "pg.nazwa"
+        joins += f" LEFT JOIN {sys_alias}.systemy_rpg pg ON pg.id = s.system_glowny_id"
+    owned = (
+        "COALESCE(s.status_kolekcja, 'W kolekcji') IN ("
+        + ", ".join("?" for _ in _OWNED_STATUSES) + ")"
+        if "status_kolekcja" in cols else "1"
+    )
+    conn.execute(
+        f"CREATE TEMP TABLE {side}_items ("
+        " n_nazwa TEXT NOT NULL, n_wydawca TEXT NOT NULL,"
+        " nazwa TEXT, typ TEXT, wydawca TEXT, system TEXT,"
+        " PRIMARY KEY (n_nazwa, n_wydawca)) WITHOUT ROWID"
+    )
+    # Kilka wpisów tej samej pozycji (np. PDF i wersja fizyczna) liczy się raz
+    conn.execute(
+        f"INSERT OR IGNORE INTO {side}_items"
+        " SELECT sesyjka_norm(s.nazwa), sesyjka_norm(" + wydawca + "),"
+        f" s.nazwa, s.typ, {wydawca},"
+        f" COALESCE({gry}, {glowny},"
+        " CASE WHEN s.typ = 'Podręcznik Główny' THEN s.nazwa END, ?)"
+        f" FROM {sys_alias}.systemy_rpg s{joins} WHERE {owned}",
+        (_NO_SYSTEM, *(_OWNED_STATUSES if owned != "1" else ())),
+    )
+
+
+_DIFF_SQL = f"""
+    CREATE TEMP VIEW diff AS
+    SELECT '{ONLY_GUEST}' AS kategoria, g.system, g.nazwa, g.typ, g.wydawca
+      FROM guest_items g LEFT JOIN own_items o USING (n_nazwa, n_wydawca)
+     WHERE o.n_nazwa IS NULL
+    UNION ALL
+    SELECT '{ONLY_OWN}', o.system, o.nazwa, o.typ, o.wydawca
+      FROM own_items o LEFT JOIN guest_items g USING (n_nazwa, n_wydawca)
+     WHERE g.n_nazwa IS NULL
+    UNION ALL
+    SELECT '{BOTH}', o.system, o.nazwa, o.typ, o.wydawca
+      FROM own_items o JOIN guest_items g USING (n_nazwa, n_wydawca)
+"""
+
+
+def compare_collections(
+    guest: GuestSource, cancel: Optional[threading.Event] = None
+) -> CollectionDiff:
+    """
+    Porównuje własną kolekcję z kolekcją gościa.
+
+    Args:
+        guest: Bazy gościa (wynik ``read_guest_source``).
+        cancel: Zdarzenie anulowania, sprawdzane także w trakcie zapytań.
+
+    Raises:
+        OperationCancelled: Gdy ustawiono ``cancel``.
+        ValueError: Gdy u gościa nie ma bazy systemów.
+    """
+    with closing(sqlite3.connect(":memory:")) as conn:
+        conn.create_function("sesyjka_norm", 1, normalize_name, deterministic=True)
+        if cancel is not None:
+            conn.set_progress_handler(lambda: int(cancel.is_set()), _CHECK_INTERRUPT_STEPS)
+
+        own_sys = Path(get_own_db_path("systemy_rpg.db"))
+        own_wyd = Path(get_own_db_path("wydawcy.db"))
+        if own_sys.exists():
+            conn.execute(
+                "ATTACH DATABASE ? AS own_sys", (own_sys.resolve().as_uri() + "?mode=ro",)
+            )
+        else:
+            conn.execute("ATTACH DATABASE ':memory:' AS own_sys")
+            conn.execute(
+                "CREATE TABLE own_sys.systemy_rpg (id INTEGER PRIMARY KEY, nazwa TEXT, typ TEXT)"
+            )
+        own_wyd_alias: Optional[str] = None
+        if own_wyd.exists():
+            conn.execute(
+                "ATTACH DATABASE ? AS own_wyd", (own_wyd.resolve().as_uri() + "?mode=ro",)
+            )
+            own_wyd_alias = "own_wyd"
+        if not _attach_guest(conn, guest, "systemy_rpg.db", "guest_sys"):
+            raise ValueError("Źródło gościa nie zawiera bazy systemy_rpg.db.")
+        guest_wyd_alias = (
+            "guest_wyd" if _attach_guest(conn, guest, "wydawcy.db", "guest_wyd") else None
+        )
+
+        def _check() -> None:
+            if cancel is not None and cancel.is_set():
+                raise OperationCancelled()
+
+        try:
+            _check()
+            _fill_items(conn, "own", "own_sys", own_wyd_alias)
+            _check()
+            _fill_items(conn, "guest", "guest_sys", guest_wyd_alias)
+            _check()
+            conn.execute(_DIFF_SQL)
+            rows = [
+                DiffRow(kat, system or _NO_SYSTEM, nazwa or "", typ or "", wydawca or "")
+                for kat, system, nazwa, typ, wydawca in conn.execute(
+                    "SELECT kategoria, system, nazwa, typ, wydawca FROM diff"
+                    " ORDER BY system COLLATE NOCASE, nazwa COLLATE NOCASE"
+                )
+            ]
+            per_system = {
+                system or _NO_SYSTEM: (only_guest, only_own, both)
+                for system, only_guest, only_own, both in conn.execute(
+                    f"SELECT system,"
+                    f" SUM(kategoria = '{ONLY_GUEST}'), SUM(kategoria = '{ONLY_OWN}'),"
+                    f" SUM(kategoria = '{BOTH}')"
+                    " FROM diff GROUP BY system ORDER BY system COLLATE NOCASE"
+                )
+            }
+            _check()
+        except sqlite3.OperationalError as e:
+            if cancel is not None and cancel.is_set():
+                raise OperationCancelled() from e
+            raise
+
+    result = CollectionDiff(rows, per_system)
+    _log.info("Porównanie kolekcji: %s", dict(zip(CATEGORIES, result.totals())))
+    return result
+
+
+__all__ = [
+    "BOTH",
+    "CATEGORIES",
+    "CollectionDiff",
+    "DiffRow",
+    "ONLY_GUEST",
+    "ONLY_OWN",
+    "compare_collections",
+    "normalize_name",
+]
@@ -0,0 +1,329 @@
+"""
+Import scalający — dołączanie zmian z cudzej kopii baz zamiast nadpisywania plików.
+
+Bazy źródłowe są podłączane przez ``ATTACH`` (tylko do odczytu) do jednego
+połączenia razem z własnymi bazami. Dla każdej tabeli liczony jest skrót
+treści każdego wiersza po obu stronach, a zapisywane są wyłącznie wiersze,
+które się różnią — w jednej transakcji obejmującej wszystkie pliki baz.
+
+Rozstrzyganie różnic korzysta ze skrótów z ostatniego scalenia (tabela
+``_merge_base`` w każdej własnej bazie):
+
+- wiersza nie ma u siebie → wstawienie; jeśli został usunięty lokalnie po
+  poprzednim scaleniu, usunięcie zostaje (konflikt, gdy źródło go zmieniło),
+- zmienił się tylko w źródle → aktualizacja,
+- zmienił się tylko u siebie → bez zmian,
+- zmienił się po obu stronach albo nie ma bazy porównania (pierwsze
+  scalenie) → konflikt; domyślnie zostaje własna wersja.
+
+Wiersze obecne tylko u siebie nie są usuwane. Moduł nie importuje Tk.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from database_manager import (
+    OperationCancelled,
+    ProgressCallback,
+    get_own_db_path,
+)
+
+_log = logging.getLogger(__name__)
+
+# Plik bazy → tabele (z kolumnami klucza) w kolejności scalania
+MERGE_TABLES: Dict[str, Tuple[Tuple[str, Tuple[str, ...]], ...]] = {
+    "systemy_rpg.db": (("systemy_gry", ("id",)), ("systemy_rpg", ("id",))),
+    "sesje_rpg.db": (("sesje_rpg", ("id",)), ("sesje_gracze", ("sesja_id", "gracz_id"))),
+    "gracze.db": (("gracze", ("id",)),),
+    "wydawcy.db": (("wydawcy", ("id",)),),
+}
+
+# Skróty wierszy z ostatniego scalenia / synchronizacji (wspólne z ``db_sync``)
+BASE_TABLE = "_merge_base"
+_BUSY_TIMEOUT = 30.0
+
+
+@dataclass
+class MergeConflict:
+    """Wiersz zmieniony po obu stronach (lub usunięty lokalnie)."""
+
+    table: str
+    key: str
+    reason: str
+
+
+@dataclass
+class MergeReport:
+    """Wynik scalenia (lub planu scalenia przy ``apply=False``)."""
+
+    inserted: Dict[str, int] = field(default_factory=dict)
+    updated: Dict[str, int] = field(default_factory=dict)
+    unchanged: Dict[str, int] = field(default_factory=dict)
+    conflicts: List[MergeConflict] = field(default_factory=list)
+    # Klucze wstawionych/zaktualizowanych wierszy (do zdarzeń zmian)
+    changed_keys: Dict[str, List[str]] = field(default_factory=dict)
+    skipped_tables: List[str] = field(default_factory=list)
+    applied: bool = False
+
+    @property
+    def change_count(self) -> int:
+        return sum(self.inserted.values()) + sum(self.updated.values())
+
+
+@dataclass
+class _TablePlan:
+    table: str
+    key_cols: Tuple[str, ...]
+    columns: List[str]
+    inserts: List[Tuple[Any, ...]] = field(default_factory=list)
+    updates: List[Tuple[Any, ...]] = field(default_factory=list)
+    base_updates: List[Tuple[str, str]] = field(default_factory=list)
+    unchanged: int = 0
+
+
+def row_hash(*values: Any) -> str:
+    """Skrót treści wiersza (funkcja SQL ``sesyjka_row_hash``)."""
+    return hashlib.blake2b(repr(values).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def key_text(key: Sequence[Any]) -> str:
+    """Klucz wiersza w postaci tekstowej (jak w ``BASE_TABLE`` i dzienniku ``db_sync``)."""
+    return ":".join(str(part) for part in key)
+
+
+def ensure_base_table(conn: sqlite3.Connection, schema: str = "main") -> None:
+    """Tworzy (idempotentnie) tabelę skrótów bazowych w bazie ``schema``."""
+    conn.execute(
+        f"CREATE TABLE IF NOT EXISTS {schema}.{BASE_TABLE} ("
+        " tabela TEXT NOT NULL, klucz TEXT NOT NULL, hash TEXT NOT NULL,"
+        " PRIMARY KEY (tabela, klucz)) WITHOUT ROWID"
+    )
+
+
+def _columns(conn: sqlite3.Connection, schema: str, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{table}])")]
+
+
+def _plan_table(
+    conn: sqlite3.Connection,
+    own: str,
+    src: str,
+    table: str,
+    key_cols: Tuple[str, ...],
+    prefer_incoming: bool,
+    report: MergeReport,
+) -> Optional[_TablePlan]:
+    own_cols = _columns(conn, own, table)
+    src_cols = _columns(conn, src, table)
+    if not own_cols or not src_cols:
+        report.skipped_tables.append(table)
+        return None
+    # Porównywane są kolumny wspólne — różnice wersji schematu nie dają konfliktów
+    columns = [c for c in src_cols if c in own_cols]
+    if not all(k in columns for k in key_cols):
+        report.skipped_tables.append(table)
+        return None
+    plan = _TablePlan(table, key_cols, columns)
+
+    s_cols = ", ".join(f"s.[{c}]" for c in columns)
+    o_cols = ", ".join(f"o.[{c}]" for c in columns)
+    s_keys = ", ".join(f"s.[{k}]" for k in key_cols)
+    join = " AND ".join(f"o.[{k}] = s.[{k}]" for k in key_cols)
+    key_expr = " || ':' || ".join(f"CAST(s.[{k}] AS TEXT)" for k in key_cols)
+    has_base = conn.execute(
+        f"SELECT 1 FROM {own}.sqlite_master WHERE type='table' AND name=?", (BASE_TABLE,)
+    ).fetchone() is not None
+    base_sel = "b.hash" if has_base else "NULL"
+    base_join = (
+        f"LEFT JOIN {own}.{BASE_TABLE} b ON b.tabela = ? AND b.klucz = {key_expr}"
+        if has_base else ""
+    )
+    sql = (
+        f"SELECT {s_keys}, sesyjka_row_hash({s_cols}),"
+        f" CASE WHEN o.[{key_cols[0]}] IS NULL THEN NULL ELSE sesyjka_row_hash({o_cols}) END,"
+        f" {base_sel}"
+        f" FROM {src}.[{table}] s LEFT JOIN {own}.[{table}] o ON {join} {base_join}"
+    )
+    n = len(key_cols)
+    for row in conn.execute(sql, (table,) if has_base else ()):
+        key, src_hash, own_hash, base_hash = row[:n], row[n], row[n + 1], row[n + 2]
+        key_txt = key_text(key)
+        if own_hash == src_hash:
+            plan.unchanged += 1
+            if base_hash != src_hash:
+                plan.base_updates.append((key_txt, src_hash))
+            continue
+        if own_hash is None:
+            if base_hash == src_hash:
+                plan.unchanged += 1  # usunięty lokalnie po poprzednim scaleniu — zostaje
+                continue
+            if base_hash is not None:
+                report.conflicts.append(
+                    MergeConflict(table, key_txt, "usunięty lokalnie, zmieniony w źródle")
+                )
+            if base_hash is None or prefer_incoming:
+                plan.inserts.append(key)
+                plan.base_updates.append((key_txt, src_hash))
+            continue
+        if base_hash is not None and own_hash == base_hash:
+            plan.updates.append(key)
+            plan.base_updates.append((key_txt, src_hash))
+        elif base_hash is not None and src_hash == base_hash:
+            plan.unchanged += 1  # zmiana tylko lokalna — zostaje
+        else:
+            reason = (
+                "zmieniony po obu stronach" if base_hash
+                else "różne wersje (brak poprzedniego scalenia)"
+            )
+            report.conflicts.append(MergeConflict(table, key_txt, reason))
+            if prefer_incoming:
+                plan.updates.append(key)
+                plan.base_updates.append((key_txt, src_hash))
+    return plan
+
+
+def _apply_table(conn: sqlite3.Connection, own: str, src: str, plan: _TablePlan) -> None:
+    cols = ", ".join(f"[{c}]" for c in plan.columns)
+    where = " AND ".join(f"[{k}] = ?" for k in plan.key_cols)
+    conn.executemany(
+        f"INSERT INTO {own}.[{plan.table}] ({cols}) SELECT {cols} FROM {src}.[{plan.table}]"
+        f" WHERE {where}",
+        plan.inserts,
+    )
+    value_cols = [c for c in plan.columns if c not in plan.key_cols]
+    if value_cols and plan.updates:
+        select = ", ".join(f"[{c}]" for c in value_cols)
+        assign = ", ".join(f"[{c}] = ?" for c in value_cols)
+        rows = []
+        for key in plan.updates:
+            values = conn.execute(
+                f"SELECT {select} FROM {src}.[{plan.table}] WHERE {where}", key
+            ).fetchone()
+            rows.append(tuple(values) + tuple(key))
+        conn.executemany(
+            f"UPDATE {own}.[{plan.table}] SET {assign} WHERE {where}", rows
+        )
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {own}.{BASE_TABLE} (tabela, klucz, hash) VALUES (?, ?, ?)",
+        [(plan.table, key, h) for key, h in plan.base_updates],
+    )
+
+
+def merge_databases(
+    source_dir: Path,
+    db_files: List[str],
+    apply: bool = True,
+    prefer_incoming: bool = False,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> MergeReport:
+    """
+    Scala bazy z ``source_dir`` z własnymi bazami.
+
+    Wszystkie zmiany (we wszystkich plikach) zapisywane są w jednej transakcji;
+    anulowanie lub błąd cofa całość. Zaległe zapisy (``db_writer.flush``) musi
+    opróżnić wywołujący.
+
+    Args:
+        source_dir: Katalog z plikami .db źródła (np. z ``prepare_import_source``).
+        db_files: Pliki baz do scalenia.
+        apply: False — tylko plan (raport bez zapisu).
+        prefer_incoming: Czy w konfliktach brać wersję ze źródła.
+        progress: Callback postępu (jednostka: tabele).
+        cancel: Zdarzenie anulowania sprawdzane między tabelami.
+
+    Raises:
+        OperationCancelled: Gdy ustawiono ``cancel``.
+    """
+    pairs = [
+        (db_file, source_dir / db_file)
+        for db_file in db_files
+        if db_file in MERGE_TABLES and (source_dir / db_file).exists()
+    ]
+    report = MergeReport()
+    if not pairs:
+        return report
+    total = sum(len(MERGE_TABLES[f]) for f, _ in pairs)
+    done = 0
+
+    # Pierwsza własna baza jest główną („main”) — dzięki temu commit obejmujący
+    # kilka plików jest atomowy (dziennik główny SQLite); pozostałe są dołączane
+    main_file = pairs[0][0]
+    conn = sqlite3.connect(
+        Path(get_own_db_path(main_file)).resolve().as_uri(),
+        uri=True, timeout=_BUSY_TIMEOUT, isolation_level=None,
+    )
+    with closing(conn):
+        conn.create_function("sesyjka_row_hash", -1, row_hash, deterministic=True)
+        aliases: Dict[str, Tuple[str, str]] = {}
+        for i, (db_file, src_path) in enumerate(pairs):
+            own = "main"
+            if db_file != main_file:
+                own = f"own{i}"
+                conn.execute(
+                    "ATTACH DATABASE ? AS " + own,
+                    (Path(get_own_db_path(db_file)).resolve().as_uri(),),
+                )
+            src = f"src{i}"
+            conn.execute(
+                "ATTACH DATABASE ? AS " + src, (src_path.resolve().as_uri() + "?mode=ro",)
+            )
+            aliases[db_file] = (own, src)
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for db_file, _ in pairs:
+                own, src = aliases[db_file]
+                if apply:
+                    ensure_base_table(conn, own)
+                for table, key_cols in MERGE_TABLES[db_file]:
+                    if cancel is not None and cancel.is_set():
+                        raise OperationCancelled()
+                    plan = _plan_table(
+                        conn, own, src, table, key_cols, prefer_incoming, report
+                    )
+                    done += 1
+                    if progress is not None:
+                        progress(done, total, table)
+                    if plan is None:
+                        continue
+                    report.inserted[table] = len(plan.inserts)
+                    report.updated[table] = len(plan.updates)
+                    report.unchanged[table] = plan.unchanged
+                    report.changed_keys[table] = [
+                        key_text(k) for k in plan.inserts + plan.updates
+                    ]
+                    if apply:
+                        _apply_table(conn, own, src, plan)
+            if cancel is not None and cancel.is_set():
+                raise OperationCancelled()
+            conn.execute("COMMIT" if apply else "ROLLBACK")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    report.applied = apply
+    _log.info(
+        "Scalenie baz: %d zmian, %d konfliktów%s",
+        report.change_count, len(report.conflicts), "" if apply else " (plan)",
+    )
+    return report
+
+
+__all__ = [
+    "BASE_TABLE",
+    "MERGE_TABLES",
+    "MergeConflict",
+    "MergeReport",
+    "ensure_base_table",
+    "key_text",
+    "merge_databases",
+    "row_hash",
+]
@@ -0,0 +1,582 @@
+"""
+Synchronizacja przyrostowa — eksport i wczytywanie samych zmian między instalacjami.
+
+Każda własna baza ma dziennik zmian utrzymywany przez wyzwalacze
+(``_sync_log``): po każdym INSERT/UPDATE/DELETE w tabelach z
+``db_merge.MERGE_TABLES`` zapisywany jest klucz wiersza z kolejnym numerem
+z monotonicznego licznika (``_sync_state``). Dziennik trzyma tylko ostatni
+numer dla każdego klucza, więc jego rozmiar nie rośnie z liczbą edycji.
+
+Punkt synchronizacji (``_sync_points``) to nazwany numer z licznika —
+np. nazwa drugiego urządzenia. Eksport zapisuje wiersze, które zmieniły się
+od tego punktu (aktualną treść albo informację o usunięciu), do małego pliku
+JSON skompresowanego ``lzma``, a następnie przesuwa punkt. Wczytanie pliku
+na drugiej instalacji wykonuje wstawienia, aktualizacje i usunięcia w jednej
+transakcji.
+
+Identyfikatory wierszy każda instalacja nadaje sama, więc ten sam klucz może
+oznaczać różne wiersze. Wczytanie rozstrzyga różnice tak jak ``db_merge`` —
+skrótami treści z ostatniej wymiany (``db_merge.BASE_TABLE``, zapisywanymi
+przy eksporcie i wczytaniu). Każdy wiersz pakietu niesie skrót wersji, od
+której wyszła zmiana; własny wiersz o innej treści (zmieniony u siebie albo
+dodany po obu stronach pod tym samym ID) nie jest nadpisywany ani usuwany,
+tylko zgłaszany jako konflikt.
+
+Wczytane zmiany trafiają do własnego dziennika, więc kolejny eksport
+przekazuje je dalej (np. z laptopa na trzecie urządzenie); odesłane z powrotem
+do źródła mają już zgodny skrót i są pomijane.
+
+Moduł nie importuje Tk.
+"""
+from __future__ import annotations
+
+import json
+import logging
+import lzma
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from database_manager import (
+    OperationCancelled,
+    ProgressCallback,
+    get_own_db_path,
+)
+from db_merge import (
+    BASE_TABLE,
+    MERGE_TABLES,
+    MergeConflict,
+    ensure_base_table,
+    key_text,
+    row_hash,
+)
+
+_log = logging.getLogger(__name__)
+
+CHANGESET_FORMAT = "sesyjka-changeset"
+CHANGESET_VERSION = 1
+CHANGESET_SUFFIX = ".sesyjka-zmiany"
+
+_LOG_TABLE = "_sync_log"
+_STATE_TABLE = "_sync_state"
+_POINTS_TABLE = "_sync_points"
+# Skrót bazowy sprzed ostatniej wymiany — wersja, od której wyszła zmiana przekazywana dalej
+_PREV_TABLE = "_sync_prev"
+_BUSY_TIMEOUT = 30.0
+
+
+@dataclass
+class ChangesetReport:
+    """Podsumowanie eksportu lub wczytania pakietu zmian."""
+
+    upserted: Dict[str, int] = field(default_factory=dict)
+    deleted: Dict[str, int] = field(default_factory=dict)
+    # ID zmienionych wierszy (tabele z kluczem ``id``) — do zdarzeń zmian
+    changed_ids: Dict[str, List[int]] = field(default_factory=dict)
+    # Wiersze pozostawione bez zmian, bo zmieniły się także u siebie
+    conflicts: List[MergeConflict] = field(default_factory=list)
+    since: Optional[str] = None  # None — pełny stan (brak wcześniejszego punktu)
+
+    @property
+    def change_count(self) -> int:
+        return sum(self.upserted.values()) + sum(self.deleted.values())
+
+
+# ── Dziennik zmian (wyzwalacze) ──
+
+def _key_sql(prefix: str, key_cols: Tuple[str, ...]) -> str:
+    return " || ':' || ".join(f"CAST({prefix}.[{k}] AS TEXT)" for k in key_cols)
+
+
+def ensure_change_log(conn: sqlite3.Connection, db_file: str, schema: str = "main") -> None:
+    """
+    Tworzy (idempotentnie) tabele dziennika i wyzwalacze dla tabel pliku ``db_file``.
+
+    Wołane po schemacie modułu — przebudowa tabeli w migracji usuwa wyzwalacze,
+    a ten krok tworzy je na nowo. Tabele, których jeszcze nie ma, są pomijane.
+    """
+    tables = MERGE_TABLES.get(db_file, ())
+    existing = {
+        row[0] for row in conn.execute(
+            f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'"
+        )
+    }
+    statements = [
+        f"CREATE TABLE IF NOT EXISTS {schema}.{_LOG_TABLE} ("
+        " tabela TEXT NOT NULL, klucz TEXT NOT NULL, seq INTEGER NOT NULL,"
+        " PRIMARY KEY (tabela, klucz)) WITHOUT ROWID",
+        f"CREATE INDEX IF NOT EXISTS {schema}.{_LOG_TABLE}_seq ON {_LOG_TABLE} (seq)",
+        f"CREATE TABLE IF NOT EXISTS {schema}.{_STATE_TABLE} ("
+        " id INTEGER PRIMARY KEY CHECK (id = 1), seq INTEGER NOT NULL)",
+        f"INSERT OR IGNORE INTO {schema}.{_STATE_TABLE} (id, seq) VALUES (1, 0)",
+        f"CREATE TABLE IF NOT EXISTS {schema}.{_POINTS_TABLE} ("
+        " nazwa TEXT PRIMARY KEY, seq INTEGER NOT NULL, utworzono TEXT NOT NULL)",
+        f"CREATE TABLE IF NOT EXISTS {schema}.{_PREV_TABLE} ("
+        " tabela TEXT NOT NULL, klucz TEXT NOT NULL, hash TEXT NOT NULL,"
+        " PRIMARY KEY (tabela, klucz)) WITHOUT ROWID",
+    ]
+    for table, key_cols in tables:
+        if table not in existing:
+            continue
+        bump = f"UPDATE {_STATE_TABLE} SET seq = seq + 1 WHERE id = 1;"
+
+        # Upsert zamiast INSERT OR REPLACE — klauzula OR w wyzwalaczu jest
+        # nadpisywana przez klauzulę instrukcji zewnętrznej (np. upsertu)
+        def _record(key: str, condition: str = "") -> str:
+            return (
+                f"INSERT INTO {_LOG_TABLE} (tabela, klucz, seq)"
+                f" SELECT '{table}', {key}, seq FROM {_STATE_TABLE} WHERE id = 1{condition}"
+                " ON CONFLICT (tabela, klucz) DO UPDATE SET seq = excluded.seq;"
+            )
+
+        new_key, old_key = _key_sql("NEW", key_cols), _key_sql("OLD", key_cols)
+        statements += [
+            f"CREATE TRIGGER IF NOT EXISTS {schema}.[{_LOG_TABLE}_{table}_ins]"
+            f" AFTER INSERT ON [{table}] BEGIN {bump} {_record(new_key)} END",
+            f"CREATE TRIGGER IF NOT EXISTS {schema}.[{_LOG_TABLE}_{table}_del]"
+            f" AFTER DELETE ON [{table}] BEGIN {bump} {_record(old_key)} END",
+            # Zmiana klucza: stary klucz trafia do dziennika jako usunięcie
+            f"CREATE TRIGGER IF NOT EXISTS {schema}.[{_LOG_TABLE}_{table}_upd]"
+            f" AFTER UPDATE ON [{table}] BEGIN {bump} {_record(new_key)}"
+            f" {_record(old_key, f' AND {old_key} IS NOT {new_key}')} END",
+        ]
+    for sql in statements:
+        conn.execute(sql)
+    ensure_base_table(conn, schema)
+
+
+def _open_own(db_files: Sequence[str]) -> Tuple[sqlite3.Connection, Dict[str, str]]:
+    """Jedno połączenie z własnymi bazami (pierwsza jako ``main``, reszta dołączona)."""
+    conn = sqlite3.connect(
+        Path(get_own_db_path(db_files[0])).resolve().as_uri(),
+        uri=True, timeout=_BUSY_TIMEOUT, isolation_level=None,
+    )
+    aliases = {db_files[0]: "main"}
+    for i, db_file in enumerate(db_files[1:], start=1):
+        alias = f"own{i}"
+        conn.execute(
+            "ATTACH DATABASE ? AS " + alias, (Path(get_own_db_path(db_file)).resolve().as_uri(),)
+        )
+        aliases[db_file] = alias
+    return conn, aliases
+
+
+def _parse_key(key: str) -> List[Any]:
+    return [int(part) if part.lstrip("-").isdigit() else part for part in key.split(":")]
+
+
+def _hash_lookup(
+    conn: sqlite3.Connection, schema: str, table: str, hash_table: str
+) -> Callable[[List[Any]], Optional[str]]:
+    sql = f"SELECT hash FROM {schema}.{hash_table} WHERE tabela = ? AND klucz = ?"
+
+    def _lookup(key: List[Any]) -> Optional[str]:
+        found = conn.execute(sql, (table, key_text(key))).fetchone()
+        return found[0] if found else None
+
+    return _lookup
+
+
+def _store_bases(
+    conn: sqlite3.Connection, schema: str, rows: List[Tuple[str, str, str]]
+) -> None:
+    """Zapisuje nowe skróty bazowe; poprzednie (jeśli inne) trafiają do ``_PREV_TABLE``."""
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {schema}.{_PREV_TABLE} (tabela, klucz, hash)"
+        f" SELECT tabela, klucz, hash FROM {schema}.{BASE_TABLE}"
+        " WHERE tabela = ? AND klucz = ? AND hash <> ?",
+        rows,
+    )
+    conn.executemany(
+        f"INSERT OR REPLACE INTO {schema}.{BASE_TABLE} (tabela, klucz, hash) VALUES (?, ?, ?)",
+        rows,
+    )
+
+
+# ── Eksport ──
+
+def export_changeset(
+    dest: Path,
+    point: str,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ChangesetReport:
+    """
+    Zapisuje do ``dest`` zmiany od punktu ``point`` i przesuwa punkt.
+
+    Gdy punktu jeszcze nie ma, eksportowany jest pełny stan tabel (punkt
+    bazowy dla kolejnych, już przyrostowych eksportów). Punkt jest przesuwany
+    dopiero po zapisaniu pliku — razem ze skrótami wysłanych wierszy, które są
+    bazą rozpoznawania konfliktów. Powtórne wczytanie tych samych zmian jest
+    nieszkodliwe (wiersze o zgodnym skrócie są pomijane).
+
+    Raises:
+        OperationCancelled: Gdy ustawiono ``cancel`` (plik nie powstaje).
+    """
+    db_files = [f for f in MERGE_TABLES if Path(get_own_db_path(f)).exists()]
+    if not db_files:
+        raise FileNotFoundError("Brak własnych baz danych do eksportu zmian.")
+    report = ChangesetReport()
+    databases: Dict[str, Any] = {}
+    marks: Dict[str, int] = {}
+    # Skróty wysłanych wierszy — po zapisie pliku stają się bazą kolejnej wymiany
+    sent: Dict[str, List[Tuple[str, str, str]]] = {}
+    total = sum(len(MERGE_TABLES[f]) for f in db_files)
+    done = 0
+    since_any = False
+
+    conn, aliases = _open_own(db_files)
+    with closing(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for db_file in db_files:
+                ensure_change_log(conn, db_file, aliases[db_file])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+        # Jeden odczyt spójny dla wszystkich plików; zmiany zapisane w trakcie
+        # dostaną wyższy numer niż zapamiętany i trafią do następnego eksportu
+        conn.execute("BEGIN")
+        try:
+            for db_file in db_files:
+                schema = aliases[db_file]
+                marks[db_file] = conn.execute(
+                    f"SELECT seq FROM {schema}.{_STATE_TABLE} WHERE id = 1"
+                ).fetchone()[0]
+                row = conn.execute(
+                    f"SELECT seq FROM {schema}.{_POINTS_TABLE} WHERE nazwa = ?", (point,)
+                ).fetchone()
+                since = None if row is None else row[0]
+                since_any = since_any or since is not None
+                tables: Dict[str, Any] = {}
+                sent[db_file] = []
+                for table, key_cols in MERGE_TABLES[db_file]:
+                    if cancel is not None and cancel.is_set():
+                        raise OperationCancelled()
+                    tables[table] = _table_delta(
+                        conn, schema, table, key_cols, since, marks[db_file], report
+                    )
+                    sent[db_file] += _sent_hashes(table, key_cols, tables[table])
+                    done += 1
+                    if progress is not None:
+                        progress(done, total, table)
+                databases[db_file] = {"since_seq": since, "tables": tables}
+        finally:
+            conn.execute("ROLLBACK")
+
+        payload = {
+            "format": CHANGESET_FORMAT,
+            "version": CHANGESET_VERSION,
+            "created": datetime.now().isoformat(timespec="seconds"),
+            "point": point,
+            "full": not since_any,
+            "databases": databases,
+        }
+        partial = dest.with_name(dest.name + ".partial")
+        try:
+            with lzma.open(partial, "wt", encoding="utf-8") as fh:
+                json.dump(payload, fh, ensure_ascii=False, separators=(",", ":"))
+            if cancel is not None and cancel.is_set():
+                raise OperationCancelled()
+            os.replace(partial, dest)
+        except BaseException:
+            if partial.exists():
+                partial.unlink()
+            raise
+
+        now = datetime.now().isoformat(timespec="seconds")
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for db_file, seq in marks.items():
+                conn.execute(
+                    f"INSERT OR REPLACE INTO {aliases[db_file]}.{_POINTS_TABLE}"
+                    " (nazwa, seq, utworzono) VALUES (?, ?, ?)",
+                    (point, seq, now),
+                )
+                _store_bases(conn, aliases[db_file], sent[db_file])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    report.since = point if since_any else None
+    _log.info(
+        "Eksport zmian (%s, od %s): %d wierszy → %s",
+        point, "punktu" if since_any else "początku", report.change_count, dest,
+    )
+    return report
+
+
+def _table_delta(
+    conn: sqlite3.Connection,
+    schema: str,
+    table: str,
+    key_cols: Tuple[str, ...],
+    since: Optional[int],
+    mark: int,
+    report: ChangesetReport,
+) -> Dict[str, Any]:
+    columns = [row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{table}])")]
+    # ``bases``/``delete_bases`` — skrót wersji, od której wyszła zmiana
+    # (równolegle do ``upserts``/``deletes``); odbiorca zmienia tylko wiersz
+    # o tym właśnie skrócie
+    delta: Dict[str, Any] = {
+        "columns": columns, "key": list(key_cols),
+        "upserts": [], "deletes": [], "bases": [], "delete_bases": [],
+    }
+    if not columns or not all(k in columns for k in key_cols):
+        return delta
+    cols = ", ".join(f"[{c}]" for c in columns)
+    if since is None:
+        rows = conn.execute(f"SELECT {cols} FROM {schema}.[{table}]")
+        delta["upserts"] = [list(r) for r in rows]
+    else:
+        where = " AND ".join(f"[{k}] = ?" for k in key_cols)
+        lookup = f"SELECT {cols} FROM {schema}.[{table}] WHERE {where}"
+        for (key,) in conn.execute(
+            f"SELECT klucz FROM {schema}.{_LOG_TABLE}"
+            " WHERE tabela = ? AND seq > ? AND seq <= ? ORDER BY seq",
+            (table, since, mark),
+        ).fetchall():
+            parts = _parse_key(key)
+            if len(parts) != len(key_cols):
+                continue
+            row = conn.execute(lookup, parts).fetchone()
+            if row is None:
+                delta["deletes"].append(parts)
+            else:
+                delta["upserts"].append(list(row))
+    key_pos = [columns.index(k) for k in key_cols]
+    base_of = _hash_lookup(conn, schema, table, BASE_TABLE)
+    prev_of = _hash_lookup(conn, schema, table, _PREV_TABLE)
+
+    def _origin(row: List[Any]) -> Optional[str]:
+        # Wiersz zmieniony u siebie wychodzi od ostatniej wymiany; niezmieniony
+        # od niej (np. przekazywany dalej) — od wersji sprzed tej wymiany
+        key = [row[i] for i in key_pos]
+        base = base_of(key)
+        return prev_of(key) if base == row_hash(*row) else base
+
+    delta["bases"] = [_origin(row) for row in delta["upserts"]]
+    delta["delete_bases"] = [base_of(key) for key in delta["deletes"]]
+    report.upserted[table] = len(delta["upserts"])
+    report.deleted[table] = len(delta["deletes"])
+    return delta
+
+
+def _sent_hashes(
+    table: str, key_cols: Tuple[str, ...], delta: Dict[str, Any]
+) -> List[Tuple[str, str, str]]:
+    columns: List[str] = delta["columns"]
+    if not columns or not all(k in columns for k in key_cols):
+        return []
+    positions = [columns.index(k) for k in key_cols]
+    return [
+        (table, key_text([row[i] for i in positions]), row_hash(*row))
+        for row in delta["upserts"]
+    ]
+
+
+# ── Wczytywanie ──
+
+def read_changeset(path: Path) -> Dict[str, Any]:
+    """Wczytuje i sprawdza plik pakietu zmian (``ValueError`` przy złym formacie)."""
+    try:
+        with lzma.open(path, "rt", encoding="utf-8") as fh:
+            payload = json.load(fh)
+    except (lzma.LZMAError, json.JSONDecodeError, UnicodeDecodeError) as e:
+        raise ValueError(f"Plik {path.name} nie jest pakietem zmian Sesyjki: {e}") from e
+    if not isinstance(payload, dict) or payload.get("format") != CHANGESET_FORMAT:
+        raise ValueError(f"Plik {path.name} nie jest pakietem zmian Sesyjki.")
+    if payload.get("version", 0) > CHANGESET_VERSION:
+        raise ValueError(
+            f"Pakiet zmian w wersji {payload.get('version')} — zaktualizuj Sesyjkę."
+        )
+    return payload
+
+
+def apply_changeset(
+    path: Path,
+    progress: Optional[ProgressCallback] = None,
+    cancel: Optional[threading.Event] = None,
+) -> ChangesetReport:
+    """
+    Wczytuje pakiet zmian do własnych baz w jednej transakcji.
+
+    Wiersz z pakietu zastępuje własny tylko wtedy, gdy własny nie zmienił się
+    od ostatniej wymiany (skrót zgodny z ``BASE_TABLE``); usunięcie — na tej
+    samej zasadzie. Pozostałe różnice trafiają do ``report.conflicts``, a własna
+    wersja zostaje. Wczytane zmiany zostają w dzienniku, żeby kolejny eksport
+    przekazał je dalej. Zaległe zapisy (``db_writer.flush``) musi opróżnić
+    wywołujący.
+    """
+    payload = read_changeset(path)
+    incoming: Dict[str, Any] = payload.get("databases", {})
+    db_files = [
+        f for f in MERGE_TABLES if f in incoming and Path(get_own_db_path(f)).exists()
+    ]
+    report = ChangesetReport(since=None if payload.get("full") else payload.get("point"))
+    if not db_files:
+        return report
+    total = sum(len(MERGE_TABLES[f]) for f in db_files)
+    done = 0
+
+    conn, aliases = _open_own(db_files)
+    with closing(conn):
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for db_file in db_files:
+                schema = aliases[db_file]
+                ensure_change_log(conn, db_file, schema)
+                tables = incoming[db_file].get("tables", {})
+                for table, key_cols in MERGE_TABLES[db_file]:
+                    if cancel is not None and cancel.is_set():
+                        raise OperationCancelled()
+                    if table in tables:
+                        _apply_table_delta(conn, schema, table, key_cols, tables[table], report)
+                    done += 1
+                    if progress is not None:
+                        progress(done, total, table)
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    _log.info(
+        "Wczytano pakiet zmian %s: %d wierszy, %d konfliktów",
+        path.name, report.change_count, len(report.conflicts),
+    )
+    return report
+
+
+def _apply_table_delta(
+    conn: sqlite3.Connection,
+    schema: str,
+    table: str,
+    key_cols: Tuple[str, ...],
+    delta: Dict[str, Any],
+    report: ChangesetReport,
+) -> None:
+    own_cols = {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{table}])")}
+    columns: List[str] = delta.get("columns", [])
+    if not own_cols or not all(k in own_cols and k in columns for k in key_cols):
+        return
+    # Kolumny nieznane u siebie (nowsza wersja schematu) są pomijane
+    keep = [i for i, c in enumerate(columns) if c in own_cols]
+    names = [columns[i] for i in keep]
+    key_pos = [names.index(k) for k in key_cols]
+    cols = ", ".join(f"[{c}]" for c in names)
+    where = " AND ".join(f"[{k}] = ?" for k in key_cols)
+    own_sql = f"SELECT {cols} FROM {schema}.[{table}] WHERE {where}"
+    base_of = _hash_lookup(conn, schema, table, BASE_TABLE)
+
+    def _state(key: List[Any]) -> Tuple[Optional[str], Optional[str]]:
+        own = conn.execute(own_sql, key).fetchone()
+        return (row_hash(*own) if own is not None else None), base_of(key)
+
+    inserts: List[List[Any]] = []
+    updates: List[List[Any]] = []
+    base_updates: List[Tuple[str, str, str]] = []
+    upserts = delta.get("upserts", [])
+    sent_bases = delta.get("bases") or [None] * len(upserts)
+    for raw, sent_base in zip(upserts, sent_bases):
+        row = [raw[i] for i in keep]
+        key = [row[i] for i in key_pos]
+        incoming = row_hash(*row)
+        own_hash, base_hash = _state(key)
+        if own_hash is None:
+            if base_hash is not None:
+                # Usunięty u siebie po ostatniej wymianie — zostaje usunięty
+                if base_hash != incoming:
+                    report.conflicts.append(MergeConflict(
+                        table, key_text(key), "usunięty lokalnie, zmieniony w źródle"
+                    ))
+                continue
+            inserts.append(row)
+        elif own_hash == incoming:
+            # Już zgodny, np. zmiana odesłana z powrotem do źródła
+            pass
+        elif sent_base is not None and own_hash == sent_base:
+            updates.append(row)
+        elif base_hash == incoming:
+            # Zmieniony tylko u siebie — zostaje własna wersja
+            continue
+        else:
+            reason = (
+                "zmieniony po obu stronach" if sent_base is not None or base_hash is not None
+                else "inny wiersz pod tym samym kluczem"
+            )
+            report.conflicts.append(MergeConflict(table, key_text(key), reason))
+            continue
+        if base_hash != incoming:
+            base_updates.append((table, key_text(key), incoming))
+
+    deletes: List[List[Any]] = []
+    delete_keys = delta.get("deletes", [])
+    delete_bases = delta.get("delete_bases") or [None] * len(delete_keys)
+    for key, sent_base in zip(delete_keys, delete_bases):
+        if len(key) != len(key_cols):
+            continue
+        own_hash, _ = _state(key)
+        if own_hash is None:
+            continue
+        if sent_base is not None and own_hash == sent_base:
+            deletes.append(key)
+        else:
+            report.conflicts.append(
+                MergeConflict(table, key_text(key), "zmieniony lokalnie, usunięty w źródle")
+            )
+
+    conn.executemany(
+        f"INSERT INTO {schema}.[{table}] ({cols}) VALUES ({', '.join('?' for _ in names)})",
+        inserts,
+    )
+    value_cols = [c for c in names if c not in key_cols]
+    if value_cols:
+        assign = ", ".join(f"[{c}] = ?" for c in value_cols)
+        value_pos = [names.index(c) for c in value_cols]
+        conn.executemany(
+            f"UPDATE {schema}.[{table}] SET {assign} WHERE {where}",
+            [[row[i] for i in value_pos] + [row[i] for i in key_pos] for row in updates],
+        )
+    conn.executemany(f"DELETE FROM {schema}.[{table}] WHERE {where}", deletes)
+    _store_bases(conn, schema, base_updates)
+
+    report.upserted[table] = len(inserts) + len(updates)
+    report.deleted[table] = len(deletes)
+    if key_cols == ("id",):
+        report.changed_ids[table] = [row[key_pos[0]] for row in inserts + updates] + [
+            key[0] for key in deletes
+        ]
+
+
+def list_sync_points(db_file: str = "systemy_rpg.db") -> List[Tuple[str, str]]:
+    """Nazwy punktów synchronizacji z datą utworzenia (najnowsze pierwsze)."""
+    path = Path(get_own_db_path(db_file))
+    if not path.exists():
+        return []
+    with closing(sqlite3.connect(path.resolve().as_uri() + "?mode=ro", uri=True)) as conn:
+        try:
+            return conn.execute(
+                f"SELECT nazwa, utworzono FROM {_POINTS_TABLE} ORDER BY utworzono DESC"
+            ).fetchall()
+        except sqlite3.OperationalError:
+            return []  # dziennik jeszcze nie założony
+
+
+__all__ = [
+    "CHANGESET_SUFFIX",
+    "ChangesetReport",
+    "apply_changeset",
+    "ensure_change_log",
+    "export_changeset",
+    "list_sync_points",
+    "read_changeset",
+]
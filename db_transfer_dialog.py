@@ -3,40 +3,123 @@
 Dialog zarządzania bazami danych — eksport, import, tryb gościa.
 
 Eksport: zapisuje własne 4 bazy do pliku ZIP lub folderu.
-Import własnych danych: zastępuje własne bazy (z backupem) danymi z ZIP/folderu.
+Import własnych danych: zastępuje własne bazy (z backupem) danymi z ZIP/folderu
+albo scala z nimi tylko różniące się wiersze (``db_merge``).
+Synchronizacja: eksport/wczytanie samych zmian od punktu synchronizacji (``db_sync``).
+Import masowy: systemy, suplementy, sesje lub gracze z CSV/JSONL (``bulk_import``)
+oraz zmiany z arkusza Excel w formacie eksportu (``import_databases_excel``).
+Kopie zapasowe: lista kopii z magazynu (``backup_store``) i przywracanie.
 Tryb gościa: otwiera bazy innego użytkownika do przeglądania (tylko odczyt).
+
+Operacje na plikach wykonywane są w tle (``task_executor``) z paskiem postępu,
+szacowanym czasem do końca i przyciskiem anulowania — okno nie zamarza
+przy dużych bazach.
 """
+import threading
+import time
 import tkinter as tk
 from tkinter import filedialog, messagebox
 from pathlib import Path
-from typing import Any, Callable, Optional
+from typing import Any, Callable, List, Optional, Tuple
 
 import customtkinter as ctk
 import logging
 
-from database_manager import export_databases, export_databases_excel, prepare_import_source, replace_own_databases
+import backup_store
+import bulk_import
+import change_events
+import db_writer
+import task_executor
+from db_merge import MERGE_TABLES, MergeReport, merge_databases
+from db_sync import (
+    CHANGESET_SUFFIX,
+    ChangesetReport,
+    apply_changeset,
+    export_changeset,
+    list_sync_points,
+)
+from database_manager import (
+    OperationCancelled,
+    ProgressCallback,
+    export_databases,
+    export_databases_excel,
+    ExcelImportReport,
+    GuestSource,
+    format_validation_errors,
+    import_databases_excel,
+    prepare_import_source,
+    read_guest_source,
+    validate_import_source,
+    replace_own_databases,
+)
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel
 
 _log = logging.getLogger(__name__)
 
 
+def _publish_replaced(db_files: List[str]) -> None:
+    """Ogłasza zmianę wszystkich tabel z podmienionych plików baz.
+
+    Po zastąpieniu całego pliku nie wiadomo, które wiersze się zmieniły,
+    więc zakładki przeładowują całe tabele (``main._on_data_changed``).
+    """
+    for db_file in db_files:
+        for table, _key_cols in MERGE_TABLES.get(db_file, ()):
+            change_events.publish(table)
+
+# Minimalny odstęp między aktualizacjami paska postępu (sekundy)
+_PROGRESS_INTERVAL = 0.1
+
+# Filtr okien wyboru pliku dla pakietów zmian (``db_sync``)
+_CHANGESET_TYPES = [("Pakiet zmian Sesyjki", f"*{CHANGESET_SUFFIX}"), ("Wszystkie pliki", "*.*")]
+
+# Rodzaje importu masowego: etykieta → ``bulk_import.KIND_*``
+_BULK_KINDS = {
+    "Systemy (podręczniki i suplementy)": bulk_import.KIND_SYSTEMS,
+    "Suplementy": bulk_import.KIND_SUPPLEMENTS,
+    "Sesje": bulk_import.KIND_SESSIONS,
+    "Gracze": bulk_import.KIND_PLAYERS,
+}
+_BULK_TYPES = [("CSV lub JSONL", "*.csv *.jsonl *.ndjson"), ("Wszystkie pliki", "*.*")]
+_EXCEL_TYPES = [("Arkusz Excel", "*.xlsx"), ("Wszystkie pliki", "*.*")]
+
+
+def _format_eta(seconds: float) -> str:
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds} s"
+    return f"{seconds // 60} min {seconds % 60:02d} s"
+
+
+def _validate_source(
+    source: Path, progress: ProgressCallback, cancel: threading.Event
+) -> None:
+    """Sprawdza bazy w źródle (wątek roboczy); ValueError z listą problemów."""
+    problems = format_validation_errors(validate_import_source(source, progress, cancel))
+    if problems:
+        raise ValueError(
+            "Źródło zawiera nieprawidłowe lub uszkodzone bazy danych:\n\n"
+            f"{problems}\n\nNic nie zostało zmienione."
+        )
+
+
 def show_db_transfer_dialog(
     parent: Any,
-    on_enter_guest: Callable[[Path, str], None],
+    on_enter_guest: Callable[[GuestSource, str], None],
 ) -> None:
     """
     Otwiera dialog zarządzania bazami danych.
 
     Args:
         parent: Okno nadrzędne.
-        on_enter_guest: callback(source_dir, label) — wywoływany po wybraniu baz gościa.
+        on_enter_guest: callback(guest_source, label) — wywoływany po wczytaniu baz gościa.
     """
     dlg = create_ctk_toplevel(parent)
     dlg.title("Zarządzanie bazami danych")
     dlg.transient(parent)
     dlg.resizable(True, True)
-    apply_safe_geometry(dlg, parent, 540, 520)
+    apply_safe_geometry(dlg, parent, 540, 640)
 
     font_h = ctk.CTkFont(family='Segoe UI', size=scale_font_size(13), weight='bold')
     font_n = ctk.CTkFont(family='Segoe UI', size=scale_font_size(11))
@@ -78,7 +161,17 @@ def show_db_transfer_dialog(
         fmt_row, text="Excel (.xlsx)", variable=exp_fmt_var, value="excel", font=font_n
     ).pack(side=tk.LEFT)
 
+    exp_compact_var = tk.BooleanVar(value=False)
+    ctk.CTkCheckBox(
+        exp_frame,
+        text="Kompaktuj bazy (VACUUM) — mniejsze pliki ZIP/folderu, dłuższy eksport",
+        variable=exp_compact_var,
+        font=font_s,
+    ).pack(anchor="w", padx=12, pady=(0, 8))
+
     def _do_export() -> None:
+        if busy:
+            return
         fmt = exp_fmt_var.get()
         if fmt == "excel":
             dlg.update()  # upewnij się, że CTkToplevel jest wyrenderowany przed natywnym dialogiem
@@ -91,19 +184,29 @@ def show_db_transfer_dialog(
             )
             if not dest_str:
                 return
-            try:
-                result = export_databases_excel(Path(dest_str))
+
+            def _excel_work(progress: ProgressCallback, cancel: threading.Event) -> Path:
+                db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+                return export_databases_excel(Path(dest_str), progress, cancel)
+
+            def _excel_done(result: Path) -> None:
                 messagebox.showinfo(
                     "Eksport zakończony",
                     f"Bazy danych zostały wyeksportowane do:\n{result}\n\n"
                     "Każda tabela to osobny arkusz w pliku Excel.",
                     parent=dlg,
                 )
-            except ImportError as exc:
-                messagebox.showerror("Brak biblioteki", str(exc), parent=dlg)
-            except Exception as exc:
-                _log.error("Błąd eksportu Excel", exc_info=True)
+
+            def _excel_error(exc: BaseException) -> None:
+                if isinstance(exc, ImportError):
+                    messagebox.showerror("Brak biblioteki", str(exc), parent=dlg)
+                    return
+                _log.error(
+                    "Błąd eksportu Excel", exc_info=(type(exc), exc, exc.__traceback__)
+                )
                 messagebox.showerror("Błąd eksportu", str(exc), parent=dlg)
+
+            _run_in_background("Eksport do Excela", _excel_work, _excel_done, _excel_error)
             return
         if fmt == "zip":
             dlg.update()  # upewnij się, że CTkToplevel jest wyrenderowany przed natywnym dialogiem
@@ -124,18 +227,28 @@ def show_db_transfer_dialog(
                 return
             dest = Path(dest_str)
 
-        try:
-            result = export_databases(dest, fmt)
+        compact = exp_compact_var.get()
+
+        def _export_work(progress: ProgressCallback, cancel: threading.Event) -> Path:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            return export_databases(dest, fmt, progress, cancel, compact=compact)
+
+        def _export_done(result: Path) -> None:
             messagebox.showinfo(
                 "Eksport zakończony",
                 f"Bazy danych zostały wyeksportowane do:\n{result}",
                 parent=dlg,
             )
-        except Exception as exc:
-            _log.error("Błąd eksportu baz danych", exc_info=True)
+
+        def _export_error(exc: BaseException) -> None:
+            _log.error(
+                "Błąd eksportu baz danych", exc_info=(type(exc), exc, exc.__traceback__)
+            )
             messagebox.showerror("Błąd eksportu", str(exc), parent=dlg)
 
-    ctk.CTkButton(
+        _run_in_background("Eksport baz danych", _export_work, _export_done, _export_error)
+
+    export_btn = ctk.CTkButton(
         exp_frame,
         text="📤  Eksportuj bazy danych",
         command=_do_export,
@@ -144,7 +257,8 @@ def show_db_transfer_dialog(
         hover_color="#0D47A1",
         width=210,
         height=32,
-    ).pack(padx=12, pady=(0, 12), anchor="w")
+    )
+    export_btn.pack(padx=12, pady=(0, 12), anchor="w")
 
     # ── Sekcja IMPORT własnych danych ─────────────────────────────────────────
 
@@ -158,7 +272,8 @@ def show_db_transfer_dialog(
         imp_frame,
         text=(
             "Wczytaj bazy ze swojego eksportu (np. z innego urządzenia lub kopii zapasowej).\n"
-            "Przed zastąpieniem automatycznie zostanie wykonany backup bieżących baz."
+            "Przed zastąpieniem automatycznie zostanie wykonany backup bieżących baz.\n"
+            "Scalanie dołącza tylko nowe i zmienione wiersze, zachowując Twoje zmiany."
         ),
         font=font_s,
         justify="left",
@@ -186,16 +301,31 @@ def show_db_transfer_dialog(
         return Path(source_str) if source_str else None
 
     def _do_import_own() -> None:
+        if busy:
+            return
         source = _pick_source(parent)
         if source is None:
             return
 
-        try:
-            source_dir, found = prepare_import_source(source)
-        except ValueError as exc:
-            messagebox.showerror("Błąd", str(exc), parent=dlg)
-            return
+        def _prepare_work(
+            progress: ProgressCallback, cancel: threading.Event
+        ) -> Tuple[Path, List[str]]:
+            _validate_source(source, progress, cancel)
+            return prepare_import_source(source, progress, cancel)
+
+        _run_in_background(
+            "Sprawdzanie i wczytywanie źródła", _prepare_work, _confirm_import, _prepare_error
+        )
+
+    def _prepare_error(exc: BaseException) -> None:
+        if not isinstance(exc, ValueError):
+            _log.error(
+                "Błąd odczytu źródła importu", exc_info=(type(exc), exc, exc.__traceback__)
+            )
+        messagebox.showerror("Błąd", str(exc), parent=dlg)
 
+    def _confirm_import(prepared: Tuple[Path, List[str]]) -> None:
+        source_dir, found = prepared
         answer = messagebox.askyesno(
             "Potwierdzenie importu",
             (
@@ -209,21 +339,94 @@ def show_db_transfer_dialog(
         if not answer:
             return
 
-        try:
-            replace_own_databases(source_dir, found)
+        def _replace_work(progress: ProgressCallback, cancel: threading.Event) -> None:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            replace_own_databases(source_dir, found, progress, cancel)
+
+        def _replace_done(_result: None) -> None:
+            _publish_replaced(found)
+            messagebox.showinfo("Import zakończony", "Dane zostały zastąpione.", parent=dlg)
+
+        def _replace_error(exc: BaseException) -> None:
+            _log.error(
+                "Błąd zastępowania własnych baz danych",
+                exc_info=(type(exc), exc, exc.__traceback__),
+            )
+            messagebox.showerror("Błąd importu", str(exc), parent=dlg)
+
+        _run_in_background("Import danych", _replace_work, _replace_done, _replace_error)
+
+    def _do_merge() -> None:
+        if busy:
+            return
+        source = _pick_source(parent)
+        if source is None:
+            return
+
+        def _plan_work(
+            progress: ProgressCallback, cancel: threading.Event
+        ) -> Tuple[Path, List[str], MergeReport]:
+            _validate_source(source, progress, cancel)
+            source_dir, found = prepare_import_source(source, progress, cancel)
+            db_writer.flush()  # plan liczony na aktualnych plikach
+            return source_dir, found, merge_databases(
+                source_dir, found, apply=False, progress=progress, cancel=cancel
+            )
+
+        _run_in_background("Porównywanie baz", _plan_work, _confirm_merge, _prepare_error)
+
+    def _confirm_merge(planned: Tuple[Path, List[str], MergeReport]) -> None:
+        source_dir, found, plan = planned
+        if plan.change_count == 0 and not plan.conflicts:
             messagebox.showinfo(
-                "Import zakończony",
-                (
-                    "Dane zostały zastąpione.\n\n"
-                    "Uruchom ponownie aplikację, aby odświeżyć wszystkie widoki."
-                ),
+                "Scalanie", "Bazy są zgodne — nie ma nic do scalenia.", parent=dlg
+            )
+            return
+        lines = [
+            f"  {table}: +{plan.inserted.get(table, 0)} nowych, "
+            f"{plan.updated.get(table, 0)} zmienionych"
+            for table in dict.fromkeys([*plan.inserted, *plan.updated])
+            if plan.inserted.get(table) or plan.updated.get(table)
+        ]
+        conflicts = "\n".join(
+            f"  {c.table} #{c.key}: {c.reason}" for c in plan.conflicts[:10]
+        )
+        if len(plan.conflicts) > 10:
+            conflicts += f"\n  … i {len(plan.conflicts) - 10} więcej"
+        message = "Zmiany do scalenia:\n" + ("\n".join(lines) or "  brak") + "\n\n"
+        if plan.conflicts:
+            message += (
+                f"Konflikty ({len(plan.conflicts)}) — zostaną zachowane Twoje wersje:\n"
+                f"{conflicts}\n\n"
+            )
+        message += "Backup Twoich baz zostanie wykonany automatycznie.\nCzy scalić dane?"
+        if not messagebox.askyesno("Potwierdzenie scalania", message, parent=dlg):
+            return
+
+        def _merge_work(progress: ProgressCallback, cancel: threading.Event) -> MergeReport:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            backup_store.store_own_databases(backup_store.REASON_IMPORT)
+            return merge_databases(source_dir, found, progress=progress, cancel=cancel)
+
+        def _merge_done(report: MergeReport) -> None:
+            for table, keys in report.changed_keys.items():
+                if keys:
+                    ids = [int(k) for k in keys if k.isdigit()]
+                    change_events.publish(table, ids if len(ids) == len(keys) else ())
+            messagebox.showinfo(
+                "Scalanie zakończone",
+                f"Scalono {report.change_count} wierszy, "
+                f"konfliktów pozostawionych bez zmian: {len(report.conflicts)}.",
                 parent=dlg,
             )
-        except Exception as exc:
-            _log.error("Błąd zastępowania własnych baz danych", exc_info=True)
-            messagebox.showerror("Błąd importu", str(exc), parent=dlg)
 
-    ctk.CTkButton(
+        def _merge_error(exc: BaseException) -> None:
+            _log.error("Błąd scalania baz danych", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd scalania", str(exc), parent=dlg)
+
+        _run_in_background("Scalanie danych", _merge_work, _merge_done, _merge_error)
+
+    import_btn = ctk.CTkButton(
         imp_btn_row,
         text="📥  Wybierz ZIP lub folder...",
         command=_do_import_own,
@@ -232,8 +435,426 @@ def show_db_transfer_dialog(
         hover_color="#38006b",
         width=210,
         height=32,
+    )
+    import_btn.pack(side=tk.LEFT, padx=(0, 8))
+    merge_btn = ctk.CTkButton(
+        imp_btn_row,
+        text="🔀  Scal zmiany z ZIP lub folderu...",
+        command=_do_merge,
+        font=font_n,
+        fg_color="#00695C",
+        hover_color="#004D40",
+        width=230,
+        height=32,
+    )
+    merge_btn.pack(side=tk.LEFT)
+
+    # ── Sekcja SYNCHRONIZACJA ─────────────────────────────────────────────────
+
+    sync_frame = ctk.CTkFrame(outer)
+    sync_frame.pack(fill=tk.X, pady=(0, 10))
+
+    ctk.CTkLabel(sync_frame, text="🔄  Synchronizacja zmian", font=font_h).pack(
+        anchor="w", padx=12, pady=(10, 2)
+    )
+    ctk.CTkLabel(
+        sync_frame,
+        text=(
+            "Przenoś na drugie urządzenie tylko to, co zmieniło się od poprzedniej\n"
+            "synchronizacji z nim. Pierwszy eksport dla danej nazwy zawiera pełny stan."
+        ),
+        font=font_s,
+        justify="left",
+        wraplength=480,
+    ).pack(anchor="w", padx=12, pady=(0, 8))
+
+    point_row = ctk.CTkFrame(sync_frame, fg_color="transparent")
+    point_row.pack(fill=tk.X, padx=12, pady=(0, 8))
+    ctk.CTkLabel(point_row, text="Urządzenie:", font=font_n).pack(side=tk.LEFT, padx=(0, 8))
+    known_points = [name for name, _created in list_sync_points()]
+    point_var = tk.StringVar(value=known_points[0] if known_points else "drugie urządzenie")
+    ctk.CTkComboBox(
+        point_row, variable=point_var, values=known_points or [point_var.get()],
+        font=font_n, width=220,
     ).pack(side=tk.LEFT)
 
+    def _do_export_changes() -> None:
+        if busy:
+            return
+        point = point_var.get().strip()
+        if not point:
+            messagebox.showwarning("Synchronizacja", "Podaj nazwę urządzenia.", parent=dlg)
+            return
+        dest_str = filedialog.asksaveasfilename(
+            parent=dlg,
+            title="Zapisz pakiet zmian",
+            defaultextension=CHANGESET_SUFFIX,
+            filetypes=_CHANGESET_TYPES,
+            initialfile=f"sesyjka_zmiany_{time.strftime('%Y%m%d')}{CHANGESET_SUFFIX}",
+        )
+        if not dest_str:
+            return
+        dest = Path(dest_str)
+
+        def _changes_work(
+            progress: ProgressCallback, cancel: threading.Event
+        ) -> ChangesetReport:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            return export_changeset(dest, point, progress, cancel)
+
+        def _changes_done(report: ChangesetReport) -> None:
+            scope = (
+                f"od poprzedniej synchronizacji z „{point}”" if report.since
+                else "pełny stan (pierwsza synchronizacja)"
+            )
+            messagebox.showinfo(
+                "Eksport zmian zakończony",
+                f"Zapisano {report.change_count} zmienionych wierszy — {scope}.\n"
+                f"Plik: {dest} ({dest.stat().st_size / 1024:.1f} KB)",
+                parent=dlg,
+            )
+
+        def _changes_error(exc: BaseException) -> None:
+            _log.error("Błąd eksportu zmian", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd eksportu zmian", str(exc), parent=dlg)
+
+        _run_in_background("Eksport zmian", _changes_work, _changes_done, _changes_error)
+
+    def _do_apply_changes() -> None:
+        if busy:
+            return
+        src_str = filedialog.askopenfilename(
+            parent=dlg,
+            title="Wybierz pakiet zmian",
+            filetypes=_CHANGESET_TYPES,
+        )
+        if not src_str:
+            return
+        src = Path(src_str)
+        if not messagebox.askyesno(
+            "Potwierdzenie",
+            "Zmiany z pakietu zastąpią odpowiadające im wiersze w Twoich bazach.\n"
+            "Backup Twoich baz zostanie wykonany automatycznie.\nCzy kontynuować?",
+            parent=dlg,
+        ):
+            return
+
+        def _apply_work(progress: ProgressCallback, cancel: threading.Event) -> ChangesetReport:
+            db_writer.flush()
+            backup_store.store_own_databases(backup_store.REASON_IMPORT)
+            return apply_changeset(src, progress, cancel)
+
+        def _apply_done(report: ChangesetReport) -> None:
+            for table, ids in report.changed_ids.items():
+                if ids:
+                    change_events.publish(table, ids)
+            sg = change_events.SESJE_GRACZE
+            if report.upserted.get(sg) or report.deleted.get(sg):
+                change_events.publish(sg)
+            message = (
+                f"Zapisano {sum(report.upserted.values())} wierszy, "
+                f"usunięto {sum(report.deleted.values())}."
+            )
+            if report.conflicts:
+                conflicts = "\n".join(
+                    f"  {c.table} #{c.key}: {c.reason}" for c in report.conflicts[:10]
+                )
+                if len(report.conflicts) > 10:
+                    conflicts += f"\n  … i {len(report.conflicts) - 10} więcej"
+                message += (
+                    f"\n\nKonflikty ({len(report.conflicts)}) — zachowano Twoje wersje:\n"
+                    f"{conflicts}"
+                )
+            messagebox.showinfo("Wczytano zmiany", message, parent=dlg)
+
+        def _apply_error(exc: BaseException) -> None:
+            _log.error("Błąd wczytywania zmian", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd wczytywania zmian", str(exc), parent=dlg)
+
+        _run_in_background("Wczytywanie zmian", _apply_work, _apply_done, _apply_error)
+
+    sync_btn_row = ctk.CTkFrame(sync_frame, fg_color="transparent")
+    sync_btn_row.pack(fill=tk.X, padx=12, pady=(0, 12))
+    sync_export_btn = ctk.CTkButton(
+        sync_btn_row,
+        text="📤  Eksportuj zmiany...",
+        command=_do_export_changes,
+        font=font_n,
+        width=200,
+        height=32,
+    )
+    sync_export_btn.pack(side=tk.LEFT, padx=(0, 8))
+    sync_apply_btn = ctk.CTkButton(
+        sync_btn_row,
+        text="📥  Wczytaj zmiany...",
+        command=_do_apply_changes,
+        font=font_n,
+        fg_color="#00695C",
+        hover_color="#004D40",
+        width=200,
+        height=32,
+    )
+    sync_apply_btn.pack(side=tk.LEFT)
+
+    # ── Sekcja IMPORT MASOWY ──────────────────────────────────────────────────
+
+    bulk_frame = ctk.CTkFrame(outer)
+    bulk_frame.pack(fill=tk.X, pady=(0, 10))
+
+    ctk.CTkLabel(bulk_frame, text="📋  Import masowy (CSV/JSONL, Excel)", font=font_h).pack(
+        anchor="w", padx=12, pady=(10, 2)
+    )
+    ctk.CTkLabel(
+        bulk_frame,
+        text=(
+            "Dodaje wiersze z pliku (nagłówki = nazwy pól, np. nazwa, typ, wydawca, gra).\n"
+            "Brakujący wydawcy, systemy gier i gracze są zakładani po nazwie.\n"
+            "Arkusz z eksportu do Excela (np. po zmianie cen lub statusów) aktualizuje\n"
+            "wiersze po identyfikatorze."
+        ),
+        font=font_s,
+        justify="left",
+        wraplength=480,
+    ).pack(anchor="w", padx=12, pady=(0, 8))
+
+    bulk_row = ctk.CTkFrame(bulk_frame, fg_color="transparent")
+    bulk_row.pack(fill=tk.X, padx=12, pady=(0, 8))
+    bulk_kind_var = tk.StringVar(value=next(iter(_BULK_KINDS)))
+    ctk.CTkComboBox(
+        bulk_row, variable=bulk_kind_var, values=list(_BULK_KINDS),
+        font=font_n, width=260, state="readonly",
+    ).pack(side=tk.LEFT, padx=(0, 8))
+
+    def _do_bulk_import() -> None:
+        if busy:
+            return
+        kind = _BULK_KINDS[bulk_kind_var.get()]
+        src_str = filedialog.askopenfilename(
+            parent=dlg, title="Wybierz plik CSV lub JSONL", filetypes=_BULK_TYPES
+        )
+        if not src_str:
+            return
+        src = Path(src_str)
+
+        def _bulk_work(
+            progress: ProgressCallback, cancel: threading.Event
+        ) -> bulk_import.BulkImportReport:
+            db_writer.flush()
+            backup_store.store_own_databases(backup_store.REASON_IMPORT)
+            return bulk_import.import_file(src, kind, progress, cancel)
+
+        def _bulk_done(report: bulk_import.BulkImportReport) -> None:
+            for table, ids in report.inserted_ids.items():
+                change_events.publish(table, ids, change_events.INSERT)
+            if kind == bulk_import.KIND_SESSIONS and report.inserted:
+                change_events.publish(change_events.SESJE_GRACZE, kind=change_events.INSERT)
+            show = messagebox.showwarning if report.errors else messagebox.showinfo
+            show("Import masowy zakończony", bulk_import.format_report(report), parent=dlg)
+
+        def _bulk_error(exc: BaseException) -> None:
+            _log.error("Błąd importu masowego", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd importu masowego", str(exc), parent=dlg)
+
+        _run_in_background("Import masowy", _bulk_work, _bulk_done, _bulk_error)
+
+    bulk_btn = ctk.CTkButton(
+        bulk_row,
+        text="📋  Importuj z pliku...",
+        command=_do_bulk_import,
+        font=font_n,
+        width=200,
+        height=32,
+    )
+    bulk_btn.pack(side=tk.LEFT)
+
+    def _do_excel_import() -> None:
+        if busy:
+            return
+        src_str = filedialog.askopenfilename(
+            parent=dlg, title="Wybierz arkusz z eksportu Sesyjki", filetypes=_EXCEL_TYPES
+        )
+        if not src_str:
+            return
+        src = Path(src_str)
+        if not messagebox.askyesno(
+            "Potwierdzenie",
+            "Wiersze z arkusza zastąpią wiersze o tych samych identyfikatorach,\n"
+            "a nowe zostaną dodane. Backup Twoich baz zostanie wykonany automatycznie.\n"
+            "Czy kontynuować?",
+            parent=dlg,
+        ):
+            return
+
+        def _excel_import_work(
+            progress: ProgressCallback, cancel: threading.Event
+        ) -> ExcelImportReport:
+            db_writer.flush()
+            backup_store.store_own_databases(backup_store.REASON_IMPORT)
+            return import_databases_excel(src, progress, cancel)
+
+        def _excel_import_done(report: ExcelImportReport) -> None:
+            for table, count in report.changed.items():
+                if count:
+                    change_events.publish(table)
+            lines = [f"Zmienione lub dodane wiersze: {report.change_count}"]
+            lines += [f"  {table}: {n}" for table, n in report.changed.items() if n]
+            if report.skipped_rows:
+                lines.append(f"Pominięte wiersze: {len(report.skipped_rows)}")
+                lines += [
+                    f"  {sheet}, wiersz {row}: {reason}"
+                    for sheet, row, reason in report.skipped_rows[:10]
+                ]
+            if report.skipped_sheets:
+                lines.append("Pominięte arkusze: " + ", ".join(report.skipped_sheets))
+            show = messagebox.showwarning if report.skipped_rows else messagebox.showinfo
+            show("Wczytano arkusz", "\n".join(lines), parent=dlg)
+
+        def _excel_import_error(exc: BaseException) -> None:
+            _log.error("Błąd importu z Excela", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd importu z Excela", str(exc), parent=dlg)
+
+        _run_in_background(
+            "Import z Excela", _excel_import_work, _excel_import_done, _excel_import_error
+        )
+
+    excel_import_btn = ctk.CTkButton(
+        bulk_frame,
+        text="📊  Wczytaj arkusz Excel...",
+        command=_do_excel_import,
+        font=font_n,
+        fg_color="#2E7D32",
+        hover_color="#1B5E20",
+        width=200,
+        height=32,
+    )
+    excel_import_btn.pack(anchor="w", padx=12, pady=(0, 12))
+
+    # ── Sekcja KOPIE ZAPASOWE ─────────────────────────────────────────────────
+
+    bak_frame = ctk.CTkFrame(outer)
+    bak_frame.pack(fill=tk.X, pady=(0, 10))
+
+    ctk.CTkLabel(bak_frame, text="🗄️  Kopie zapasowe", font=font_h).pack(
+        anchor="w", padx=12, pady=(10, 2)
+    )
+    ctk.CTkLabel(
+        bak_frame,
+        text=(
+            "Kopie tworzone automatycznie przed migracją i importem.\n"
+            "Identyczne kopie nie zajmują dodatkowego miejsca, najstarsze są usuwane."
+        ),
+        font=font_s,
+        justify="left",
+        wraplength=480,
+    ).pack(anchor="w", padx=12, pady=(0, 8))
+
+    bak_list = ctk.CTkScrollableFrame(bak_frame, height=140)
+    bak_list.pack(fill=tk.X, padx=12, pady=(0, 8))
+    bak_var = tk.StringVar(value="")
+
+    def _refresh_backups() -> None:
+        for child in bak_list.winfo_children():
+            child.destroy()
+        bak_var.set("")
+        try:
+            entries = backup_store.list_backups()
+        except Exception:
+            _log.error("Nie udało się wczytać listy kopii zapasowych", exc_info=True)
+            entries = []
+        if not entries:
+            ctk.CTkLabel(bak_list, text="Brak kopii zapasowych.", font=font_s).pack(anchor="w")
+            return
+        for entry in entries:
+            ctk.CTkRadioButton(
+                bak_list,
+                text=(
+                    f"{entry.created_at:%Y-%m-%d %H:%M}  ·  {entry.db}  ·  {entry.reason}"
+                    f"  ·  {entry.size / 1024:.0f} KB"
+                ),
+                variable=bak_var,
+                value=entry.id,
+                font=font_s,
+            ).pack(anchor="w", pady=1)
+
+    def _do_backup_now() -> None:
+        if busy:
+            return
+
+        def _backup_work(_progress: ProgressCallback, _cancel: threading.Event) -> None:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            backup_store.store_own_databases(backup_store.REASON_MANUAL)
+
+        def _backup_error(exc: BaseException) -> None:
+            _log.error("Błąd tworzenia kopii", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd kopii zapasowej", str(exc), parent=dlg)
+
+        _run_in_background(
+            "Tworzenie kopii zapasowej", _backup_work, lambda _r: _refresh_backups(), _backup_error
+        )
+
+    def _do_restore() -> None:
+        if busy:
+            return
+        entry_id = bak_var.get()
+        entry = next((e for e in backup_store.list_backups() if e.id == entry_id), None)
+        if entry is None:
+            messagebox.showwarning(
+                "Kopie zapasowe", "Wybierz kopię do przywrócenia.", parent=dlg
+            )
+            return
+        if not messagebox.askyesno(
+            "Potwierdzenie przywrócenia",
+            (
+                f"Przywrócić bazę {entry.db} z kopii z {entry.created_at:%Y-%m-%d %H:%M}?\n\n"
+                "Bieżąca baza zostanie wcześniej zapisana w kopiach zapasowych."
+            ),
+            parent=dlg,
+        ):
+            return
+
+        def _restore_work(progress: ProgressCallback, cancel: threading.Event) -> None:
+            db_writer.flush()  # zaległe zapisy z dialogów muszą trafić do plików
+            backup_store.restore_backup(entry.id, progress, cancel)
+
+        def _restore_done(_result: None) -> None:
+            _refresh_backups()
+            _publish_replaced([entry.db])
+            messagebox.showinfo(
+                "Przywracanie zakończone", f"Baza {entry.db} została przywrócona.", parent=dlg
+            )
+
+        def _restore_error(exc: BaseException) -> None:
+            _log.error("Błąd przywracania kopii", exc_info=(type(exc), exc, exc.__traceback__))
+            messagebox.showerror("Błąd przywracania", str(exc), parent=dlg)
+
+        _run_in_background("Przywracanie kopii", _restore_work, _restore_done, _restore_error)
+
+    bak_btn_row = ctk.CTkFrame(bak_frame, fg_color="transparent")
+    bak_btn_row.pack(fill=tk.X, padx=12, pady=(0, 12))
+    restore_btn = ctk.CTkButton(
+        bak_btn_row,
+        text="♻️  Przywróć wybraną",
+        command=_do_restore,
+        font=font_n,
+        fg_color="#2E7D32",
+        hover_color="#1B5E20",
+        width=180,
+        height=32,
+    )
+    restore_btn.pack(side=tk.LEFT, padx=(0, 8))
+    backup_now_btn = ctk.CTkButton(
+        bak_btn_row,
+        text="💾  Utwórz kopię teraz",
+        command=_do_backup_now,
+        font=font_n,
+        fg_color="#555555",
+        hover_color="#444444",
+        width=180,
+        height=32,
+    )
+    backup_now_btn.pack(side=tk.LEFT)
+    _refresh_backups()
+
     # ── Sekcja TRYB GOŚCIA ────────────────────────────────────────────────────
 
     guest_frame = ctk.CTkFrame(outer)
@@ -255,22 +876,25 @@ def show_db_transfer_dialog(
     ).pack(anchor="w", padx=12, pady=(0, 8))
 
     def _do_open_guest() -> None:
+        if busy:
+            return
         source = _pick_source(parent)
         if source is None:
             return
 
         label = source.stem  # nazwa pliku/folderu jako etykieta
 
-        try:
-            source_dir, found = prepare_import_source(source)
-        except ValueError as exc:
-            messagebox.showerror("Błąd", str(exc), parent=dlg)
-            return
+        def _guest_work(progress: ProgressCallback, cancel: threading.Event) -> GuestSource:
+            _validate_source(source, progress, cancel)
+            return read_guest_source(source, progress, cancel)
+
+        def _guest_done(guest: GuestSource) -> None:
+            dlg.destroy()
+            on_enter_guest(guest, label)
 
-        dlg.destroy()
-        on_enter_guest(source_dir, label)
+        _run_in_background("Wczytywanie baz gościa", _guest_work, _guest_done, _prepare_error)
 
-    ctk.CTkButton(
+    guest_btn = ctk.CTkButton(
         guest_frame,
         text="👁️  Otwórz bazy gościa...",
         command=_do_open_guest,
@@ -279,17 +903,147 @@ def show_db_transfer_dialog(
         hover_color="#BF360C",
         width=210,
         height=32,
-    ).pack(padx=12, pady=(0, 12), anchor="w")
+    )
+    guest_btn.pack(padx=12, pady=(0, 12), anchor="w")
+
+    # ── Postęp operacji w tle ─────────────────────────────────────────────────
+
+    progress_frame = ctk.CTkFrame(dlg)
+    progress_title = ctk.CTkLabel(progress_frame, text="", font=font_n, anchor="w")
+    progress_title.pack(fill=tk.X, padx=12, pady=(8, 2))
+    progress_bar = ctk.CTkProgressBar(progress_frame)
+    progress_bar.pack(fill=tk.X, padx=12, pady=2)
+    progress_status = ctk.CTkLabel(progress_frame, text="", font=font_s, anchor="w")
+    progress_status.pack(fill=tk.X, padx=12, pady=(2, 4))
+    cancel_btn = ctk.CTkButton(
+        progress_frame,
+        text="Anuluj",
+        font=font_n,
+        fg_color="#B71C1C",
+        hover_color="#7F0000",
+        width=100,
+        height=28,
+    )
+    cancel_btn.pack(padx=12, pady=(0, 8), anchor="e")
+
+    busy = False
+    close_requested = False
+    cancel_event = threading.Event()
+
+    def _show_progress(title: str, started: float, done: int, total: int, label: str) -> None:
+        fraction = done / total if total else 0.0
+        progress_bar.set(fraction)
+        text = f"{fraction:.0%}"
+        if label:
+            text += f" · {label}"
+        elapsed = time.monotonic() - started
+        if 0 < done < total and elapsed > 1.0:
+            text += f" · pozostało ok. {_format_eta(elapsed / done * (total - done))}"
+        progress_status.configure(text=text)
+        progress_title.configure(text=title)
+
+    def _request_cancel() -> None:
+        cancel_event.set()
+        cancel_btn.configure(state="disabled")
+        progress_status.configure(text="Anulowanie...")
+
+    def _run_in_background(
+        title: str,
+        work: Callable[[ProgressCallback, threading.Event], Any],
+        on_done: Callable[[Any], None],
+        on_error: Callable[[BaseException], None],
+    ) -> None:
+        """
+        Wykonuje operację na plikach w wątku roboczym z paskiem postępu.
+
+        Callback postępu z wątku roboczego jest dławiony do ``_PROGRESS_INTERVAL``
+        i przekazywany do Tk przez ``task_executor.post``. Anulowanie kończy się
+        komunikatem, a nie błędem — częściowe pliki usuwa ``database_manager``.
+        """
+        nonlocal busy
+        busy = True
+        cancel_event.clear()
+        started = time.monotonic()
+        last_post = [0.0]
+
+        def _progress(done: int, total: int, label: str) -> None:
+            now = time.monotonic()
+            if now - last_post[0] < _PROGRESS_INTERVAL and done < total:
+                return
+            last_post[0] = now
+
+            def _apply() -> None:
+                if busy:
+                    _show_progress(title, started, done, total, label)
+
+            task_executor.post(dlg, _apply)
+
+        def _finish() -> bool:
+            nonlocal busy
+            busy = False
+            for btn in (
+                export_btn, import_btn, merge_btn, sync_export_btn, sync_apply_btn,
+                bulk_btn, excel_import_btn, restore_btn, backup_now_btn, guest_btn,
+            ):
+                btn.configure(state="normal")
+            progress_frame.pack_forget()
+            if close_requested:
+                dlg.destroy()
+                return False
+            return True
+
+        def _done(result: Any) -> None:
+            if _finish():
+                on_done(result)
+
+        def _error(exc: BaseException) -> None:
+            if not _finish():
+                return
+            if isinstance(exc, OperationCancelled):
+                messagebox.showinfo("Anulowano", f"{title}: operacja anulowana.", parent=dlg)
+            else:
+                on_error(exc)
+
+        for btn in (
+            export_btn, import_btn, merge_btn, sync_export_btn, sync_apply_btn,
+            bulk_btn, excel_import_btn, restore_btn, backup_now_btn, guest_btn,
+        ):
+            btn.configure(state="disabled")
+        cancel_btn.configure(state="normal", command=_request_cancel)
+        progress_bar.set(0)
+        progress_title.configure(text=title)
+        progress_status.configure(text="Przygotowywanie...")
+        progress_frame.pack(fill=tk.X, padx=12, pady=(0, 4), before=close_btn)
+
+        task_executor.submit(
+            "db_transfer",
+            dlg,
+            lambda: work(_progress, cancel_event),
+            _done,
+            priority=task_executor.PRIORITY_VISIBLE,
+            on_error=_error,
+        )
+
+    def _close() -> None:
+        """Zamyka dialog; trwająca operacja jest najpierw anulowana."""
+        nonlocal close_requested
+        if not busy:
+            dlg.destroy()
+            return
+        close_requested = True
+        _request_cancel()
 
     # ── Dolne przyciski ───────────────────────────────────────────────────────
 
-    ctk.CTkButton(
+    close_btn = ctk.CTkButton(
         dlg,
         text="Zamknij",
-        command=dlg.destroy,
+        command=_close,
         font=font_n,
         fg_color="#555555",
         hover_color="#444444",
         width=100,
         height=32,
-    ).pack(pady=(4, 12))
+    )
+    close_btn.pack(pady=(4, 12))
+    dlg.protocol("WM_DELETE_WINDOW", _close)
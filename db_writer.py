@@ -0,0 +1,280 @@
+"""
+Wątek zapisu do baz danych aplikacji Sesyjka (jeden pisarz, kolejka poleceń).
+
+Dialogi nie otwierają już połączeń i nie wykonują ``commit`` w wątku Tk:
+
+- polecenie zapisu to funkcja ``work(conn)`` wykonywana w wątku pisarza,
+  w całości w jednej transakcji (``BEGIN IMMEDIATE`` … ``COMMIT``, przy błędzie
+  ``ROLLBACK``) — powiązane zapisy (np. sesja i jej wiersze ``sesje_gracze``)
+  trafiają do bazy razem albo wcale,
+- polecenia wykonywane są po kolei, w kolejności zlecenia,
+- polecenie może dołączyć inne pliki baz (``attach``) — zapis obejmujący kilka
+  baz (np. usunięcie graczy wraz z ich udziałem w sesjach) to wtedy nadal jedna
+  transakcja,
+- callbacki ``on_done`` / ``on_error`` wracają do wątku Tk przez kolejkę
+  ``task_executor`` — pętla zdarzeń nigdy nie czeka na fsync,
+- po udanym zapisie publikowane są zdarzenia ``change_events`` przekazane
+  w ``changes`` (odświeżenie zależnych widoków),
+- połączenia są otwarte tylko na czas serii poleceń; po opróżnieniu kolejki
+  pisarz je zamyka (zanim ``flush`` wróci), żeby nie blokować podmiany plików
+  baz (import, przywracanie kopii, tryb gościa).
+"""
+from __future__ import annotations
+
+import logging
+import queue
+import sqlite3
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+import tkinter as tk
+from tkinter import messagebox
+
+import change_events
+import task_executor
+from change_events import ChangeEvent
+
+_log = logging.getLogger(__name__)
+
+# Ile sekund SQLite czeka na zwolnienie blokady przez inne połączenie (odczyty w tle)
+_BUSY_TIMEOUT = 30.0
+
+
+@dataclass
+class _WriteCommand:
+    db_path: str
+    work: Callable[[sqlite3.Connection], Any]
+    widget: Optional[tk.Misc]
+    on_done: Optional[Callable[[Any], None]]
+    on_error: Optional[Callable[[BaseException], None]]
+    label: str
+    changes: Sequence[ChangeEvent] = ()
+    attach: Sequence[Tuple[str, str]] = ()
+
+
+_commands: "queue.Queue[_WriteCommand]" = queue.Queue()
+_lock = threading.Lock()
+_thread: Optional[threading.Thread] = None
+
+
+def submit(
+    db_path: str,
+    work: Callable[[sqlite3.Connection], Any],
+    widget: Optional[tk.Misc] = None,
+    on_done: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+    label: str = "zapis",
+    changes: Sequence[ChangeEvent] = (),
+    attach: Sequence[Tuple[str, str]] = (),
+) -> None:
+    """
+    Zleca zapis do bazy; ``work(conn)`` wykona się w jednej transakcji w wątku pisarza.
+
+    Args:
+        db_path: Ścieżka do pliku bazy.
+        work: Funkcja wykonująca zapytania na przekazanym połączeniu (bez ``commit``
+            i bez wywołań Tk); jej wynik trafia do ``on_done``.
+        widget: Widget, przez który callbacki wracają do pętli Tk (zwykle zakładka,
+            nie dialog — zapis ma zostać odświeżony także po zamknięciu okna).
+        on_done: Callback z wynikiem ``work`` (wątek Tk).
+        on_error: Callback z wyjątkiem (wątek Tk); domyślnie wyjątek jest logowany.
+        label: Opis polecenia do logów.
+        changes: Zdarzenia zmian publikowane w wątku Tk po zatwierdzeniu transakcji
+            (przed ``on_done``); wymagają ``widget``.
+        attach: Pary (alias, ścieżka) baz dołączanych do połączenia przed transakcją;
+            ``work`` odwołuje się do ich tabel jako ``alias.tabela``.
+    """
+    _ensure_thread()
+    _commands.put(
+        _WriteCommand(db_path, work, widget, on_done, on_error, label, changes, attach)
+    )
+
+
+def execute(
+    db_path: str,
+    sql: str,
+    params: Sequence[Any] = (),
+    widget: Optional[tk.Misc] = None,
+    on_done: Optional[Callable[[Any], None]] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+    changes: Sequence[ChangeEvent] = (),
+) -> None:
+    """Zleca pojedyncze zapytanie; ``on_done`` otrzymuje ``lastrowid``."""
+    submit(
+        db_path,
+        lambda conn: conn.execute(sql, params).lastrowid,
+        widget,
+        on_done,
+        on_error,
+        label=sql.split(None, 1)[0] if sql.strip() else "zapis",
+        changes=changes,
+    )
+
+
+def submit_dialog_save(
+    db_path: str,
+    work: Callable[[sqlite3.Connection], Any],
+    dialog: tk.Misc,
+    owner: tk.Misc,
+    on_saved: Callable[[Any], None],
+    buttons: Sequence[Any] = (),
+    error_message: str = "Nie udało się zapisać zmian.",
+    changes: Sequence[ChangeEvent] = (),
+) -> None:
+    """
+    Zapis z okna dialogowego: przyciski są blokowane do czasu zakończenia zapisu.
+
+    Po udanym zapisie wywoływane jest ``on_saved(wynik)`` (zwykle odświeżenie
+    widoku), a dialog jest zamykany. Przy błędzie przyciski są odblokowywane,
+    a dialog pozostaje otwarty z komunikatem — wpisane dane nie przepadają.
+
+    Args:
+        owner: Widget trwały (zakładka / okno główne), przez który wraca wynik.
+    """
+    for btn in buttons:
+        btn.configure(state="disabled")
+
+    def _done(result: Any) -> None:
+        try:
+            on_saved(result)
+        finally:
+            if _exists(dialog):
+                dialog.destroy()
+
+    def _error(exc: BaseException) -> None:
+        if not _exists(dialog):
+            messagebox.showerror(
+                "Błąd", f"{error_message}\n{exc}", parent=owner.winfo_toplevel()
+            )
+            return
+        for btn in buttons:
+            btn.configure(state="normal")
+        messagebox.showerror("Błąd", f"{error_message}\n{exc}", parent=dialog)
+
+    submit(db_path, work, owner, _done, _error, changes=changes)
+
+
+def _exists(widget: tk.Misc) -> bool:
+    try:
+        return bool(widget.winfo_exists())
+    except tk.TclError:
+        return False
+
+
+def flush(timeout: Optional[float] = None) -> bool:
+    """
+    Czeka, aż wszystkie zlecone zapisy zostaną wykonane, a pisarz zamknie połączenia.
+
+    Wywoływane przy zamykaniu aplikacji i przed operacjami na plikach baz
+    (nie z wątku pisarza) — po powrocie żaden plik bazy nie jest otwarty
+    przez pisarza, więc można go podmienić (także w Windows).
+
+    Returns:
+        True, jeśli kolejka została opróżniona przed upływem ``timeout``.
+    """
+    with _commands.all_tasks_done:
+        return _commands.all_tasks_done.wait_for(
+            lambda: _commands.unfinished_tasks == 0, timeout
+        )
+
+
+def _ensure_thread() -> None:
+    global _thread
+    with _lock:
+        if _thread is None:
+            _thread = threading.Thread(target=_writer_loop, name="sesyjka-db-writer", daemon=True)
+            _thread.start()
+
+
+def _open(db_path: str) -> sqlite3.Connection:
+    conn = sqlite3.connect(db_path, timeout=_BUSY_TIMEOUT, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA foreign_keys = ON")
+    return conn
+
+
+def _attach(conn: sqlite3.Connection, attach: Sequence[Tuple[str, str]]) -> None:
+    """Dołącza bazy pod aliasami (poza transakcją; ponownie tylko po zmianie pliku)."""
+    attached = {row[1]: row[2] for row in conn.execute("PRAGMA database_list")}
+    for alias, path in attach:
+        target = str(Path(path).resolve())
+        if alias in attached:
+            if attached[alias] == target:
+                continue
+            conn.execute(f"DETACH DATABASE {alias}")
+        conn.execute(f"ATTACH DATABASE ? AS {alias}", (target,))
+
+
+def _writer_loop() -> None:
+    connections: Dict[str, sqlite3.Connection] = {}
+    while True:
+        cmd = _commands.get()
+        try:
+            _run(cmd, connections)
+        finally:
+            if _commands.empty():
+                # Seria zapisów zakończona — pliki baz zwalniane przed task_done(),
+                # więc po flush() można je bezpiecznie podmienić
+                _close_all(connections)
+            _commands.task_done()
+
+
+def _close_all(connections: Dict[str, sqlite3.Connection]) -> None:
+    for conn in connections.values():
+        try:
+            conn.close()
+        except sqlite3.Error:
+            _log.debug("Nie można zamknąć połączenia pisarza", exc_info=True)
+    connections.clear()
+
+
+def _run(cmd: _WriteCommand, connections: Dict[str, sqlite3.Connection]) -> None:
+    """Wykonuje jedno polecenie w transakcji i przekazuje wynik do wątku Tk."""
+    result: Any = None
+    error: Optional[BaseException] = None
+    try:
+        conn = connections.get(cmd.db_path)
+        if conn is None:
+            conn = connections[cmd.db_path] = _open(cmd.db_path)
+        if cmd.attach:
+            _attach(conn, cmd.attach)
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            result = cmd.work(conn)
+            conn.execute("COMMIT")
+        except BaseException:
+            if conn.in_transaction:
+                conn.execute("ROLLBACK")
+            raise
+    except Exception as exc:  # przekazywany do wątku Tk
+        error = exc
+        _log.debug("Zapis do bazy nie powiódł się (%s): %s", cmd.label, exc)
+
+    if cmd.widget is None:
+        if error is not None and cmd.on_error is None:
+            _log.error(
+                "Błąd zapisu do bazy (%s)", cmd.label,
+                exc_info=(type(error), error, error.__traceback__),
+            )
+        return
+    try:
+        task_executor.post(cmd.widget, lambda: _deliver(cmd, result, error))
+    except (RuntimeError, tk.TclError):
+        _log.debug("Nie można przekazać wyniku zapisu do wątku Tk", exc_info=True)
+
+
+def _deliver(cmd: _WriteCommand, result: Any, error: Optional[BaseException]) -> None:
+    if error is None:
+        for event in cmd.changes:
+            change_events.publish_event(event)
+        if cmd.on_done is not None:
+            cmd.on_done(result)
+    elif cmd.on_error is not None:
+        cmd.on_error(error)
+    else:
+        _log.error(
+            "Błąd zapisu do bazy (%s)", cmd.label,
+            exc_info=(type(error), error, error.__traceback__),
+        )
@@ -1,19 +1,27 @@
-import threading
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 import sqlite3
+from contextlib import closing
 import webbrowser
 from typing import Optional, Callable, Sequence, Any, Union, List, Dict, Tuple
 import customtkinter as ctk  # type: ignore
 import logging
-from database_manager import get_db_path, is_guest_mode
+from database_manager import connect_db, get_own_db_path, is_guest_mode, open_schema_connection
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel
 from ctk_table import CTkDataTable
+from view_export import export_table_view
+import change_events
+import db_writer
+from change_events import ChangeEvent
+import task_executor
+import view_snapshot
 
 _log = logging.getLogger(__name__)
-DB_FILE = get_db_path("gracze.db")
+DB_FILE = get_own_db_path("gracze.db")
+# Pliki baz, z których pochodzą dane zakładki (sygnatura migawki)
+_SNAPSHOT_DBS = ("gracze.db",)
 
 # Moduł: Gracze
 # Tutaj będą funkcje i klasy związane z obsługą graczy
@@ -21,43 +29,58 @@ DB_FILE = get_db_path("gracze.db")
 _gracze_db_initialized: bool = False
 
 
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Tworzy/migruje schemat bazy graczy na podanym połączeniu.
+
+    Args:
+        conn: Połączenie w trybie autocommit (patrz ``open_schema_connection``).
+    """
+    c = conn.cursor()
+    c.execute(
+        """
+        CREATE TABLE IF NOT EXISTS gracze (
+            id INTEGER PRIMARY KEY,
+            nick TEXT NOT NULL,
+            imie_nazwisko TEXT,
+            plec TEXT,
+            social TEXT,
+            glowny_uzytkownik INTEGER DEFAULT 0,
+            wazna INTEGER DEFAULT 0
+        )
+    """
+    )
+    # Migracja - dodaj kolumny jeśli nie istnieją
+    try:
+        c.execute("ALTER TABLE gracze ADD COLUMN glowny_uzytkownik INTEGER DEFAULT 0")
+    except sqlite3.OperationalError:
+        pass  # Kolumna już istnieje
+    try:
+        c.execute("ALTER TABLE gracze ADD COLUMN wazna INTEGER DEFAULT 0")
+    except sqlite3.OperationalError:
+        pass  # Kolumna już istnieje
+    try:
+        c.execute("ALTER TABLE gracze ADD COLUMN grupa TEXT")
+    except sqlite3.OperationalError:
+        pass  # Kolumna już istnieje
+
+
 def _ensure_gracze_db() -> None:
     """Jednorazowa inicjalizacja i migracja bazy gracze.db."""
     global _gracze_db_initialized
     if _gracze_db_initialized:
         return
+    with closing(open_schema_connection(DB_FILE)) as conn:
+        ensure_schema(conn)
+    _gracze_db_initialized = True
+
+
+def prepare_db(conn: sqlite3.Connection) -> None:
+    """Krok startowy dla ``initialize_app_databases`` — schemat na wspólnym połączeniu."""
+    global _gracze_db_initialized
+    _gracze_db_initialized = False  # także po podmianie pliku (refresh_databases)
+    ensure_schema(conn)
     _gracze_db_initialized = True
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS gracze (
-                id INTEGER PRIMARY KEY,
-                nick TEXT NOT NULL,
-                imie_nazwisko TEXT,
-                plec TEXT,
-                social TEXT,
-                glowny_uzytkownik INTEGER DEFAULT 0,
-                wazna INTEGER DEFAULT 0
-            )
-        """
-        )
-        # Migracja - dodaj kolumny jeśli nie istnieją
-        try:
-            c.execute("ALTER TABLE gracze ADD COLUMN glowny_uzytkownik INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Kolumna już istnieje
-        try:
-            c.execute("ALTER TABLE gracze ADD COLUMN wazna INTEGER DEFAULT 0")
-        except sqlite3.OperationalError:
-            pass  # Kolumna już istnieje
-        try:
-            c.execute("ALTER TABLE gracze ADD COLUMN grupa TEXT")
-        except sqlite3.OperationalError:
-            pass  # Kolumna już istnieje
-        conn.commit()
 
 # Przechowuj aktywne filtry na poziomie modułu
 active_filters_gracze: Dict[str, Any] = {}
@@ -232,25 +255,29 @@ def dodaj_gracza(
             return
 
         _ensure_gracze_db()
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
 
+        def _write(conn: sqlite3.Connection) -> None:
             # Jeśli ustawiamy głównego użytkownika, usuń flagę z pozostałych
             if glowny == 1:
-                c.execute("UPDATE gracze SET glowny_uzytkownik = 0")
+                conn.execute("UPDATE gracze SET glowny_uzytkownik = 0")
 
-            c.execute(
+            conn.execute(
                 "INSERT INTO gracze (nick, imie_nazwisko, plec, social,"
                 " glowny_uzytkownik, wazna, grupa) VALUES (?, ?, ?, ?, ?, ?, ?)",
                 (nick, name if name else None, gender, social if social else None, glowny, wazna,
                  grupa if grupa else None),
             )
-            conn.commit()
-        if refresh_callback:
-            refresh_callback(dark_mode=get_dark_mode_from_tab(parent))  # type: ignore
-        dialog.destroy()
+
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=get_dark_mode_from_tab(parent))  # type: ignore
+
+        # Bez okna rodzica wynik wraca przez sam dialog
+        owner: tk.Misc = parent if parent is not None else dialog
+        db_writer.submit_dialog_save(
+            DB_FILE, _write, dialog, owner, _saved, buttons=(btn_ok, btn_cancel),
+            changes=(ChangeEvent(change_events.GRACZE, kind=change_events.INSERT),),
+        )
 
     def on_cancel() -> None:
         dialog.destroy()
@@ -279,7 +306,7 @@ def get_first_free_id() -> int:
 
 def get_all_players() -> list[tuple[Any, ...]]:
     _ensure_gracze_db()
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("gracze.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -290,6 +317,49 @@ def get_all_players() -> list[tuple[Any, ...]]:
         return c.fetchall()
 
 
+def _load_gracze_rows() -> List[List[Any]]:
+    """
+    Wczytuje graczy jako 9-polowe wiersze tabeli (wątek roboczy):
+    [id, nick, imie, plec, social, emoji, grupa, glowny_int, wazna_int].
+    """
+    data: List[List[Any]] = []
+    for rec in get_all_players():
+        status = "⭐" if rec[5] == 1 else ("👑" if rec[6] == 1 else "")
+        data.append(
+            [
+                rec[0],
+                rec[1] if rec[1] else "",
+                rec[2] if rec[2] else "",
+                rec[3] if rec[3] else "",
+                rec[4] if rec[4] else "",
+                status,
+                rec[7] if rec[7] else "",  # Grupa
+                rec[5],  # glowny_uzytkownik int (ukryty)
+                rec[6],  # wazna int (ukryty)
+            ]
+        )
+    return data
+
+
+def _submit_gracze_load(
+    tab: tk.Frame, dark_mode: bool, shown: Optional[List[List[Any]]] = None
+) -> None:
+    """
+    Zleca wczytanie danych zakładki w tle; starsze zlecenia tej zakładki są odrzucane.
+
+    ``shown`` to dane już narysowane z migawki — identyczny wynik nie przerysowuje tabeli.
+    """
+
+    def _done(data: List[List[Any]]) -> None:
+        if shown is not None and data == shown:
+            return
+        fill_gracze_tab(tab, dark_mode, _preloaded_data=data)
+
+    task_executor.submit(
+        "tab:gracze", tab, view_snapshot.loader("gracze", _SNAPSHOT_DBS, _load_gracze_rows), _done
+    )
+
+
 def fill_gracze_tab(
     tab: tk.Frame,
     dark_mode: bool = False,
@@ -307,33 +377,7 @@ def fill_gracze_tab(
         try:
             if cache['table_ref'].winfo_exists():
                 if _preloaded_data is None:
-
-                    def _bg_fast_gr() -> None:
-                        recs = get_all_players()
-                        data: List[List[Any]] = []
-                        for rec in recs:
-                            status = "⭐" if rec[5] == 1 else ("👑" if rec[6] == 1 else "")
-                            data.append(
-                                [
-                                    rec[0],
-                                    rec[1] if rec[1] else "",
-                                    rec[2] if rec[2] else "",
-                                    rec[3] if rec[3] else "",
-                                    rec[4] if rec[4] else "",
-                                    status,
-                                    rec[7] if rec[7] else "",  # Grupa
-                                    rec[5],
-                                    rec[6],
-                                ]
-                            )
-                        tab.after(
-                            0,
-                            lambda: fill_gracze_tab(
-                                tab, dark_mode, _preloaded_data=data
-                            ),
-                        )
-
-                    threading.Thread(target=_bg_fast_gr, daemon=True).start()
+                    _submit_gracze_load(tab, dark_mode)
                     return
                 cache['data_ref'][0] = _preloaded_data
                 cache['apply_fn']()
@@ -343,32 +387,16 @@ def fill_gracze_tab(
         del tab._gracze_tab_cache  # type: ignore[attr-defined]
 
     if _preloaded_data is None:
-
-        def _bg_full_gr() -> None:
-            recs = get_all_players()
-            data: List[List[Any]] = []
-            for rec in recs:
-                status = "⭐" if rec[5] == 1 else ("👑" if rec[6] == 1 else "")
-                data.append(
-                    [
-                        rec[0],
-                        rec[1] if rec[1] else "",
-                        rec[2] if rec[2] else "",
-                        rec[3] if rec[3] else "",
-                        rec[4] if rec[4] else "",
-                        status,
-                        rec[7] if rec[7] else "",  # Grupa
-                        rec[5],  # glowny_uzytkownik int (ukryty)
-                        rec[6],  # wazna int (ukryty)
-                    ]
-                )
-            tab.after(
-                0,
-                lambda: fill_gracze_tab(tab, dark_mode, _preloaded_data=data),
-            )
-
-        threading.Thread(target=_bg_full_gr, daemon=True).start()
-        return
+        # Pierwsze rysowanie po starcie — z migawki, jeśli jest; świeże dane w tle
+        snapshot = view_snapshot.take("gracze", _SNAPSHOT_DBS)
+        if snapshot is None:
+            _submit_gracze_load(tab, dark_mode)
+            return
+        shown: List[List[Any]]
+        shown, up_to_date = snapshot
+        if not up_to_date:
+            _submit_gracze_load(tab, dark_mode, shown=shown)
+        _preloaded_data = shown
 
     for widget in tab.winfo_children():
         widget.destroy()
@@ -622,6 +650,12 @@ def fill_gracze_tab(
     cols_btn = ttk.Button(top_bar, text="Kolumny", command=lambda: _open_columns_dialog())
     cols_btn.pack(side=tk.LEFT, padx=4)
 
+    def _export_view() -> None:
+        if _table[0] is not None:
+            export_table_view(tab, _table[0], "gracze")
+
+    ttk.Button(top_bar, text="Eksportuj widok", command=_export_view).pack(side=tk.LEFT, padx=4)
+
     # ── Callbacki tabeli ─────────────────────────────────────────────────────
     def _on_edit(_row_idx: int, row_data: List[Any]) -> None:
         if is_guest_mode():
@@ -647,7 +681,7 @@ def fill_gracze_tab(
         open_edit_gracz_dialog(
             tab,
             edit_vals,
-            refresh_callback=lambda **_kw: fill_gracze_tab(tab, dark_mode=get_dark_mode_from_tab(tab)),  # type: ignore[misc]
+            refresh_callback=lambda **_kw: change_events.publish(change_events.GRACZE),
         )
 
     def _on_sort(col_idx: int) -> None:
@@ -669,27 +703,24 @@ def fill_gracze_tab(
             _on_edit(_row_idx, row_data)
 
         def _del() -> None:
-            if is_guest_mode():
-                messagebox.showwarning(
-                    "Tryb gościa",
-                    "W trybie gościa usuwanie danych jest wyłączone.",
-                    parent=tab,
-                )
-                return
-            if messagebox.askyesno(
-                "Usuń gracza", f"Czy na pewno chcesz usunąć gracza: {row_data[1]}?", parent=tab
-            ):
-                with sqlite3.connect(DB_FILE) as conn:
-                    conn.row_factory = sqlite3.Row
-                    conn.execute("PRAGMA foreign_keys = ON")
-                    conn.cursor().execute("DELETE FROM gracze WHERE id=?", (row_data[0],))
-                    conn.commit()
-                fill_gracze_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
+            import bulk_delete
+
+            # Ta sama kaskada co przy wielu graczach: udziały w sesjach, liczba graczy, MG
+            bulk_delete.confirm_and_delete(
+                tab, bulk_delete.plan_players([int(row_data[0])], name=str(row_data[1]))
+            )
+
+        selected = _table[0].get_selected_rows() if _table[0] is not None else []
 
         ctx = tk.Menu(tab, tearoff=0)
         ctx.add_command(label="Edytuj", command=_edit)
         ctx.add_separator()
         ctx.add_command(label="Usuń", command=_del)
+        if len(selected) > 1:
+            ctx.add_command(
+                label=f"Usuń zaznaczonych ({len(selected)})...",
+                command=lambda: usun_zaznaczonego_gracza(tab),
+            )
         ctx.tk_popup(event.x_root, event.y_root)
         ctx.grab_release()
 
@@ -1081,16 +1112,13 @@ def open_edit_gracz_dialog(
         if not nick:
             messagebox.showerror("Błąd", "Nick gracza jest wymagany.", parent=dialog)  # type: ignore
             return
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
 
+        def _write(conn: sqlite3.Connection) -> None:
             # Jeśli ustawiamy głównego użytkownika, usuń flagę z pozostałych
             if glowny == 1:
-                c.execute("UPDATE gracze SET glowny_uzytkownik = 0 WHERE id != ?", (values[0],))
+                conn.execute("UPDATE gracze SET glowny_uzytkownik = 0 WHERE id != ?", (values[0],))
 
-            c.execute(
+            conn.execute(
                 "UPDATE gracze SET nick=?, imie_nazwisko=?, plec=?, social=?,"
                 " glowny_uzytkownik=?, wazna=?, grupa=? WHERE id=?",
                 (
@@ -1104,10 +1132,15 @@ def open_edit_gracz_dialog(
                     values[0],
                 ),
             )
-            conn.commit()
-        if refresh_callback:
-            refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
-        dialog.destroy()
+
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
+
+        db_writer.submit_dialog_save(
+            DB_FILE, _write, dialog, parent, _saved, buttons=(btn_save, btn_cancel),
+            changes=(ChangeEvent(change_events.GRACZE, (int(values[0]),)),),
+        )
 
     def on_cancel() -> None:
         dialog.destroy()
@@ -1127,6 +1160,9 @@ def open_edit_gracz_dialog(
 def usun_zaznaczonego_gracza(
     tab: tk.Frame, refresh_callback: Optional[Callable[..., None]] = None
 ) -> None:
+    """Usuwa zaznaczonych graczy (jednego lub wielu) po podglądzie skutków w sesjach."""
+    import bulk_delete
+
     table: Optional[CTkDataTable] = None
     for widget in tab.winfo_children():
         if isinstance(widget, CTkDataTable):
@@ -1135,23 +1171,21 @@ def usun_zaznaczonego_gracza(
     if table is None:
         messagebox.showerror("Błąd", "Nie znaleziono tabeli graczy.", parent=tab)  # type: ignore
         return
-    sel = table.get_selected()
-    if not sel:
-        messagebox.showinfo("Brak wyboru", "Zaznacz gracza do usunięcia w tabeli.", parent=tab)  # type: ignore
+    rows = table.get_selected_rows()
+    if not rows:
+        messagebox.showinfo(  # type: ignore
+            "Brak wyboru", "Zaznacz graczy do usunięcia.", parent=tab
+        )
         return
-    _, row_data = sel
-    gracz_id = row_data[0]
-    gracz_nick = row_data[1]
-    if messagebox.askyesno("Usuń gracza", f"Czy na pewno chcesz usunąć gracza: {gracz_nick}?", parent=tab):  # type: ignore
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute("DELETE FROM gracze WHERE id=?", (gracz_id,))
-            conn.commit()
+
+    def _deleted() -> None:
         if refresh_callback:
             refresh_callback(dark_mode=get_dark_mode_from_tab(tab))
 
+    bulk_delete.confirm_and_delete(
+        tab, bulk_delete.plan_players([int(r[0]) for r in rows]), on_deleted=_deleted
+    )
+
 
 # Alias dla kompatybilności z main.py
 usun_zaznaczony_gracza = usun_zaznaczonego_gracza
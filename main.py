@@ -1,29 +1,93 @@
 from __future__ import annotations
-from typing import Optional
+from typing import Callable, Dict, FrozenSet, Optional, Tuple
+import startup_profiler
+
+# Profilowanie startu (SESYJKA_PROFILE_STARTUP=1 lub --profile-startup):
+# ciężkie biblioteki zewnętrzne mierzone osobno, zanim zaimportują je moduły aplikacji
+for _mod_name in ("customtkinter", "PIL.Image", "matplotlib.pyplot", "openpyxl"):
+    startup_profiler.time_import(_mod_name)
+
 import customtkinter as ctk  # type: ignore
 import tkinter as tk
 from tkinter import ttk
 import os
 import sys
-import systemy_rpg
-import sesje_rpg
-from sesje_rpg_dialogs import dodaj_sesje_rpg
-import gracze
-import wydawcy
-import statystyki  # type: ignore
-import about_dialog
-import apphistory
-import help_dialog
-import splash_screen
-import database_manager
-import font_scaling
-from font_scaling import scale_font_size
-import settings as app_settings
-import db_transfer_dialog
+import time
+
+with startup_profiler.phase("import modułów aplikacji", "import"):
+    import systemy_rpg
+    import sesje_rpg
+    import gracze
+    import wydawcy
+    import statystyki  # type: ignore
+    import splash_screen
+    import database_manager
+    import font_scaling
+    from font_scaling import scale_font_size
+    import settings as app_settings
+import importlib
 import logging
+import change_events
+import db_writer
+import task_executor
+from change_events import ChangeEvent
 
 _log = logging.getLogger(__name__)
 
+# ── Zależności widoków od tabel ───────────────────────────────────────────────
+# Zdarzenie zmiany w tabeli unieważnia tylko zakładki, które z niej czytają
+_VIEW_DEPENDENCIES: Dict[str, FrozenSet[str]] = {
+    "Systemy RPG": frozenset(
+        {change_events.SYSTEMY_GRY, change_events.SYSTEMY_RPG, change_events.WYDAWCY}
+    ),
+    "Sesje RPG": frozenset(
+        {
+            change_events.SESJE_RPG,
+            change_events.SESJE_GRACZE,
+            change_events.SYSTEMY_GRY,
+            change_events.SYSTEMY_RPG,
+            change_events.GRACZE,
+        }
+    ),
+    "Gracze": frozenset({change_events.GRACZE}),
+    "Wydawcy": frozenset({change_events.WYDAWCY}),
+    "Statystyki": change_events.ALL_TABLES,
+}
+
+# ── Moduły dialogów ładowane leniwie ──────────────────────────────────────────
+# Potrzebne dopiero po kliknięciu w przycisk ribbonu, więc nie są importowane
+# przy starcie. Po pokazaniu okna można je wstępnie załadować w tle.
+_LAZY_DIALOG_MODULES: tuple[str, ...] = (
+    "sesje_rpg_dialogs",
+    "db_transfer_dialog",
+    "help_dialog",
+    "about_dialog",
+    "apphistory",
+)
+
+
+def warm_up_dialog_modules(widget: tk.Misc) -> None:
+    """Importuje moduły dialogów w tle (bez tworzenia widgetów), z najniższym priorytetem."""
+
+    def _bg_warmup() -> None:
+        for name in _LAZY_DIALOG_MODULES:
+            if name in sys.modules:
+                continue
+            try:
+                importlib.import_module(name)
+            except Exception:
+                _log.debug(
+                    "Wstępne ładowanie modułu %s nie powiodło się", name, exc_info=True
+                )
+
+    task_executor.submit(
+        "warmup:dialogs",
+        widget,
+        _bg_warmup,
+        lambda _result: None,
+        priority=task_executor.PRIORITY_IDLE,
+    )
+
 # Konfiguracja CustomTkinter
 ctk.set_appearance_mode("light")  # Domyślnie tryb jasny
 ctk.set_default_color_theme("blue")  # Kolorystyka niebieska
@@ -234,6 +298,7 @@ class SesyjkaApp(ctk.CTk):
         self.set_modern_theme(self.dark_mode)
 
         self.create_ribbon()
+        self._guest_source: Optional[Tuple["database_manager.GuestSource", str]] = None
         self._create_guest_banner()
         self.create_content_area()
 
@@ -297,11 +362,43 @@ class SesyjkaApp(ctk.CTk):
         self.ribbon_add_buttons = {}
         self._ribbon_write_buttons: list = []  # wszystkie przyciski CRUD — wyłączane w trybie gościa
 
+        on_systems = self._publish_change(change_events.SYSTEMY_RPG)
+        on_sessions = self._publish_change(change_events.SESJE_RPG)
+        on_players = self._publish_change(change_events.GRACZE)
+        on_publishers = self._publish_change(change_events.WYDAWCY)
         sections = [
-            ("Systemy RPG", "Dodaj System RPG", lambda: systemy_rpg.dodaj_system_rpg(self, refresh_callback=lambda **kwargs: (systemy_rpg.fill_systemy_rpg_tab(self.tabs["Systemy RPG"], dark_mode=self.dark_mode), self.refresh_statistics())), "Usuń", lambda: systemy_rpg.usun_zaznaczony_system(self.tabs["Systemy RPG"], refresh_callback=lambda **kwargs: (systemy_rpg.fill_systemy_rpg_tab(self.tabs["Systemy RPG"], dark_mode=self.dark_mode), self.refresh_statistics()))),  # type: ignore
-            ("Sesje RPG", "Dodaj Sesję RPG", lambda: dodaj_sesje_rpg(self, refresh_callback=lambda **kwargs: (sesje_rpg.fill_sesje_rpg_tab(self.tabs["Sesje RPG"], dark_mode=self.dark_mode), self.refresh_statistics())), "Usuń", lambda: sesje_rpg.usun_zaznaczona_sesja(self.tabs["Sesje RPG"], refresh_callback=lambda **kwargs: (sesje_rpg.fill_sesje_rpg_tab(self.tabs["Sesje RPG"], dark_mode=self.dark_mode), self.refresh_statistics()))),  # type: ignore
-            ("Gracze", "Dodaj Gracza", lambda: gracze.dodaj_gracza(self, refresh_callback=lambda **kwargs: (gracze.fill_gracze_tab(self.tabs["Gracze"], dark_mode=self.dark_mode), self.refresh_statistics())), "Usuń", lambda: gracze.usun_zaznaczony_gracza(self.tabs["Gracze"], refresh_callback=lambda **kwargs: (gracze.fill_gracze_tab(self.tabs["Gracze"], dark_mode=self.dark_mode), self.refresh_statistics()))),  # type: ignore
-            ("Wydawcy", "Dodaj Wydawcę", lambda: wydawcy.dodaj_wydawce(self, refresh_callback=lambda **kwargs: (wydawcy.fill_wydawcy_tab(self.tabs["Wydawcy"], dark_mode=self.dark_mode), self.refresh_statistics())), "Usuń", lambda: wydawcy.usun_zaznaczony_wydawce(self.tabs["Wydawcy"], refresh_callback=lambda **kwargs: (wydawcy.fill_wydawcy_tab(self.tabs["Wydawcy"], dark_mode=self.dark_mode), self.refresh_statistics()))),  # type: ignore
+            (
+                "Systemy RPG", "Dodaj System RPG",
+                lambda: systemy_rpg.dodaj_system_rpg(self, refresh_callback=on_systems),
+                "Usuń",
+                lambda: systemy_rpg.usun_zaznaczony_system(
+                    self.tabs["Systemy RPG"], refresh_callback=on_systems
+                ),
+            ),
+            (
+                "Sesje RPG", "Dodaj Sesję RPG",
+                lambda: self._open_add_session_dialog(refresh_callback=on_sessions),
+                "Usuń",
+                lambda: sesje_rpg.usun_zaznaczona_sesja(
+                    self.tabs["Sesje RPG"], refresh_callback=on_sessions
+                ),
+            ),
+            (
+                "Gracze", "Dodaj Gracza",
+                lambda: gracze.dodaj_gracza(self, refresh_callback=on_players),
+                "Usuń",
+                lambda: gracze.usun_zaznaczony_gracza(
+                    self.tabs["Gracze"], refresh_callback=on_players
+                ),
+            ),
+            (
+                "Wydawcy", "Dodaj Wydawcę",
+                lambda: wydawcy.dodaj_wydawce(self, refresh_callback=on_publishers),
+                "Usuń",
+                lambda: wydawcy.usun_zaznaczony_wydawce(
+                    self.tabs["Wydawcy"], refresh_callback=on_publishers
+                ),
+            ),
         ]
 
         for _idx, (name, _tooltip, add_func, del_label, del_func) in enumerate(sections):
@@ -328,12 +425,7 @@ class SesyjkaApp(ctk.CTk):
                     text="✚ Dodaj System",
                     command=lambda: systemy_rpg.open_add_game_dialog(
                         self,
-                        refresh_callback=lambda **kwargs: (  # type: ignore[arg-type]
-                            systemy_rpg.fill_systemy_rpg_tab(
-                                self.tabs["Systemy RPG"], dark_mode=self.dark_mode
-                            ),
-                            self.refresh_statistics(),
-                        ),
+                        refresh_callback=self._publish_change(change_events.SYSTEMY_GRY),
                     ),
                     width=110,
                     height=32,
@@ -499,15 +591,24 @@ class SesyjkaApp(ctk.CTk):
         # Po utworzeniu zakładek, wyświetl puste tksheet w każdej oprócz Wydawców
         import systemy_rpg, sesje_rpg, gracze, wydawcy, statystyki
 
-        systemy_rpg.fill_systemy_rpg_tab(self.tabs["Systemy RPG"], dark_mode=getattr(self, 'dark_mode', False))  # type: ignore
-        sesje_rpg.fill_sesje_rpg_tab(self.tabs["Sesje RPG"], dark_mode=getattr(self, 'dark_mode', False))  # type: ignore
-        gracze.fill_gracze_tab(self.tabs["Gracze"], dark_mode=getattr(self, 'dark_mode', False))  # type: ignore
-        wydawcy.fill_wydawcy_tab(self.tabs["Wydawcy"], dark_mode=getattr(self, 'dark_mode', False))  # type: ignore
-        statystyki.fill_statystyki_tab(self.tabs["Statystyki"], dark_mode=getattr(self, 'dark_mode', False))  # type: ignore
+        dark_mode = getattr(self, 'dark_mode', False)
+        tab_fills = [
+            (systemy_rpg.fill_systemy_rpg_tab, "Systemy RPG"),
+            (sesje_rpg.fill_sesje_rpg_tab, "Sesje RPG"),
+            (gracze.fill_gracze_tab, "Gracze"),
+            (wydawcy.fill_wydawcy_tab, "Wydawcy"),
+            (statystyki.fill_statystyki_tab, "Statystyki"),
+        ]
+        for fill, internal_name in tab_fills:
+            with startup_profiler.phase(fill.__name__):
+                fill(self.tabs[internal_name], dark_mode=dark_mode)  # type: ignore
         self.notebook.select(0)  # type: ignore # Startowa zakładka: Systemy RPG
         self._dirty_tabs: set[str] = set()
         self._font_scale_timer: Optional[str] = None  # type: ignore
         self.notebook.bind("<<NotebookTabChanged>>", self._on_tab_changed)
+        self._pending_change_tables: set[str] = set()
+        self._change_flush_id: Optional[str] = None
+        change_events.subscribe(self._on_data_changed)
 
     def select_tab(self, idx: int) -> None:
         self.notebook.select(idx)  # type: ignore
@@ -531,6 +632,28 @@ class SesyjkaApp(ctk.CTk):
             self._rebuild_tab(name)
             self._dirty_tabs.discard(name)
 
+    # ── Zdarzenia zmian danych (koalescencja odświeżeń) ──────────────────────
+
+    def _publish_change(self, table: str) -> Callable[..., None]:
+        """Zwraca ``refresh_callback`` dla dialogów, publikujący zmianę w tabeli."""
+        return lambda **_kw: change_events.publish(table)
+
+    def _on_data_changed(self, event: ChangeEvent) -> None:
+        """Zbiera zdarzenia zmian; odświeżenie wykonywane raz, gdy pętla Tk jest bezczynna."""
+        self._pending_change_tables.add(event.table)
+        if self._change_flush_id is None:
+            self._change_flush_id = self.after_idle(self._flush_data_changes)
+
+    def _flush_data_changes(self) -> None:
+        """Unieważnia widoki zależne od zmienionych tabel; odświeża tylko aktywny."""
+        self._change_flush_id = None
+        tables, self._pending_change_tables = self._pending_change_tables, set()
+        for name, deps in _VIEW_DEPENDENCIES.items():
+            if name in self.tabs and deps & tables:
+                self._dirty_tabs.add(name)
+        # Ukryte zakładki zostaną przebudowane raz, przy aktywacji (_on_tab_changed)
+        self._refresh_active_tab()
+
     def _rebuild_tab(self, name: str) -> None:
         import systemy_rpg, sesje_rpg, gracze, wydawcy, statystyki
 
@@ -634,21 +757,34 @@ class SesyjkaApp(ctk.CTk):
             text_color="white",
         ).pack(side=tk.RIGHT, padx=16, pady=4)
 
+        ctk.CTkButton(
+            self._guest_banner,
+            text="⚖️  Porównaj z moją kolekcją",
+            command=self.show_collection_compare,
+            fg_color="#E64A19",
+            hover_color="#BF360C",
+            width=220,
+            height=28,
+            font=ctk.CTkFont(family='Segoe UI', size=scale_font_size(11), weight='bold'),
+            text_color="white",
+        ).pack(side=tk.RIGHT, pady=4)
+
     # ── Tryb gościa ───────────────────────────────────────────────────────────
 
-    def enter_guest_mode(self, source_dir: "Path", label: str) -> None:
+    def enter_guest_mode(self, source: "database_manager.GuestSource", label: str) -> None:
         """
         Przełącza aplikację na bazy danych gościa.
 
         Blokuje wszystkie operacje zapisu (przyciski Dodaj/Usuń w ribbonie),
         pokazuje baner z nazwą gościa i przebudowuje wszystkie zakładki.
+        Bazy gościa są otwierane przez SQLite tylko do odczytu.
 
         Args:
-            source_dir: Katalog z plikami .db gościa.
+            source: Bazy gościa wczytane przez ``read_guest_source``.
             label: Etykieta wyświetlana w banerze (nazwa pliku/folderu).
         """
-        from pathlib import Path as _Path
-        database_manager.set_guest_db_dir(_Path(source_dir))
+        database_manager.set_guest_source(source)
+        self._guest_source = (source, label)
 
         # Pokaż baner
         self._guest_banner.configure(height=38)
@@ -672,7 +808,8 @@ class SesyjkaApp(ctk.CTk):
 
         Ukrywa baner, włącza przyciski CRUD i przebudowuje wszystkie zakładki.
         """
-        database_manager.set_guest_db_dir(None)
+        database_manager.set_guest_source(None)
+        self._guest_source = None
 
         # Ukryj baner
         self._guest_banner.configure(height=0)
@@ -689,23 +826,46 @@ class SesyjkaApp(ctk.CTk):
         self._rebuild_tab(self._get_active_tab_name() or "Systemy RPG")
         self._dirty_tabs.discard(self._get_active_tab_name() or "Systemy RPG")
 
+    def _open_add_session_dialog(self, **kwargs: object) -> None:
+        """Otwiera dialog dodawania sesji (moduł dialogów ładowany przy pierwszym użyciu)."""
+        from sesje_rpg_dialogs import dodaj_sesje_rpg
+
+        dodaj_sesje_rpg(self, **kwargs)  # type: ignore[arg-type]
+
     def show_db_transfer_dialog(self) -> None:
         """Otwiera dialog zarządzania bazami danych (eksport/import/gość)."""
+        import db_transfer_dialog
+
         db_transfer_dialog.show_db_transfer_dialog(
             self,
             on_enter_guest=self.enter_guest_mode,
         )
 
+    def show_collection_compare(self) -> None:
+        """Otwiera porównanie własnej kolekcji z kolekcją bieżącego gościa."""
+        if self._guest_source is None:
+            return
+        import collection_compare_dialog
+
+        source, label = self._guest_source
+        collection_compare_dialog.show_collection_compare_dialog(self, source, label)
+
     def show_help(self) -> None:
         """Wyświetla okno instrukcji obsługi"""
+        import help_dialog
+
         help_dialog.show_help_dialog(self)  # type: ignore
 
     def show_about(self) -> None:
         """Wyświetla okno 'O programie'"""
+        import about_dialog
+
         about_dialog.show_about_dialog(self, APP_NAME, APP_VERSION)  # type: ignore
 
     def show_version_history(self) -> None:
         """Wyświetla okno historii wersji"""
+        import apphistory
+
         apphistory.show_version_history_dialog(self, APP_NAME)  # type: ignore
 
     def refresh_statistics(self) -> None:
@@ -726,12 +886,23 @@ class SesyjkaApp(ctk.CTk):
 
 
 if __name__ == "__main__":
-    # Inicjalizuj i zmigruj bazy danych
-    database_manager.initialize_app_databases()
+    # Inicjalizuj i zmigruj bazy danych — jeden przebieg (jedno połączenie na plik):
+    # wersja schematu, schemat modułów i sonda kreatora migracji
+    with startup_profiler.phase("initialize_app_databases"):
+        database_manager.initialize_app_databases(
+            {
+                "systemy_rpg.db": systemy_rpg.prepare_db,
+                "sesje_rpg.db": sesje_rpg.prepare_db,
+                "gracze.db": gracze.prepare_db,
+                "wydawcy.db": wydawcy.prepare_db,
+            }
+        )
     # Skopiuj ikony do AppData (działa również z pliku EXE)
-    database_manager.ensure_app_icons()
+    with startup_profiler.phase("ensure_app_icons"):
+        database_manager.ensure_app_icons()
 
     # Wczytaj zapisane ustawienia filtrów i sortowania
+    _t_settings = time.perf_counter()
     _saved = app_settings.load_settings()
     systemy_rpg.active_filters_systemy.update(_saved["filters"].get("systemy", {}))
     sesje_rpg.active_filters_sesje.update(_saved["filters"].get("sesje", {}))
@@ -764,6 +935,7 @@ if __name__ == "__main__":
     _initial_dark_mode = bool(_saved.get("dark_mode", False))
     font_scaling.set_font_scale_factor(float(_saved.get("font_scale", 1.0)))
     systemy_rpg.all_expanded_systemy = bool(_saved.get("all_expanded_systemy", False))
+    _warmup_dialogs = bool(_saved.get("warmup_dialogs", True))
 
     # Wczytaj geometrię okna (tylko rozmiar)
     _win = _saved.get("window", {})
@@ -771,11 +943,14 @@ if __name__ == "__main__":
         "width": max(800, int(_win.get("width", START_WIDTH))),
         "height": max(600, int(_win.get("height", START_HEIGHT))),
     }
+    startup_profiler.record("wczytanie ustawień", _t_settings, time.perf_counter())
 
     # Skonfiguruj automatyczne skalowanie DPI dla wyższych rozdzielczości
-    setup_dpi_scaling()
+    with startup_profiler.phase("setup_dpi_scaling"):
+        setup_dpi_scaling()
 
-    app = SesyjkaApp()
+    with startup_profiler.phase("SesyjkaApp.__init__"):
+        app = SesyjkaApp()
     app.withdraw()
     _splash = splash_screen.SplashScreen(version=APP_VERSION, parent=app)
     _splash.show()
@@ -788,6 +963,9 @@ if __name__ == "__main__":
         if hasattr(app, '_dirty_tabs') and hasattr(app, 'tabs'):
             app._dirty_tabs = set(app.tabs.keys())
             app.after(100, app._refresh_active_tab)
+        # Moduły dialogów doładuj w tle dopiero, gdy okno jest już widoczne
+        if _warmup_dialogs:
+            app.after(1500, lambda: warm_up_dialog_modules(app))
 
     app.after(2000, _on_splash_close)
 
@@ -796,14 +974,20 @@ if __name__ == "__main__":
         if systemy_rpg.needs_migration_wizard():
             systemy_rpg.show_migration_wizard(app)
     app.after(500, _run_migration_wizard)
+    # Raport profilowania zapisywany przy pierwszej bezczynności pętli Tk
+    startup_profiler.mark_first_idle(app, APP_VERSION)
     try:
         app.mainloop()
     finally:
+        # Dokończ zapisy z kolejki wątku zapisu, zanim proces się zakończy
+        if not db_writer.flush(timeout=10.0):
+            _log.warning("Nie wszystkie zapisy do bazy zostały zakończone")
         # Zapisz ustawienia filtrów i sortowania przed zamknięciem
         _to_save = {
             "dark_mode": app.dark_mode,
             "font_scale": font_scaling.get_font_scale_factor(),
             "all_expanded_systemy": systemy_rpg.all_expanded_systemy,
+            "warmup_dialogs": _warmup_dialogs,
             "window": (
                 app.saved_geometry
                 if app.saved_geometry
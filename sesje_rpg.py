@@ -1,35 +1,40 @@
-import threading
 import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 import sqlite3
+from contextlib import closing
 from datetime import datetime
 from typing import Optional, Callable, Any, List, Tuple, Dict, Union
 import customtkinter as ctk  # type: ignore
 import logging
-from database_manager import get_db_path, is_guest_mode
+from database_manager import connect_db, get_own_db_path, is_guest_mode, open_schema_connection
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel
 from ctk_table import CTkDataTable
+from view_export import export_table_view
+import change_events
+import db_writer
+import task_executor
+import view_snapshot
+from change_events import ChangeEvent
 
-# Import funkcji dialogowych z oddzielnego modułu
-from sesje_rpg_dialogs import open_edit_session_dialog, dodaj_sesje_rpg
+# Funkcje dialogowe (sesje_rpg_dialogs) importowane leniwie przy pierwszym użyciu
 
 _log = logging.getLogger(__name__)
 
-DB_FILE = get_db_path("sesje_rpg.db")
+DB_FILE = get_own_db_path("sesje_rpg.db")
+# Pliki baz, z których pochodzą dane zakładki (sygnatura migawki)
+_SNAPSHOT_DBS = ("sesje_rpg.db", "systemy_rpg.db", "gracze.db")
 
+# Schemat sprawdzony w tej sesji (ustawiane przez init_db / prepare_db)
+_db_initialized: bool = False
 
-def _migrate_mg_id_nullable() -> None:
-    """Migracja: zmienia mg_id INTEGER NOT NULL → INTEGER (nullable) dla obsługi sesji GM-less."""
-    import os
 
-    if not os.path.exists(DB_FILE):
-        return
+def _migrate_mg_id_nullable(conn: sqlite3.Connection) -> None:
+    """Migracja: zmienia mg_id INTEGER NOT NULL → INTEGER (nullable) dla obsługi sesji GM-less.
 
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    conn.isolation_level = None
+    Wymaga połączenia w trybie autocommit — migracja sama zarządza transakcją.
+    """
     try:
         c = conn.cursor()
         c.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='sesje_rpg'")
@@ -79,26 +84,18 @@ def _migrate_mg_id_nullable() -> None:
             pass
         _log.error("Błąd podczas migracji mg_id nullable: %s", exc)
         raise
-    finally:
-        conn.close()
 
 
-def _migrate_remove_cross_db_fks() -> None:
+def _migrate_remove_cross_db_fks(conn: sqlite3.Connection) -> None:
     """Jednorazowa migracja: usuwa cross-bazowe FK z tabel sesje_rpg i sesje_gracze.
 
     SQLite nie obsługuje FK między różnymi plikami .db.  Tabele mogły zostać
     założone z błędnymi deklaracjami FOREIGN KEY, co powoduje błąd przy każdym
     INSERT gdy PRAGMA foreign_keys = ON.  Funkcja sprawdza stan istniejącej bazy
     i w razie potrzeby odtwarza tabele bez tych ograniczeń.
-    """
-    import os
 
-    if not os.path.exists(DB_FILE):
-        return  # Baza nie istnieje — init_db() stworzy ją poprawnie
-
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    conn.isolation_level = None  # tryb explicit — pełna kontrola nad transakcją
+    Wymaga połączenia w trybie autocommit — migracja sama zarządza transakcją.
+    """
     try:
         c = conn.cursor()
 
@@ -177,8 +174,6 @@ def _migrate_remove_cross_db_fks() -> None:
             pass
         _log.error("Błąd podczas migracji sesji RPG: %s", exc)
         raise
-    finally:
-        conn.close()
 
 
 # Przechowuj aktywne filtry na poziomie modułu
@@ -206,46 +201,70 @@ _ALWAYS_VISIBLE_SESJE = {"ID"}
 show_edit_btn_sesje: bool = True
 
 
-def init_db() -> None:
-    """Inicjalizuje bazę danych sesji RPG"""
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Tworzy/migruje schemat bazy sesji RPG na podanym połączeniu.
+
+    Args:
+        conn: Połączenie w trybie autocommit (patrz ``open_schema_connection``).
+    """
     # Jednorazowa migracja usuwająca cross-bazowe FK sprzed poprawki
-    _migrate_mg_id_nullable()
-    _migrate_remove_cross_db_fks()
+    _migrate_mg_id_nullable(conn)
+    _migrate_remove_cross_db_fks(conn)
 
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        # Tabela główna sesji — bez cross-bazowych FK (system_id/mg_id z innych plików .db)
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sesje_rpg (
-                id INTEGER PRIMARY KEY,
-                data_sesji TEXT NOT NULL,
-                system_id INTEGER NOT NULL,
-                liczba_graczy INTEGER NOT NULL,
-                mg_id INTEGER,
-                kampania INTEGER DEFAULT 0,
-                jednostrzal INTEGER DEFAULT 0,
-                tytul_kampanii TEXT,
-                tytul_przygody TEXT
-            )
+    c = conn.cursor()
+    # Tabela główna sesji — bez cross-bazowych FK (system_id/mg_id z innych plików .db)
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS sesje_rpg (
+            id INTEGER PRIMARY KEY,
+            data_sesji TEXT NOT NULL,
+            system_id INTEGER NOT NULL,
+            liczba_graczy INTEGER NOT NULL,
+            mg_id INTEGER,
+            kampania INTEGER DEFAULT 0,
+            jednostrzal INTEGER DEFAULT 0,
+            tytul_kampanii TEXT,
+            tytul_przygody TEXT
         )
+    """
+    )
 
-        # Tabela relacji sesja-gracze — FK do sesje_rpg jest w tej samej bazie (OK)
-        # gracz_id pochodzi z gracze.db (inna baza) — walidacja po stronie Pythona
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sesje_gracze (
-                sesja_id INTEGER NOT NULL,
-                gracz_id INTEGER NOT NULL,
-                PRIMARY KEY (sesja_id, gracz_id),
-                FOREIGN KEY (sesja_id) REFERENCES sesje_rpg(id) ON DELETE CASCADE
-            )
+    # Tabela relacji sesja-gracze — FK do sesje_rpg jest w tej samej bazie (OK)
+    # gracz_id pochodzi z gracze.db (inna baza) — walidacja po stronie Pythona
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS sesje_gracze (
+            sesja_id INTEGER NOT NULL,
+            gracz_id INTEGER NOT NULL,
+            PRIMARY KEY (sesja_id, gracz_id),
+            FOREIGN KEY (sesja_id) REFERENCES sesje_rpg(id) ON DELETE CASCADE
         )
-        conn.commit()
+    """
+    )
+
+    # Indeksy odwołań do innych baz — podgląd skutków usuwania graczy i systemów
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sesje_gracze_gracz ON sesje_gracze (gracz_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sesje_rpg_mg ON sesje_rpg (mg_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_sesje_rpg_system ON sesje_rpg (system_id)")
+
+
+def init_db() -> None:
+    """Inicjalizuje bazę danych sesji RPG (jednorazowo na sesję aplikacji)."""
+    global _db_initialized
+    if _db_initialized:
+        return
+    with closing(open_schema_connection(DB_FILE)) as conn:
+        ensure_schema(conn)
+    _db_initialized = True
+
+
+def prepare_db(conn: sqlite3.Connection) -> None:
+    """Krok startowy dla ``initialize_app_databases`` — schemat na wspólnym połączeniu."""
+    global _db_initialized
+    _db_initialized = False  # także po podmianie pliku (refresh_databases)
+    ensure_schema(conn)
+    _db_initialized = True
 
 
 def get_dark_mode_from_tab(tab: tk.Widget) -> bool:
@@ -322,7 +341,7 @@ def get_first_free_id() -> int:
 def get_all_systems() -> List[Tuple[int, str]]:
     """Pobiera tylko podręczniki główne systemów RPG z bazy (bez suplementów)"""
     try:
-        with sqlite3.connect(get_db_path("systemy_rpg.db")) as conn:
+        with connect_db("systemy_rpg.db") as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
             c = conn.cursor()
@@ -335,7 +354,7 @@ def get_all_systems() -> List[Tuple[int, str]]:
 def get_all_players() -> List[Tuple[int, str]]:
     """Pobiera wszystkich graczy z bazy"""
     try:
-        with sqlite3.connect(get_db_path("gracze.db")) as conn:
+        with connect_db("gracze.db") as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
             c = conn.cursor()
@@ -347,7 +366,7 @@ def get_all_players() -> List[Tuple[int, str]]:
 
 def get_all_sessions() -> List[Tuple[Any, ...]]:
     """Pobiera wszystkie sesje RPG z bazy (zoptymalizowane – bulk queries)."""
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("sesje_rpg.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -380,7 +399,7 @@ def get_all_sessions() -> List[Tuple[Any, ...]]:
     # Pobierz wszystkie systemy jednym zapytaniem
     systems_map: Dict[int, str] = {}
     try:
-        with sqlite3.connect(get_db_path("systemy_rpg.db")) as sys_conn:
+        with connect_db("systemy_rpg.db") as sys_conn:
             sys_conn.row_factory = sqlite3.Row
             sys_conn.execute("PRAGMA foreign_keys = ON")
             sc = sys_conn.cursor()
@@ -392,7 +411,7 @@ def get_all_sessions() -> List[Tuple[Any, ...]]:
     # Pobierz wszystkich graczy jednym zapytaniem
     players_map: Dict[int, str] = {}
     try:
-        with sqlite3.connect(get_db_path("gracze.db")) as gracze_conn:
+        with connect_db("gracze.db") as gracze_conn:
             gracze_conn.row_factory = sqlite3.Row
             gracze_conn.execute("PRAGMA foreign_keys = ON")
             gc = gracze_conn.cursor()
@@ -438,6 +457,31 @@ def get_all_sessions() -> List[Tuple[Any, ...]]:
     return result  # type: ignore
 
 
+def _load_sesje_rows() -> List[List[Any]]:
+    """Wczytuje sesje jako wiersze tabeli (wątek roboczy)."""
+    raw = get_all_sessions()
+    return [[v if v is not None else "" for v in rec] for rec in raw]
+
+
+def _submit_sesje_load(
+    tab: tk.Frame, dark_mode: bool, shown: Optional[List[List[Any]]] = None
+) -> None:
+    """
+    Zleca wczytanie danych zakładki w tle; starsze zlecenia tej zakładki są odrzucane.
+
+    ``shown`` to dane już narysowane z migawki — identyczny wynik nie przerysowuje tabeli.
+    """
+
+    def _done(data: List[List[Any]]) -> None:
+        if shown is not None and data == shown:
+            return
+        fill_sesje_rpg_tab(tab, dark_mode, _preloaded_data=data)
+
+    task_executor.submit(
+        "tab:sesje", tab, view_snapshot.loader("sesje", _SNAPSHOT_DBS, _load_sesje_rows), _done
+    )
+
+
 # Funkcja dodaj_sesje_rpg została przeniesiona do sesje_rpg_dialogs.py
 def fill_sesje_rpg_tab(
     tab: tk.Frame,
@@ -457,20 +501,7 @@ def fill_sesje_rpg_tab(
         try:
             if cache['table_ref'].winfo_exists():
                 if _preloaded_data is None:
-
-                    def _bg_fast_ses() -> None:
-                        raw = get_all_sessions()
-                        data: List[List[Any]] = [
-                            [v if v is not None else "" for v in rec] for rec in raw
-                        ]
-                        tab.after(
-                            0,
-                            lambda: fill_sesje_rpg_tab(
-                                tab, dark_mode, _preloaded_data=data
-                            ),
-                        )
-
-                    threading.Thread(target=_bg_fast_ses, daemon=True).start()
+                    _submit_sesje_load(tab, dark_mode)
                     return
                 cache['data_ref'][0] = _preloaded_data
                 cache['apply_fn']()
@@ -480,19 +511,16 @@ def fill_sesje_rpg_tab(
         del tab._sesje_tab_cache  # type: ignore[attr-defined]
 
     if _preloaded_data is None:
-
-        def _bg_full_ses() -> None:
-            raw = get_all_sessions()
-            data_list: List[List[Any]] = [
-                [v if v is not None else "" for v in rec] for rec in raw
-            ]
-            tab.after(
-                0,
-                lambda: fill_sesje_rpg_tab(tab, dark_mode, _preloaded_data=data_list),
-            )
-
-        threading.Thread(target=_bg_full_ses, daemon=True).start()
-        return
+        # Pierwsze rysowanie po starcie — z migawki, jeśli jest; świeże dane w tle
+        snapshot = view_snapshot.take("sesje", _SNAPSHOT_DBS)
+        if snapshot is None:
+            _submit_sesje_load(tab, dark_mode)
+            return
+        shown: List[List[Any]]
+        shown, up_to_date = snapshot
+        if not up_to_date:
+            _submit_sesje_load(tab, dark_mode, shown=shown)
+        _preloaded_data = shown
 
     for widget in tab.winfo_children():
         widget.destroy()
@@ -713,6 +741,12 @@ def fill_sesje_rpg_tab(
     cols_btn = ttk.Button(top_bar, text="Kolumny", command=lambda: _open_columns_dialog())
     cols_btn.pack(side=tk.LEFT, padx=4)
 
+    def _export_view() -> None:
+        if _table[0] is not None:
+            export_table_view(tab, _table[0], "sesje")
+
+    ttk.Button(top_bar, text="Eksportuj widok", command=_export_view).pack(side=tk.LEFT, padx=4)
+
     # ── Callbacki tabeli ─────────────────────────────────────────────────────
     def _on_edit(_row_idx: int, row_data: List[Any]) -> None:
         if is_guest_mode():
@@ -723,10 +757,12 @@ def fill_sesje_rpg_tab(
                 parent=tab,
             )
             return
+        from sesje_rpg_dialogs import open_edit_session_dialog
+
         open_edit_session_dialog(
             tab,
             row_data,
-            refresh_callback=lambda **_kw: fill_sesje_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab)),  # type: ignore[misc]
+            refresh_callback=lambda **_kw: change_events.publish(change_events.SESJE_RPG),
         )
 
     def _on_sort(col_idx: int) -> None:
@@ -759,20 +795,28 @@ def fill_sesje_rpg_tab(
                 "\n\nOperacja jest nieodwracalna.",
                 parent=tab,
             ):
-                try:
-                    with sqlite3.connect(DB_FILE) as conn:
-                        conn.row_factory = sqlite3.Row
-                        conn.execute("PRAGMA foreign_keys = ON")
-                        c = conn.cursor()
-                        c.execute("DELETE FROM sesje_gracze WHERE sesja_id=?", (sesja_id,))
-                        c.execute("DELETE FROM sesje_rpg WHERE id=?", (sesja_id,))
-                        conn.commit()
-                    fill_sesje_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
-                except sqlite3.Error as e:
+
+                def _write(conn: sqlite3.Connection) -> None:
+                    conn.execute("DELETE FROM sesje_gracze WHERE sesja_id=?", (sesja_id,))
+                    conn.execute("DELETE FROM sesje_rpg WHERE id=?", (sesja_id,))
+
+                def _delete_error(exc: BaseException) -> None:
                     messagebox.showerror(
-                        "Błąd bazy danych", f"Nie udało się usunąć sesji:\n{e}", parent=tab
+                        "Błąd bazy danych", f"Nie udało się usunąć sesji:\n{exc}", parent=tab
                     )
 
+                db_writer.submit(
+                    DB_FILE,
+                    _write,
+                    tab,
+                    on_error=_delete_error,
+                    label="usunięcie sesji",
+                    changes=tuple(
+                        ChangeEvent(table, (int(sesja_id),), change_events.DELETE)
+                        for table in (change_events.SESJE_RPG, change_events.SESJE_GRACZE)
+                    ),
+                )
+
         def _add_to_campaign() -> None:
             """Otwiera dialog dodawania sesji z danymi z wybranej kampanii."""
             if is_guest_mode():
@@ -819,18 +863,27 @@ def fill_sesje_rpg_tab(
                 "player_ids": player_ids,
                 "tytul_kampanii": src["tytul_kampanii"],
             }
+            from sesje_rpg_dialogs import dodaj_sesje_rpg
+
             dodaj_sesje_rpg(
                 tab,
-                refresh_callback=lambda **_kw: fill_sesje_rpg_tab(
-                    tab, dark_mode=get_dark_mode_from_tab(tab)
-                ),
+                refresh_callback=lambda **_kw: change_events.publish(change_events.SESJE_RPG),
                 prefill=prefill,
             )
 
+        selected = _table[0].get_selected_rows() if _table[0] is not None else []
+
+        def _bulk_edit() -> None:
+            from sesje_rpg_dialogs import edytuj_zaznaczone_sesje
+
+            edytuj_zaznaczone_sesje(tab, [int(r[0]) for r in selected])
+
         is_kampania = str(row_data[3]).startswith("Kampania") if row_data[3] else False
 
         ctx = tk.Menu(tab, tearoff=0)
         ctx.add_command(label="Edytuj", command=_edit)
+        if len(selected) > 1:
+            ctx.add_command(label=f"Edytuj zaznaczone ({len(selected)})...", command=_bulk_edit)
         if is_kampania:
             ctx.add_separator()
             ctx.add_command(
@@ -839,6 +892,11 @@ def fill_sesje_rpg_tab(
             )
         ctx.add_separator()
         ctx.add_command(label="Usuń", command=_del)
+        if len(selected) > 1:
+            ctx.add_command(
+                label=f"Usuń zaznaczone ({len(selected)})...",
+                command=lambda: usun_zaznaczona_sesja(tab),
+            )
         ctx.tk_popup(event.x_root, event.y_root)
         ctx.grab_release()
 
@@ -1161,7 +1219,9 @@ def fill_sesje_rpg_tab(
 def usun_zaznaczona_sesja(
     tab: tk.Frame, refresh_callback: Optional[Callable[..., None]] = None
 ) -> None:
-    """Usuwa zaznaczoną sesję z bazy danych"""
+    """Usuwa zaznaczone sesje (jedną lub wiele) po podglądzie skutków."""
+    import bulk_delete
+
     table: Optional[CTkDataTable] = None
     for widget in tab.winfo_children():
         if isinstance(widget, CTkDataTable):
@@ -1172,38 +1232,17 @@ def usun_zaznaczona_sesja(
         messagebox.showerror("Błąd", "Nie znaleziono tabeli sesji RPG.", parent=tab)
         return
 
-    sel = table.get_selected()
-    if not sel:
-        messagebox.showinfo("Brak wyboru", "Zaznacz sesję do usunięcia w tabeli.", parent=tab)
+    rows = table.get_selected_rows()
+    if not rows:
+        messagebox.showinfo("Brak wyboru", "Zaznacz sesje do usunięcia w tabeli.", parent=tab)
         return
 
-    _, row_data = sel
-    sesja_id = row_data[0]
-    sesja_data = row_data[1]
-
-    result = messagebox.askyesno(
-        "Potwierdzenie usunięcia",
-        f"Czy na pewno chcesz usunąć sesję z dnia {sesja_data}?\n\nOperacja jest nieodwracalna.",
-        parent=tab,
+    bulk_delete.confirm_and_delete(
+        tab,
+        bulk_delete.plan_sessions([int(r[0]) for r in rows]),
+        on_deleted=refresh_callback,
     )
 
-    if result:
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                c = conn.cursor()
-                c.execute("DELETE FROM sesje_gracze WHERE sesja_id = ?", (sesja_id,))
-                c.execute("DELETE FROM sesje_rpg WHERE id = ?", (sesja_id,))
-                conn.commit()
-            messagebox.showinfo("Sukces", "Sesja została usunięta z bazy.", parent=tab)
-            if refresh_callback:
-                refresh_callback()
-        except sqlite3.Error as e:
-            messagebox.showerror(
-                "Błąd bazy danych", f"Nie udało się usunąć sesji:\n{str(e)}", parent=tab
-            )
-
 
 # Alias dla kompatybilności z main.py
 # Funkcja open_edit_session_dialog została przeniesiona do sesje_rpg_dialogs.py
@@ -7,13 +7,18 @@ from datetime import datetime
 from typing import Optional, Callable, Sequence, Any, Dict, List, Tuple
 import customtkinter as ctk
 import logging
-from database_manager import get_db_path, is_guest_mode
+import change_events
+import db_writer
+from change_events import ChangeEvent
+from database_manager import connect_db, get_own_db_path, is_guest_mode
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel, open_calendar_picker, make_scrollable_dialog_frame
 
 _log = logging.getLogger(__name__)
 # Stałe i podstawowe funkcje (duplikowane aby uniknąć cyklicznego importu)
-DB_FILE = get_db_path("sesje_rpg.db")
+# Moduł ładowany leniwie (także w trybie gościa) — zawsze wskazuje własną bazę,
+# tak jak przy wcześniejszym imporcie w trakcie startu aplikacji
+DB_FILE = get_own_db_path("sesje_rpg.db")
 
 # ── Polska kolejność alfabetyczna ─────────────────────────────────────────────
 # Mapuje polskie litery na sekwencje sortujące zgodnie z kolejnością polskiego alfabetu:
@@ -30,41 +35,10 @@ def _pl_sort_key(s: str) -> str:
 
 
 def init_db() -> None:
-    """Inicjalizuje bazę danych sesji RPG"""
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        # Tabela główna sesji — bez cross-bazowych FK (system_id/mg_id z innych plików .db)
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sesje_rpg (
-                id INTEGER PRIMARY KEY,
-                data_sesji TEXT NOT NULL,
-                system_id INTEGER NOT NULL,
-                liczba_graczy INTEGER NOT NULL,
-                mg_id INTEGER NOT NULL,
-                kampania INTEGER DEFAULT 0,
-                jednostrzal INTEGER DEFAULT 0,
-                tytul_kampanii TEXT,
-                tytul_przygody TEXT
-            )
-        """
-        )
+    """Inicjalizuje bazę danych sesji RPG (schemat utrzymuje moduł sesje_rpg)."""
+    import sesje_rpg as _sesje
 
-        # Tabela relacji sesja-gracze — FK do sesje_rpg jest w tej samej bazie (OK)
-        # gracz_id pochodzi z gracze.db (inna baza) — walidacja po stronie Pythona
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS sesje_gracze (
-                sesja_id INTEGER NOT NULL,
-                gracz_id INTEGER NOT NULL,
-                PRIMARY KEY (sesja_id, gracz_id),
-                FOREIGN KEY (sesja_id) REFERENCES sesje_rpg(id) ON DELETE CASCADE
-            )
-        """
-        )
-        conn.commit()
+    _sesje.init_db()
 
 
 def get_first_free_id() -> int:
@@ -83,7 +57,7 @@ def get_first_free_id() -> int:
 def get_all_systems() -> List[Tuple[int, str]]:
     """Pobiera tylko podręczniki główne systemów RPG z bazy danych (bez suplementów)"""
     try:
-        with sqlite3.connect(get_db_path("systemy_rpg.db")) as conn:
+        with connect_db("systemy_rpg.db") as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
             c = conn.cursor()
@@ -97,7 +71,7 @@ def get_all_systems() -> List[Tuple[int, str]]:
 
 def get_all_players() -> List[Tuple[int, str, Any]]:
     """Pobiera wszystkich graczy z bazy danych"""
-    with sqlite3.connect(get_db_path("gracze.db")) as conn:
+    with connect_db("gracze.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -290,15 +264,8 @@ def dodaj_sesje_rpg(
         _all_sys_values.clear()
         _all_sys_values.extend(new_values)
         system_combo.configure(values=new_values)
-        # Odśwież też zakładkę Systemy RPG w głównym oknie
-        try:
-            import systemy_rpg as _sysmod
-            root = dialog.winfo_toplevel()
-            sys_tab = getattr(root, 'tabs', {}).get('Systemy RPG')
-            if sys_tab:
-                _sysmod.fill_systemy_rpg_tab(sys_tab, dark_mode=getattr(root, 'dark_mode', False))
-        except Exception:
-            pass
+        # Zakładkę Systemy RPG w głównym oknie odświeży harmonogram zdarzeń zmian
+        change_events.publish(change_events.SYSTEMY_GRY, kind=change_events.INSERT)
 
     def _open_add_system_dodaj() -> None:
         import systemy_rpg as _sysmod
@@ -522,10 +489,6 @@ def dodaj_sesje_rpg(
             players.clear()
             players.extend(new_players)
             _rebuild_listbox()
-            if hasattr(parent, 'tabs') and hasattr(parent, 'dark_mode'):
-                import gracze as _gracze_mod
-
-                _gracze_mod.fill_gracze_tab(parent.tabs["Gracze"], dark_mode=parent.dark_mode)  # type: ignore
 
         def _open_add_player() -> None:
             import gracze as _gracze
@@ -705,10 +668,6 @@ def dodaj_sesje_rpg(
             players.clear()
             players.extend(new_players)
             _rebuild_mg_listbox()
-            if hasattr(parent, 'tabs') and hasattr(parent, 'dark_mode'):
-                import gracze as _gracze_mod
-
-                _gracze_mod.fill_gracze_tab(parent.tabs["Gracze"], dark_mode=parent.dark_mode)  # type: ignore
 
         def _open_add_player_mg() -> None:
             import gracze as _gracze
@@ -918,53 +877,60 @@ def dodaj_sesje_rpg(
                 return
             system_id = int(match.group(1))
 
-            # Zapisz do bazy
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                c = conn.cursor()
-
-                # Dodaj sesję
-                c.execute(
-                    """
-                    INSERT INTO sesje_rpg (
-                        data_sesji, system_id, liczba_graczy, mg_id, 
-                        kampania, jednostrzal, tytul_kampanii, tytul_przygody
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        date_entry.get(),
-                        system_id,
-                        int(liczba_var.get()),
-                        None if gmless_var.get() else selected_mg_id,
-                        int(kampania_var.get()),
-                        int(jednostrzal_var.get()),
-                        tytul_kampanii_entry.get().strip() or None,
-                        tytul_przygody_entry.get().strip() or None,
-                    ),
-                )
-
-                sesja_id = c.lastrowid
-
-                # Dodaj relacje sesja-gracze
-                for player_id in selected_players_list:
-                    c.execute(
-                        "INSERT INTO sesje_gracze (sesja_id, gracz_id) VALUES (?, ?)",
-                        (sesja_id, player_id),
-                    )
+            session_values = (
+                date_entry.get(),
+                system_id,
+                int(liczba_var.get()),
+                None if gmless_var.get() else selected_mg_id,
+                int(kampania_var.get()),
+                int(jednostrzal_var.get()),
+                tytul_kampanii_entry.get().strip() or None,
+                tytul_przygody_entry.get().strip() or None,
+            )
+            player_ids = list(selected_players_list)
+        except Exception as e:
+            messagebox.showerror(
+                "Błąd", f"Nie udało się zapisać sesji:\n{str(e)}", parent=dialog
+            )
+            return
 
-                conn.commit()
+        def _write(conn: sqlite3.Connection) -> None:
+            # Sesja i jej relacje sesja-gracze w jednej transakcji
+            c = conn.execute(
+                """
+                INSERT INTO sesje_rpg (
+                    data_sesji, system_id, liczba_graczy, mg_id,
+                    kampania, jednostrzal, tytul_kampanii, tytul_przygody
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                session_values,
+            )
+            sesja_id = c.lastrowid
+            conn.executemany(
+                "INSERT INTO sesje_gracze (sesja_id, gracz_id) VALUES (?, ?)",
+                [(sesja_id, player_id) for player_id in player_ids],
+            )
 
+        def _saved(_result: object) -> None:
             messagebox.showinfo("Sukces", "Sesja została dodana do bazy.", parent=dialog)
 
             # Odśwież widok jeśli callback istnieje
             if refresh_callback:
                 refresh_callback()
 
-            dialog.destroy()
-
-        except Exception as e:
-            messagebox.showerror("Błąd", f"Nie udało się zapisać sesji:\n{str(e)}", parent=dialog)
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            _write,
+            dialog,
+            parent,  # type: ignore[arg-type]
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            error_message="Nie udało się zapisać sesji:",
+            changes=(
+                ChangeEvent(change_events.SESJE_RPG, kind=change_events.INSERT),
+                ChangeEvent(change_events.SESJE_GRACZE, kind=change_events.INSERT),
+            ),
+        )
 
     # Przyciski
     buttons_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -1180,14 +1146,8 @@ def open_edit_session_dialog(
         _all_sys_values_e.clear()
         _all_sys_values_e.extend(new_values)
         system_combo.configure(values=new_values)
-        try:
-            import systemy_rpg as _sysmod
-            root = dialog.winfo_toplevel()
-            sys_tab = getattr(root, 'tabs', {}).get('Systemy RPG')
-            if sys_tab:
-                _sysmod.fill_systemy_rpg_tab(sys_tab, dark_mode=getattr(root, 'dark_mode', False))
-        except Exception:
-            pass
+        # Zakładkę Systemy RPG w głównym oknie odświeży harmonogram zdarzeń zmian
+        change_events.publish(change_events.SYSTEMY_GRY, kind=change_events.INSERT)
 
     def _open_add_system_edytuj() -> None:
         import systemy_rpg as _sysmod
@@ -1414,10 +1374,6 @@ def open_edit_session_dialog(
             players.clear()
             players.extend(new_players)
             _rebuild_listbox_edit()
-            if hasattr(parent, 'tabs') and hasattr(parent, 'dark_mode'):
-                import gracze as _gracze_mod
-
-                _gracze_mod.fill_gracze_tab(parent.tabs["Gracze"], dark_mode=parent.dark_mode)  # type: ignore
 
         def _open_add_player_edit() -> None:
             import gracze as _gracze
@@ -1607,10 +1563,6 @@ def open_edit_session_dialog(
             players.clear()
             players.extend(new_players)
             _rebuild_mg_listbox_edit()
-            if hasattr(parent, 'tabs') and hasattr(parent, 'dark_mode'):
-                import gracze as _gracze_mod
-
-                _gracze_mod.fill_gracze_tab(parent.tabs["Gracze"], dark_mode=parent.dark_mode)  # type: ignore
 
         def _open_add_player_mg_edit() -> None:
             import gracze as _gracze
@@ -1812,55 +1764,61 @@ def open_edit_session_dialog(
                 return
             system_id = int(match.group(1))
 
-            # Aktualizuj dane w bazie
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                c = conn.cursor()
-
-                # Aktualizuj sesję
-                c.execute(
-                    """
-                    UPDATE sesje_rpg SET
-                        data_sesji = ?, system_id = ?, liczba_graczy = ?, mg_id = ?,
-                        kampania = ?, jednostrzal = ?, tytul_kampanii = ?, tytul_przygody = ?
-                    WHERE id = ?
-                """,
-                    (
-                        date_entry.get(),
-                        system_id,
-                        len(selected_players_list),
-                        None if gmless_var.get() else selected_mg_id,
-                        int(kampania_var.get()),
-                        int(jednostrzal_var.get()),
-                        tytul_kampanii_entry.get().strip() or None,
-                        tytul_przygody_entry.get().strip() or None,
-                        session_id,
-                    ),
-                )
-
-                # Usuń stare relacje sesja-gracze
-                c.execute("DELETE FROM sesje_gracze WHERE sesja_id = ?", (session_id,))
-
-                # Dodaj nowe relacje sesja-gracze
-                for player_id in selected_players_list:
-                    c.execute(
-                        "INSERT INTO sesje_gracze (sesja_id, gracz_id) VALUES (?, ?)",
-                        (session_id, player_id),
-                    )
+            session_values = (
+                date_entry.get(),
+                system_id,
+                len(selected_players_list),
+                None if gmless_var.get() else selected_mg_id,
+                int(kampania_var.get()),
+                int(jednostrzal_var.get()),
+                tytul_kampanii_entry.get().strip() or None,
+                tytul_przygody_entry.get().strip() or None,
+                session_id,
+            )
+            player_ids = list(selected_players_list)
+        except Exception as e:
+            messagebox.showerror(  # type: ignore
+                "Błąd", f"Nie udało się zaktualizować sesji:\n{str(e)}", parent=dialog
+            )
+            return
 
-                conn.commit()
+        def _write(conn: sqlite3.Connection) -> None:
+            # Sesja i jej relacje sesja-gracze w jednej transakcji
+            conn.execute(
+                """
+                UPDATE sesje_rpg SET
+                    data_sesji = ?, system_id = ?, liczba_graczy = ?, mg_id = ?,
+                    kampania = ?, jednostrzal = ?, tytul_kampanii = ?, tytul_przygody = ?
+                WHERE id = ?
+            """,
+                session_values,
+            )
+            conn.execute("DELETE FROM sesje_gracze WHERE sesja_id = ?", (session_id,))
+            conn.executemany(
+                "INSERT INTO sesje_gracze (sesja_id, gracz_id) VALUES (?, ?)",
+                [(session_id, player_id) for player_id in player_ids],
+            )
 
+        def _saved(_result: object) -> None:
             messagebox.showinfo("Sukces", "Sesja została zaktualizowana.", parent=dialog)
 
             # Odśwież widok jeśli callback istnieje
             if refresh_callback:
                 refresh_callback()
 
-            dialog.destroy()
-
-        except Exception as e:
-            messagebox.showerror("Błąd", f"Nie udało się zaktualizować sesji:\n{str(e)}", parent=dialog)  # type: ignore
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            _write,
+            dialog,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            error_message="Nie udało się zaktualizować sesji:",
+            changes=(
+                ChangeEvent(change_events.SESJE_RPG, (session_id,)),
+                ChangeEvent(change_events.SESJE_GRACZE, (session_id,)),
+            ),
+        )
 
     # Przyciski
     buttons_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
@@ -1888,3 +1846,36 @@ def open_edit_session_dialog(
 
     # Focus na datę
     dialog.after(100, lambda: date_entry.focus_set() if date_entry.winfo_exists() else None)
+
+
+def edytuj_zaznaczone_sesje(parent: tk.Widget, session_ids: Sequence[int]) -> None:
+    """Otwiera okno edycji zbiorczej zaznaczonych sesji (system, typ, tytuł kampanii)."""
+    from bulk_edit import BulkField, open_bulk_edit_dialog
+
+    fields: List[BulkField] = []
+    systems = get_all_systems()
+    if systems:
+        fields.append(
+            BulkField(
+                "System RPG", [(f"{s[1]} (ID: {s[0]})", {"system_id": s[0]}) for s in systems]
+            )
+        )
+    fields.append(
+        BulkField(
+            "Typ sesji",
+            [
+                ("Kampania", {"kampania": 1, "jednostrzal": 0}),
+                ("Jednostrzał", {"kampania": 0, "jednostrzal": 1}),
+            ],
+        )
+    )
+    fields.append(BulkField("Tytuł kampanii", column="tytul_kampanii"))
+    open_bulk_edit_dialog(
+        parent,
+        title="Edytuj zaznaczone sesje",
+        db_path=DB_FILE,
+        table="sesje_rpg",
+        ids=session_ids,
+        fields=fields,
+        change_tables=(change_events.SESJE_RPG,),
+    )
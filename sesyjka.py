@@ -0,0 +1,443 @@
+"""
+Sesyjka — interfejs wiersza poleceń do operacji wsadowych (bez GUI).
+
+Uruchomienie z katalogu aplikacji::
+
+    python -m sesyjka export zip kopia.zip
+    python -m sesyjka export csv eksport_csv/
+    python -m sesyjka import kopia.zip            # zastąpienie (z backupem)
+    python -m sesyjka merge kopia.zip --dry-run   # scalenie różniących się wierszy
+    python -m sesyjka bulk-import systemy kolekcja.csv   # także: suplementy, sesje, gracze
+    python -m sesyjka import-xlsx eksport.xlsx    # zmiany z arkusza w formacie eksportu
+    python -m sesyjka backup create | list | prune | restore ID
+    python -m sesyjka check [ŹRÓDŁO]
+    python -m sesyjka stats
+    python -m sesyjka query "SELECT nazwa FROM wydawcy"
+    python -m sesyjka search warhammer
+
+Moduł nie importuje Tk, customtkinter ani matplotlib — start trwa ułamek
+sekundy, więc nadaje się do zadań harmonogramu. Wyniki trafiają na stdout
+(JSON/JSONL/CSV), komunikaty na stderr. Kody wyjścia: 0 — sukces,
+1 — błąd, 2 — złe argumenty, 3 — nieudana walidacja baz.
+
+Polecenia zapisujące (import, merge, bulk-import, import-xlsx, backup restore)
+nie powinny być uruchamiane, gdy otwarte jest okno Sesyjki.
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import os
+import shutil
+import sqlite3
+import sys
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+import database_manager as dm
+
+_log = logging.getLogger("sesyjka.cli")
+
+EXIT_OK = 0
+EXIT_ERROR = 1
+EXIT_INVALID = 3
+
+_EXPORT_FORMATS = ("zip", "folder", "xlsx") + dm.TEXT_EXPORT_FORMATS
+
+_DB_FILES = ("systemy_rpg.db", "sesje_rpg.db", "gracze.db", "wydawcy.db")
+
+# Pola przeszukiwane przez ``search``: tabela → kolumny tekstowe
+_SEARCH_FIELDS: Dict[str, Sequence[str]] = {
+    "systemy_gry": ("nazwa",),
+    "systemy_rpg": ("nazwa",),
+    "wydawcy": ("nazwa",),
+    "gracze": ("nick", "imie_nazwisko"),
+    "sesje_rpg": ("tytul_kampanii", "tytul_przygody"),
+}
+
+
+# ── Wyjście ──
+
+def _print_json(data: Any) -> None:
+    json.dump(data, sys.stdout, ensure_ascii=False, indent=2, default=str)
+    sys.stdout.write("\n")
+
+
+def _print_rows(columns: List[str], rows: Iterable[Sequence[Any]], fmt: str) -> int:
+    """Wypisuje wiersze jako JSONL lub CSV; zwraca ich liczbę."""
+    count = 0
+    if fmt == "csv":
+        writer = csv.writer(sys.stdout)
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row)
+            count += 1
+        return count
+    for row in rows:
+        sys.stdout.write(json.dumps(dict(zip(columns, row)), ensure_ascii=False, default=str))
+        sys.stdout.write("\n")
+        count += 1
+    return count
+
+
+def _info(message: str) -> None:
+    print(message, file=sys.stderr)
+
+
+def open_readonly() -> sqlite3.Connection:
+    """
+    Połączenie tylko do odczytu ze wszystkimi własnymi bazami.
+
+    Każda baza dołączona jest pod nazwą pliku bez rozszerzenia (``gracze``,
+    ``wydawcy``…); nazwy tabel są unikalne, więc zapytania mogą ich używać
+    bez prefiksu schematu.
+    """
+    conn = sqlite3.connect(":memory:")
+    for db_file in _DB_FILES:
+        path = Path(dm.get_own_db_path(db_file))
+        if path.exists():
+            conn.execute(
+                f"ATTACH DATABASE ? AS {path.stem}", (path.resolve().as_uri() + "?mode=ro",)
+            )
+    conn.execute("PRAGMA query_only = ON")
+    return conn
+
+
+# ── Polecenia ──
+
+def cmd_export(args: argparse.Namespace) -> int:
+    dest = Path(args.dest)
+    if args.format == "xlsx":
+        dm.export_databases_excel(dest)
+    elif args.format in dm.TEXT_EXPORT_FORMATS:
+        dm.export_databases_text(dest, args.format)
+    else:
+        dm.export_databases(dest, args.format, compact=args.compact)
+    _info(f"✓ Eksport ({args.format}): {dest}")
+    return EXIT_OK
+
+
+def _validated_source(source: Path) -> Optional[int]:
+    results = dm.validate_import_source(source)
+    if not results:
+        _info(f"⚠ Nie znaleziono baz danych Sesyjki w: {source}")
+        return EXIT_INVALID
+    if not all(r.ok for r in results):
+        _info(dm.format_validation_errors(results))
+        return EXIT_INVALID
+    return None
+
+
+def cmd_import(args: argparse.Namespace) -> int:
+    source = Path(args.source)
+    failed = _validated_source(source)
+    if failed is not None:
+        return failed
+    source_dir, found = dm.prepare_import_source(source)
+    try:
+        dm.replace_own_databases(source_dir, found)
+    finally:
+        if source.is_file():
+            shutil.rmtree(source_dir, ignore_errors=True)  # katalog rozpakowanego ZIP
+    _info(f"✓ Zastąpiono bazy: {', '.join(found)} (poprzednie w magazynie kopii)")
+    return EXIT_OK
+
+
+def cmd_merge(args: argparse.Namespace) -> int:
+    import backup_store
+    import db_merge
+
+    source = Path(args.source)
+    failed = _validated_source(source)
+    if failed is not None:
+        return failed
+    source_dir, found = dm.prepare_import_source(source)
+    try:
+        if not args.dry_run:
+            backup_store.store_own_databases(backup_store.REASON_IMPORT)
+        report = db_merge.merge_databases(
+            source_dir, found, apply=not args.dry_run, prefer_incoming=args.prefer_incoming
+        )
+    finally:
+        if source.is_file():
+            shutil.rmtree(source_dir, ignore_errors=True)  # katalog rozpakowanego ZIP
+    _print_json({
+        "applied": report.applied,
+        "inserted": report.inserted,
+        "updated": report.updated,
+        "unchanged": report.unchanged,
+        "skipped_tables": report.skipped_tables,
+        "conflicts": [
+            {"table": c.table, "key": c.key, "reason": c.reason} for c in report.conflicts
+        ],
+    })
+    return EXIT_OK
+
+
+def cmd_bulk_import(args: argparse.Namespace) -> int:
+    import backup_store
+    import bulk_import
+
+    backup_store.store_own_databases(backup_store.REASON_IMPORT)
+    report = bulk_import.import_file(Path(args.source), args.kind)
+    _print_json({
+        "inserted": report.inserted,
+        "created": report.created,
+        "errors": [{"line": e.line, "message": e.message} for e in report.errors],
+    })
+    return EXIT_OK
+
+
+def cmd_import_xlsx(args: argparse.Namespace) -> int:
+    import backup_store
+
+    backup_store.store_own_databases(backup_store.REASON_IMPORT)
+    report = dm.import_databases_excel(Path(args.source))
+    _print_json({
+        "changed": report.changed,
+        "unchanged": report.unchanged,
+        "skipped_rows": [
+            {"sheet": sheet, "row": row, "reason": reason}
+            for sheet, row, reason in report.skipped_rows
+        ],
+        "skipped_sheets": report.skipped_sheets,
+    })
+    return EXIT_OK
+
+
+def cmd_backup(args: argparse.Namespace) -> int:
+    import backup_store
+
+    if args.action == "create":
+        entries = backup_store.store_own_databases(backup_store.REASON_MANUAL)
+        _print_json([e.id for e in entries])
+    elif args.action == "list":
+        _print_json([
+            {
+                "id": e.id, "db": e.db, "created": e.created, "reason": e.reason,
+                "size": e.size, "stored_size": e.stored_size, "codec": e.codec,
+            }
+            for e in backup_store.list_backups(args.db)
+        ])
+    elif args.action == "prune":
+        before = len(backup_store.list_backups())
+        backup_store.prune()
+        _info(f"✓ Usunięto kopii: {before - len(backup_store.list_backups())}")
+    else:
+        if not args.id:
+            _info("⚠ Podaj identyfikator kopii (backup list).")
+            return EXIT_ERROR
+        backup_store.restore_backup(args.id)
+        _info(f"✓ Przywrócono kopię: {args.id}")
+    return EXIT_OK
+
+
+def cmd_check(args: argparse.Namespace) -> int:
+    source = Path(args.source) if args.source else dm.get_app_data_dir()
+    results = dm.validate_import_source(source)
+    _print_json([
+        {"db": r.db_file, "ok": r.ok, "errors": r.errors, "schema": r.fingerprint}
+        for r in results
+    ])
+    if not results or not all(r.ok for r in results):
+        return EXIT_INVALID
+    return EXIT_OK
+
+
+def _session_year(date_str: Optional[str]) -> Optional[str]:
+    """Rok z daty sesji (format DD.MM.YYYY lub YYYY-MM-DD)."""
+    if not date_str:
+        return None
+    if "." in date_str:
+        parts = date_str.split(".")
+        return parts[2] if len(parts) == 3 else None
+    parts = date_str.split("-")
+    return parts[0] if len(parts) == 3 else None
+
+
+def collect_stats() -> Dict[str, Any]:
+    """Podsumowanie statystyk własnych baz (też dla ``api_server``)."""
+    with closing(open_readonly()) as conn:
+        schemas = {row[1] for row in conn.execute("PRAGMA database_list")}
+        tables = {
+            name
+            for schema in schemas - {"main", "temp"}
+            for (name,) in conn.execute(
+                f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'"
+            )
+        }
+        counts = {
+            table: conn.execute(f"SELECT COUNT(*) FROM [{table}]").fetchone()[0]
+            for table in sorted(tables)
+            if not table.startswith(("sqlite_", "_"))
+        }
+        summary: Dict[str, Any] = {"tables": counts}
+        if "systemy_rpg" in tables:
+            summary["collection"] = {
+                "by_type": dict(conn.execute(
+                    "SELECT typ, COUNT(*) FROM systemy_rpg GROUP BY typ ORDER BY typ"
+                ).fetchall()),
+                "by_status": dict(conn.execute(
+                    "SELECT COALESCE(status_kolekcja, 'W kolekcji'), COUNT(*)"
+                    " FROM systemy_rpg GROUP BY 1 ORDER BY 1"
+                ).fetchall()),
+            }
+        if "sesje_rpg" in tables:
+            per_year: Dict[str, int] = {}
+            for (date_str,) in conn.execute("SELECT data_sesji FROM sesje_rpg"):
+                year = _session_year(date_str)
+                if year:
+                    per_year[year] = per_year.get(year, 0) + 1
+            summary["sessions_per_year"] = dict(sorted(per_year.items(), reverse=True))
+            if "systemy_gry" in tables:
+                summary["top_systems"] = [
+                    {"system": name, "sessions": n}
+                    for name, n in conn.execute(
+                        "SELECT COALESCE(g.nazwa, '?'), COUNT(*) FROM sesje_rpg s"
+                        " LEFT JOIN systemy_gry g ON g.id = s.system_id"
+                        " GROUP BY s.system_id ORDER BY 2 DESC LIMIT 10"
+                    )
+                ]
+    return summary
+
+
+def cmd_stats(_args: argparse.Namespace) -> int:
+    _print_json(collect_stats())
+    return EXIT_OK
+
+
+def cmd_query(args: argparse.Namespace) -> int:
+    with closing(open_readonly()) as conn:
+        cursor = conn.execute(args.sql)
+        if cursor.description is None:
+            return EXIT_OK
+        columns = [d[0] for d in cursor.description]
+        count = _print_rows(columns, cursor, args.format)
+    _info(f"({count} wierszy)")
+    return EXIT_OK
+
+
+def cmd_search(args: argparse.Namespace) -> int:
+    from db_compare import normalize_name
+
+    needle = normalize_name(args.text)
+    with closing(open_readonly()) as conn:
+        conn.create_function("sesyjka_norm", 1, normalize_name, deterministic=True)
+        schemas = [row[1] for row in conn.execute("PRAGMA database_list")]
+        existing = {
+            name: {row[1] for row in conn.execute(f"PRAGMA {schema}.table_info([{name}])")}
+            for schema in schemas
+            for (name,) in conn.execute(
+                f"SELECT name FROM {schema}.sqlite_master WHERE type = 'table'"
+            )
+        }
+        parts = []
+        for table, fields in _SEARCH_FIELDS.items():
+            for column in fields:
+                if column in existing.get(table, ()):
+                    parts.append(
+                        f"SELECT '{table}', id, '{column}', [{column}] FROM [{table}]"
+                        f" WHERE instr(sesyjka_norm([{column}]), :needle) > 0"
+                    )
+        if not parts:
+            return EXIT_OK
+        sql = " UNION ALL ".join(parts) + " LIMIT :limit"
+        rows = conn.execute(sql, {"needle": needle, "limit": args.limit})
+        count = _print_rows(["table", "id", "column", "value"], rows, args.format)
+    _info(f"({count} trafień)")
+    return EXIT_OK
+
+
+# ── Parser ──
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m sesyjka",
+        description="Sesyjka — operacje na bazach bez uruchamiania okna aplikacji.",
+    )
+    parser.add_argument(
+        "-v", "--verbose", action="store_true", help="szczegółowe logi na stderr"
+    )
+    sub = parser.add_subparsers(dest="command", required=True, metavar="POLECENIE")
+
+    p = sub.add_parser("export", help="eksport własnych baz")
+    p.add_argument("format", choices=_EXPORT_FORMATS)
+    p.add_argument("dest", help="plik (zip, xlsx) lub katalog (folder, csv, jsonl)")
+    p.add_argument("--compact", action="store_true", help="kompaktowanie kopii (VACUUM INTO)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("import", help="zastąpienie własnych baz danymi z ZIP/folderu")
+    p.add_argument("source")
+    p.set_defaults(func=cmd_import)
+
+    p = sub.add_parser("merge", help="scalenie różniących się wierszy z ZIP/folderu")
+    p.add_argument("source")
+    p.add_argument("--dry-run", action="store_true", help="tylko plan, bez zapisu")
+    p.add_argument(
+        "--prefer-incoming", action="store_true", help="w konfliktach bierz wersję ze źródła"
+    )
+    p.set_defaults(func=cmd_merge)
+
+    p = sub.add_parser("bulk-import", help="dodanie wierszy z pliku CSV/JSONL")
+    p.add_argument("kind", choices=("systemy", "suplementy", "sesje", "gracze"))
+    p.add_argument("source", help="plik .csv (przecinek lub średnik) albo .jsonl")
+    p.set_defaults(func=cmd_bulk_import)
+
+    p = sub.add_parser("import-xlsx", help="wczytanie zmian z arkusza w formacie eksportu")
+    p.add_argument("source", help="plik .xlsx z eksportu (np. po edycji cen lub statusów)")
+    p.set_defaults(func=cmd_import_xlsx)
+
+    p = sub.add_parser("backup", help="magazyn kopii zapasowych")
+    p.add_argument("action", choices=("create", "list", "prune", "restore"), nargs="?",
+                   default="create")
+    p.add_argument("id", nargs="?", help="identyfikator kopii (restore)")
+    p.add_argument("--db", help="tylko kopie tej bazy (list), np. gracze.db")
+    p.set_defaults(func=cmd_backup)
+
+    p = sub.add_parser("check", help="sprawdzenie spójności i schematu baz")
+    p.add_argument("source", nargs="?", help="ZIP/folder do sprawdzenia (domyślnie własne bazy)")
+    p.set_defaults(func=cmd_check)
+
+    p = sub.add_parser("stats", help="podsumowanie statystyk jako JSON")
+    p.set_defaults(func=cmd_stats)
+
+    p = sub.add_parser("query", help="zapytanie SQL tylko do odczytu")
+    p.add_argument("sql")
+    p.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    p.set_defaults(func=cmd_query)
+
+    p = sub.add_parser("search", help="wyszukiwanie po nazwach (bez wielkości liter i akcentów)")
+    p.add_argument("text")
+    p.add_argument("--limit", type=int, default=100)
+    p.add_argument("--format", choices=("jsonl", "csv"), default="jsonl")
+    p.set_defaults(func=cmd_search)
+    return parser
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+    logging.basicConfig(
+        level=logging.INFO if args.verbose else logging.WARNING,
+        format="%(levelname)s %(name)s: %(message)s",
+        stream=sys.stderr,
+    )
+    try:
+        return args.func(args)
+    except BrokenPipeError:
+        # Odbiorca wyjścia zamknął potok (np. ``| head``) — to nie jest błąd
+        sys.stdout = open(os.devnull, "w")
+        return EXIT_OK
+    except KeyboardInterrupt:
+        _info("Przerwano.")
+        return EXIT_ERROR
+    except (OSError, ValueError, sqlite3.Error, ImportError, dm.OperationCancelled) as e:
+        _log.debug("Błąd polecenia %s", args.command, exc_info=True)
+        _info(f"⚠ {e}")
+        return EXIT_ERROR
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -20,6 +20,16 @@ _DEFAULT_SETTINGS: Dict[str, Any] = {
     "dark_mode": False,
     "font_scale": 1.0,
     "all_expanded_systemy": False,
+    # Wstępne ładowanie modułów dialogów w tle po starcie (szybsze pierwsze otwarcie)
+    "warmup_dialogs": True,
+    # Magazyn kopii zapasowych baz: ostatnie N kopii każdej bazy + najnowsza
+    # z każdego z ostatnich dni/tygodni; kompresja: auto | zstd | lzma | none
+    "backups": {
+        "keep_last": 10,
+        "keep_daily": 7,
+        "keep_weekly": 4,
+        "compression": "auto",
+    },
     "window": {
         "width": 1800,
         "height": 920,
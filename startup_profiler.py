@@ -0,0 +1,173 @@
+"""
+Profiler faz startu aplikacji Sesyjka (opcjonalny).
+
+Włączany zmienną środowiskową ``SESYJKA_PROFILE_STARTUP=1`` lub flagą
+``--profile-startup`` w linii poleceń. Gdy jest wyłączony, wszystkie funkcje
+są praktycznie bezkosztowe (``phase()`` zwraca pusty kontekst).
+
+Raport zapisywany jest do katalogu danych aplikacji jako
+``startup_profile.json`` (do porównań między wersjami) oraz
+``startup_profile.txt`` (czytelne podsumowanie).
+"""
+from __future__ import annotations
+
+import contextlib
+import importlib
+import json
+import logging
+import os
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+_log = logging.getLogger(__name__)
+
+_ENV_VAR = "SESYJKA_PROFILE_STARTUP"
+_CLI_FLAG = "--profile-startup"
+_REPORT_JSON = "startup_profile.json"
+_REPORT_TXT = "startup_profile.txt"
+
+# Punkt zerowy — moment pierwszego importu tego modułu (przed customtkinter)
+_t0: float = time.perf_counter()
+_enabled: bool = os.environ.get(_ENV_VAR, "").strip() not in ("", "0") or _CLI_FLAG in sys.argv
+_phases: List[Dict[str, Any]] = []
+_report_written: bool = False
+
+
+def is_enabled() -> bool:
+    """Czy profilowanie startu jest aktywne w tym uruchomieniu."""
+    return _enabled
+
+
+def record(name: str, start: float, end: float, category: str = "phase") -> None:
+    """Zapisuje fazę o znanym czasie początku i końca (wartości z ``perf_counter``)."""
+    if not _enabled:
+        return
+    _phases.append(
+        {
+            "name": name,
+            "category": category,
+            "start_ms": round((start - _t0) * 1000.0, 2),
+            "duration_ms": round((end - start) * 1000.0, 2),
+        }
+    )
+
+
+@contextlib.contextmanager
+def phase(name: str, category: str = "phase") -> Iterator[None]:
+    """Kontekst mierzący czas ściany jednej fazy startu."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record(name, start, time.perf_counter(), category)
+
+
+def time_import(module_name: str) -> None:
+    """
+    Mierzy czas importu modułu zewnętrznego.
+
+    Moduł już obecny w ``sys.modules`` jest odnotowywany z czasem 0 — jego koszt
+    został poniesiony wcześniej (np. jako zależność innego modułu).
+    Brak modułu nie jest błędem, bo część bibliotek jest opcjonalna (openpyxl).
+    """
+    if not _enabled:
+        return
+    if module_name in sys.modules:
+        now = time.perf_counter()
+        record(f"import {module_name} (już załadowany)", now, now, "import")
+        return
+    start = time.perf_counter()
+    try:
+        importlib.import_module(module_name)
+    except ImportError:
+        record(f"import {module_name} (niedostępny)", start, time.perf_counter(), "import")
+        return
+    record(f"import {module_name}", start, time.perf_counter(), "import")
+
+
+def mark_first_idle(widget: Any, app_version: str) -> None:
+    """
+    Rejestruje moment pierwszej bezczynności pętli Tk i zapisuje raport.
+
+    Args:
+        widget: Dowolny widget Tk (zwykle główne okno aplikacji).
+        app_version: Wersja aplikacji zapisywana w raporcie.
+    """
+    if not _enabled:
+        return
+    scheduled = time.perf_counter()
+
+    def _on_idle() -> None:
+        record("pierwsza bezczynność pętli Tk", scheduled, time.perf_counter(), "idle")
+        write_report(app_version)
+
+    widget.after_idle(_on_idle)
+
+
+def write_report(app_version: str, out_dir: Optional[Path] = None) -> Optional[Path]:
+    """
+    Zapisuje raport JSON i tekstowy do katalogu danych aplikacji.
+
+    Raport zapisywany jest tylko raz na uruchomienie. Błędy zapisu są logowane,
+    ale nie przerywają startu aplikacji.
+
+    Returns:
+        Ścieżka do pliku JSON lub None (profilowanie wyłączone / błąd zapisu).
+    """
+    global _report_written
+    if not _enabled or _report_written:
+        return None
+    _report_written = True
+
+    total_ms = round((time.perf_counter() - _t0) * 1000.0, 2)
+    report: Dict[str, Any] = {
+        "app_version": app_version,
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "platform": sys.platform,
+        "frozen": bool(getattr(sys, "frozen", False)),
+        "total_ms": total_ms,
+        "phases": list(_phases),
+    }
+
+    try:
+        if out_dir is None:
+            from database_manager import get_app_data_dir
+
+            out_dir = get_app_data_dir()
+        json_path = out_dir / _REPORT_JSON
+        with open(json_path, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        with open(out_dir / _REPORT_TXT, "w", encoding="utf-8") as f:
+            f.write(_format_text(report))
+    except OSError:
+        _log.warning("Nie udało się zapisać raportu profilowania startu", exc_info=True)
+        return None
+
+    print(f"[Profiler] Start aplikacji: {total_ms:.0f} ms — raport: {json_path}")
+    return json_path
+
+
+def _format_text(report: Dict[str, Any]) -> str:
+    """Formatuje raport jako tabelę tekstową posortowaną wg czasu rozpoczęcia."""
+    lines = [
+        f"Sesyjka v{report['app_version']} — profil startu ({report['timestamp']})",
+        f"Python {report['python']} / {report['platform']}"
+        + (" / EXE" if report["frozen"] else ""),
+        "=" * 72,
+        f"{'start [ms]':>10}  {'czas [ms]':>10}  {'kategoria':<8}  faza",
+        "-" * 72,
+    ]
+    for p in sorted(report["phases"], key=lambda x: x["start_ms"]):
+        lines.append(
+            f"{p['start_ms']:>10.1f}  {p['duration_ms']:>10.1f}  {p['category']:<8}  {p['name']}"
+        )
+    lines.append("-" * 72)
+    lines.append(f"Łącznie do pierwszej bezczynności: {report['total_ms']:.1f} ms")
+    return "\n".join(lines) + "\n"
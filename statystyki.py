@@ -1,4 +1,3 @@
-import threading
 import tkinter as tk
 from tkinter import ttk  # type: ignore
 from typing import Any, Dict, List, Optional
@@ -10,8 +9,9 @@ matplotlib.use('TkAgg')  # Backend dla tkinter
 import matplotlib.pyplot as plt  # type: ignore
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg  # type: ignore
 from matplotlib.figure import Figure  # type: ignore
-from database_manager import get_db_path
+from database_manager import connect_db
 from font_scaling import scale_font_size
+import task_executor
 
 
 def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
@@ -117,7 +117,7 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
 
     # Pobierz dane z bazy
     try:
-        conn = sqlite3.connect(get_db_path("sesje_rpg.db"))
+        conn = connect_db("sesje_rpg.db")
         c = conn.cursor()
         c.execute("SELECT data_sesji FROM sesje_rpg")
         rows = c.fetchall()
@@ -280,7 +280,7 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
 
     # Pobierz głównego użytkownika
     try:
-        conn_gracze = sqlite3.connect(get_db_path("gracze.db"))
+        conn_gracze = connect_db("gracze.db")
         c_gracze = conn_gracze.cursor()
         c_gracze.execute("SELECT id, nick FROM gracze WHERE glowny_uzytkownik = 1")
         main_user = c_gracze.fetchone()
@@ -291,7 +291,7 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
             main_user_nick = main_user[1]
 
             # Pobierz dane z sesji
-            conn_sesje = sqlite3.connect(get_db_path("sesje_rpg.db"))
+            conn_sesje = connect_db("sesje_rpg.db")
             c_sesje = conn_sesje.cursor()
 
             # Zlicz sesje jako MG po roku
@@ -592,7 +592,7 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
 
     # Pobierz wszystkie dostępne lata z bazy
     try:
-        conn_years = sqlite3.connect(get_db_path("sesje_rpg.db"))
+        conn_years = connect_db("sesje_rpg.db")
         c_years = conn_years.cursor()
         c_years.execute("SELECT DISTINCT data_sesji FROM sesje_rpg ORDER BY data_sesji DESC")
         all_dates = c_years.fetchall()
@@ -637,49 +637,46 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
 
                 selected_year = year_var.get()
 
-                def _fetch() -> None:
+                def _fetch() -> Optional[List]:
                     """Pobiera dane SQL w wątku tła, naprawia N+1 query."""
-                    try:
-                        with sqlite3.connect(get_db_path("sesje_rpg.db")) as _conn_s:
-                            _conn_s.row_factory = sqlite3.Row
-                            _c_s = _conn_s.cursor()
-                            _c_s.execute(
-                                "SELECT system_id FROM sesje_rpg WHERE data_sesji LIKE ?",
-                                (f"%{selected_year}%",),
-                            )
-                            sessions_data = _c_s.fetchall()
-
-                        system_id_counts: Dict[int, int] = defaultdict(int)
-                        for row in sessions_data:
-                            if row[0]:
-                                system_id_counts[row[0]] += 1
-
-                        sorted_result: Optional[List] = None
-                        if system_id_counts:
-                            ids_ph = ",".join("?" * len(system_id_counts))
-                            with sqlite3.connect(get_db_path("systemy_rpg.db")) as _conn_sys:
-                                _conn_sys.row_factory = sqlite3.Row
-                                _c_sys = _conn_sys.cursor()
-                                _c_sys.execute(
-                                    f"SELECT id, nazwa FROM systemy_gry"
-                                    f" WHERE id IN ({ids_ph})",
-                                    list(system_id_counts.keys()),
-                                )
-                                names_map = {row[0]: row[1] for row in _c_sys.fetchall()}
-
-                            system_counts_map = {
-                                names_map.get(sid, f"System ID {sid}"): cnt
-                                for sid, cnt in system_id_counts.items()
-                            }
-                            sorted_result = sorted(
-                                system_counts_map.items(),
-                                key=lambda x: x[1],
-                                reverse=True,
+                    with connect_db("sesje_rpg.db") as _conn_s:
+                        _conn_s.row_factory = sqlite3.Row
+                        _c_s = _conn_s.cursor()
+                        _c_s.execute(
+                            "SELECT system_id FROM sesje_rpg WHERE data_sesji LIKE ?",
+                            (f"%{selected_year}%",),
+                        )
+                        sessions_data = _c_s.fetchall()
+
+                    system_id_counts: Dict[int, int] = defaultdict(int)
+                    for row in sessions_data:
+                        if row[0]:
+                            system_id_counts[row[0]] += 1
+
+                    sorted_result: Optional[List] = None
+                    if system_id_counts:
+                        ids_ph = ",".join("?" * len(system_id_counts))
+                        with connect_db("systemy_rpg.db") as _conn_sys:
+                            _conn_sys.row_factory = sqlite3.Row
+                            _c_sys = _conn_sys.cursor()
+                            _c_sys.execute(
+                                f"SELECT id, nazwa FROM systemy_gry"
+                                f" WHERE id IN ({ids_ph})",
+                                list(system_id_counts.keys()),
                             )
+                            names_map = {row[0]: row[1] for row in _c_sys.fetchall()}
+
+                        system_counts_map = {
+                            names_map.get(sid, f"System ID {sid}"): cnt
+                            for sid, cnt in system_id_counts.items()
+                        }
+                        sorted_result = sorted(
+                            system_counts_map.items(),
+                            key=lambda x: x[1],
+                            reverse=True,
+                        )
 
-                        chart_system_frame.after(0, lambda r=sorted_result: _render(r))
-                    except Exception as exc:
-                        chart_system_frame.after(0, lambda e=exc: _show_error(str(e)))
+                    return sorted_result
 
                 def _render(sorted_systems: Optional[List]) -> None:
                     """Buduje wykres w wątku głównym."""
@@ -796,7 +793,13 @@ def fill_statystyki_tab(tab: Any, dark_mode: bool = False) -> None:
                     )
                     error_system_label.pack(pady=30)
 
-                threading.Thread(target=_fetch, daemon=True).start()
+                task_executor.submit(
+                    "statystyki:system_chart",
+                    chart_system_frame,
+                    _fetch,
+                    _render,
+                    on_error=lambda e: _show_error(str(e)),
+                )
 
             # Bind zmiany roku
             year_var.trace_add('write', update_system_chart)
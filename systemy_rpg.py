@@ -6,15 +6,34 @@ import tksheet  # type: ignore
 from tkinter import ttk, messagebox
 import sqlite3
 import logging
-import threading
-from typing import Optional, Callable, Sequence, Any, Dict, List, Union
+from contextlib import closing
+from typing import Optional, Callable, Sequence, Any, Dict, List, Tuple, Union
 import customtkinter as ctk  # type: ignore
-from database_manager import get_db_path, get_app_data_dir, is_guest_mode
+from database_manager import (
+    connect_db,
+    get_app_data_dir,
+    get_own_db_path,
+    is_guest_mode,
+    open_schema_connection,
+)
 from font_scaling import scale_font_size
 from ctk_table import CTkDataTable
+from view_export import export_table_view
+import change_events
+import db_writer
+from change_events import ChangeEvent
+import task_executor
+import view_snapshot
 from dialog_utils import apply_safe_geometry, clamp_geometry, create_ctk_toplevel
 
-DB_FILE = get_db_path("systemy_rpg.db")
+DB_FILE = get_own_db_path("systemy_rpg.db")
+# Pliki baz, z których pochodzą dane zakładki (sygnatura migawki)
+_SNAPSHOT_DBS = ("systemy_rpg.db", "wydawcy.db")
+
+# Schemat sprawdzony w tej sesji (ustawiane przez init_db / prepare_db)
+_db_initialized: bool = False
+# Wynik sondy kreatora migracji z przebiegu startowego (None = brak)
+_wizard_probe_result: Optional[bool] = None
 
 
 # ── Konfiguracja loggera ────────────────────────────────────────────────────
@@ -51,8 +70,6 @@ active_col_widths_systemy: List[int] = []
 all_expanded_systemy: bool = False
 # Ukrywanie wierszy "System" gdy "Rozwiń wszystkie" jest włączone
 hide_systems_systemy: bool = False
-# Ukrywanie wierszy "System" gdy "Rozwiń wszystkie" jest włączone
-hide_systems_systemy: bool = False
 # Widoczność kolumn w tabeli systemów (klucz = nazwa kolumny, wartość = czy widoczna)
 active_visible_cols_systemy: Dict[str, bool] = {
     "Nazwa systemu": True,
@@ -81,22 +98,18 @@ _ALWAYS_VISIBLE_SYSTEMY = {"", "ID"}
 show_edit_btn_systemy: bool = True
 
 
-def _migrate_remove_cross_db_fks() -> None:
+def _migrate_remove_cross_db_fks(conn: sqlite3.Connection) -> None:
     """Jednorazowa migracja: usuwa cross-bazowy FK wydawcy z tabeli systemy_rpg.
 
     `FOREIGN KEY (wydawca_id) REFERENCES wydawcy(id)` wskazuje na inny plik .db,
     co jest nieobsługiwane przez SQLite i powoduje błąd przy INSERT gdy
     PRAGMA foreign_keys = ON.  FK do systemy_rpg(id) (self-reference) jest
     zachowywany — leży w tej samej bazie.
-    """
-    import os
 
-    if not os.path.exists(DB_FILE):
-        return  # Baza nie istnieje — init_db() stworzy ją poprawnie
-
-    conn = sqlite3.connect(DB_FILE)
-    conn.row_factory = sqlite3.Row
-    conn.isolation_level = None  # tryb explicit — pełna kontrola nad transakcją
+    Args:
+        conn: Połączenie w trybie autocommit (isolation_level=None) — migracja
+            sama zarządza transakcją (BEGIN/COMMIT).
+    """
     try:
         c = conn.cursor()
         c.execute("SELECT sql FROM sqlite_master WHERE type='table' AND name='systemy_rpg'")
@@ -164,132 +177,166 @@ def _migrate_remove_cross_db_fks() -> None:
             pass
         logger.error("Błąd podczas migracji systemy_rpg: %s", exc)
         raise
-    finally:
-        conn.close()
 
 
-def init_db() -> None:
-    """Inicjalizuje bazę danych systemów RPG"""
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Tworzy/migruje schemat bazy systemów RPG na podanym połączeniu.
+
+    Args:
+        conn: Połączenie w trybie autocommit (patrz ``open_schema_connection``).
+    """
     # Jednorazowa migracja usuwająca cross-bazowe FK sprzed poprawki
-    _migrate_remove_cross_db_fks()
+    _migrate_remove_cross_db_fks(conn)
 
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS systemy_rpg (
-                id INTEGER PRIMARY KEY,
-                nazwa TEXT NOT NULL,
-                typ TEXT NOT NULL,
-                system_glowny_id INTEGER,
-                typ_suplementu TEXT,
-                wydawca_id INTEGER,
-                fizyczny INTEGER DEFAULT 0,
-                pdf INTEGER DEFAULT 0,
-                jezyk TEXT,
-                status_gra TEXT DEFAULT 'Nie grane',
-                status_kolekcja TEXT DEFAULT 'W kolekcji',
-                cena_zakupu REAL,
-                waluta_zakupu TEXT,
-                cena_sprzedazy REAL,
-                waluta_sprzedazy TEXT,
-                FOREIGN KEY (system_glowny_id) REFERENCES systemy_rpg(id)
-            )
+    c = conn.cursor()
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS systemy_rpg (
+            id INTEGER PRIMARY KEY,
+            nazwa TEXT NOT NULL,
+            typ TEXT NOT NULL,
+            system_glowny_id INTEGER,
+            typ_suplementu TEXT,
+            wydawca_id INTEGER,
+            fizyczny INTEGER DEFAULT 0,
+            pdf INTEGER DEFAULT 0,
+            jezyk TEXT,
+            status_gra TEXT DEFAULT 'Nie grane',
+            status_kolekcja TEXT DEFAULT 'W kolekcji',
+            cena_zakupu REAL,
+            waluta_zakupu TEXT,
+            cena_sprzedazy REAL,
+            waluta_sprzedazy TEXT,
+            FOREIGN KEY (system_glowny_id) REFERENCES systemy_rpg(id)
         )
+    """
+    )
 
-        # Migracja - dodaj nowe kolumny do istniejących tabel
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN status_gra TEXT DEFAULT 'Nie grane'")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    # Migracja - dodaj nowe kolumny do istniejących tabel
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN status_gra TEXT DEFAULT 'Nie grane'")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute(
-                "ALTER TABLE systemy_rpg ADD COLUMN status_kolekcja TEXT DEFAULT 'W kolekcji'"
-            )
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute(
+            "ALTER TABLE systemy_rpg ADD COLUMN status_kolekcja TEXT DEFAULT 'W kolekcji'"
+        )
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_zakupu REAL")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_zakupu REAL")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN waluta_zakupu TEXT")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN waluta_zakupu TEXT")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_sprzedazy REAL")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_sprzedazy REAL")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN waluta_sprzedazy TEXT")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN waluta_sprzedazy TEXT")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN vtt TEXT")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN vtt TEXT")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN system_glowny_nazwa_custom TEXT")
-        except sqlite3.OperationalError:
-            # Kolumna już istnieje
-            pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN system_glowny_nazwa_custom TEXT")
+    except sqlite3.OperationalError:
+        # Kolumna już istnieje
+        pass
 
-        # ── Nowy poziom hierarchii: systemy_gry ──────────────────────────
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS systemy_gry (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                nazwa TEXT NOT NULL,
-                wydawca_id INTEGER,
-                jezyk TEXT,
-                notatki TEXT
-            )
+    # ── Nowy poziom hierarchii: systemy_gry ──────────────────────────
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS systemy_gry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            nazwa TEXT NOT NULL,
+            wydawca_id INTEGER,
+            jezyk TEXT,
+            notatki TEXT
         )
+    """
+    )
 
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN system_gry_id INTEGER REFERENCES systemy_gry(id)")
-        except sqlite3.OperationalError:
-            pass  # Kolumna już istnieje
-
-        # Migracja cen per forma posiadania (v0.4.x)
-        # cena_zakupu → zostaje jako backup; cena_fiz kopiuje jej wartość
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_fiz REAL")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_pdf REAL")
-        except sqlite3.OperationalError:
-            pass
-        try:
-            c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_vtt REAL")
-        except sqlite3.OperationalError:
-            pass
-        # Jednorazowe kopiowanie: cena_zakupu → cena_fiz (tylko gdy cena_fiz jeszcze NULL)
+    try:
         c.execute(
-            "UPDATE systemy_rpg SET cena_fiz = cena_zakupu "
-            "WHERE cena_fiz IS NULL AND cena_zakupu IS NOT NULL"
+            "ALTER TABLE systemy_rpg ADD COLUMN system_gry_id INTEGER REFERENCES systemy_gry(id)"
         )
+    except sqlite3.OperationalError:
+        pass  # Kolumna już istnieje
+
+    # Migracja cen per forma posiadania (v0.4.x)
+    # cena_zakupu → zostaje jako backup; cena_fiz kopiuje jej wartość
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_fiz REAL")
+    except sqlite3.OperationalError:
+        pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_pdf REAL")
+    except sqlite3.OperationalError:
+        pass
+    try:
+        c.execute("ALTER TABLE systemy_rpg ADD COLUMN cena_vtt REAL")
+    except sqlite3.OperationalError:
+        pass
+    # Jednorazowe kopiowanie: cena_zakupu → cena_fiz (tylko gdy cena_fiz jeszcze NULL)
+    c.execute(
+        "UPDATE systemy_rpg SET cena_fiz = cena_zakupu "
+        "WHERE cena_fiz IS NULL AND cena_zakupu IS NOT NULL"
+    )
+
+    # Indeksy kolumn wiążących — podgląd skutków i odłączanie przy usuwaniu zbiorczym
+    for sql in (
+        "CREATE INDEX IF NOT EXISTS idx_systemy_rpg_system_gry ON systemy_rpg (system_gry_id)",
+        "CREATE INDEX IF NOT EXISTS idx_systemy_rpg_system_glowny "
+        "ON systemy_rpg (system_glowny_id)",
+        "CREATE INDEX IF NOT EXISTS idx_systemy_rpg_wydawca ON systemy_rpg (wydawca_id)",
+        "CREATE INDEX IF NOT EXISTS idx_systemy_gry_wydawca ON systemy_gry (wydawca_id)",
+    ):
+        c.execute(sql)
 
-        conn.commit()
+
+def init_db() -> None:
+    """Inicjalizuje bazę danych systemów RPG (jednorazowo na sesję aplikacji)."""
+    global _db_initialized
+    if _db_initialized:
+        return
+    with closing(open_schema_connection(DB_FILE)) as conn:
+        ensure_schema(conn)
+    _db_initialized = True
+
+
+def prepare_db(conn: sqlite3.Connection) -> None:
+    """
+    Krok startowy dla ``initialize_app_databases``: schemat + sonda kreatora migracji.
+
+    Wynik sondy jest zapamiętywany, więc pierwsze ``needs_migration_wizard()``
+    nie otwiera bazy ponownie.
+    """
+    global _db_initialized, _wizard_probe_result
+    _db_initialized = False  # także po podmianie pliku (refresh_databases)
+    ensure_schema(conn)
+    _db_initialized = True
+    _wizard_probe_result = _probe_migration_wizard(conn)
 
 
 def get_dark_mode_from_tab(tab: tk.Widget) -> bool:
@@ -365,7 +412,7 @@ def get_first_free_id() -> int:
 
 def get_all_systems() -> list[tuple[Any, ...]]:
     """Pobiera wszystkie systemy RPG z bazy"""
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("systemy_rpg.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -397,7 +444,7 @@ def get_all_systems() -> list[tuple[Any, ...]]:
     # Pobierz wszystkich wydawców jednym zapytaniem
     publishers_map: Dict[int, str] = {}
     try:
-        with sqlite3.connect(get_db_path("wydawcy.db")) as wydawcy_conn:
+        with connect_db("wydawcy.db") as wydawcy_conn:
             wydawcy_conn.row_factory = sqlite3.Row
             wydawcy_conn.execute("PRAGMA foreign_keys = ON")
             w_cursor = wydawcy_conn.cursor()
@@ -474,7 +521,7 @@ def get_all_systems() -> list[tuple[Any, ...]]:
 def get_all_games() -> list[tuple[Any, ...]]:
     """Pobiera wszystkie gry (systemy_gry – najwyższy poziom hierarchii) z bazy."""
     try:
-        with sqlite3.connect(DB_FILE) as conn:
+        with connect_db("systemy_rpg.db") as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
             c = conn.cursor()
@@ -492,7 +539,7 @@ def get_all_games() -> list[tuple[Any, ...]]:
 
     publishers_map: Dict[int, str] = {}
     try:
-        with sqlite3.connect(get_db_path("wydawcy.db")) as wconn:
+        with connect_db("wydawcy.db") as wconn:
             wconn.row_factory = sqlite3.Row
             wc = wconn.cursor()
             wc.execute("SELECT id, nazwa FROM wydawcy")
@@ -512,32 +559,40 @@ def get_all_games() -> list[tuple[Any, ...]]:
     ]
 
 
+def _probe_migration_wizard(conn: sqlite3.Connection) -> bool:
+    """Sprawdza na podanym połączeniu, czy istnieją PG bez system_gry_id."""
+    c = conn.cursor()
+    c.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='systemy_gry'")
+    if not c.fetchone():
+        return False
+    c.execute(
+        "SELECT COUNT(*) FROM systemy_rpg "
+        "WHERE typ='Podręcznik Główny' AND (system_gry_id IS NULL OR system_gry_id=0)"
+    )
+    return c.fetchone()[0] > 0
+
+
 def needs_migration_wizard() -> bool:
     """Zwraca True jeśli istnieją PG bez przypisanego system_gry_id (migracja wymagana)."""
+    global _wizard_probe_result
+    # Wynik z jednorazowego przebiegu startowego (prepare_db) — zużywany raz
+    if _wizard_probe_result is not None:
+        result = _wizard_probe_result
+        _wizard_probe_result = None
+        return result
     import os
     if not os.path.exists(DB_FILE):
         return False
     try:
         with sqlite3.connect(DB_FILE) as conn:
-            c = conn.cursor()
-            c.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name='systemy_gry'"
-            )
-            if not c.fetchone():
-                return False
-            c.execute(
-                "SELECT COUNT(*) FROM systemy_rpg "
-                "WHERE typ='Podręcznik Główny' AND (system_gry_id IS NULL OR system_gry_id=0)"
-            )
-            count = c.fetchone()[0]
-            return count > 0
+            return _probe_migration_wizard(conn)
     except sqlite3.Error:
         return False
 
 
 def get_main_systems() -> list[tuple[int, str]]:
     """Pobiera systemy główne (Podręcznik Główny) do wyboru jako rodzic dla suplementów"""
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("systemy_rpg.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -550,7 +605,7 @@ def get_main_systems() -> list[tuple[int, str]]:
 def get_all_publishers() -> list[tuple[int, str]]:
     """Pobiera wszystkich wydawców z bazy wydawców"""
     try:
-        with sqlite3.connect(get_db_path("wydawcy.db")) as conn:
+        with connect_db("wydawcy.db") as conn:
             conn.row_factory = sqlite3.Row
             conn.execute("PRAGMA foreign_keys = ON")
             c = conn.cursor()
@@ -653,8 +708,6 @@ def show_migration_wizard(parent: tk.Misc) -> None:
     bf = ctk.CTkFrame(dlg, fg_color="transparent")
     bf.grid(row=2, column=0, sticky="ew", padx=20, pady=(0, 16))
 
-    migration_done = [False]
-
     def _apply_migration() -> None:
         """Wykonuje migrację na podstawie wartości z pól tekstowych."""
         # Zbierz mapę: pg_id → nazwa_systemu
@@ -670,76 +723,83 @@ def show_migration_wizard(parent: tk.Misc) -> None:
 
         # Unikalne nazwy systemów → utwórz rekordy w systemy_gry
         unique_names = dict.fromkeys(assignments.values())  # zachowuje kolejność
-        name_to_gry_id: Dict[str, int] = {}
+        sesje_db = get_own_db_path("sesje_rpg.db")
+        with_sessions = os.path.exists(sesje_db)
+
+        def _write(conn: sqlite3.Connection) -> None:
+            name_to_gry_id: Dict[str, int] = {}
+            for sysname in unique_names:
+                # Sprawdź czy System o tej nazwie już istnieje
+                row = conn.execute(
+                    "SELECT id FROM systemy_gry WHERE nazwa=?", (sysname,)
+                ).fetchone()
+                if row:
+                    name_to_gry_id[sysname] = row[0]
+                else:
+                    name_to_gry_id[sysname] = conn.execute(  # type: ignore[assignment]
+                        "INSERT INTO systemy_gry (nazwa) VALUES (?)", (sysname,)
+                    ).lastrowid
+
+            # Aktualizuj systemy_rpg.system_gry_id dla każdego PG
+            # i propaguj go do suplementów przez system_glowny_id
+            pg_to_gry = {pg_id: name_to_gry_id[name] for pg_id, name in assignments.items()}
+            for pg_id, gry_id in pg_to_gry.items():
+                conn.execute(
+                    "UPDATE systemy_rpg SET system_gry_id=? WHERE id=?", (gry_id, pg_id)
+                )
+                conn.execute(
+                    "UPDATE systemy_rpg SET system_gry_id=? "
+                    "WHERE typ='Suplement' AND system_glowny_id=?",
+                    (gry_id, pg_id),
+                )
 
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                c = conn.cursor()
-
-                for sysname in unique_names:
-                    # Sprawdź czy System o tej nazwie już istnieje
-                    c.execute("SELECT id FROM systemy_gry WHERE nazwa=?", (sysname,))
-                    row = c.fetchone()
-                    if row:
-                        name_to_gry_id[sysname] = row[0]
-                    else:
-                        c.execute(
-                            "INSERT INTO systemy_gry (nazwa) VALUES (?)", (sysname,)
+            # Aktualizuj sesje_rpg.system_id: z PG-id → system_gry-id (ta sama transakcja)
+            if with_sessions:
+                sessions = conn.execute("SELECT id, system_id FROM ses.sesje_rpg").fetchall()
+                for sess_id, old_sys_id in sessions:
+                    new_sys_id = pg_to_gry.get(old_sys_id)
+                    if new_sys_id:
+                        conn.execute(
+                            "UPDATE ses.sesje_rpg SET system_id=? WHERE id=?",
+                            (new_sys_id, sess_id),
                         )
-                        name_to_gry_id[sysname] = c.lastrowid  # type: ignore[assignment]
-
-                # Aktualizuj systemy_rpg.system_gry_id dla każdego PG
-                for pg_id, sysname in assignments.items():
-                    gry_id = name_to_gry_id[sysname]
-                    c.execute(
-                        "UPDATE systemy_rpg SET system_gry_id=? WHERE id=?",
-                        (gry_id, pg_id),
-                    )
 
-                # Propaguj system_gry_id do suplementów przez system_glowny_id
-                for pg_id, sysname in assignments.items():
-                    gry_id = name_to_gry_id[sysname]
-                    c.execute(
-                        "UPDATE systemy_rpg SET system_gry_id=? "
-                        "WHERE typ='Suplement' AND system_glowny_id=?",
-                        (gry_id, pg_id),
-                    )
-
-                conn.commit()
-
-            # Aktualizuj sesje_rpg.system_id: z PG-id → system_gry-id
-            # Budujemy mapę: pg_id → system_gry_id
-            pg_to_gry: Dict[int, int] = {}
-            for pg_id, sysname in assignments.items():
-                pg_to_gry[pg_id] = name_to_gry_id[sysname]
-
-            sesje_db = get_db_path("sesje_rpg.db")
-            if os.path.exists(sesje_db):
-                with sqlite3.connect(sesje_db) as sconn:
-                    sc = sconn.cursor()
-                    sc.execute("SELECT id, system_id FROM sesje_rpg")
-                    sessions = sc.fetchall()
-                    for sess_id, old_sys_id in sessions:
-                        new_sys_id = pg_to_gry.get(old_sys_id)
-                        if new_sys_id:
-                            sc.execute(
-                                "UPDATE sesje_rpg SET system_id=? WHERE id=?",
-                                (new_sys_id, sess_id),
-                            )
-                    sconn.commit()
-
-            migration_done[0] = True
+        def _done(_result: object) -> None:
+            open_dlg = bool(dlg.winfo_exists())
             messagebox.showinfo(
                 "Migracja zakończona",
-                f"Utworzono {len(unique_names)} systemów i przypisano {len(pgs)} Podręczników Głównych.",
-                parent=dlg,
+                f"Utworzono {len(unique_names)} systemów i przypisano "
+                f"{len(pgs)} Podręczników Głównych.",
+                parent=dlg if open_dlg else parent,
             )
-            dlg.destroy()
+            if open_dlg:
+                dlg.destroy()
 
-        except sqlite3.Error as e:
-            messagebox.showerror("Błąd migracji", f"Nie udało się wykonać migracji:\n{e}", parent=dlg)
+        def _error(exc: BaseException) -> None:
+            open_dlg = bool(dlg.winfo_exists())
+            if open_dlg:
+                migrate_btn.configure(state="normal")
+            messagebox.showerror(
+                "Błąd migracji",
+                f"Nie udało się wykonać migracji:\n{exc}",
+                parent=dlg if open_dlg else parent,
+            )
+
+        migrate_btn.configure(state="disabled")
+        db_writer.submit(
+            DB_FILE,
+            _write,
+            parent,
+            on_done=_done,
+            on_error=_error,
+            label="kreator migracji",
+            changes=(
+                ChangeEvent(change_events.SYSTEMY_GRY, kind=change_events.INSERT),
+                ChangeEvent(change_events.SYSTEMY_RPG),
+                *((ChangeEvent(change_events.SESJE_RPG),) if with_sessions else ()),
+            ),
+            attach=(("ses", sesje_db),) if with_sessions else (),
+        )
 
     def _skip_migration() -> None:
         if messagebox.askyesno(
@@ -751,7 +811,7 @@ def show_migration_wizard(parent: tk.Misc) -> None:
         ):
             dlg.destroy()
 
-    ctk.CTkButton(
+    migrate_btn = ctk.CTkButton(
         bf,
         text="Wykonaj migrację",
         command=_apply_migration,
@@ -759,7 +819,8 @@ def show_migration_wizard(parent: tk.Misc) -> None:
         hover_color="#1B5E20",
         width=160,
         font=ctk.CTkFont(family="Segoe UI", size=scale_font_size(11)),
-    ).pack(side=tk.LEFT, padx=(0, 10))
+    )
+    migrate_btn.pack(side=tk.LEFT, padx=(0, 10))
     ctk.CTkButton(
         bf,
         text="Pomiń na razie",
@@ -926,15 +987,8 @@ def dodaj_system_rpg(
                 wydawca_var.set(f"{new_pub[0]} - {new_pub[1]}")
         else:
             wydawca_combo.configure(values=[])
-        # Odśwież zakładkę Wydawcy w głównym oknie
-        try:
-            import wydawcy as _wydawcy_mod
-            root = dialog.winfo_toplevel()
-            wydawcy_tab = getattr(root, 'tabs', {}).get('Wydawcy')
-            if wydawcy_tab:
-                _wydawcy_mod.fill_wydawcy_tab(wydawcy_tab, dark_mode=getattr(root, 'dark_mode', False))
-        except Exception:
-            pass
+        # Zakładkę Wydawcy w głównym oknie odświeży harmonogram zdarzeń zmian
+        change_events.publish(change_events.WYDAWCY, kind=change_events.INSERT)
 
     def _open_add_publisher() -> None:
         import wydawcy as _wydawcy
@@ -1319,11 +1373,8 @@ def dodaj_system_rpg(
             if wybrane_vtt:
                 vtt_str = ", ".join(wybrane_vtt)  # type: ignore
 
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute(
+        def _write(conn: sqlite3.Connection) -> None:
+            conn.execute(
                 """
                 INSERT INTO systemy_rpg (id, nazwa, typ, system_glowny_id, typ_suplementu,
                                        wydawca_id, fizyczny, pdf, vtt, jezyk,
@@ -1359,11 +1410,17 @@ def dodaj_system_rpg(
                     cena_vtt_new,
                 ),
             )
-            conn.commit()
 
-        if refresh_callback:
-            refresh_callback(dark_mode=getattr(parent, 'dark_mode', False))
-        dialog.destroy()
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=getattr(parent, 'dark_mode', False))
+
+        db_writer.submit_dialog_save(
+            DB_FILE, _write, dialog, parent, _saved, buttons=(btn_ok, btn_cancel),
+            changes=(
+                ChangeEvent(change_events.SYSTEMY_RPG, (reserved_id,), change_events.INSERT),
+            ),
+        )
 
     def on_cancel() -> None:
         """Anuluje dodawanie"""
@@ -1389,6 +1446,30 @@ def dodaj_system_rpg(
     dialog.after(0, dialog.deiconify)  # pokaż gdy wszystkie widgety są gotowe
 
 
+def _submit_systemy_load(
+    tab: tk.Frame, dark_mode: bool, shown: Optional[Tuple[List[Any], List[Any]]] = None
+) -> None:
+    """
+    Zleca wczytanie danych zakładki w tle; starsze zlecenia tej zakładki są odrzucane.
+
+    ``shown`` to dane już narysowane z migawki — identyczny wynik nie przerysowuje tabeli.
+    """
+
+    def _done(res: Tuple[List[Any], List[Any]]) -> None:
+        if shown is not None and res == shown:
+            return
+        fill_systemy_rpg_tab(tab, dark_mode, _preloaded_data=res[0], _preloaded_games=res[1])
+
+    task_executor.submit(
+        "tab:systemy",
+        tab,
+        view_snapshot.loader(
+            "systemy", _SNAPSHOT_DBS, lambda: (get_all_systems(), get_all_games())
+        ),
+        _done,
+    )
+
+
 def fill_systemy_rpg_tab(
     tab: tk.Frame,
     dark_mode: bool = False,
@@ -1408,18 +1489,7 @@ def fill_systemy_rpg_tab(
         try:
             if cache['table_ref'].winfo_exists():
                 if _preloaded_data is None:
-
-                    def _bg_fast_sys() -> None:
-                        data = get_all_systems()
-                        games = get_all_games()
-                        tab.after(
-                            0,
-                            lambda: fill_systemy_rpg_tab(
-                                tab, dark_mode, _preloaded_data=data, _preloaded_games=games
-                            ),
-                        )
-
-                    threading.Thread(target=_bg_fast_sys, daemon=True).start()
+                    _submit_systemy_load(tab, dark_mode)
                     return
                 cache['records_ref'][0] = _preloaded_data
                 if _preloaded_games is not None:
@@ -1431,19 +1501,15 @@ def fill_systemy_rpg_tab(
         del tab._systemy_tab_cache  # type: ignore[attr-defined]
 
     if _preloaded_data is None or _preloaded_games is None:
-
-        def _bg_full_sys() -> None:
-            data = get_all_systems()
-            games = get_all_games()
-            tab.after(
-                0,
-                lambda: fill_systemy_rpg_tab(
-                    tab, dark_mode, _preloaded_data=data, _preloaded_games=games
-                ),
-            )
-
-        threading.Thread(target=_bg_full_sys, daemon=True).start()
-        return
+        # Pierwsze rysowanie po starcie — z migawki, jeśli jest; świeże dane w tle
+        snapshot = view_snapshot.take("systemy", _SNAPSHOT_DBS)
+        if snapshot is None:
+            _submit_systemy_load(tab, dark_mode)
+            return
+        shown, up_to_date = snapshot
+        _preloaded_data, _preloaded_games = shown
+        if not up_to_date:
+            _submit_systemy_load(tab, dark_mode, shown=shown)
 
     for widget in tab.winfo_children():
         widget.destroy()
@@ -1776,7 +1842,10 @@ def fill_systemy_rpg_tab(
 
     # ── Callbacki tabeli ─────────────────────────────────────────────────
     def _systemy_refresh(**_kw: Any) -> None:
-        fill_systemy_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
+        change_events.publish(change_events.SYSTEMY_RPG)
+
+    def _gry_refresh(**_kw: Any) -> None:
+        change_events.publish(change_events.SYSTEMY_GRY)
 
     def _on_edit(_row_idx: int, row_data: List[Any]) -> None:
         if is_guest_mode():
@@ -1794,7 +1863,7 @@ def fill_systemy_rpg_tab(
         try:
             if typ == "System" or str(sid).startswith("G"):
                 gid_str = str(sid)[1:] if str(sid).startswith("G") else str(sid)
-                open_edit_game_dialog(tab, int(gid_str), refresh_callback=_systemy_refresh)
+                open_edit_game_dialog(tab, int(gid_str), refresh_callback=_gry_refresh)
             else:
                 open_edit_system_dialog(tab, [str(sid)], refresh_callback=_systemy_refresh)
         except Exception as e:
@@ -1927,19 +1996,24 @@ def fill_systemy_rpg_tab(
                     )
                 if not messagebox.askyesno("Usuń System", warn, parent=tab):
                     return
-                try:
-                    with sqlite3.connect(DB_FILE) as conn:
-                        conn.execute("PRAGMA foreign_keys = ON")
-                        cur = conn.cursor()
-                        cur.execute(
-                            "UPDATE systemy_rpg SET system_gry_id=NULL WHERE system_gry_id=?",
-                            (gid_int,),
-                        )
-                        cur.execute("DELETE FROM systemy_gry WHERE id=?", (gid_int,))
-                        conn.commit()
-                    fill_systemy_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
-                except sqlite3.Error as e:
-                    messagebox.showerror("Błąd bazy danych", f"Nie udało się usunąć:\n{e}", parent=tab)
+
+                def _delete_game(conn: sqlite3.Connection, gid: int = gid_int) -> None:
+                    conn.execute(
+                        "UPDATE systemy_rpg SET system_gry_id=NULL WHERE system_gry_id=?", (gid,)
+                    )
+                    conn.execute("DELETE FROM systemy_gry WHERE id=?", (gid,))
+
+                db_writer.submit(
+                    DB_FILE,
+                    _delete_game,
+                    tab,
+                    on_error=_delete_error,
+                    label="usunięcie systemu",
+                    changes=(
+                        ChangeEvent(change_events.SYSTEMY_GRY, (gid_int,), change_events.DELETE),
+                        ChangeEvent(change_events.SYSTEMY_RPG),
+                    ),
+                )
                 return
 
             is_pg = stype == "Podręcznik Główny"
@@ -1949,23 +2023,37 @@ def fill_systemy_rpg_tab(
                 sid_int = int(str(sid))
             except ValueError:
                 pass
-            if messagebox.askyesno("Usuń", warn, parent=tab):
-                try:
-                    with sqlite3.connect(DB_FILE) as conn:
-                        conn.row_factory = sqlite3.Row
-                        conn.execute("PRAGMA foreign_keys = ON")
-                        cur = conn.cursor()
-                        if is_pg and sid_int is not None:
-                            # Orphan supplements — nie usuwaj, tylko odłącz od PG
-                            cur.execute(
-                                "UPDATE systemy_rpg SET system_glowny_id=NULL WHERE system_glowny_id=?",
-                                (sid_int,),
-                            )
-                        cur.execute("DELETE FROM systemy_rpg WHERE id=?", (str(sid),))
-                        conn.commit()
-                    fill_systemy_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
-                except sqlite3.Error as e:
-                    messagebox.showerror("Błąd bazy danych", f"Nie udało się usunąć:\n{e}", parent=tab)
+            if not messagebox.askyesno("Usuń", warn, parent=tab):
+                return
+
+            def _delete_item(conn: sqlite3.Connection) -> None:
+                if is_pg and sid_int is not None:
+                    # Orphan supplements — nie usuwaj, tylko odłącz od PG
+                    conn.execute(
+                        "UPDATE systemy_rpg SET system_glowny_id=NULL WHERE system_glowny_id=?",
+                        (sid_int,),
+                    )
+                conn.execute("DELETE FROM systemy_rpg WHERE id=?", (str(sid),))
+
+            db_writer.submit(
+                DB_FILE,
+                _delete_item,
+                tab,
+                on_error=_delete_error,
+                label="usunięcie pozycji",
+                changes=(
+                    ChangeEvent(
+                        change_events.SYSTEMY_RPG,
+                        (sid_int,) if sid_int is not None else (),
+                        change_events.DELETE,
+                    ),
+                ),
+            )
+
+        def _delete_error(exc: BaseException) -> None:
+            messagebox.showerror(
+                "Błąd bazy danych", f"Nie udało się usunąć:\n{exc}", parent=tab
+            )
 
         def _toggle() -> None:
             _on_cell_click(row_idx, 0, row_data)
@@ -1989,8 +2077,19 @@ def fill_systemy_rpg_tab(
                 return
             _open_assign_pg_dialog(tab, pg_id, clean_name, _systemy_refresh)
 
+        selected = _table[0].get_selected_rows() if _table[0] is not None else []
+
         ctx = tk.Menu(tab, tearoff=0)
         ctx.add_command(label="Edytuj", command=_edit)
+        if len(selected) > 1:
+            ctx.add_command(
+                label=f"Edytuj zaznaczone ({len(selected)})...",
+                command=lambda: edytuj_zaznaczone_systemy(tab, selected),
+            )
+            ctx.add_command(
+                label=f"Usuń zaznaczone ({len(selected)})...",
+                command=lambda: usun_zaznaczone_systemy(tab, selected),
+            )
         if stype == "System":
             if symbol in ("[+]", "[-]"):
                 ctx.add_command(label="Zwiń" if symbol == "[-]" else "Rozwiń", command=_toggle)
@@ -2154,6 +2253,12 @@ def fill_systemy_rpg_tab(
     cols_btn = ttk.Button(top_bar, text="Kolumny", command=lambda: _open_columns_dialog())
     cols_btn.pack(side=tk.LEFT, padx=4)
 
+    def _export_view() -> None:
+        if _table[0] is not None:
+            export_table_view(tab, _table[0], "systemy")
+
+    ttk.Button(top_bar, text="Eksportuj widok", command=_export_view).pack(side=tk.LEFT, padx=4)
+
     # ── Tabela ───────────────────────────────────────────────────────────
     _rebuild_groups()
     if all_expanded_systemy:
@@ -2465,33 +2570,87 @@ def fill_systemy_rpg_tab(
 def usun_zaznaczony_system(
     tab: tk.Frame, refresh_callback: Optional[Callable[..., None]] = None
 ) -> None:
-    """Usuwa zaznaczony system RPG – deleguje do menu kontekstowego tabeli."""
+    """Usuwa zaznaczone systemy i pozycje (PG/suplementy) po podglądzie skutków."""
     cache = getattr(tab, '_systemy_tab_cache', None)
     tbl: Optional[CTkDataTable] = cache.get('table_ref') if cache else None
     if tbl is None:
         messagebox.showerror("Błąd", "Nie znaleziono tabeli systemów RPG.", parent=tab)  # type: ignore
         return
-    row_data = tbl.get_selected()
-    if row_data is None:
+    rows = tbl.get_selected_rows()
+    if not rows:
         messagebox.showinfo("Brak wyboru", "Zaznacz system do usunięcia w tabeli.", parent=tab)  # type: ignore
         return
-    system_id = row_data[1] if len(row_data) > 1 else None
-    system_name = row_data[2] if len(row_data) > 2 else ""
-    if system_name and " (" in system_name and " supl.)" in system_name:
-        system_name = system_name.split(" (")[0]
-    if not system_id:
+    usun_zaznaczone_systemy(tab, rows, refresh_callback)
+
+
+def usun_zaznaczone_systemy(
+    tab: tk.Widget,
+    rows: Sequence[List[Any]],
+    refresh_callback: Optional[Callable[..., None]] = None,
+) -> None:
+    """Usuwanie wielu wierszy tabeli naraz: ID "G<n>" to systemy gier, liczby to pozycje."""
+    import bulk_delete
+
+    game_ids: List[int] = []
+    item_ids: List[int] = []
+    for row in rows:
+        rid = str(row[1]) if len(row) > 1 else ""
+        if rid.startswith("G") and rid[1:].isdigit():
+            game_ids.append(int(rid[1:]))
+        elif rid.isdigit():
+            item_ids.append(int(rid))
+    if not game_ids and not item_ids:
         return
-    if messagebox.askyesno("Usuń system RPG", f"Czy na pewno chcesz usunąć system: {system_name}?", parent=tab):  # type: ignore
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute("DELETE FROM systemy_rpg WHERE id=?", (system_id,))
-            conn.commit()
-        fill_systemy_rpg_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
+
+    def _deleted() -> None:
         if refresh_callback:
             refresh_callback(dark_mode=get_dark_mode_from_tab(tab))
 
+    bulk_delete.confirm_and_delete(
+        tab, bulk_delete.plan_systems(item_ids, game_ids), on_deleted=_deleted
+    )
+
+
+def edytuj_zaznaczone_systemy(tab: tk.Widget, rows: Sequence[List[Any]]) -> None:
+    """Edycja zbiorcza zaznaczonych pozycji (PG i suplementów); wiersze systemów są pomijane."""
+    from bulk_edit import BulkField, open_bulk_edit_dialog
+
+    ids = [int(str(row[1])) for row in rows if len(row) > 1 and str(row[1]).isdigit()]
+    if not ids:
+        messagebox.showinfo(
+            "Edycja zbiorcza",
+            "Zaznacz podręczniki lub suplementy — "
+            "wierszy systemów nie można edytować zbiorczo.",
+            parent=tab,
+        )
+        return
+
+    def _yes_no(col: str) -> List[Tuple[str, Dict[str, Any]]]:
+        return [("Tak", {col: 1}), ("Nie", {col: 0})]
+
+    fields = (
+        BulkField(
+            "Status kolekcji",
+            [
+                (v, {"status_kolekcja": v})
+                for v in ("W kolekcji", "Na sprzedaż", "Sprzedane", "Nieposiadane", "Do kupienia")
+            ],
+        ),
+        BulkField("Status gry", [(v, {"status_gra": v}) for v in ("Grane", "Nie grane")]),
+        BulkField("Fizyczny", _yes_no("fizyczny")),
+        BulkField("PDF", _yes_no("pdf")),
+        BulkField("Język", [(v, {"jezyk": v}) for v in ("PL", "ENG", "DE", "FR", "ES", "IT")]),
+    )
+    open_bulk_edit_dialog(
+        tab,
+        title="Edytuj zaznaczone pozycje",
+        db_path=DB_FILE,
+        table="systemy_rpg",
+        ids=ids,
+        fields=fields,
+        change_tables=(change_events.SYSTEMY_RPG,),
+    )
+
 
 def open_edit_system_dialog(
     parent: tk.Widget,
@@ -2730,15 +2889,8 @@ def open_edit_system_dialog(
                 wydawca_var.set(f"{new_pub[0]} - {new_pub[1]}")
         else:
             wydawca_combo.configure(values=[])
-        # Odśwież zakładkę Wydawcy w głównym oknie
-        try:
-            import wydawcy as _wydawcy_mod
-            root = dialog.winfo_toplevel()
-            wydawcy_tab = getattr(root, 'tabs', {}).get('Wydawcy')
-            if wydawcy_tab:
-                _wydawcy_mod.fill_wydawcy_tab(wydawcy_tab, dark_mode=getattr(root, 'dark_mode', False))
-        except Exception:
-            pass
+        # Zakładkę Wydawcy w głównym oknie odświeży harmonogram zdarzeń zmian
+        change_events.publish(change_events.WYDAWCY, kind=change_events.INSERT)
 
     def _open_add_publisher() -> None:
         import wydawcy as _wydawcy
@@ -3167,11 +3319,8 @@ def open_edit_system_dialog(
             if wybrane_vtt:
                 vtt_str = ", ".join(wybrane_vtt)  # type: ignore
 
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute(
+        def _write(conn: sqlite3.Connection) -> None:
+            conn.execute(
                 """
                 UPDATE systemy_rpg
                 SET nazwa=?, typ=?, system_glowny_id=?, typ_suplementu=?,
@@ -3205,11 +3354,15 @@ def open_edit_system_dialog(
                     system_data[0],
                 ),
             )
-            conn.commit()
 
-        if refresh_callback:
-            refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
-        dialog.destroy()
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
+
+        db_writer.submit_dialog_save(
+            DB_FILE, _write, dialog, parent, _saved, buttons=(btn_save, btn_cancel),
+            changes=(ChangeEvent(change_events.SYSTEMY_RPG, (system_data[0],)),),
+        )
 
     def on_cancel() -> None:
         """Anuluje edycję"""
@@ -3251,7 +3404,7 @@ def show_supplements_window(parent: tk.Widget, system_id: str, system_name: str)
     apply_safe_geometry(dialog, parent, 800, 600)
 
     # Pobierz suplementy z bazy
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("systemy_rpg.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -3271,7 +3424,7 @@ def show_supplements_window(parent: tk.Widget, system_id: str, system_name: str)
     supplements = []
     for supp in supplements_base:
         try:
-            with sqlite3.connect(get_db_path("wydawcy.db")) as wydawcy_conn:
+            with connect_db("wydawcy.db") as wydawcy_conn:
                 wydawcy_conn.row_factory = sqlite3.Row
                 wydawcy_conn.execute("PRAGMA foreign_keys = ON")
                 w_cursor = wydawcy_conn.cursor()
@@ -3398,26 +3551,33 @@ def open_add_game_dialog(
             messagebox.showerror("Błąd", "Nazwa systemu jest wymagana.", parent=dlg)
             return
         notatki = notatki_entry.get("1.0", tk.END).strip() or None
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute(
-                    "INSERT INTO systemy_gry (nazwa, notatki) VALUES (?,?)",
-                    (nazwa, notatki),
-                )
-                conn.commit()
-            dlg.destroy()
+
+        def _saved(_result: object) -> None:
             if refresh_callback:
                 refresh_callback()
-        except sqlite3.Error as e:
-            messagebox.showerror("Błąd bazy danych", f"Nie udało się dodać Systemu:\n{e}", parent=dlg)
 
-    ctk.CTkButton(
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            lambda conn: conn.execute(
+                "INSERT INTO systemy_gry (nazwa, notatki) VALUES (?,?)", (nazwa, notatki)
+            ),
+            dlg,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            error_message="Nie udało się dodać Systemu.",
+            changes=(ChangeEvent(change_events.SYSTEMY_GRY, kind=change_events.INSERT),),
+        )
+
+    save_btn = ctk.CTkButton(
         bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100,
-    ).pack(side=tk.LEFT, padx=5)
-    ctk.CTkButton(
-        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555", width=90,
-    ).pack(side=tk.LEFT, padx=5)
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    cancel_btn = ctk.CTkButton(
+        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555",
+        width=90,
+    )
+    cancel_btn.pack(side=tk.LEFT, padx=5)
     dlg.after(0, dlg.deiconify)
 
 
@@ -3480,26 +3640,32 @@ def open_edit_game_dialog(
             messagebox.showerror("Błąd", "Nazwa systemu jest wymagana.", parent=dlg)
             return
         notatki = notatki_entry.get("1.0", tk.END).strip() or None
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute(
-                    "UPDATE systemy_gry SET nazwa=?, notatki=? WHERE id=?",
-                    (nazwa, notatki, game_id),
-                )
-                conn.commit()
-            dlg.destroy()
+
+        def _saved(_result: object) -> None:
             if refresh_callback:
                 refresh_callback()
-        except sqlite3.Error as e:
-            messagebox.showerror("Błąd bazy danych", f"Nie udało się zapisać:\n{e}", parent=dlg)
 
-    ctk.CTkButton(
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            lambda conn: conn.execute(
+                "UPDATE systemy_gry SET nazwa=?, notatki=? WHERE id=?", (nazwa, notatki, game_id)
+            ),
+            dlg,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            changes=(ChangeEvent(change_events.SYSTEMY_GRY, (game_id,)),),
+        )
+
+    save_btn = ctk.CTkButton(
         bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100,
-    ).pack(side=tk.LEFT, padx=5)
-    ctk.CTkButton(
-        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555", width=90,
-    ).pack(side=tk.LEFT, padx=5)
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    cancel_btn = ctk.CTkButton(
+        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555",
+        width=90,
+    )
+    cancel_btn.pack(side=tk.LEFT, padx=5)
     dlg.after(0, dlg.deiconify)
 
 
@@ -3565,21 +3731,32 @@ def _open_assign_supl_dialog(
         except (ValueError, IndexError):
             messagebox.showerror("Błąd", "Nieprawidłowy wybór.", parent=dlg)
             return
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute(
-                    "UPDATE systemy_rpg SET system_gry_id=? WHERE id=?", (gid, supl_id)
-                )
-                conn.commit()
-            dlg.destroy()
+
+        def _saved(_result: object) -> None:
             if refresh_callback:
                 refresh_callback()
-        except sqlite3.Error as e:
-            messagebox.showerror("Błąd", f"Nie udało się zapisać:\n{e}", parent=dlg)
 
-    ctk.CTkButton(bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100).pack(side=tk.LEFT, padx=5)
-    ctk.CTkButton(bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555", width=90).pack(side=tk.LEFT, padx=5)
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            lambda conn: conn.execute(
+                "UPDATE systemy_rpg SET system_gry_id=? WHERE id=?", (gid, supl_id)
+            ),
+            dlg,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            changes=(ChangeEvent(change_events.SYSTEMY_RPG, (supl_id,)),),
+        )
+
+    save_btn = ctk.CTkButton(
+        bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100,
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    cancel_btn = ctk.CTkButton(
+        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555",
+        width=90,
+    )
+    cancel_btn.pack(side=tk.LEFT, padx=5)
     dlg.after(0, dlg.deiconify)
 
 
@@ -3643,26 +3820,37 @@ def _open_assign_pg_dialog(
         except (ValueError, IndexError):
             messagebox.showerror("Błąd", "Nieprawidłowy wybór.", parent=dlg)
             return
-        try:
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.execute(
-                    "UPDATE systemy_rpg SET system_gry_id=? WHERE id=?", (gid, pg_id)
-                )
-                # Propaguj też do suplementów tego PG
-                conn.execute(
-                    "UPDATE systemy_rpg SET system_gry_id=? WHERE system_glowny_id=?",
-                    (gid, pg_id),
-                )
-                conn.commit()
-            dlg.destroy()
+
+        def _write(conn: sqlite3.Connection) -> None:
+            conn.execute("UPDATE systemy_rpg SET system_gry_id=? WHERE id=?", (gid, pg_id))
+            # Propaguj też do suplementów tego PG
+            conn.execute(
+                "UPDATE systemy_rpg SET system_gry_id=? WHERE system_glowny_id=?", (gid, pg_id)
+            )
+
+        def _saved(_result: object) -> None:
             if refresh_callback:
                 refresh_callback()
-        except sqlite3.Error as e:
-            messagebox.showerror("Błąd", f"Nie udało się zapisać:\n{e}", parent=dlg)
 
-    ctk.CTkButton(bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100).pack(side=tk.LEFT, padx=5)
-    ctk.CTkButton(bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555", width=90).pack(side=tk.LEFT, padx=5)
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            _write,
+            dlg,
+            parent,
+            _saved,
+            buttons=(save_btn, cancel_btn),
+            changes=(ChangeEvent(change_events.SYSTEMY_RPG),),
+        )
+
+    save_btn = ctk.CTkButton(
+        bf, text="Zapisz", command=_save, fg_color="#2E7D32", hover_color="#1B5E20", width=100,
+    )
+    save_btn.pack(side=tk.LEFT, padx=5)
+    cancel_btn = ctk.CTkButton(
+        bf, text="Anuluj", command=dlg.destroy, fg_color="#666666", hover_color="#555555",
+        width=90,
+    )
+    cancel_btn.pack(side=tk.LEFT, padx=5)
     dlg.after(0, dlg.deiconify)
 
 
@@ -3965,22 +4153,13 @@ def dodaj_suplement_do_systemu(
                     messagebox.showerror("Błąd", "Cena sprzedaży musi być liczbą.", parent=dialog)  # type: ignore
                     return
 
-        # Pobierz system_gry_id z PG-rodzica, aby zachować spójność hierarchii
-        parent_system_gry_id: Optional[int] = None
-        try:
-            with sqlite3.connect(DB_FILE) as _pc:
-                _row = _pc.execute(
-                    "SELECT system_gry_id FROM systemy_rpg WHERE id=?", (system_glowny_id,)
-                ).fetchone()
-                parent_system_gry_id = _row[0] if _row else None
-        except sqlite3.Error:
-            pass
-
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            c = conn.cursor()
-            c.execute(
+        def _write(conn: sqlite3.Connection) -> None:
+            # system_gry_id z PG-rodzica (ta sama transakcja) — spójność hierarchii
+            row = conn.execute(
+                "SELECT system_gry_id FROM systemy_rpg WHERE id=?", (system_glowny_id,)
+            ).fetchone()
+            parent_system_gry_id = row[0] if row else None
+            conn.execute(
                 """
                 INSERT INTO systemy_rpg (id, nazwa, typ, system_glowny_id, typ_suplementu, 
                                        wydawca_id, fizyczny, pdf, jezyk,
@@ -4008,13 +4187,23 @@ def dodaj_suplement_do_systemu(
                     parent_system_gry_id,
                 ),
             )
-            conn.commit()
 
-        messagebox.showinfo("Sukces", f"Suplement '{nazwa}' został dodany do systemu '{system_glowny_nazwa}'.", parent=dialog)  # type: ignore
+        def _saved(_result: object) -> None:
+            messagebox.showinfo(  # type: ignore
+                "Sukces",
+                f"Suplement '{nazwa}' został dodany do systemu '{system_glowny_nazwa}'.",
+                parent=dialog,
+            )
 
-        if refresh_callback:
-            refresh_callback(dark_mode=getattr(parent, 'dark_mode', False))
-        dialog.destroy()
+            if refresh_callback:
+                refresh_callback(dark_mode=getattr(parent, 'dark_mode', False))
+
+        db_writer.submit_dialog_save(
+            DB_FILE, _write, dialog, parent, _saved, buttons=(btn_ok, btn_cancel),
+            changes=(
+                ChangeEvent(change_events.SYSTEMY_RPG, (reserved_id,), change_events.INSERT),
+            ),
+        )
 
     def on_cancel() -> None:
         """Anuluje dodawanie"""
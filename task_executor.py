@@ -0,0 +1,211 @@
+"""
+Wspólny wykonawca zadań w tle dla aplikacji Sesyjka.
+
+Zastępuje osobne ``threading.Thread`` uruchamiane przy każdym odświeżeniu zakładki:
+
+- ograniczona pula wątków roboczych (``_MAX_WORKERS``),
+- priorytety — zakładka widoczna ładuje się przed ukrytymi,
+- tokeny generacji per klucz (np. zakładka) — wynik zadania, które zostało
+  zastąpione nowszym zleceniem, jest odrzucany przed renderowaniem,
+  a zadanie zastąpione jeszcze w kolejce w ogóle się nie wykonuje,
+- jedna kolejka wyników po stronie Tk, opróżniana partiami w wątku głównym
+  (``post`` pozwala innym wątkom, np. ``db_writer``, korzystać z tej samej kolejki).
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import queue
+import threading
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import tkinter as tk
+
+_log = logging.getLogger(__name__)
+
+# ── Priorytety (mniejsza liczba = wcześniej) ─────────────────────────────────
+PRIORITY_VISIBLE = 0
+PRIORITY_HIDDEN = 10
+PRIORITY_IDLE = 20
+
+_MAX_WORKERS = 3
+# Maksymalna liczba wyników obsłużonych w jednym wywołaniu pętli Tk
+_DRAIN_BATCH = 8
+
+
+@dataclass(order=True)
+class _Task:
+    priority: int
+    seq: int
+    key: str = field(compare=False)
+    token: int = field(compare=False)
+    widget: tk.Misc = field(compare=False)
+    work: Callable[[], Any] = field(compare=False)
+    on_done: Callable[[Any], None] = field(compare=False)
+    on_error: Optional[Callable[[BaseException], None]] = field(compare=False)
+
+
+_tasks: "queue.PriorityQueue[_Task]" = queue.PriorityQueue()
+_seq = itertools.count()
+_generations: Dict[str, int] = {}
+_lock = threading.Lock()
+_workers: List[threading.Thread] = []
+
+# Callbacki oczekujące na wywołanie w wątku Tk: (widget, callback)
+_results: Deque[tuple[tk.Misc, Callable[[], None]]] = deque()
+_drain_scheduled: bool = False
+
+
+def priority_for(widget: tk.Misc) -> int:
+    """Zwraca priorytet zależny od tego, czy widget jest aktualnie widoczny (wątek Tk)."""
+    try:
+        return PRIORITY_VISIBLE if widget.winfo_ismapped() else PRIORITY_HIDDEN
+    except tk.TclError:
+        return PRIORITY_HIDDEN
+
+
+def submit(
+    key: str,
+    widget: tk.Misc,
+    work: Callable[[], Any],
+    on_done: Callable[[Any], None],
+    priority: Optional[int] = None,
+    on_error: Optional[Callable[[BaseException], None]] = None,
+) -> int:
+    """
+    Zleca zadanie w tle; ``on_done(wynik)`` zostanie wywołane w wątku Tk.
+
+    Każde nowe zlecenie z tym samym kluczem unieważnia poprzednie — ich wyniki
+    nie trafią do ``on_done``.
+
+    Args:
+        key: Klucz grupujący zlecenia (np. ``"tab:systemy"``).
+        widget: Widget, przez który wynik wraca do pętli Tk; zniszczony = wynik odrzucony.
+        work: Funkcja wykonywana w wątku roboczym (bez wywołań Tk).
+        on_done: Callback z wynikiem, wywoływany w wątku Tk.
+        priority: Priorytet; domyślnie wg widoczności widgetu (``priority_for``).
+        on_error: Callback z wyjątkiem (wątek Tk); domyślnie wyjątek jest logowany.
+
+    Returns:
+        Token generacji zlecenia.
+    """
+    if priority is None:
+        priority = priority_for(widget)
+    with _lock:
+        token = _generations.get(key, 0) + 1
+        _generations[key] = token
+        _ensure_workers()
+    _tasks.put(_Task(priority, next(_seq), key, token, widget, work, on_done, on_error))
+    return token
+
+
+def cancel(key: str) -> None:
+    """Unieważnia wszystkie oczekujące i trwające zlecenia dla klucza."""
+    with _lock:
+        _generations[key] = _generations.get(key, 0) + 1
+
+
+def post(widget: tk.Misc, callback: Callable[[], None]) -> None:
+    """
+    Przekazuje callback do wywołania w wątku Tk (bezpieczne z dowolnego wątku).
+
+    Callback jest pomijany, jeśli ``widget`` zostanie w międzyczasie zniszczony.
+    """
+    _results.append((widget, callback))
+    # Okno główne, nie ``winfo_toplevel()`` — okno dialogu może zniknąć przed
+    # obsługą kolejki; ``nametowidget(".")`` nie odpytuje Tcl (wątek roboczy)
+    _schedule_drain(widget.nametowidget("."))
+
+
+def _is_current(task: _Task) -> bool:
+    with _lock:
+        return _generations.get(task.key) == task.token
+
+
+def _ensure_workers() -> None:
+    """Uruchamia brakujące wątki robocze (wywoływane pod ``_lock``)."""
+    while len(_workers) < _MAX_WORKERS:
+        t = threading.Thread(
+            target=_worker_loop, name=f"sesyjka-worker-{len(_workers)}", daemon=True
+        )
+        _workers.append(t)
+        t.start()
+
+
+def _worker_loop() -> None:
+    while True:
+        task = _tasks.get()
+        if not _is_current(task):
+            continue  # zastąpione nowszym zleceniem, zanim zdążyło ruszyć
+        result: Any = None
+        error: Optional[BaseException] = None
+        try:
+            result = task.work()
+        except Exception as exc:  # przekazywany do wątku Tk
+            error = exc
+        if not _is_current(task):
+            continue
+        post(task.widget, lambda t=task, r=result, e=error: _deliver(t, r, e))
+
+
+def _deliver(task: _Task, result: Any, error: Optional[BaseException]) -> None:
+    """Przekazuje wynik zadania do callbacku (wątek Tk), o ile zadanie jest aktualne."""
+    if not _is_current(task):
+        return
+    if error is None:
+        task.on_done(result)
+    elif task.on_error is not None:
+        task.on_error(error)
+    else:
+        _log.error(
+            "Błąd zadania w tle (%s)", task.key,
+            exc_info=(type(error), error, error.__traceback__),
+        )
+
+
+def _schedule_drain(root: tk.Misc) -> None:
+    """
+    Planuje opróżnienie kolejki wyników w pętli Tk (jedno zaplanowanie naraz).
+
+    Callback rejestrowany jest na oknie głównym, a nie na widgecie zadania —
+    ``after`` zniszczonego widgetu nigdy się nie wykona i zablokowałby kolejkę.
+    """
+    global _drain_scheduled
+    with _lock:
+        if _drain_scheduled:
+            return
+        _drain_scheduled = True
+    try:
+        root.after(0, lambda: _drain(root))
+    except (RuntimeError, tk.TclError):
+        # Pętla Tk zakończona — wyniki nie mają dokąd trafić
+        with _lock:
+            _drain_scheduled = False
+        _log.debug("Nie można zaplanować obsługi wyników zadań w tle", exc_info=True)
+
+
+def _drain(root: tk.Misc) -> None:
+    """Obsługuje partię wyników w wątku Tk; resztę przekłada na następny obieg pętli."""
+    global _drain_scheduled
+    for _ in range(_DRAIN_BATCH):
+        try:
+            widget, callback = _results.popleft()
+        except IndexError:
+            break
+        try:
+            if not widget.winfo_exists():
+                continue
+        except tk.TclError:
+            continue
+        try:
+            callback()
+        except Exception:
+            _log.error("Błąd obsługi wyniku zadania w tle", exc_info=True)
+
+    with _lock:
+        _drain_scheduled = False
+    if _results:
+        # Pozostałe wyniki — kolejny obieg, żeby nie blokować pętli zdarzeń
+        _schedule_drain(root)
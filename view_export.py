@@ -0,0 +1,164 @@
+"""
+Eksport bieżącego widoku zakładki — dokładnie to, co pokazuje ``CTkDataTable``.
+
+Wiersze pochodzą z tabeli po filtrach, wyszukiwaniu, sortowaniu i rozwinięciu
+hierarchii (``CTkDataTable.displayed_rows``), kolumny — tylko widoczne,
+w kolejności wyświetlania. Wątek Tk bierze jedynie płytką kopię listy wierszy
+(same wiersze nie są kopiowane); zapis do CSV/XLSX/JSONL idzie w tle
+(``task_executor``) wiersz po wierszu do pliku ``*.partial``, podmienianego
+na końcu.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+import time
+from pathlib import Path
+from tkinter import filedialog, messagebox
+from typing import Any, Iterable, List, Sequence
+
+import task_executor
+from ctk_table import CTkDataTable
+
+_log = logging.getLogger(__name__)
+
+VIEW_EXPORT_FORMATS = ("csv", "xlsx", "jsonl")
+
+_FILE_TYPES = [
+    ("CSV (Excel, arkusze)", "*.csv"),
+    ("Excel", "*.xlsx"),
+    ("JSON Lines", "*.jsonl"),
+]
+
+
+def _cell(value: Any) -> Any:
+    # Wcięcia i symbole rozwinięcia służą tylko wyświetlaniu
+    return value.strip() if isinstance(value, str) else value
+
+
+def write_view(
+    dest: Path, fmt: str, headers: Sequence[str], rows: Iterable[Sequence[Any]]
+) -> int:
+    """
+    Zapisuje wiersze widoku do pliku strumieniowo.
+
+    Returns:
+        int: Liczba zapisanych wierszy.
+
+    Raises:
+        ValueError: Nieznany format.
+        ImportError: Format ``xlsx`` bez biblioteki openpyxl.
+    """
+    if fmt not in VIEW_EXPORT_FORMATS:
+        raise ValueError(f"Nieznany format eksportu: {fmt!r}")
+    tmp = dest.with_name(dest.name + ".partial")
+    count = 0
+    try:
+        if fmt == "xlsx":
+            try:
+                import openpyxl
+                from openpyxl.styles import Font
+                from openpyxl.cell import WriteOnlyCell
+            except ImportError:
+                raise ImportError(
+                    "Eksport do Excela wymaga biblioteki openpyxl.\n"
+                    "Zainstaluj ją poleceniem: pip install openpyxl"
+                )
+            wb = openpyxl.Workbook(write_only=True)
+            ws = wb.create_sheet(title="Widok")
+            header_row = []
+            for header in headers:
+                cell = WriteOnlyCell(ws, value=header)
+                cell.font = Font(bold=True)
+                header_row.append(cell)
+            ws.append(header_row)
+            for row in rows:
+                ws.append([_cell(v) for v in row])
+                count += 1
+            wb.save(tmp)
+        else:
+            # CSV z BOM — poprawnie otwiera się w Excelu (jak ``export_databases_text``)
+            encoding = "utf-8-sig" if fmt == "csv" else "utf-8"
+            with open(tmp, "w", encoding=encoding, newline="") as fh:
+                if fmt == "csv":
+                    writer = csv.writer(fh)
+                    writer.writerow(headers)
+                    for row in rows:
+                        writer.writerow([_cell(v) for v in row])
+                        count += 1
+                else:
+                    for row in rows:
+                        record = dict(zip(headers, (_cell(v) for v in row)))
+                        fh.write(json.dumps(record, ensure_ascii=False) + "\n")
+                        count += 1
+        os.replace(tmp, dest)
+    except BaseException:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+        raise
+    return count
+
+
+def export_table_view(parent: Any, table: CTkDataTable, name: str) -> None:
+    """
+    Pyta o plik i eksportuje w tle bieżący widok tabeli.
+
+    Args:
+        parent: Widget zakładki (rodzic okien dialogowych).
+        table: Tabela zakładki.
+        name: Nazwa widoku w domyślnej nazwie pliku, np. ``"systemy"``.
+    """
+    dest_str = filedialog.asksaveasfilename(
+        parent=parent.winfo_toplevel(),
+        title="Eksportuj bieżący widok",
+        defaultextension=".csv",
+        filetypes=_FILE_TYPES,
+        initialfile=f"sesyjka_{name}_{time.strftime('%Y%m%d')}.csv",
+    )
+    if not dest_str:
+        return
+    dest = Path(dest_str)
+    fmt = dest.suffix.lower().lstrip(".")
+    if fmt not in VIEW_EXPORT_FORMATS:
+        messagebox.showerror(
+            "Eksport widoku",
+            f"Nieobsługiwane rozszerzenie pliku: {dest.suffix or '(brak)'}\n"
+            f"Wybierz: {', '.join('.' + f for f in VIEW_EXPORT_FORMATS)}.",
+            parent=parent,
+        )
+        return
+
+    columns = table.visible_columns()
+    headers = [table.headers[j] for j in columns if table.headers[j]]
+    columns = [j for j in columns if table.headers[j]]  # bez kolumny symbolu rozwinięcia
+    rows: List[List[Any]] = table.displayed_rows()
+
+    def _work() -> int:
+        return write_view(
+            dest, fmt, headers, ([row[j] if j < len(row) else "" for j in columns] for row in rows)
+        )
+
+    def _done(count: int) -> None:
+        messagebox.showinfo(
+            "Eksport widoku", f"Zapisano {count} wierszy do pliku:\n{dest}", parent=parent
+        )
+
+    def _error(exc: BaseException) -> None:
+        _log.error("Błąd eksportu widoku", exc_info=(type(exc), exc, exc.__traceback__))
+        messagebox.showerror("Błąd eksportu widoku", str(exc), parent=parent)
+
+    task_executor.submit(
+        f"view_export:{dest}",
+        parent,
+        _work,
+        _done,
+        priority=task_executor.PRIORITY_VISIBLE,
+        on_error=_error,
+    )
+
+
+__all__ = ["VIEW_EXPORT_FORMATS", "export_table_view", "write_view"]
@@ -0,0 +1,144 @@
+"""
+Migawki danych zakładek do natychmiastowego pierwszego rysowania (warm start).
+
+Po każdym wczytaniu danych zakładki w tle jej wiersze zapisywane są do małej
+bazy ``view_cache.db`` w katalogu danych aplikacji, razem z sygnaturą plików
+baz, z których pochodzą. Sygnatura to licznik zmian z nagłówka pliku SQLite
+(bajty 24–27, zwiększany przy każdej transakcji zapisu), rozmiar i mtime.
+
+Przy starcie zakładka rysuje się od razu z migawki. Jeśli sygnatura plików
+się nie zgadza, dane są wczytywane ponownie w tle i podmieniane tylko wtedy,
+gdy faktycznie się różnią. W trybie gościa migawki nie są ani czytane, ani
+zapisywane — dotyczą wyłącznie własnych danych użytkownika.
+"""
+from __future__ import annotations
+
+import logging
+import marshal
+import os
+import sqlite3
+import sys
+import threading
+import time
+from contextlib import closing
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple
+
+from database_manager import get_app_data_dir, get_own_db_path, is_guest_mode
+
+_log = logging.getLogger(__name__)
+
+_CACHE_FILE = "view_cache.db"
+# Format marshal zależy od wersji Pythona — migawka z innej wersji jest pomijana
+_FORMAT = f"{marshal.version}:{sys.version_info[0]}.{sys.version_info[1]}"
+
+Signature = Tuple[Tuple[Any, ...], ...]
+
+_lock = threading.Lock()
+_consumed: set[str] = set()
+_saved_signatures: Dict[str, Signature] = {}
+
+
+def source_signature(db_names: Sequence[str]) -> Signature:
+    """Zwraca sygnaturę plików baz (licznik zmian z nagłówka, rozmiar, mtime)."""
+    parts = []
+    for name in db_names:
+        path = get_own_db_path(name)
+        try:
+            st = os.stat(path)
+            with open(path, "rb") as f:
+                header = f.read(28)
+            counter = int.from_bytes(header[24:28], "big") if len(header) == 28 else -1
+            parts.append((name, counter, st.st_size, st.st_mtime_ns))
+        except OSError:
+            parts.append((name, None, None, None))
+    return tuple(parts)
+
+
+def take(key: str, db_names: Sequence[str]) -> Optional[Tuple[Any, bool]]:
+    """
+    Zwraca migawkę zakładki do pierwszego rysowania (tylko raz na uruchomienie).
+
+    Returns:
+        ``(dane, aktualna)`` — ``aktualna`` oznacza zgodność sygnatury plików,
+        czyli brak potrzeby ponownego wczytywania; None, gdy migawki brak.
+    """
+    with _lock:
+        if key in _consumed:
+            return None
+        _consumed.add(key)
+    if is_guest_mode():
+        return None
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT signature, payload FROM snapshots WHERE key=? AND format=?",
+                (key, _FORMAT),
+            ).fetchone()
+        if row is None:
+            return None
+        saved_sig = marshal.loads(row[0])
+        payload = marshal.loads(row[1])
+    except (sqlite3.Error, OSError, ValueError, EOFError, TypeError):
+        _log.debug("Nie udało się wczytać migawki zakładki %s", key, exc_info=True)
+        return None
+    with _lock:
+        _saved_signatures[key] = saved_sig
+    return payload, saved_sig == source_signature(db_names)
+
+
+def loader(
+    key: str, db_names: Sequence[str], load: Callable[[], Any]
+) -> Callable[[], Any]:
+    """
+    Opakowuje funkcję wczytującą dane zakładki (wątek roboczy) zapisem migawki.
+
+    Sygnatura liczona jest przed zapytaniem — zapis, który nastąpi w trakcie,
+    zmieni ją i przy następnym starcie wymusi ponowne wczytanie.
+    """
+
+    def _work() -> Any:
+        guest = is_guest_mode()
+        sig = None if guest else source_signature(db_names)
+        data = load()
+        if sig is not None:
+            save(key, sig, data)
+        return data
+
+    return _work
+
+
+def save(key: str, signature: Signature, data: Any) -> None:
+    """Zapisuje migawkę, o ile sygnatura zmieniła się od ostatniego zapisu."""
+    with _lock:
+        if _saved_signatures.get(key) == signature:
+            return
+    try:
+        payload = marshal.dumps(data)
+        with closing(_connect()) as conn:
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO snapshots (key, format, signature, payload, saved_at)"
+                    " VALUES (?, ?, ?, ?, ?)",
+                    (key, _FORMAT, marshal.dumps(signature), payload, time.time()),
+                )
+    except (ValueError, sqlite3.Error, OSError):
+        _log.debug("Nie udało się zapisać migawki zakładki %s", key, exc_info=True)
+        return
+    with _lock:
+        _saved_signatures[key] = signature
+
+
+def _connect() -> sqlite3.Connection:
+    conn = sqlite3.connect(str(get_app_data_dir() / _CACHE_FILE), timeout=5.0)
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS snapshots (
+            key TEXT PRIMARY KEY,
+            format TEXT NOT NULL,
+            signature BLOB NOT NULL,
+            payload BLOB NOT NULL,
+            saved_at REAL NOT NULL
+        )
+        """
+    )
+    return conn
@@ -1,19 +1,30 @@
-﻿import threading
-import tkinter as tk
+﻿import tkinter as tk
 import tkinter.font as tkfont
 from tkinter import ttk, messagebox
 import sqlite3
+from contextlib import closing
 from typing import Optional, Union, List, Dict, Any
 import webbrowser
 import customtkinter as ctk  # type: ignore
 import logging
-from database_manager import get_db_path, is_guest_mode
+from database_manager import connect_db, get_own_db_path, is_guest_mode, open_schema_connection
 from font_scaling import scale_font_size
 from dialog_utils import apply_safe_geometry, create_ctk_toplevel
 from ctk_table import CTkDataTable
+from view_export import export_table_view
+import change_events
+import db_writer
+import task_executor
+import view_snapshot
+from change_events import ChangeEvent
 
 _log = logging.getLogger(__name__)
-DB_FILE = get_db_path("wydawcy.db")
+DB_FILE = get_own_db_path("wydawcy.db")
+# Pliki baz, z których pochodzą dane zakładki (sygnatura migawki)
+_SNAPSHOT_DBS = ("wydawcy.db",)
+
+# Schemat sprawdzony w tej sesji (ustawiane przez init_db / prepare_db)
+_db_initialized: bool = False
 
 # Przechowuj aktywne filtry na poziomie modułu
 active_filters_wydawcy: Dict[str, Any] = {}
@@ -78,31 +89,51 @@ def _apply_dark_theme_to_widget(
         )
 
 
-def init_db():
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        c.execute(
-            """
-            CREATE TABLE IF NOT EXISTS wydawcy (
-                id INTEGER PRIMARY KEY,
-                nazwa TEXT NOT NULL,
-                strona TEXT,
-                kraj TEXT
-            )
+def ensure_schema(conn: sqlite3.Connection) -> None:
+    """
+    Tworzy/migruje schemat bazy wydawców na podanym połączeniu.
+
+    Args:
+        conn: Połączenie w trybie autocommit (patrz ``open_schema_connection``).
+    """
+    c = conn.cursor()
+    c.execute(
         """
+        CREATE TABLE IF NOT EXISTS wydawcy (
+            id INTEGER PRIMARY KEY,
+            nazwa TEXT NOT NULL,
+            strona TEXT,
+            kraj TEXT
         )
-        # Dodaj kolumnę kraj jeśli nie istnieje (migracja)
-        c.execute("PRAGMA table_info(wydawcy)")
-        columns = [row[1] for row in c.fetchall()]
-        if 'kraj' not in columns:
-            c.execute("ALTER TABLE wydawcy ADD COLUMN kraj TEXT")
-        conn.commit()
+    """
+    )
+    # Dodaj kolumnę kraj jeśli nie istnieje (migracja)
+    c.execute("PRAGMA table_info(wydawcy)")
+    columns = [row[1] for row in c.fetchall()]
+    if 'kraj' not in columns:
+        c.execute("ALTER TABLE wydawcy ADD COLUMN kraj TEXT")
+
+
+def init_db() -> None:
+    """Inicjalizuje bazę danych wydawców (jednorazowo na sesję aplikacji)."""
+    global _db_initialized
+    if _db_initialized:
+        return
+    with closing(open_schema_connection(DB_FILE)) as conn:
+        ensure_schema(conn)
+    _db_initialized = True
+
+
+def prepare_db(conn: sqlite3.Connection) -> None:
+    """Krok startowy dla ``initialize_app_databases`` — schemat na wspólnym połączeniu."""
+    global _db_initialized
+    _db_initialized = False  # także po podmianie pliku (refresh_databases)
+    ensure_schema(conn)
+    _db_initialized = True
 
 
 def get_all_publishers():
-    with sqlite3.connect(DB_FILE) as conn:
+    with connect_db("wydawcy.db") as conn:
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
         c = conn.cursor()
@@ -120,16 +151,18 @@ def get_first_free_id() -> int:
         return 1 if result[0] is None else result[0] + 1
 
 
-def add_publisher_to_db(id_wydawcy: int, nazwa: str, strona: Optional[str], kraj: Optional[str]):
-    with sqlite3.connect(DB_FILE) as conn:
-        conn.row_factory = sqlite3.Row
-        conn.execute("PRAGMA foreign_keys = ON")
-        c = conn.cursor()
-        c.execute(
-            "INSERT INTO wydawcy (id, nazwa, strona, kraj) VALUES (?, ?, ?, ?)",
-            (id_wydawcy, nazwa, strona, kraj),
-        )
-        conn.commit()
+def add_publisher_to_db(
+    conn: sqlite3.Connection,
+    id_wydawcy: int,
+    nazwa: str,
+    strona: Optional[str],
+    kraj: Optional[str],
+) -> None:
+    """Dodaje wydawcę na połączeniu pisarza (``db_writer``, bez ``commit``)."""
+    conn.execute(
+        "INSERT INTO wydawcy (id, nazwa, strona, kraj) VALUES (?, ?, ?, ?)",
+        (id_wydawcy, nazwa, strona, kraj),
+    )
 
 
 def get_dark_mode_from_tab(tab):  # type: ignore
@@ -183,10 +216,22 @@ def dodaj_wydawce(parent: tk.Tk, refresh_callback=None):  # type: ignore
         if not nazwa:
             messagebox.showerror("Błąd", "Nazwa wydawcy jest wymagana.", parent=dialog)  # type: ignore
             return
-        add_publisher_to_db(reserved_id, nazwa, strona if strona else None, kraj if kraj else None)
-        if refresh_callback:
-            refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
-        dialog.destroy()
+
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
+
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            lambda conn: add_publisher_to_db(
+                conn, reserved_id, nazwa, strona if strona else None, kraj if kraj else None
+            ),
+            dialog,
+            parent,
+            _saved,
+            buttons=(btn_ok, btn_cancel),
+            changes=(ChangeEvent(change_events.WYDAWCY, (reserved_id,), change_events.INSERT),),
+        )
 
     def on_cancel():
         dialog.destroy()
@@ -217,6 +262,34 @@ def dodaj_wydawce(parent: tk.Tk, refresh_callback=None):  # type: ignore
     dialog.protocol("WM_DELETE_WINDOW", on_cancel)
 
 
+def _load_wydawcy_rows() -> List[List[Any]]:
+    """Wczytuje wydawców jako wiersze tabeli (wątek roboczy)."""
+    recs = get_all_publishers()
+    return [[v if v is not None else "" for v in rec] for rec in recs]
+
+
+def _submit_wydawcy_load(
+    tab: tk.Frame, dark_mode: bool, shown: Optional[List[List[Any]]] = None
+) -> None:
+    """
+    Zleca wczytanie danych zakładki w tle; starsze zlecenia tej zakładki są odrzucane.
+
+    ``shown`` to dane już narysowane z migawki — identyczny wynik nie przerysowuje tabeli.
+    """
+
+    def _done(data: List[List[Any]]) -> None:
+        if shown is not None and data == shown:
+            return
+        fill_wydawcy_tab(tab, dark_mode, _preloaded_data=data)
+
+    task_executor.submit(
+        "tab:wydawcy",
+        tab,
+        view_snapshot.loader("wydawcy", _SNAPSHOT_DBS, _load_wydawcy_rows),
+        _done,
+    )
+
+
 def fill_wydawcy_tab(
     tab: tk.Frame,
     dark_mode: bool = False,
@@ -235,20 +308,7 @@ def fill_wydawcy_tab(
         try:
             if cache['table_ref'].winfo_exists():
                 if _preloaded_data is None:
-
-                    def _bg_fast_wyd() -> None:
-                        recs = get_all_publishers()
-                        data: List[List[Any]] = [
-                            [v if v is not None else "" for v in rec] for rec in recs
-                        ]
-                        tab.after(
-                            0,
-                            lambda: fill_wydawcy_tab(
-                                tab, dark_mode, _preloaded_data=data
-                            ),
-                        )
-
-                    threading.Thread(target=_bg_fast_wyd, daemon=True).start()
+                    _submit_wydawcy_load(tab, dark_mode)
                     return
                 cache['data_ref'][0] = _preloaded_data
                 cache['apply_fn']()
@@ -258,19 +318,16 @@ def fill_wydawcy_tab(
         del tab._wydawcy_tab_cache  # type: ignore[attr-defined]
 
     if _preloaded_data is None:
-
-        def _bg_full_wyd() -> None:
-            recs = get_all_publishers()
-            data: List[List[Any]] = [
-                [v if v is not None else "" for v in rec] for rec in recs
-            ]
-            tab.after(
-                0,
-                lambda: fill_wydawcy_tab(tab, dark_mode, _preloaded_data=data),
-            )
-
-        threading.Thread(target=_bg_full_wyd, daemon=True).start()
-        return
+        # Pierwsze rysowanie po starcie — z migawki, jeśli jest; świeże dane w tle
+        snapshot = view_snapshot.take("wydawcy", _SNAPSHOT_DBS)
+        if snapshot is None:
+            _submit_wydawcy_load(tab, dark_mode)
+            return
+        shown: List[List[Any]]
+        shown, up_to_date = snapshot
+        if not up_to_date:
+            _submit_wydawcy_load(tab, dark_mode, shown=shown)
+        _preloaded_data = shown
 
     for widget in tab.winfo_children():
         widget.destroy()
@@ -408,6 +465,13 @@ def fill_wydawcy_tab(
         _search_after_id[0] = tab.after(200, _apply_and_draw)
 
     search_var.trace_add('write', _on_search_changed)  # type: ignore[misc]
+    ttk.Separator(top_bar, orient=tk.VERTICAL).pack(side=tk.LEFT, padx=10, fill=tk.Y)
+
+    def _export_view() -> None:
+        if _table[0] is not None:
+            export_table_view(tab, _table[0], "wydawcy")
+
+    ttk.Button(top_bar, text="Eksportuj widok", command=_export_view).pack(side=tk.LEFT, padx=4)
 
     # ── Callbacki tabeli ────────────────────────────────────────────────────
     def _on_edit(_row_idx: int, row_data: List[Any]) -> None:
@@ -422,9 +486,7 @@ def fill_wydawcy_tab(
         open_edit_dialog(
             tab,
             row_data,
-            refresh_callback=lambda **kw: fill_wydawcy_tab(  # type: ignore[misc]
-                tab, dark_mode=get_dark_mode_from_tab(tab)
-            ),
+            refresh_callback=lambda **_kw: change_events.publish(change_events.WYDAWCY),
         )
 
     def _on_sort(col_idx: int) -> None:
@@ -446,33 +508,28 @@ def fill_wydawcy_tab(
             open_edit_dialog(
                 tab,
                 row_data,
-                refresh_callback=lambda **kw: fill_wydawcy_tab(  # type: ignore[misc]
-                    tab, dark_mode=get_dark_mode_from_tab(tab)
-                ),
+                refresh_callback=lambda **_kw: change_events.publish(change_events.WYDAWCY),
             )
 
         def _del() -> None:
-            if is_guest_mode():
-                messagebox.showwarning(
-                    "Tryb gościa",
-                    "W trybie gościa usuwanie danych jest wyłączone.",
-                    parent=tab,
-                )
-                return
-            if messagebox.askyesno(
-                "Usuń wydawcę", f"Czy na pewno chcesz usunąć wydawcę: {row_data[1]}?", parent=tab
-            ):
-                with sqlite3.connect(DB_FILE) as conn:
-                    conn.row_factory = sqlite3.Row
-                    conn.execute("PRAGMA foreign_keys = ON")
-                    conn.cursor().execute("DELETE FROM wydawcy WHERE id=?", (row_data[0],))
-                    conn.commit()
-                fill_wydawcy_tab(tab, dark_mode=get_dark_mode_from_tab(tab))
+            import bulk_delete
+
+            # Ta sama kaskada co przy wielu wydawcach: odwołania w systemach i pozycjach
+            bulk_delete.confirm_and_delete(
+                tab, bulk_delete.plan_publishers([int(row_data[0])], name=str(row_data[1]))
+            )
+
+        selected = _table[0].get_selected_rows() if _table[0] is not None else []
 
         ctx = tk.Menu(tab, tearoff=0)
         ctx.add_command(label="Edytuj", command=_edit)
         ctx.add_separator()
         ctx.add_command(label="Usuń", command=_del)
+        if len(selected) > 1:
+            ctx.add_command(
+                label=f"Usuń zaznaczonych ({len(selected)})...",
+                command=lambda: usun_zaznaczonego_wydawce(tab),
+            )
         ctx.tk_popup(event.x_root, event.y_root)
         ctx.grab_release()
 
@@ -681,39 +738,47 @@ def open_edit_dialog(parent: Any, values: List[Any], refresh_callback: Any = Non
         if not nazwa:
             messagebox.showerror("Błąd", "Nazwa wydawcy jest wymagana.", parent=dialog)
             return
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.cursor().execute(
+
+        def _saved(_result: object) -> None:
+            if refresh_callback:
+                refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
+
+        db_writer.submit_dialog_save(
+            DB_FILE,
+            lambda conn: conn.execute(
                 "UPDATE wydawcy SET nazwa=?, strona=?, kraj=? WHERE id=?",
                 (nazwa, strona if strona else None, kraj if kraj else None, record_id),
-            )
-            conn.commit()
-        if refresh_callback:
-            refresh_callback(dark_mode=get_dark_mode_from_tab(parent))
-        dialog.destroy()
+            ),
+            dialog,
+            parent,
+            _saved,
+            buttons=(btn_save, btn_cancel),
+            changes=(ChangeEvent(change_events.WYDAWCY, (int(record_id),)),),
+        )
 
     def on_cancel() -> None:
         dialog.destroy()
 
     btn_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
     btn_frame.grid(row=4, column=0, columnspan=2, pady=(20, 0))
-    ctk.CTkButton(
+    btn_save = ctk.CTkButton(
         btn_frame,
         text="Zapisz",
         command=on_ok,
         width=100,
         fg_color="#1976D2",
         hover_color="#1565C0",
-    ).pack(side=tk.LEFT, padx=10)
-    ctk.CTkButton(
+    )
+    btn_save.pack(side=tk.LEFT, padx=10)
+    btn_cancel = ctk.CTkButton(
         btn_frame,
         text="Anuluj",
         command=on_cancel,
         width=100,
         fg_color="#666666",
         hover_color="#555555",
-    ).pack(side=tk.LEFT, padx=10)
+    )
+    btn_cancel.pack(side=tk.LEFT, padx=10)
 
     dialog.protocol("WM_DELETE_WINDOW", on_cancel)
 
@@ -756,18 +821,16 @@ def usun_wydawce_dialog(parent: Any, refresh_callback: Any = None) -> None:  # t
         sel = listbox.curselection()  # type: ignore[assignment]
         if not sel:
             return
+        import bulk_delete
+
         rec = records[sel[0]]
-        if messagebox.askyesno(
-            "Potwierdź usunięcie", f"Czy na pewno chcesz usunąć wydawcę: {rec[1]}?", parent=dialog
-        ):
-            with sqlite3.connect(DB_FILE) as conn:
-                conn.row_factory = sqlite3.Row
-                conn.execute("PRAGMA foreign_keys = ON")
-                conn.cursor().execute("DELETE FROM wydawcy WHERE id=?", (rec[0],))
-                conn.commit()
-            if refresh_callback:
-                refresh_callback()
-            dialog.destroy()
+        dialog.destroy()
+        # Potwierdzenie z podglądem skutków i zapis — wspólna kaskada z bulk_delete
+        bulk_delete.confirm_and_delete(
+            parent,
+            bulk_delete.plan_publishers([int(rec[0])], name=str(rec[1])),
+            on_deleted=refresh_callback,
+        )
 
     def on_cancel_del() -> None:
         dialog.destroy()
@@ -795,7 +858,9 @@ def usun_wydawce_dialog(parent: Any, refresh_callback: Any = None) -> None:  # t
 
 
 def usun_zaznaczonego_wydawce(tab: tk.Frame, refresh_callback: Any = None) -> None:  # type: ignore
-    """Usuwa zaznaczonego wydawcę z tabeli CTkDataTable (przycisk w ribbonie)."""
+    """Usuwa zaznaczonych wydawców (przycisk w ribbonie) po podglądzie skutków."""
+    import bulk_delete
+
     table: Any = None
     for widget in tab.winfo_children():
         if isinstance(widget, CTkDataTable):
@@ -804,22 +869,19 @@ def usun_zaznaczonego_wydawce(tab: tk.Frame, refresh_callback: Any = None) -> No
     if table is None:
         messagebox.showerror("Błąd", "Nie znaleziono tabeli wydawców.", parent=tab)
         return
-    sel = table.get_selected()
-    if sel is None:
-        messagebox.showinfo("Brak wyboru", "Zaznacz wydawcę do usunięcia w tabeli.", parent=tab)
+    rows = table.get_selected_rows()
+    if not rows:
+        messagebox.showinfo("Brak wyboru", "Zaznacz wydawców do usunięcia w tabeli.", parent=tab)
         return
-    _, values = sel
-    if messagebox.askyesno(
-        "Usuń wydawcę", f"Czy na pewno chcesz usunąć wydawcę: {values[1]}?", parent=tab
-    ):
-        with sqlite3.connect(DB_FILE) as conn:
-            conn.row_factory = sqlite3.Row
-            conn.execute("PRAGMA foreign_keys = ON")
-            conn.cursor().execute("DELETE FROM wydawcy WHERE id=?", (values[0],))
-            conn.commit()
+
+    def _deleted() -> None:
         if refresh_callback:
             refresh_callback(dark_mode=get_dark_mode_from_tab(tab))
 
+    bulk_delete.confirm_and_delete(
+        tab, bulk_delete.plan_publishers([int(r[0]) for r in rows]), on_deleted=_deleted
+    )
+
 
 # Alias dla kompatybilności z main.py
 usun_zaznaczony_wydawce = usun_zaznaczonego_wydawce  # type: ignore